@@ -739,7 +739,8 @@ def render_chat_assistant():
                 st.session_state.chat_assistant.clear_history()
             st.rerun()
 
-    # Suggested questions
+    # Suggested questions (answered through the same streaming path as the chat input)
+    suggested_input = None
     if len(st.session_state.chat_messages) == 0:
         st.markdown("**Suggested questions:**")
         try:
@@ -756,23 +757,7 @@ def render_chat_assistant():
         for i, suggestion in enumerate(suggestions[:4]):
             with cols[i % 2]:
                 if st.button(suggestion, key=f"suggest_{i}", use_container_width=True):
-                    st.session_state.chat_messages.append({
-                        "role": "user",
-                        "content": suggestion
-                    })
-                    with st.spinner("Thinking..."):
-                        try:
-                            response = st.session_state.chat_assistant.chat(suggestion)
-                            st.session_state.chat_messages.append({
-                                "role": "assistant",
-                                "content": response.get('response', 'Sorry, I encountered an error.')
-                            })
-                        except Exception as e:
-                            st.session_state.chat_messages.append({
-                                "role": "assistant",
-                                "content": f"Sorry, I encountered an error: {str(e)}"
-                            })
-                    st.rerun()
+                    suggested_input = suggestion
 
     # Display chat messages
     for message in st.session_state.chat_messages:
@@ -780,7 +765,7 @@ def render_chat_assistant():
             st.markdown(message["content"])
 
     # Chat input
-    user_input = st.chat_input("Ask about your procurement brief...")
+    user_input = st.chat_input("Ask about your procurement brief...") or suggested_input
 
     if user_input:
         st.session_state.chat_messages.append({
@@ -788,18 +773,23 @@ def render_chat_assistant():
             "content": user_input
         })
 
-        with st.spinner("Thinking..."):
+        with st.chat_message("user"):
+            st.markdown(user_input)
+
+        # Stream the answer so the first tokens show up immediately
+        with st.chat_message("assistant"):
             try:
-                response = st.session_state.chat_assistant.chat(user_input)
-                assistant_message = response.get('response', 'Sorry, I encountered an error.')
+                assistant_message = st.write_stream(
+                    st.session_state.chat_assistant.chat_stream(user_input)
+                )
             except Exception as e:
                 assistant_message = f"Sorry, I encountered an error: {str(e)}"
                 logger.error(f"Chat error: {e}")
 
-            st.session_state.chat_messages.append({
-                "role": "assistant",
-                "content": assistant_message
-            })
+        st.session_state.chat_messages.append({
+            "role": "assistant",
+            "content": assistant_message or 'Sorry, I encountered an error.'
+        })
 
         st.rerun()
 
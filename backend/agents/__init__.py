@@ -9,6 +9,7 @@ This module provides specialized agents for different aspects of procurement bri
 - RecommendationAgent: Strategic recommendations with business justification
 - MarketIntelligenceAgent: Market context, regional insights, cost drivers
 - BriefOrchestrator: Coordinates all agents to generate complete briefs
+- StagePipeline: Runs agent stages as a dependency DAG (concurrently where possible)
 
 Source Priority:
 1. Verified Sources (RAG/FAISS) - cite as [SOURCE-N]
@@ -45,6 +46,7 @@ from .data_analysis_agent import DataAnalysisAgent
 from .risk_assessment_agent import RiskAssessmentAgent
 from .recommendation_agent import RecommendationAgent
 from .market_intelligence_agent import MarketIntelligenceAgent
+from .stage_pipeline import StagePipeline, PipelineStage, PipelineAborted, PipelineError
 from .brief_orchestrator import BriefOrchestrator
 
 __all__ = [
@@ -53,5 +55,9 @@ __all__ = [
     'RiskAssessmentAgent',
     'RecommendationAgent',
     'MarketIntelligenceAgent',
-    'BriefOrchestrator'
+    'BriefOrchestrator',
+    'StagePipeline',
+    'PipelineStage',
+    'PipelineAborted',
+    'PipelineError'
 ]
@@ -6,7 +6,8 @@ Provides:
 - Web search fallback when RAG has low confidence
 - LLM integration with strict grounding
 - Data access utilities
-- Standard prompt building
+- Standard prompt building within per-section token budgets
+- Tracing spans around execute(), RAG and web lookups
 
 Source Priority:
 1. Verified Sources (RAG/FAISS) - Internal knowledge base
@@ -23,6 +24,8 @@ if str(root_path) not in sys.path:
     sys.path.insert(0, str(root_path))
 
 from backend.engines.web_search_engine import WebSearchEngine
+from backend.engines.prompt_compiler import PromptCompiler
+from backend.engines import tracing
 
 
 class BaseAgent(ABC):
@@ -49,6 +52,9 @@ class BaseAgent(ABC):
     # Minimum confidence threshold for using LLM (vs template fallback)
     DEFAULT_CONFIDENCE_THRESHOLD = 0.4
 
+    # Knowledge base chunks retrieved to ground generate_with_llm prompts
+    GROUNDING_RAG_K = 5
+
     def __init__(
         self,
         llm_engine=None,
@@ -79,10 +85,19 @@ class BaseAgent(ABC):
         # Initialize web search engine for fallback
         self.web_search_engine = WebSearchEngine() if enable_web_search else None
 
+        # Token budgets for RAG chunks, web snippets and data sections
+        self.prompt_compiler = PromptCompiler(model=getattr(llm_engine, 'model', None))
+
         # Track sources used in generation for traceability
         self._sources_used = []
         self._web_sources_used = []
 
+    def __init_subclass__(cls, **kwargs):
+        """Run each agent's execute() inside an 'agent.<ClassName>' span"""
+        super().__init_subclass__(**kwargs)
+        if 'execute' in cls.__dict__:
+            cls.execute = tracing.traced(f"agent.{cls.__name__}")(cls.__dict__['execute'])
+
     @property
     @abstractmethod
     def agent_name(self) -> str:
@@ -102,6 +117,7 @@ class BaseAgent(ABC):
         """
         pass
 
+    @tracing.traced('rag.context')
     def get_rag_context(
         self,
         query: str,
@@ -129,6 +145,7 @@ class BaseAgent(ABC):
 
         try:
             results = self.vector_store.search(query=query, k=k)
+            tracing.current_span().set_attribute('results', len(results or []))
 
             if not results:
                 return {
@@ -144,7 +161,8 @@ class BaseAgent(ABC):
             sources = []
             citations = []
 
-            for i, result in enumerate(results, 1):
+            # Best-scoring chunks first, within the RAG token budget
+            for i, result in enumerate(self.prompt_compiler.fit_rag(results), 1):
                 metadata = result.get('metadata', {})
                 source_file = metadata.get('file_name', metadata.get('source', 'knowledge_base'))
                 source_category = result.get('category', metadata.get('category', 'general'))
@@ -158,6 +176,7 @@ class BaseAgent(ABC):
                     'citation_id': citation_id,
                     'file_name': source_file,
                     'category': source_category,
+                    'section': metadata.get('section', ''),
                     'relevance_score': score,
                     'excerpt': content[:200] + '...' if len(content) > 200 else content
                 })
@@ -173,6 +192,7 @@ class BaseAgent(ABC):
 
             # Track sources for this generation
             self._sources_used = sources
+            tracing.current_span().set_attributes(kept=len(sources), confidence=round(confidence, 2))
 
             return {
                 'context': "\n\n".join(context_parts),
@@ -194,6 +214,7 @@ class BaseAgent(ABC):
                 'source_type': 'none'
             }
 
+    @tracing.traced('web.context')
     def get_web_context(
         self,
         query: str,
@@ -249,24 +270,29 @@ class BaseAgent(ABC):
                     'reason': result.get('error', 'Web search failed')
                 }
 
-            # Format sources for tracking
+            # Format sources for tracking (snippets truncated to the web token budget)
             web_sources = []
-            for r in result.get('results', []):
+            context_parts = []
+            citations = []
+            for i, r in enumerate(self.prompt_compiler.fit_web(result.get('results', [])), 1):
                 web_sources.append({
                     'title': r.get('title', ''),
                     'url': r.get('url', ''),
                     'snippet': r.get('snippet', ''),
                     'source_type': 'internet'
                 })
+                context_parts.append(f"[WEB-{i}] {r.get('title', '')}\n{r.get('snippet', '')}\nSource: {r.get('url', '')}")
+                citations.append(f"[WEB-{i}]: {r.get('url', '')}")
 
             # Track web sources used
             self._web_sources_used = web_sources
+            tracing.current_span().set_attribute('results', len(web_sources))
 
             return {
-                'context': result.get('context', ''),
+                'context': "\n\n".join(context_parts),
                 'sources': web_sources,
                 'success': True,
-                'source_citations': result.get('sources', ''),
+                'source_citations': "\n".join(citations),
                 'source_type': 'internet'
             }
 
@@ -351,7 +377,8 @@ class BaseAgent(ABC):
         task_instruction: str,
         rag_query: Optional[str] = None,
         fallback_generator: callable = None,
-        category: Optional[str] = None
+        category: Optional[str] = None,
+        semantic_cache: bool = True
     ) -> Dict[str, Any]:
         """
         Generate content using LLM with strict grounding.
@@ -364,6 +391,9 @@ class BaseAgent(ABC):
             rag_query: Optional query for RAG/web context
             fallback_generator: Function to call if LLM fails
             category: Optional category for better web search
+            semantic_cache: Allow serving a response cached for a near-duplicate
+                            prompt of the same category (pass False when exact
+                            numbers matter; needs category)
 
         Returns:
             Dict with:
@@ -376,7 +406,7 @@ class BaseAgent(ABC):
         # Attempt context retrieval with fallback (RAG -> Web Search)
         context_result = None
         if rag_query and (self.enable_rag or self.enable_web_search):
-            context_result = self.get_context_with_fallback(rag_query, category)
+            context_result = self.get_context_with_fallback(rag_query, category, self.GROUNDING_RAG_K)
 
         # Check if we should use LLM
         has_context = context_result and (
@@ -415,9 +445,20 @@ class BaseAgent(ABC):
         try:
             # Build strictly grounded prompt (handles both verified and web sources)
             prompt = self._build_grounded_prompt(data_section, context_result, task_instruction)
-
-            # Generate with LLM
-            response = self.llm_engine._generate_openai(prompt)
+            token_report = self.prompt_compiler.report(prompt, task=task_instruction)
+
+            # Generate with LLM (or reuse a near-duplicate prompt's response)
+            cache = self._get_semantic_cache() if semantic_cache and category else None
+            cache_namespace = f"{self.agent_name}:{category}"
+            rag_context = context_result.get('context', '') if context_result else ''
+            response = (
+                cache.lookup(cache_namespace, task_instruction, data_section, context=rag_context)
+                if cache else None
+            )
+            if response is None:
+                response = self.llm_engine._generate_openai(prompt)
+                if cache and not self._is_llm_refusal(response):
+                    cache.add(cache_namespace, task_instruction, data_section, response, context=rag_context)
 
             # Check for refusal
             if self._is_llm_refusal(response):
@@ -454,7 +495,8 @@ class BaseAgent(ABC):
                 'sources': sources,
                 'source_type': source_type,
                 'used_web_fallback': context_result.get('used_web_fallback', False) if context_result else False,
-                'confidence': context_result.get('confidence', 0.0) if context_result else 0.0
+                'confidence': context_result.get('confidence', 0.0) if context_result else 0.0,
+                'prompt_tokens': token_report
             }
 
         except Exception as e:
@@ -477,6 +519,11 @@ class BaseAgent(ABC):
                 'reason': f'LLM error: {str(e)}'
             }
 
+    def _get_semantic_cache(self):
+        """Shared semantic prompt cache, or None unless enabled with embeddings available"""
+        from backend.engines.semantic_cache import get_semantic_cache
+        return get_semantic_cache(self.vector_store)
+
     def _build_grounded_prompt(
         self,
         data_section: str,
@@ -546,7 +593,7 @@ Focus ONLY on analyzing the DATA SECTION below.
 {knowledge_section}
 
 DATA SECTION (PRIMARY SOURCE - all numbers from here):
-{data_section}
+{self.prompt_compiler.fit_data(data_section)}
 
 TASK:
 {task_instruction}
@@ -10,7 +10,8 @@ Responsibilities:
 
 import sys
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from contextlib import nullcontext
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 import pandas as pd
 
@@ -18,24 +19,30 @@ root_path = Path(__file__).parent.parent.parent
 if str(root_path) not in sys.path:
     sys.path.insert(0, str(root_path))
 
+from backend.agents.base_agent import BaseAgent
 from backend.agents.data_analysis_agent import DataAnalysisAgent
 from backend.agents.risk_assessment_agent import RiskAssessmentAgent
 from backend.agents.recommendation_agent import RecommendationAgent
 from backend.agents.market_intelligence_agent import MarketIntelligenceAgent
+from backend.agents.stage_pipeline import (
+    StagePipeline, PipelineStage, PipelineAborted, ENABLE_PARALLEL_AGENTS, AGENT_MAX_WORKERS
+)
 
 
 class BriefOrchestrator:
     """
     Orchestrates microagents to generate comprehensive procurement briefs.
 
-    Architecture:
+    Architecture (stage DAG, independent stages run concurrently):
     1. DataAnalysisAgent analyzes spend data
-    2. RiskAssessmentAgent evaluates risks
-    3. MarketIntelligenceAgent provides market context
-    4. RecommendationAgent generates strategic recommendations
+    2. RiskAssessmentAgent evaluates risks        (after 1)
+    3. MarketIntelligenceAgent provides market context (after 1)
+    4. RecommendationAgent generates strategic recommendations (after 2, 3)
     5. Orchestrator combines outputs into complete brief
 
     All agents share RAG and LLM capabilities for consistent grounding.
+    The agents' RAG lookups for a brief are prefetched in one batched
+    search before the pipeline starts.
     """
 
     def __init__(
@@ -46,7 +53,9 @@ class BriefOrchestrator:
         vector_store=None,
         enable_llm: bool = True,
         enable_rag: bool = True,
-        enable_web_search: bool = True
+        enable_web_search: bool = True,
+        parallel_stages: bool = None,
+        max_workers: int = None
     ):
         """
         Initialize orchestrator with all required components.
@@ -59,6 +68,8 @@ class BriefOrchestrator:
             enable_llm: Enable LLM across all agents
             enable_rag: Enable RAG across all agents
             enable_web_search: Enable web search fallback when RAG has low confidence
+            parallel_stages: Run independent agent stages concurrently (default: ENABLE_PARALLEL_AGENTS)
+            max_workers: Thread pool size for agent stages (default: AGENT_MAX_WORKERS)
         """
         self.data_loader = data_loader
         self.rule_engine = rule_engine
@@ -67,6 +78,8 @@ class BriefOrchestrator:
         self.enable_llm = enable_llm
         self.enable_rag = enable_rag
         self.enable_web_search = enable_web_search
+        self.parallel_stages = ENABLE_PARALLEL_AGENTS if parallel_stages is None else parallel_stages
+        self.max_workers = max_workers or AGENT_MAX_WORKERS
 
         # Initialize agents with shared LLM, RAG, and web search
         self.data_agent = DataAnalysisAgent(
@@ -113,13 +126,14 @@ class BriefOrchestrator:
         """
         Generate Incumbent Concentration Brief using microagent pipeline.
 
-        Pipeline:
+        Pipeline (stages run as soon as their inputs are ready):
         1. Load and validate data
         2. DataAnalysisAgent: Analyze spend concentration
+           (alternate supplier search runs alongside)
         3. RiskAssessmentAgent: Evaluate risks
-        4. MarketIntelligenceAgent: Get market context
+        4. MarketIntelligenceAgent: Get market context (concurrent with 3)
         5. RecommendationAgent: Generate strategy
-        6. Combine into final brief
+        6. Combine into final brief, with per-stage timings
 
         Args:
             client_id: Client identifier
@@ -128,91 +142,21 @@ class BriefOrchestrator:
         Returns:
             Complete brief dictionary
         """
-        # Step 1: Load and validate data
-        spend_df, supplier_df, resolved_info = self._load_data(client_id, category)
-
-        if spend_df is None or spend_df.empty:
-            return self._empty_brief_response(
-                resolved_info.get('error', 'No spend data found')
-            )
-
-        # Update category from resolved hierarchy
-        hierarchy = resolved_info.get('hierarchy', {})
-        resolved_sector = hierarchy.get('sector')
-        resolved_category = hierarchy.get('category')
-        if hierarchy.get('subcategory'):
-            category = hierarchy['subcategory']
-        elif hierarchy.get('category'):
-            category = hierarchy['category']
-
-        # Step 2: Data Analysis
-        data_context = {
-            'spend_df': spend_df,
-            'supplier_df': supplier_df,
-            'category': category,
-            'client_id': client_id
-        }
-        data_analysis = self.data_agent.execute(data_context)
-
-        if not data_analysis.get('success', False):
-            return self._empty_brief_response(
-                data_analysis.get('error', 'Data analysis failed')
-            )
-
-        # Find alternate suppliers
-        alternate_suppliers = self.data_agent.find_alternate_suppliers(
-            spend_df, supplier_df, category
-        )
+        scope = self._prepare_scope(client_id, category)
+        if 'error' in scope:
+            return self._empty_brief_response(scope['error'])
 
-        # Step 3: Risk Assessment
-        risk_context = {
-            'data_analysis': data_analysis,
-            'rule_engine': self.rule_engine,
-            'client_id': client_id,
-            'category': category
-        }
-        risk_assessment = self.risk_agent.execute(risk_context)
-
-        # Step 4: Market Intelligence
-        supplier_analysis = data_analysis.get('supplier_analysis', {})
-        regional_analysis = data_analysis.get('regional_analysis', {})
-
-        all_regions = (
-            supplier_analysis.get('dominant_countries', []) +
-            regional_analysis.get('all_countries', []) +
-            alternate_suppliers.get('alternate_regions', [])
-        )
-
-        market_context = {
-            'category': category,
-            'product_category': alternate_suppliers.get('product_category'),
-            'regions': list(set(all_regions))
-        }
-        market_intel = self.market_agent.execute(market_context)
-
-        # Step 5: Generate Recommendations
-        recommendation_context = {
-            'data_analysis': data_analysis,
-            'risk_assessment': risk_assessment,
-            'alternate_suppliers': alternate_suppliers,
-            'industry_config': market_intel.get('industry_config', {}),
-            'category': category
-        }
-        recommendations = self.recommendation_agent.execute(recommendation_context)
-
-        # Step 6: Assemble Final Brief
-        brief = self._assemble_incumbent_brief(
-            data_analysis=data_analysis,
-            risk_assessment=risk_assessment,
-            market_intel=market_intel,
-            recommendations=recommendations,
-            alternate_suppliers=alternate_suppliers,
-            category=category,
-            resolved_sector=resolved_sector,
-            resolved_category=resolved_category,
-            client_id=client_id
+        pipeline = self._build_pipeline(
+            self._shared_stages(scope) + self._incumbent_stages(scope)
         )
-
+        try:
+            with self._prefetch_rag(scope, incumbent=True):
+                results = pipeline.run()
+        except PipelineAborted as e:
+            return self._empty_brief_response(e.reason)
+
+        brief = results['incumbent_brief']
+        brief['stage_timings'] = pipeline.timing_report()
         return brief
 
     def generate_regional_concentration_brief(
@@ -232,120 +176,339 @@ class BriefOrchestrator:
         Returns:
             Complete brief dictionary
         """
-        # Step 1: Load and validate data
-        spend_df, supplier_df, resolved_info = self._load_data(client_id, category)
-
-        if spend_df is None or spend_df.empty:
-            return self._empty_brief_response(
-                resolved_info.get('error', 'No spend data found')
-            )
-
-        # Update category from resolved hierarchy
-        hierarchy = resolved_info.get('hierarchy', {})
-        resolved_sector = hierarchy.get('sector')
-        resolved_category = hierarchy.get('category')
-        if hierarchy.get('subcategory'):
-            category = hierarchy['subcategory']
-        elif hierarchy.get('category'):
-            category = hierarchy['category']
-
-        # Step 2: Data Analysis
-        data_context = {
-            'spend_df': spend_df,
-            'supplier_df': supplier_df,
-            'category': category,
-            'client_id': client_id
-        }
-        data_analysis = self.data_agent.execute(data_context)
-
-        if not data_analysis.get('success', False):
-            return self._empty_brief_response(
-                data_analysis.get('error', 'Data analysis failed')
-            )
-
-        # Step 3: Risk Assessment
-        risk_context = {
-            'data_analysis': data_analysis,
-            'rule_engine': self.rule_engine,
-            'client_id': client_id,
-            'category': category
-        }
-        risk_assessment = self.risk_agent.execute(risk_context)
-
-        # Step 4: Market Intelligence
-        regional_analysis = data_analysis.get('regional_analysis', {})
-        market_context = {
-            'category': category,
-            'product_category': None,
-            'regions': regional_analysis.get('all_countries', [])
-        }
-        market_intel = self.market_agent.execute(market_context)
-
-        # Step 5: Generate Target Allocation
-        total_spend = data_analysis.get('total_spend', 0)
-        country_pct = regional_analysis.get('country_pct', {})
-
-        # Convert to dict if Series
-        if hasattr(country_pct, 'to_dict'):
-            country_dist = country_pct.to_dict()
-        else:
-            country_dist = dict(country_pct) if country_pct else {}
+        scope = self._prepare_scope(client_id, category)
+        if 'error' in scope:
+            return self._empty_brief_response(scope['error'])
 
-        target_allocation = self.recommendation_agent.generate_target_allocation(
-            total_spend, country_dist
+        pipeline = self._build_pipeline(
+            self._shared_stages(scope) + self._regional_stages(scope)
         )
-
-        # Step 6: Generate Recommendations
-        alternate_suppliers = {}  # Regional brief doesn't focus on specific alternates
-        recommendation_context = {
-            'data_analysis': data_analysis,
-            'risk_assessment': risk_assessment,
-            'alternate_suppliers': alternate_suppliers,
-            'industry_config': market_intel.get('industry_config', {}),
-            'category': category
-        }
-        recommendations = self.recommendation_agent.execute(recommendation_context)
-
-        # Step 7: Assemble Final Brief
-        brief = self._assemble_regional_brief(
-            data_analysis=data_analysis,
-            risk_assessment=risk_assessment,
-            market_intel=market_intel,
-            recommendations=recommendations,
-            target_allocation=target_allocation,
-            category=category,
-            resolved_sector=resolved_sector,
-            resolved_category=resolved_category,
-            client_id=client_id
-        )
-
+        try:
+            with self._prefetch_rag(scope, regional=True):
+                results = pipeline.run()
+        except PipelineAborted as e:
+            return self._empty_brief_response(e.reason)
+
+        brief = results['regional_brief']
+        brief['stage_timings'] = pipeline.timing_report()
         return brief
 
     def generate_both_briefs(
         self,
         client_id: str,
-        category: str = None
+        category: str = None,
+        shared_analysis: bool = True
     ) -> Dict[str, Any]:
         """
         Generate both incumbent and regional concentration briefs.
 
+        In shared-analysis mode data loading, DataAnalysisAgent and
+        RiskAssessmentAgent run once for both briefs; only the
+        brief-specific stages (market context, recommendations, assembly)
+        fan out, and the two briefs are assembled concurrently.
+
         Args:
             client_id: Client identifier
             category: Category filter
+            shared_analysis: Compute shared stages once (False runs the
+                             two pipelines independently)
 
         Returns:
             Dictionary with both briefs
         """
-        incumbent_brief = self.generate_incumbent_concentration_brief(client_id, category)
-        regional_brief = self.generate_regional_concentration_brief(client_id, category)
+        if not shared_analysis:
+            incumbent_brief = self.generate_incumbent_concentration_brief(client_id, category)
+            regional_brief = self.generate_regional_concentration_brief(client_id, category)
+            stage_timings = None
+        else:
+            incumbent_brief, regional_brief, stage_timings = self._generate_both_shared(
+                client_id, category
+            )
 
-        return {
+        result = {
             'incumbent_concentration_brief': incumbent_brief,
             'regional_concentration_brief': regional_brief,
             'generated_at': datetime.now().isoformat(),
             'client_id': client_id,
             'category': category
         }
+        if stage_timings is not None:
+            result['stage_timings'] = stage_timings
+        return result
+
+    def _generate_both_shared(self, client_id: str, category: str = None) -> tuple:
+        """Run one combined pipeline producing both briefs."""
+        scope = self._prepare_scope(client_id, category)
+        if 'error' in scope:
+            error_brief = self._empty_brief_response(scope['error'])
+            return error_brief, dict(error_brief), None
+
+        pipeline = self._build_pipeline(
+            self._shared_stages(scope) +
+            self._incumbent_stages(scope) +
+            self._regional_stages(scope)
+        )
+        try:
+            with self._prefetch_rag(scope, incumbent=True, regional=True):
+                results = pipeline.run()
+        except PipelineAborted as e:
+            error_brief = self._empty_brief_response(e.reason)
+            return error_brief, dict(error_brief), None
+
+        stage_timings = pipeline.timing_report()
+        incumbent_brief = results['incumbent_brief']
+        regional_brief = results['regional_brief']
+        incumbent_brief['stage_timings'] = stage_timings
+        regional_brief['stage_timings'] = stage_timings
+        return incumbent_brief, regional_brief, stage_timings
+
+    # =========================================================================
+    # PIPELINE STAGES
+    # =========================================================================
+
+    def _prepare_scope(self, client_id: str, category: str = None) -> Dict[str, Any]:
+        """
+        Load and resolve data shared by every stage.
+
+        Returns a dict with 'error' set when there is nothing to analyze.
+        """
+        spend_df, supplier_df, resolved_info = self._load_data(client_id, category)
+
+        if spend_df is None or spend_df.empty:
+            return {'error': resolved_info.get('error', 'No spend data found')}
+
+        # Update category from resolved hierarchy
+        hierarchy = resolved_info.get('hierarchy', {})
+        if hierarchy.get('subcategory'):
+            category = hierarchy['subcategory']
+        elif hierarchy.get('category'):
+            category = hierarchy['category']
+
+        return {
+            'client_id': client_id,
+            'category': category,
+            'resolved_sector': hierarchy.get('sector'),
+            'resolved_category': hierarchy.get('category'),
+            'spend_df': spend_df,
+            'supplier_df': supplier_df,
+            'spend_cube': self._get_spend_cube(),
+            'spend_filters': resolved_info.get('filters')
+        }
+
+    def _shared_stages(self, scope: Dict[str, Any]) -> List[PipelineStage]:
+        """Stages both briefs depend on: data analysis and risk assessment."""
+        category = scope['category']
+        client_id = scope['client_id']
+
+        def data_stage(_):
+            data_context = {
+                'spend_df': scope['spend_df'],
+                'supplier_df': scope['supplier_df'],
+                'category': category,
+                'client_id': client_id,
+                'spend_cube': scope['spend_cube'],
+                'spend_filters': scope['spend_filters']
+            }
+            data_analysis = self.data_agent.execute(data_context)
+            if not data_analysis.get('success', False):
+                raise PipelineAborted(
+                    'data_analysis', data_analysis.get('error', 'Data analysis failed')
+                )
+            return data_analysis
+
+        def risk_stage(inputs):
+            risk_context = {
+                'data_analysis': inputs['data_analysis'],
+                'rule_engine': self.rule_engine,
+                'client_id': client_id,
+                'category': category
+            }
+            return self.risk_agent.execute(risk_context)
+
+        return [
+            PipelineStage('data_analysis', data_stage),
+            PipelineStage('risk_assessment', risk_stage, depends_on=['data_analysis'])
+        ]
+
+    def _incumbent_stages(self, scope: Dict[str, Any]) -> List[PipelineStage]:
+        """Incumbent-brief stages: alternates, market context, strategy, assembly."""
+        category = scope['category']
+
+        def alternates_stage(_):
+            return self.data_agent.find_alternate_suppliers(
+                scope['spend_df'], scope['supplier_df'], category
+            )
+
+        def market_stage(inputs):
+            data_analysis = inputs['data_analysis']
+            alternate_suppliers = inputs['alternate_suppliers']
+            supplier_analysis = data_analysis.get('supplier_analysis', {})
+            regional_analysis = data_analysis.get('regional_analysis', {})
+
+            all_regions = (
+                supplier_analysis.get('dominant_countries', []) +
+                regional_analysis.get('all_countries', []) +
+                alternate_suppliers.get('alternate_regions', [])
+            )
+
+            market_context = {
+                'category': category,
+                'product_category': alternate_suppliers.get('product_category'),
+                'regions': list(set(all_regions))
+            }
+            return self.market_agent.execute(market_context)
+
+        def recommendation_stage(inputs):
+            recommendation_context = {
+                'data_analysis': inputs['data_analysis'],
+                'risk_assessment': inputs['risk_assessment'],
+                'alternate_suppliers': inputs['alternate_suppliers'],
+                'industry_config': inputs['incumbent_market_intel'].get('industry_config', {}),
+                'category': category
+            }
+            return self.recommendation_agent.execute(recommendation_context)
+
+        def assembly_stage(inputs):
+            return self._assemble_incumbent_brief(
+                data_analysis=inputs['data_analysis'],
+                risk_assessment=inputs['risk_assessment'],
+                market_intel=inputs['incumbent_market_intel'],
+                recommendations=inputs['incumbent_recommendations'],
+                alternate_suppliers=inputs['alternate_suppliers'],
+                category=category,
+                resolved_sector=scope['resolved_sector'],
+                resolved_category=scope['resolved_category'],
+                client_id=scope['client_id']
+            )
+
+        return [
+            PipelineStage('alternate_suppliers', alternates_stage),
+            PipelineStage(
+                'incumbent_market_intel', market_stage,
+                depends_on=['data_analysis', 'alternate_suppliers']
+            ),
+            PipelineStage(
+                'incumbent_recommendations', recommendation_stage,
+                depends_on=['data_analysis', 'risk_assessment', 'alternate_suppliers', 'incumbent_market_intel']
+            ),
+            PipelineStage(
+                'incumbent_brief', assembly_stage,
+                depends_on=[
+                    'data_analysis', 'risk_assessment', 'alternate_suppliers',
+                    'incumbent_market_intel', 'incumbent_recommendations'
+                ]
+            )
+        ]
+
+    def _regional_stages(self, scope: Dict[str, Any]) -> List[PipelineStage]:
+        """Regional-brief stages: market context, target allocation, strategy, assembly."""
+        category = scope['category']
+
+        def market_stage(inputs):
+            regional_analysis = inputs['data_analysis'].get('regional_analysis', {})
+            market_context = {
+                'category': category,
+                'product_category': None,
+                'regions': regional_analysis.get('all_countries', [])
+            }
+            return self.market_agent.execute(market_context)
+
+        def allocation_stage(inputs):
+            data_analysis = inputs['data_analysis']
+            total_spend = data_analysis.get('total_spend', 0)
+            country_pct = data_analysis.get('regional_analysis', {}).get('country_pct', {})
+
+            # Convert to dict if Series
+            if hasattr(country_pct, 'to_dict'):
+                country_dist = country_pct.to_dict()
+            else:
+                country_dist = dict(country_pct) if country_pct else {}
+
+            return self.recommendation_agent.generate_target_allocation(
+                total_spend, country_dist
+            )
+
+        def recommendation_stage(inputs):
+            recommendation_context = {
+                'data_analysis': inputs['data_analysis'],
+                'risk_assessment': inputs['risk_assessment'],
+                'alternate_suppliers': {},  # Regional brief doesn't focus on specific alternates
+                'industry_config': inputs['regional_market_intel'].get('industry_config', {}),
+                'category': category
+            }
+            return self.recommendation_agent.execute(recommendation_context)
+
+        def assembly_stage(inputs):
+            return self._assemble_regional_brief(
+                data_analysis=inputs['data_analysis'],
+                risk_assessment=inputs['risk_assessment'],
+                market_intel=inputs['regional_market_intel'],
+                recommendations=inputs['regional_recommendations'],
+                target_allocation=inputs['target_allocation'],
+                category=category,
+                resolved_sector=scope['resolved_sector'],
+                resolved_category=scope['resolved_category'],
+                client_id=scope['client_id']
+            )
+
+        return [
+            PipelineStage('regional_market_intel', market_stage, depends_on=['data_analysis']),
+            PipelineStage('target_allocation', allocation_stage, depends_on=['data_analysis']),
+            PipelineStage(
+                'regional_recommendations', recommendation_stage,
+                depends_on=['data_analysis', 'risk_assessment', 'regional_market_intel']
+            ),
+            PipelineStage(
+                'regional_brief', assembly_stage,
+                depends_on=[
+                    'data_analysis', 'risk_assessment', 'regional_market_intel',
+                    'regional_recommendations', 'target_allocation'
+                ]
+            )
+        ]
+
+    def _rag_queries(
+        self,
+        scope: Dict[str, Any],
+        incumbent: bool = False,
+        regional: bool = False
+    ) -> List[Tuple[str, int]]:
+        """(query, k) of every agent RAG lookup the requested briefs will make."""
+        category = scope['category']
+        queries = [
+            (RiskAssessmentAgent.RAG_QUERY, RiskAssessmentAgent.RAG_K),
+            (RecommendationAgent.RAG_QUERY, RecommendationAgent.RAG_K)
+        ]
+        if incumbent:
+            product_category = self.data_agent.infer_product_category(scope['spend_df'], scope['supplier_df'])
+            queries.append(
+                (MarketIntelligenceAgent.rag_query(category, product_category), MarketIntelligenceAgent.RAG_K)
+            )
+        if regional:
+            queries.append((MarketIntelligenceAgent.rag_query(category), MarketIntelligenceAgent.RAG_K))
+        # generate_with_llm searches each query again for its grounding context
+        return queries + [(query, BaseAgent.GROUNDING_RAG_K) for query, _ in queries]
+
+    def _prefetch_rag(self, scope: Dict[str, Any], incumbent: bool = False, regional: bool = False):
+        """Context in which the agents' RAG searches are served from one batched search."""
+        if not (self.enable_llm and self.enable_rag) or not hasattr(self.vector_store, 'prefetch'):
+            return nullcontext()
+        try:
+            queries = self._rag_queries(scope, incumbent=incumbent, regional=regional)
+        except Exception as e:
+            print(f"[WARN] Could not build RAG prefetch queries: {e}")
+            return nullcontext()
+        return self.vector_store.prefetch(queries)
+
+    def _build_pipeline(self, stages: List[PipelineStage]) -> StagePipeline:
+        """Stage pipeline honouring the orchestrator's concurrency settings."""
+        return StagePipeline(stages, max_workers=self.max_workers, parallel=self.parallel_stages)
+
+    def _get_spend_cube(self):
+        """Pre-aggregated spend cube from the data loader, if supported."""
+        if self.data_loader and hasattr(self.data_loader, 'get_spend_cube'):
+            return self.data_loader.get_spend_cube()
+        return None
 
     def _load_data(
         self,
@@ -374,6 +537,7 @@ class BriefOrchestrator:
             spend_df = spend_df[spend_df['Client_ID'] == client_id]
             if not spend_df.empty and 'Sector' in spend_df.columns:
                 resolved_info['hierarchy'] = {'sector': spend_df['Sector'].iloc[0]}
+            resolved_info['filters'] = {'Client_ID': client_id}
         else:
             spend_df = pd.DataFrame()
 
@@ -20,6 +20,7 @@ if str(root_path) not in sys.path:
     sys.path.insert(0, str(root_path))
 
 from backend.agents.base_agent import BaseAgent
+from backend.engines.supplier_extraction import extract_supplier_profiles
 
 
 class DataAnalysisAgent(BaseAgent):
@@ -49,6 +50,9 @@ class DataAnalysisAgent(BaseAgent):
                 - supplier_df: DataFrame with supplier master data
                 - category: Category being analyzed
                 - client_id: Client identifier
+                - spend_cube: Optional pre-aggregated SpendCube
+                - spend_filters: Cube filters describing spend_df (required
+                  for the cube to be used)
 
         Returns:
             Dictionary with analysis results
@@ -56,6 +60,10 @@ class DataAnalysisAgent(BaseAgent):
         spend_df = context.get('spend_df')
         supplier_df = context.get('supplier_df', pd.DataFrame())
         category = context.get('category', 'Procurement')
+        spend_cube = context.get('spend_cube')
+        spend_filters = context.get('spend_filters')
+        if spend_cube is None or not spend_filters:
+            spend_cube, spend_filters = None, None
 
         if spend_df is None or spend_df.empty:
             return {
@@ -66,20 +74,28 @@ class DataAnalysisAgent(BaseAgent):
 
         try:
             # Calculate all metrics
-            total_spend = spend_df['Spend_USD'].sum()
+            if spend_cube is not None:
+                total_spend = spend_cube.totals(spend_filters)['total_spend']
+            else:
+                total_spend = spend_df['Spend_USD'].sum()
 
             # Supplier concentration analysis
-            supplier_analysis = self._analyze_supplier_concentration(spend_df, total_spend)
+            supplier_analysis = self._analyze_supplier_concentration(
+                spend_df, total_spend, spend_cube, spend_filters
+            )
 
             # Regional concentration analysis
-            regional_analysis = self._analyze_regional_concentration(spend_df, total_spend)
+            regional_analysis = self._analyze_regional_concentration(
+                spend_df, total_spend, spend_cube, spend_filters
+            )
 
             # HHI calculation
             hhi = self._calculate_hhi(supplier_analysis['supplier_spend_pct'])
 
             # Supplier performance (if master data available) with web fallback
             performance_metrics = self._calculate_performance_metrics(
-                spend_df, supplier_df, category
+                spend_df, supplier_df, category,
+                supplier_spend_totals=supplier_analysis['supplier_spend']
             )
 
             # Tail spend analysis
@@ -107,14 +123,28 @@ class DataAnalysisAgent(BaseAgent):
                 'metrics': {}
             }
 
+    def _spend_by(
+        self,
+        spend_df: pd.DataFrame,
+        column: str,
+        spend_cube=None,
+        spend_filters: Optional[Dict[str, Any]] = None
+    ) -> pd.Series:
+        """Total spend per value of a column, read from the spend cube when available."""
+        if spend_cube is not None and spend_filters:
+            return spend_cube.spend_by(column, spend_filters)
+        return spend_df.groupby(column)['Spend_USD'].sum()
+
     def _analyze_supplier_concentration(
         self,
         spend_df: pd.DataFrame,
-        total_spend: float
+        total_spend: float,
+        spend_cube=None,
+        spend_filters: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """Analyze supplier concentration."""
         # Aggregate spend by supplier
-        supplier_spend = spend_df.groupby('Supplier_Name')['Spend_USD'].sum()
+        supplier_spend = self._spend_by(spend_df, 'Supplier_Name', spend_cube, spend_filters)
         supplier_spend_pct = (supplier_spend / total_spend * 100).round(2)
         supplier_spend_sorted = supplier_spend_pct.sort_values(ascending=False)
 
@@ -159,17 +189,19 @@ class DataAnalysisAgent(BaseAgent):
     def _analyze_regional_concentration(
         self,
         spend_df: pd.DataFrame,
-        total_spend: float
+        total_spend: float,
+        spend_cube=None,
+        spend_filters: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """Analyze regional concentration."""
         # Country-level analysis
-        country_spend = spend_df.groupby('Supplier_Country')['Spend_USD'].sum()
+        country_spend = self._spend_by(spend_df, 'Supplier_Country', spend_cube, spend_filters)
         country_pct = (country_spend / total_spend * 100).round(2)
         country_sorted = country_pct.sort_values(ascending=False)
 
         # Region-level analysis
         if 'Supplier_Region' in spend_df.columns:
-            region_spend = spend_df.groupby('Supplier_Region')['Spend_USD'].sum()
+            region_spend = self._spend_by(spend_df, 'Supplier_Region', spend_cube, spend_filters)
             region_pct = (region_spend / total_spend * 100).round(2)
         else:
             region_spend = country_spend
@@ -238,7 +270,8 @@ class DataAnalysisAgent(BaseAgent):
         self,
         spend_df: pd.DataFrame,
         supplier_df: pd.DataFrame,
-        category: str = None
+        category: str = None,
+        supplier_spend_totals: Optional[pd.Series] = None
     ) -> List[Dict[str, Any]]:
         """
         Calculate supplier performance metrics using Database-First, Web-Fallback pattern.
@@ -247,16 +280,28 @@ class DataAnalysisAgent(BaseAgent):
             spend_df: Spend data DataFrame
             supplier_df: Supplier master DataFrame
             category: Optional category for web search context
+            supplier_spend_totals: Optional precomputed spend per supplier name
             
         Returns:
             List of supplier metrics dictionaries
         """
         metrics = []
         # Calculate total spend per supplier and sort descending
-        supplier_spend_series = spend_df.groupby('Supplier_Name')['Spend_USD'].sum().sort_values(ascending=False)
-        supplier_names = supplier_spend_series.index.tolist()
-
-        for supplier_name in supplier_names[:15]:
+        if supplier_spend_totals is None:
+            supplier_spend_totals = spend_df.groupby('Supplier_Name')['Spend_USD'].sum()
+        supplier_spend_series = supplier_spend_totals.sort_values(ascending=False)
+        supplier_names = supplier_spend_series.index.tolist()[:15]
+
+        # Suppliers without ratings in the spend data or the database are
+        # enriched from the web in one batch
+        web_infos = {}
+        if 'Quality_Rating' not in spend_df.columns and 'Delivery_Rating' not in spend_df.columns:
+            known = set(supplier_df['supplier_name']) if 'supplier_name' in supplier_df.columns else set()
+            unknown = [name for name in supplier_names if name not in known]
+            if unknown:
+                web_infos = self._get_suppliers_info_from_web(unknown, category)
+
+        for supplier_name in supplier_names:
             supplier_spend_data = spend_df[spend_df['Supplier_Name'] == supplier_name]
             supplier_spend = supplier_spend_data['Spend_USD'].sum()
 
@@ -300,8 +345,8 @@ class DataAnalysisAgent(BaseAgent):
                         'data_source': 'database'
                     })
                 else:
-                    # CASE 3: Supplier NOT in database - try web search fallback
-                    web_info = self._get_supplier_info_from_web(supplier_name, category)
+                    # CASE 3: Supplier NOT in database - web search fallback (fetched above)
+                    web_info = web_infos[supplier_name]
                     
                     metrics.append({
                         'supplier': supplier_name,
@@ -317,156 +362,86 @@ class DataAnalysisAgent(BaseAgent):
 
         return metrics
 
-    def _get_supplier_info_from_web(self, supplier_name: str, category: str = None) -> Dict[str, Any]:
+    def _get_suppliers_info_from_web(
+        self,
+        supplier_names: List[str],
+        category: str = None
+    ) -> Dict[str, Dict[str, Any]]:
         """
-        Fetch supplier information from the web when not found in database.
-        
-        This is a FALLBACK mechanism - only called when supplier is NOT in supplier_master.csv
-        Uses LLM (if available) to extract structured info from web search results.
-        
+        Fetch supplier information from the web for suppliers not in the database.
+
+        This is a FALLBACK mechanism - only called for suppliers NOT in supplier_master.csv.
+        Each supplier gets its own web search; the LLM (if available) then extracts
+        structured info for all of them in batched JSON-mode requests.
+
         Args:
-            supplier_name: Name of the supplier to search for
+            supplier_names: Suppliers to search for
             category: Optional category context for better search results
-            
+
         Returns:
-            Dictionary with supplier metrics (estimated from web data) or empty values
+            Supplier name -> metrics (estimated from web data) or empty values
         """
-        if not self.web_search_engine:
+        def empty_info(source: str) -> Dict[str, Any]:
             return {
-                'source': 'not_found',
+                'source': source,
                 'quality_rating': 0,
                 'delivery_reliability': 0,
                 'sustainability_score': 0,
                 'years_in_business': 0,
                 'certifications': []
             }
-        
-        try:
-            # Build search query for supplier
-            query_parts = [supplier_name]
-            if category:
-                query_parts.append(category)
-            query_parts.extend(['company', 'supplier', 'profile'])
-            query = " ".join(query_parts)
-            
-            # Search the web
-            search_result = self.web_search_engine.search(query, num_results=3)
-            
-            if not search_result.get('success') or not search_result.get('results'):
-                return {
-                    'source': 'web_search_failed',
-                    'quality_rating': 0,
-                    'delivery_reliability': 0,
-                    'sustainability_score': 0,
-                    'years_in_business': 0,
-                    'certifications': []
-                }
-            
-            # Extract info using LLM if available
-            sources = search_result.get('results', [])
-            web_context = search_result.get('context', '')
-            
-            if self.llm_engine and self.enable_llm:
-                extracted_info = self._extract_supplier_info_with_llm(
-                    supplier_name, web_context, sources
-                )
-                if extracted_info:
-                    extracted_info['source'] = 'web_search'
-                    extracted_info['web_sources'] = [s.get('url', '') for s in sources[:3]]
-                    return extracted_info
-            
-            # Return basic info with web sources for citation
-            return {
-                'source': 'web_search',
-                'quality_rating': 0,  # Cannot reliably extract without LLM
-                'delivery_reliability': 0,
-                'sustainability_score': 0,
-                'years_in_business': 0,
-                'certifications': [],
-                'web_context': web_context[:500],
-                'web_sources': [s.get('url', '') for s in sources[:3]]
-            }
-            
-        except Exception as e:
-            self.log(f"Web search failed for {supplier_name}: {e}", "WARN")
-            return {
-                'source': 'error',
-                'quality_rating': 0,
-                'delivery_reliability': 0,
-                'sustainability_score': 0,
-                'years_in_business': 0,
-                'certifications': []
-            }
-
-    def _extract_supplier_info_with_llm(
-        self, 
-        supplier_name: str, 
-        web_context: str, 
-        sources: list
-    ) -> Optional[Dict[str, Any]]:
-        """
-        Use LLM to extract structured supplier info from web search results.
-        
-        Args:
-            supplier_name: Name of the supplier
-            web_context: Combined text from web search
-            sources: List of source URLs
-            
-        Returns:
-            Extracted supplier info or None if extraction fails
-        """
-        if not self.llm_engine:
-            return None
-            
-        prompt = f"""Based on the following web search results about "{supplier_name}", extract supplier information.
-
-WEB SEARCH RESULTS:
-{web_context}
-
-INSTRUCTIONS:
-1. Extract ONLY information explicitly mentioned in the search results
-2. If information is not available, use 0 or empty values
-3. Be conservative with ratings - only assign high values if clearly supported
-4. Return a JSON object with these fields:
-   - quality_rating: 0-5 scale (0 if not mentioned)
-   - delivery_reliability: 0-100 percentage (0 if not mentioned)
-   - sustainability_score: 0-100 (0 if not mentioned)
-   - years_in_business: integer (0 if not mentioned)
-   - certifications: list of certification names found (empty list if none)
-   - company_description: brief description if found
 
-Return ONLY valid JSON, no other text."""
+        if not self.web_search_engine:
+            return {name: empty_info('not_found') for name in supplier_names}
+
+        infos: Dict[str, Dict[str, Any]] = {}
+        found: Dict[str, Dict[str, Any]] = {}
+        for supplier_name in supplier_names:
+            try:
+                # Build search query for supplier
+                query_parts = [supplier_name]
+                if category:
+                    query_parts.append(category)
+                query_parts.extend(['company', 'supplier', 'profile'])
+                query = " ".join(query_parts)
+
+                # Search the web
+                search_result = self.web_search_engine.search(query, num_results=3)
+
+                if not search_result.get('success') or not search_result.get('results'):
+                    infos[supplier_name] = empty_info('web_search_failed')
+                else:
+                    found[supplier_name] = search_result
+            except Exception as e:
+                self.log(f"Web search failed for {supplier_name}: {e}", "WARN")
+                infos[supplier_name] = empty_info('error')
+
+        # Extract info for all found suppliers in batched LLM requests
+        extracted: Dict[str, Optional[Dict[str, Any]]] = {}
+        if found and self.llm_engine and self.enable_llm:
+            try:
+                extracted = extract_supplier_profiles(
+                    self.llm_engine,
+                    {name: result.get('context', '') for name, result in found.items()}
+                )
+            except Exception as e:
+                self.log(f"LLM extraction failed for {len(found)} suppliers: {e}", "WARN")
 
-        try:
-            response = self.llm_engine.generate(
-                prompt=prompt,
-                max_tokens=500,
-                temperature=0.1  # Low temperature for structured extraction
-            )
-            
-            if response:
-                import json
-                # Try to parse JSON from response
-                response_text = response.strip()
-                if response_text.startswith('```'):
-                    response_text = response_text.split('```')[1]
-                    if response_text.startswith('json'):
-                        response_text = response_text[4:]
-                    response_text = response_text.strip()
-                
-                extracted = json.loads(response_text)
-                return {
-                    'quality_rating': float(extracted.get('quality_rating', 0)),
-                    'delivery_reliability': float(extracted.get('delivery_reliability', 0)),
-                    'sustainability_score': float(extracted.get('sustainability_score', 0)),
-                    'years_in_business': int(extracted.get('years_in_business', 0)),
-                    'certifications': extracted.get('certifications', []),
-                    'company_description': extracted.get('company_description', '')
+        for supplier_name, search_result in found.items():
+            sources = search_result.get('results', [])
+            web_sources = [s.get('url', '') for s in sources[:3]]
+            extracted_info = extracted.get(supplier_name)
+            if extracted_info:
+                infos[supplier_name] = {**extracted_info, 'source': 'web_search', 'web_sources': web_sources}
+            else:
+                # Return basic info with web sources for citation
+                infos[supplier_name] = {
+                    **empty_info('web_search'),  # Cannot reliably extract without LLM
+                    'web_context': search_result.get('context', '')[:500],
+                    'web_sources': web_sources
                 }
-        except Exception as e:
-            self.log(f"LLM extraction failed for {supplier_name}: {e}", "WARN")
-            
-        return None
+
+        return {name: infos[name] for name in supplier_names}
 
     def _analyze_tail_spend(
         self,
@@ -571,6 +546,18 @@ Return ONLY valid JSON, no other text."""
 
         return indicators
 
+    def infer_product_category(
+        self,
+        spend_df: pd.DataFrame,
+        supplier_df: pd.DataFrame
+    ) -> Optional[str]:
+        """Product category of the current suppliers, as chosen by find_alternate_suppliers."""
+        current_suppliers = set(spend_df['Supplier_Name'].unique())
+        matching_suppliers = supplier_df[supplier_df['supplier_name'].isin(current_suppliers)]
+        if matching_suppliers.empty:
+            return None
+        return matching_suppliers.iloc[0]['product_category']
+
     def find_alternate_suppliers(
         self,
         spend_df: pd.DataFrame,
@@ -202,10 +202,19 @@ class MarketIntelligenceAgent(BaseAgent):
     # Higher confidence threshold for market intelligence (needs good RAG context)
     DEFAULT_CONFIDENCE_THRESHOLD = 0.5
 
+    # Knowledge base chunks retrieved for the market narrative
+    RAG_K = 5
+
     @property
     def agent_name(self) -> str:
         return "MarketIntelligenceAgent"
 
+    @staticmethod
+    def rag_query(category: Optional[str], product_category: Optional[str] = None) -> str:
+        """RAG query for the market narrative (the orchestrator prefetches it)"""
+        cat = product_category or category or 'procurement'
+        return f"market intelligence {cat} regional sourcing supply chain trends"
+
     def execute(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """
         Execute market intelligence generation.
@@ -360,8 +369,7 @@ class MarketIntelligenceAgent(BaseAgent):
         cat = product_category or category or 'procurement'
 
         # Get RAG context for market intelligence
-        rag_query = f"market intelligence {cat} regional sourcing supply chain trends"
-        rag_result = self.get_rag_context(rag_query, k=5)
+        rag_result = self.get_rag_context(self.rag_query(category, product_category), k=self.RAG_K)
 
         # Market intelligence needs strong RAG context to avoid hallucination
         if not rag_result.get('has_strong_context', False):
@@ -400,8 +408,9 @@ TONE: Informative, strategic, evidence-based.
         result = self.generate_with_llm(
             data_section=data_section,
             task_instruction=task_instruction,
-            rag_query=rag_query,
-            fallback_generator=lambda: self._generate_market_context(category, product_category)
+            rag_query=self.rag_query(category, product_category),
+            fallback_generator=lambda: self._generate_market_context(category, product_category),
+            category=cat
         )
 
         if result.get('method') == 'llm':
@@ -33,6 +33,10 @@ class RecommendationAgent(BaseAgent):
     - Business justification narratives
     """
 
+    # RAG lookup for the recommendations narrative (the orchestrator prefetches it)
+    RAG_QUERY = "strategic procurement diversification recommendations supplier management"
+    RAG_K = 4
+
     @property
     def agent_name(self) -> str:
         return "RecommendationAgent"
@@ -492,8 +496,7 @@ class RecommendationAgent(BaseAgent):
             return None
 
         # Get RAG context
-        rag_query = "strategic procurement diversification recommendations supplier management"
-        rag_result = self.get_rag_context(rag_query, k=4)
+        rag_result = self.get_rag_context(self.RAG_QUERY, k=self.RAG_K)
 
         if not rag_result.get('has_strong_context', False):
             self.log("Low RAG confidence - using template recommendations", "INFO")
@@ -532,8 +535,9 @@ IMPORTANT: Cite sources when referencing best practices or industry benchmarks.
         result = self.generate_with_llm(
             data_section=data_section,
             task_instruction=task_instruction,
-            rag_query=rag_query,
-            fallback_generator=None
+            rag_query=self.RAG_QUERY,
+            fallback_generator=None,
+            semantic_cache=False  # Quotes exact figures from the data section
         )
 
         if result.get('method') == 'llm':
@@ -30,6 +30,10 @@ class RiskAssessmentAgent(BaseAgent):
     - LLM-powered risk analysis narrative
     """
 
+    # RAG lookup for the risk narrative (the orchestrator prefetches it)
+    RAG_QUERY = "supply chain risk assessment procurement concentration analysis"
+    RAG_K = 4
+
     @property
     def agent_name(self) -> str:
         return "RiskAssessmentAgent"
@@ -317,8 +321,7 @@ class RiskAssessmentAgent(BaseAgent):
             return None
 
         # Get RAG context for risk analysis
-        rag_query = "supply chain risk assessment procurement concentration analysis"
-        rag_result = self.get_rag_context(rag_query, k=4)
+        rag_result = self.get_rag_context(self.RAG_QUERY, k=self.RAG_K)
 
         if not rag_result.get('has_strong_context', False):
             self.log("Low RAG confidence - using template risk analysis", "INFO")
@@ -364,8 +367,9 @@ IMPORTANT: Cite sources when referencing risk thresholds or best practices.
         result = self.generate_with_llm(
             data_section=data_section,
             task_instruction=task_instruction,
-            rag_query=rag_query,
-            fallback_generator=None
+            rag_query=self.RAG_QUERY,
+            fallback_generator=None,
+            semantic_cache=False  # Quotes exact figures from the data section
         )
 
         if result.get('method') == 'llm':
@@ -0,0 +1,195 @@
+"""
+Stage Pipeline - Dependency-driven execution of agent stages
+
+Brief generation is declared as a DAG of named stages. Each stage runs as
+soon as all of its dependencies have produced results, so independent
+stages (e.g. risk assessment and market intelligence) overlap their
+LLM / RAG / web latency on a thread pool.
+
+Every run reports per-stage timings (offset from pipeline start and
+duration, in milliseconds) for inclusion in the generated brief.
+"""
+
+import time
+import contextvars
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Dict, Any, List, Callable, Iterable, Optional
+
+from backend.engines import tracing
+
+# Import settings for configuration
+try:
+    from backend.config.settings import settings
+    ENABLE_PARALLEL_AGENTS = settings.ENABLE_PARALLEL_AGENTS
+    AGENT_MAX_WORKERS = settings.AGENT_MAX_WORKERS
+except ImportError:
+    ENABLE_PARALLEL_AGENTS = True
+    AGENT_MAX_WORKERS = 4
+
+
+class PipelineError(Exception):
+    """Raised for invalid pipeline definitions"""
+    pass
+
+
+class PipelineAborted(Exception):
+    """Raised by a stage to stop the pipeline (e.g. data analysis failed)"""
+
+    def __init__(self, stage: str, reason: str):
+        self.stage = stage
+        self.reason = reason
+        super().__init__(f"{stage}: {reason}")
+
+
+class PipelineStage:
+    """
+    A named unit of work in the pipeline.
+
+    ``func`` receives a dict with the results of the stages listed in
+    ``depends_on`` and returns the stage result.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[Dict[str, Any]], Any],
+        depends_on: Iterable[str] = ()
+    ):
+        self.name = name
+        self.func = func
+        self.depends_on = tuple(depends_on)
+
+    def __repr__(self) -> str:
+        return f"PipelineStage({self.name!r}, depends_on={self.depends_on!r})"
+
+
+class StagePipeline:
+    """
+    Runs a DAG of PipelineStages, concurrently where dependencies allow.
+
+    Usage:
+        pipeline = StagePipeline([
+            PipelineStage('data', load),
+            PipelineStage('risk', assess, depends_on=['data']),
+            PipelineStage('market', market, depends_on=['data']),
+            PipelineStage('plan', plan, depends_on=['risk', 'market'])
+        ])
+        results = pipeline.run()
+        pipeline.timings  # {'data': {'start_ms': 0.0, 'duration_ms': ...}, ...}
+    """
+
+    def __init__(
+        self,
+        stages: List[PipelineStage],
+        max_workers: int = None,
+        parallel: bool = None
+    ):
+        """
+        Args:
+            stages: Stage definitions (order does not matter)
+            max_workers: Thread pool size (default: AGENT_MAX_WORKERS)
+            parallel: Run independent stages concurrently (default: ENABLE_PARALLEL_AGENTS)
+        """
+        self.stages = {stage.name: stage for stage in stages}
+        if len(self.stages) != len(stages):
+            raise PipelineError("Duplicate stage names in pipeline")
+
+        self.max_workers = max_workers or AGENT_MAX_WORKERS
+        self.parallel = ENABLE_PARALLEL_AGENTS if parallel is None else parallel
+        self.order = self._topological_order()
+
+        self.timings: Dict[str, Dict[str, float]] = {}
+        self.wall_time_ms: float = 0.0
+
+    def _topological_order(self) -> List[str]:
+        """Validate dependencies and return a deterministic execution order"""
+        for stage in self.stages.values():
+            for dep in stage.depends_on:
+                if dep not in self.stages:
+                    raise PipelineError(f"Stage '{stage.name}' depends on unknown stage '{dep}'")
+
+        order: List[str] = []
+        done = set()
+        remaining = list(self.stages)
+        while remaining:
+            ready = [name for name in remaining if all(d in done for d in self.stages[name].depends_on)]
+            if not ready:
+                raise PipelineError(f"Dependency cycle among stages: {remaining}")
+            for name in ready:
+                order.append(name)
+                done.add(name)
+                remaining.remove(name)
+        return order
+
+    def _run_stage(self, name: str, results: Dict[str, Any], started: float) -> Any:
+        """Execute a single stage and record its timing"""
+        stage = self.stages[name]
+        inputs = {dep: results[dep] for dep in stage.depends_on}
+        stage_start = time.perf_counter()
+        try:
+            with tracing.span(f"stage.{name}"):
+                return stage.func(inputs)
+        finally:
+            end = time.perf_counter()
+            self.timings[name] = {
+                'start_ms': round((stage_start - started) * 1000, 2),
+                'duration_ms': round((end - stage_start) * 1000, 2)
+            }
+
+    def run(self, initial: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Execute all stages and return their results keyed by stage name.
+
+        Args:
+            initial: Pre-computed results that stages may depend on
+
+        Raises:
+            The first exception raised by a stage (including PipelineAborted);
+            stages that have not started yet are cancelled.
+        """
+        results: Dict[str, Any] = dict(initial or {})
+        self.timings = {}
+        started = time.perf_counter()
+
+        try:
+            if not self.parallel or self.max_workers <= 1:
+                for name in self.order:
+                    if name not in results:
+                        results[name] = self._run_stage(name, results, started)
+                return results
+
+            pending = [name for name in self.order if name not in results]
+            with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='brief-stage') as pool:
+                running = {}
+                while pending or running:
+                    for name in list(pending):
+                        if all(dep in results for dep in self.stages[name].depends_on):
+                            pending.remove(name)
+                            # Each stage runs in a copy of the caller's context so its
+                            # spans nest under the active trace
+                            future = pool.submit(
+                                contextvars.copy_context().run, self._run_stage, name, results, started
+                            )
+                            running[future] = name
+
+                    finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        name = running.pop(future)
+                        error = future.exception()
+                        if error is not None:
+                            for other in running:
+                                other.cancel()
+                            raise error
+                        results[name] = future.result()
+            return results
+        finally:
+            self.wall_time_ms = round((time.perf_counter() - started) * 1000, 2)
+
+    def timing_report(self) -> Dict[str, Any]:
+        """Per-stage timings plus wall-clock and summed stage time"""
+        return {
+            'stages': dict(self.timings),
+            'wall_time_ms': self.wall_time_ms,
+            'sum_stage_ms': round(sum(t['duration_ms'] for t in self.timings.values()), 2),
+            'parallel': self.parallel and self.max_workers > 1
+        }
@@ -2,8 +2,11 @@
 API Routes for Recommendation System
 """
 
+import json
+
 from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Any
 from loguru import logger
 
@@ -14,6 +17,20 @@ recommendation_router = APIRouter()
 # Initialize data loader for API access
 data_loader = DataLoader()
 
+# LLM engine for streaming endpoints (created on first use)
+_llm_engine = None
+
+
+def get_llm_engine():
+    """Shared LLMEngine instance for interactive requests"""
+    global _llm_engine
+    if _llm_engine is None:
+        from backend.engines.llm_engine import LLMEngine
+        from backend.engines.llm_scheduler import PRIORITY_INTERACTIVE
+        # User-facing requests jump ahead of queued brief generation
+        _llm_engine = LLMEngine(priority=PRIORITY_INTERACTIVE)
+    return _llm_engine
+
 
 class RecommendationRequest(BaseModel):
     """Request model for procurement recommendation"""
@@ -34,6 +51,13 @@ class ChatResponse(BaseModel):
     answer: str
 
 
+class GenerateRequest(BaseModel):
+    """Request model for streamed LLM generation"""
+    prompt: str
+    max_tokens: int = Field(default=2000, ge=1, le=128000)
+    temperature: float = Field(default=0.3, ge=0.0, le=2.0)
+
+
 class RecommendationResponse(BaseModel):
     """Response model for procurement recommendation"""
     recommendation: Dict[str, Any]
@@ -68,6 +92,38 @@ async def chat_with_ai(request: ChatRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@recommendation_router.post("/generate/stream")
+async def generate_stream(request: GenerateRequest):
+    """
+    Stream an LLM completion as server-sent events.
+
+    Each chunk is sent as `data: {"delta": "..."}`; the stream ends with
+    `event: done`. Clients see the first tokens as soon as they arrive.
+    """
+    engine = get_llm_engine()
+    if not engine.is_available:
+        raise HTTPException(status_code=503, detail="LLM not available (OPENAI_API_KEY not set)")
+
+    async def event_stream():
+        try:
+            async for delta in engine.generate_stream_async(
+                request.prompt,
+                max_tokens=request.max_tokens,
+                temperature=request.temperature
+            ):
+                yield f"data: {json.dumps({'delta': delta})}\n\n"
+        except Exception as e:
+            logger.error(f"Error streaming generation: {str(e)}")
+            yield f"event: error\ndata: {json.dumps({'error': str(e)})}\n\n"
+        yield "event: done\ndata: {}\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @recommendation_router.post("/query-knowledge", response_model=ChatResponse)
 async def query_knowledge_base(request: ChatRequest):
     """
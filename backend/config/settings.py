@@ -24,6 +24,31 @@ class Settings(BaseSettings):
     OPENAI_MODEL: str = Field(default="gpt-4o", description="OpenAI model to use")
     OPENAI_TEMPERATURE: float = Field(default=0.2, ge=0.0, le=2.0)
     OPENAI_MAX_TOKENS: int = Field(default=4000, ge=100, le=128000)
+    LLM_MAX_CONCURRENCY: int = Field(
+        default=4, ge=1, le=32,
+        description="Maximum concurrent LLM requests when generating brief sections"
+    )
+    LLM_BACKEND: str = Field(
+        default="openai", pattern="^(openai|stub)$",
+        description="Completion backend; 'stub' generates deterministic text offline for load testing"
+    )
+    LLM_STUB_LATENCY_MS: float = Field(default=400.0, ge=0, description="Stub median time to first token")
+    LLM_STUB_LATENCY_SIGMA: float = Field(default=0.3, ge=0, description="Stub time-to-first-token lognormal shape")
+    LLM_STUB_TOKENS_PER_SECOND: float = Field(default=60.0, gt=0, description="Stub median generation throughput")
+    LLM_STUB_THROUGHPUT_SIGMA: float = Field(default=0.2, ge=0, description="Stub throughput lognormal shape")
+    LLM_STUB_RESPONSE_TOKENS: int = Field(default=250, ge=1, description="Stub tokens per response")
+    LLM_STUB_SEED: int = Field(default=0)
+    LLM_RATE_LIMIT_ENABLED: bool = Field(default=True, description="Schedule LLM requests within RPM/TPM budgets")
+    LLM_RATE_LIMIT_RPM: int = Field(default=500, ge=1, description="Requests per minute assumed until the API reports the account limit")
+    LLM_RATE_LIMIT_TPM: int = Field(default=30000, ge=1000, description="Tokens per minute assumed until the API reports the account limit")
+    LLM_RATE_LIMIT_MAX_RETRIES: int = Field(default=5, ge=0, le=20, description="Retries after rate-limit/transient errors")
+
+    # Prompt Token Budgets (input tokens per prompt section)
+    PROMPT_RAG_TOKENS: int = Field(default=1500, ge=100, description="Knowledge base chunks, highest score first")
+    PROMPT_WEB_TOKENS: int = Field(default=1000, ge=100, description="All web search results combined")
+    PROMPT_WEB_SNIPPET_TOKENS: int = Field(default=120, ge=20, description="Each web search snippet")
+    PROMPT_DATA_TOKENS: int = Field(default=2000, ge=200, description="Data section after table summarization")
+    PROMPT_TABLE_MAX_ROWS: int = Field(default=12, ge=3, description="Rows kept per list/table in a data section")
 
     # Application Configuration
     APP_ENV: str = Field(default="development", pattern="^(development|staging|production)$")
@@ -47,10 +72,21 @@ class Settings(BaseSettings):
     VECTOR_DB_TYPE: str = Field(default="chromadb", pattern="^(chromadb|faiss)$")
     CHROMA_PERSIST_DIRECTORY: str = "./data/vector_db"
     FAISS_INDEX_PATH: str = "./data/faiss_db"
+    EMBEDDING_BACKEND: str = Field(
+        default="auto", pattern="^(auto|openai|local)$",
+        description="'local' embeds on CPU with sentence-transformers; 'auto' uses OpenAI only when a key is set"
+    )
     EMBEDDING_MODEL: str = "text-embedding-3-small"
     EMBEDDING_DIMENSION: int = Field(default=1536, ge=256)
-    RAG_CHUNK_SIZE: int = Field(default=1000, ge=100)
-    RAG_CHUNK_OVERLAP: int = Field(default=200, ge=0)
+    LOCAL_EMBEDDING_MODEL: str = "sentence-transformers/all-MiniLM-L6-v2"
+    LOCAL_EMBEDDING_RUNTIME: str = Field(default="torch", pattern="^(torch|onnx)$")
+    EMBEDDING_BATCH_SIZE: int = Field(default=64, ge=1, le=1024, description="Texts per local embedding forward pass")
+    RAG_CHUNK_SIZE: int = Field(default=400, ge=100, description="Tokens per knowledge base chunk")
+    RAG_CHUNK_OVERLAP: int = Field(default=60, ge=0, description="Tokens shared by consecutive chunks of a long section")
+    EMBEDDING_CACHE_ENABLED: bool = Field(default=True, description="Cache query embeddings (memory + SQLite)")
+    EMBEDDING_CACHE_PATH: str = Field(default="./data/cache/query_embeddings.sqlite")
+    EMBEDDING_CACHE_MAX_ENTRIES: int = Field(default=20000, ge=10, description="Maximum query embeddings kept on disk")
+    EMBEDDING_CACHE_MEMORY_SIZE: int = Field(default=1024, ge=1, description="Query embeddings kept in memory")
     RAG_TOP_K_RESULTS: int = Field(default=5, ge=1, le=50)
     RAG_SIMILARITY_THRESHOLD: float = Field(default=0.7, ge=0.0, le=1.0)
 
@@ -64,10 +100,39 @@ class Settings(BaseSettings):
     CACHE_TTL_SECONDS: int = Field(default=3600, ge=60)
     CACHE_MAX_SIZE: int = Field(default=1000, ge=10, description="Maximum number of items in cache")
     CACHE_TYPE: str = Field(default="memory", pattern="^(memory|redis)$")
+    LLM_CACHE_ENABLED: bool = Field(default=True, description="Cache LLM responses keyed by prompt hash")
+    LLM_CACHE_PATH: str = Field(default="./data/cache/llm_responses.sqlite")
+    LLM_CACHE_TTL_SECONDS: int = Field(default=604800, ge=60, description="LLM response cache lifetime (1 week)")
+    LLM_CACHE_MAX_ENTRIES: int = Field(default=5000, ge=10, description="Maximum LLM responses kept on disk")
+    LLM_CACHE_MEMORY_SIZE: int = Field(default=256, ge=1, description="LLM responses kept in memory")
+    SEMANTIC_CACHE_ENABLED: bool = Field(
+        default=False,
+        description="Serve near-duplicate grounded prompts from a FAISS semantic cache (requires faiss)"
+    )
+    SEMANTIC_CACHE_DIR: str = Field(default="./data/cache/semantic")
+    SEMANTIC_CACHE_THRESHOLD: float = Field(default=0.97, ge=0.5, le=1.0, description="Minimum cosine similarity for a hit")
+    SEMANTIC_CACHE_TTL_SECONDS: int = Field(default=604800, ge=60)
+    SEMANTIC_CACHE_MAX_ENTRIES: int = Field(default=2000, ge=10)
+    ENABLE_DATA_SNAPSHOTS: bool = Field(
+        default=True,
+        description="Keep Parquet snapshots of structured CSVs for faster cold loads (requires pyarrow)"
+    )
+
+    # Agent Pipeline
+    ENABLE_PARALLEL_AGENTS: bool = Field(
+        default=True,
+        description="Run independent brief agent stages concurrently"
+    )
+    AGENT_MAX_WORKERS: int = Field(default=4, ge=1, le=32, description="Thread pool size for agent stages")
 
     # Monitoring
     ENABLE_MONITORING: bool = True
     ENABLE_TRACING: bool = True
+    TRACE_EXPORT_DIR: Optional[str] = Field(
+        default=None,
+        description="Write each finished trace to <dir>/<trace_id>.json (unset = memory only)"
+    )
+    TRACE_HISTORY_SIZE: int = Field(default=20, ge=1, le=1000, description="Finished traces kept for export")
     METRICS_PORT: int = Field(default=9090, ge=1, le=65535)
 
     # Security
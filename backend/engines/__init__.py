@@ -5,9 +5,16 @@ Includes:
 - DataLoader: Data access and category resolution
 - RuleEvaluationEngine: Procurement rule compliance checking
 - LLMEngine: OpenAI GPT integration
+- LLMResponseCache: Persistent (SQLite + memory) LLM response cache
+- PromptCompiler: Token budgets for RAG, web and data prompt sections
+- LLMScheduler: Process-wide RPM/TPM rate limiting with priorities and backoff
+- StubLLMBackend: Deterministic offline LLM backend for load testing
+- tracing: Lightweight spans (OpenTelemetry-compatible) with JSON export
 - LeadershipBriefGenerator: Brief generation (with optional agent architecture)
 - DOCXExporter: Document export
 - FAISSVectorStore: RAG vector database
+- EmbeddingBackend: OpenAI or local (sentence-transformers) embeddings for RAG
+- QueryEmbeddingCache: Persistent (SQLite + memory) cache of RAG query embeddings
 - WebSearchEngine: Internet search fallback with source citation
 - BriefVerifier: LLM-based verification using Perplexity API
 - BriefChatAssistant: Conversational AI for brief discussions (Groq)
@@ -17,6 +24,13 @@ Includes:
 from .data_loader import DataLoader
 from .rule_evaluation_engine import RuleEvaluationEngine
 from .llm_engine import LLMEngine
+from .llm_cache import LLMResponseCache
+from .prompt_compiler import PromptCompiler
+from .llm_scheduler import LLMScheduler
+from .llm_backends import LLMBackend, StubLLMBackend
+from .embedding_backends import EmbeddingBackend, create_embedding_backend
+from .embedding_cache import QueryEmbeddingCache
+from . import tracing
 from .web_search_engine import WebSearchEngine
 from .brief_verifier import BriefVerifier
 from .brief_chat_assistant import BriefChatAssistant
@@ -35,6 +49,15 @@ __all__ = [
     'DataLoader',
     'RuleEvaluationEngine',
     'LLMEngine',
+    'LLMResponseCache',
+    'PromptCompiler',
+    'LLMScheduler',
+    'LLMBackend',
+    'StubLLMBackend',
+    'EmbeddingBackend',
+    'create_embedding_backend',
+    'QueryEmbeddingCache',
+    'tracing',
     'WebSearchEngine',
     'BriefVerifier',
     'BriefChatAssistant',
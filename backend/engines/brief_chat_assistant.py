@@ -9,12 +9,13 @@ Features:
 - Full conversation history
 - Brief-aware context (knows the generated documents)
 - Procurement-focused responses
-- Fast responses via Groq
+- Fast responses via Groq, optionally streamed token by token
 """
 
 import os
+import json
 import requests
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Iterator
 from pathlib import Path
 from docx import Document
 
@@ -169,6 +170,32 @@ When the user asks questions, use this brief data to provide accurate, grounded
 
         return base_prompt + "No briefs have been loaded yet. Ask the user to generate briefs first."
 
+    def _get_headers(self) -> Dict[str, str]:
+        return {
+            'Authorization': f'Bearer {self.api_key}',
+            'Content-Type': 'application/json'
+        }
+
+    def _build_payload(self, stream: bool = False) -> Dict[str, Any]:
+        """Build the Groq request from the system prompt and recent history."""
+        messages = [
+            {'role': 'system', 'content': self._get_system_prompt()}
+        ]
+
+        # Add conversation history (last 10 messages to stay within limits)
+        messages.extend(self.conversation_history[-10:])
+
+        payload = {
+            'model': self.MODEL,
+            'messages': messages,
+            'temperature': 0.7,
+            'max_tokens': 1024,
+            'top_p': 0.9
+        }
+        if stream:
+            payload['stream'] = True
+        return payload
+
     def chat(self, user_message: str) -> Dict[str, Any]:
         """
         Send a message and get a response.
@@ -200,32 +227,11 @@ When the user asks questions, use this brief data to provide accurate, grounded
         })
 
         try:
-            # Build messages for API
-            messages = [
-                {'role': 'system', 'content': self._get_system_prompt()}
-            ]
-
-            # Add conversation history (last 10 messages to stay within limits)
-            messages.extend(self.conversation_history[-10:])
-
             # Call Groq API
-            headers = {
-                'Authorization': f'Bearer {self.api_key}',
-                'Content-Type': 'application/json'
-            }
-
-            payload = {
-                'model': self.MODEL,
-                'messages': messages,
-                'temperature': 0.7,
-                'max_tokens': 1024,
-                'top_p': 0.9
-            }
-
             response = requests.post(
                 self.GROQ_API_URL,
-                headers=headers,
-                json=payload,
+                headers=self._get_headers(),
+                json=self._build_payload(),
                 timeout=30
             )
             response.raise_for_status()
@@ -274,6 +280,73 @@ When the user asks questions, use this brief data to provide accurate, grounded
                 'error': str(e)
             }
 
+    def chat_stream(self, user_message: str) -> Iterator[str]:
+        """
+        Send a message and yield the response as it is generated.
+
+        Suitable for st.write_stream(). The full response is added to the
+        conversation history once the stream completes; errors are yielded
+        as text so the UI always shows something.
+
+        Args:
+            user_message: The user's message
+
+        Yields:
+            Response text chunks
+        """
+        if not self.enabled:
+            yield "Chat assistant is not available. Please set GROQ_API_KEY in your .env file."
+            return
+
+        if not self.brief_context.get('summary'):
+            yield "I don't have any brief context loaded yet. Please generate briefs first, then I can help you analyze them and provide recommendations."
+            return
+
+        # Add user message to history
+        self.conversation_history.append({
+            'role': 'user',
+            'content': user_message
+        })
+
+        parts: List[str] = []
+        try:
+            with requests.post(
+                self.GROQ_API_URL,
+                headers=self._get_headers(),
+                json=self._build_payload(stream=True),
+                timeout=30,
+                stream=True
+            ) as response:
+                response.raise_for_status()
+
+                # Server-sent events: "data: {json}" lines, ending with "data: [DONE]"
+                for line in response.iter_lines(decode_unicode=True):
+                    if not line or not line.startswith('data:'):
+                        continue
+                    data = line[len('data:'):].strip()
+                    if data == '[DONE]':
+                        break
+                    delta = json.loads(data).get('choices', [{}])[0].get('delta', {}).get('content')
+                    if delta:
+                        parts.append(delta)
+                        yield delta
+
+        except requests.exceptions.Timeout:
+            yield "\n\nRequest timed out. Please try again."
+        except requests.exceptions.RequestException as e:
+            yield f"\n\nAPI error: {e}"
+        except Exception as e:
+            yield f"\n\nError: {str(e)}"
+
+        # Add assistant response to history (partial responses included)
+        if parts:
+            self.conversation_history.append({
+                'role': 'assistant',
+                'content': ''.join(parts)
+            })
+        else:
+            self.conversation_history.pop()
+
     def clear_history(self):
         """Clear conversation history but keep brief context."""
         self.conversation_history = []
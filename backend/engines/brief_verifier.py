@@ -20,6 +20,8 @@ from docx import Document
 import requests
 import json
 
+from backend.engines.data_loader import SpendCube
+
 
 class BriefVerifier:
     """
@@ -43,6 +45,12 @@ class BriefVerifier:
         self.api_key = api_key or os.getenv('PERPLEXITY_API_KEY', '')
         self.enabled = bool(self.api_key)
 
+        # Spend cube for the most recently verified source DataFrame
+        # Frame the cube was built from; held so its id() cannot be reused by another frame
+        self._cube_source: Optional[pd.DataFrame] = None
+        self._cube_source_len = 0
+        self._cube: Optional[SpendCube] = None
+
         if not self.enabled:
             print("[WARN] PERPLEXITY_API_KEY not set - verification will use basic mode")
         else:
@@ -190,21 +198,22 @@ class BriefVerifier:
         subcategory: str
     ) -> Dict[str, Any]:
         """Calculate expected values from source data."""
+        cube = self._get_spend_cube(source_df)
+
         # Filter for subcategory
-        if 'SubCategory' in source_df.columns:
-            filtered_df = source_df[source_df['SubCategory'] == subcategory]
-        else:
-            filtered_df = source_df
+        filters = {'SubCategory': subcategory} if 'SubCategory' in source_df.columns else None
+        cells = cube.filter(filters)
 
-        if filtered_df.empty:
+        if cells.empty:
             return {'error': f'No data found for subcategory: {subcategory}'}
 
         # Calculate metrics
-        total_spend = filtered_df['Spend_USD'].sum()
-        num_suppliers = filtered_df['Supplier_ID'].nunique()
+        totals = cube.totals(filters)
+        total_spend = totals['total_spend']
+        num_suppliers = cells['Supplier_ID'].nunique()
 
         # Supplier analysis
-        supplier_spend = filtered_df.groupby(['Supplier_ID', 'Supplier_Name'])['Spend_USD'].sum()
+        supplier_spend = cube.spend_by(['Supplier_ID', 'Supplier_Name'], filters)
         supplier_spend = supplier_spend.reset_index()
         supplier_spend = supplier_spend.sort_values('Spend_USD', ascending=False)
 
@@ -213,8 +222,8 @@ class BriefVerifier:
         dominant_supplier_pct = (dominant_supplier_spend / total_spend * 100) if total_spend > 0 else 0
 
         # Region analysis
-        if 'Supplier_Region' in filtered_df.columns:
-            region_spend = filtered_df.groupby('Supplier_Region')['Spend_USD'].sum()
+        if 'Supplier_Region' in source_df.columns:
+            region_spend = cube.spend_by('Supplier_Region', filters)
             region_spend = region_spend.sort_values(ascending=False)
             dominant_region = region_spend.index[0] if len(region_spend) > 0 else 'Unknown'
             dominant_region_pct = (region_spend.iloc[0] / total_spend * 100) if total_spend > 0 else 0
@@ -230,9 +239,17 @@ class BriefVerifier:
             'dominant_supplier_pct': round(dominant_supplier_pct, 1),
             'dominant_region': dominant_region,
             'dominant_region_pct': round(dominant_region_pct, 1),
-            'num_transactions': len(filtered_df)
+            'num_transactions': totals['transactions']
         }
 
+    def _get_spend_cube(self, source_df: pd.DataFrame) -> SpendCube:
+        """Build (or reuse) the spend cube for a source DataFrame."""
+        if self._cube is None or self._cube_source is not source_df or self._cube_source_len != len(source_df):
+            self._cube = SpendCube(source_df)
+            self._cube_source = source_df
+            self._cube_source_len = len(source_df)
+        return self._cube
+
     def _compare_data(
         self,
         docx_data: Dict[str, Any],
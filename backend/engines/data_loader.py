@@ -4,18 +4,27 @@ Loads and manages all data sources for the recommendation system.
 Features:
 - LRU cache with configurable size limit
 - TTL-based cache expiration
+- Columnar Parquet snapshots of CSV sources (optional, requires pyarrow)
+- Zero-copy read-only cache hits (explicit mutable=True copies)
+- Hierarchy index and pre-aggregated spend cube per data version
+- Pre-joined supplier dimension (master + contracts)
+- Traced file loads and cache hit counts
 - Proper error handling and logging
 """
 
 import pandas as pd
+import numpy as np
 import os
 import logging
 import time
+import threading
 from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 from collections import OrderedDict
 from datetime import datetime
 
+from backend.engines import tracing
+
 # Configure logger
 logger = logging.getLogger(__name__)
 
@@ -24,9 +33,26 @@ try:
     from backend.config.settings import settings
     CACHE_MAX_SIZE = settings.CACHE_MAX_SIZE
     CACHE_TTL_SECONDS = settings.CACHE_TTL_SECONDS
+    ENABLE_DATA_SNAPSHOTS = settings.ENABLE_DATA_SNAPSHOTS
 except ImportError:
     CACHE_MAX_SIZE = 1000
     CACHE_TTL_SECONDS = 3600  # 1 hour default
+    ENABLE_DATA_SNAPSHOTS = True
+
+# Optional columnar snapshot support
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Low-cardinality text columns stored dictionary-encoded in snapshots
+SNAPSHOT_DICTIONARY_COLUMNS = (
+    'Sector', 'Category', 'SubCategory', 'Client_ID',
+    'Supplier_ID', 'Supplier_Name', 'Supplier_Country', 'Supplier_Region',
+)
+SNAPSHOT_DIR_NAME = '.snapshots'
 
 
 class CacheEntry:
@@ -52,9 +78,11 @@ class LRUCache:
     """
     LRU (Least Recently Used) cache with TTL expiration.
     Provides bounded memory usage and automatic cleanup.
+    Safe to share between threads (briefs are assembled concurrently).
     """
 
     def __init__(self, max_size: int = CACHE_MAX_SIZE, default_ttl: int = CACHE_TTL_SECONDS):
+        self._lock = threading.RLock()
         self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
         self.max_size = max_size
         self.default_ttl = default_ttl
@@ -66,57 +94,65 @@ class LRUCache:
         Get item from cache, returning None if not found or expired.
         Moves accessed items to end (most recently used).
         """
-        if key not in self._cache:
-            self._misses += 1
-            return None
-
-        entry = self._cache[key]
-
-        # Check expiration
-        if entry.is_expired():
-            del self._cache[key]
-            self._misses += 1
-            logger.debug(f"Cache entry expired: {key}")
-            return None
-
-        # Move to end (most recently used)
-        self._cache.move_to_end(key)
-        entry.touch()
-        self._hits += 1
-        return entry.data
+        with self._lock:
+            if key not in self._cache:
+                self._misses += 1
+                tracing.count('data_cache_misses')
+                return None
+
+            entry = self._cache[key]
+
+            # Check expiration
+            if entry.is_expired():
+                del self._cache[key]
+                self._misses += 1
+                tracing.count('data_cache_misses')
+                logger.debug(f"Cache entry expired: {key}")
+                return None
+
+            # Move to end (most recently used)
+            self._cache.move_to_end(key)
+            entry.touch()
+            self._hits += 1
+            tracing.count('data_cache_hits')
+            return entry.data
 
     def set(self, key: str, value: Any, ttl: int = None):
         """
         Add item to cache, evicting LRU items if necessary.
         """
-        ttl = ttl or self.default_ttl
+        with self._lock:
+            ttl = ttl or self.default_ttl
 
-        # Remove oldest items if at capacity
-        while len(self._cache) >= self.max_size:
-            oldest_key = next(iter(self._cache))
-            del self._cache[oldest_key]
-            logger.debug(f"Cache evicted (LRU): {oldest_key}")
+            # Remove oldest items if at capacity
+            while len(self._cache) >= self.max_size:
+                oldest_key = next(iter(self._cache))
+                del self._cache[oldest_key]
+                logger.debug(f"Cache evicted (LRU): {oldest_key}")
 
-        # Add new entry
-        self._cache[key] = CacheEntry(value, ttl)
-        self._cache.move_to_end(key)
+            # Add new entry
+            self._cache[key] = CacheEntry(value, ttl)
+            self._cache.move_to_end(key)
 
     def delete(self, key: str):
         """Remove item from cache"""
-        if key in self._cache:
-            del self._cache[key]
+        with self._lock:
+            if key in self._cache:
+                del self._cache[key]
 
     def clear(self):
         """Clear all cached items"""
-        self._cache.clear()
-        self._hits = 0
-        self._misses = 0
+        with self._lock:
+            self._cache.clear()
+            self._hits = 0
+            self._misses = 0
 
     def cleanup_expired(self):
         """Remove all expired entries"""
-        expired_keys = [k for k, v in self._cache.items() if v.is_expired()]
-        for key in expired_keys:
-            del self._cache[key]
+        with self._lock:
+            expired_keys = [k for k, v in self._cache.items() if v.is_expired()]
+            for key in expired_keys:
+                del self._cache[key]
         if expired_keys:
             logger.debug(f"Cleaned up {len(expired_keys)} expired cache entries")
 
@@ -149,16 +185,557 @@ class DataParseError(DataLoaderError):
     pass
 
 
+def freeze_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Mark the NumPy arrays backing a DataFrame as read-only (in place).
+
+    In-place edits on a frozen frame (or on shallow views of it) raise
+    ``ValueError: assignment destination is read-only`` instead of silently
+    corrupting shared cached data. Adding or replacing whole columns on a
+    view still works because that only touches the view's own manager.
+    """
+    try:
+        for array in df._mgr.arrays:
+            values = getattr(array, '_ndarray', array)
+            if isinstance(values, np.ndarray):
+                values.flags.writeable = False
+    except Exception as e:
+        logger.debug(f"Could not freeze DataFrame arrays: {e}")
+    return df
+
+
+class SnapshotStore:
+    """
+    Columnar Parquet snapshots of structured CSV files.
+
+    Each snapshot records the source file's size and mtime in its schema
+    metadata and is only used while both still match, so editing the CSV
+    transparently invalidates it. Supplier/hierarchy text columns are
+    written dictionary-encoded; dates are stored already parsed.
+    """
+
+    METADATA_KEY = b'source_signature'
+
+    def __init__(self, snapshot_dir: Path, enabled: bool = True):
+        self.snapshot_dir = Path(snapshot_dir)
+        self.enabled = enabled and PYARROW_AVAILABLE
+        self._hits = 0
+        self._misses = 0
+        self._writes = 0
+
+    @staticmethod
+    def _signature(source_path: Path, parse_dates: Optional[List[str]]) -> str:
+        """Build a cheap freshness signature from file size, mtime and parse options"""
+        stat = source_path.stat()
+        dates = ','.join(parse_dates or [])
+        return f"{stat.st_size}:{stat.st_mtime_ns}:{dates}"
+
+    @staticmethod
+    def file_signature(source_path: Path) -> str:
+        """Size/mtime signature of a file ('missing' if it does not exist)"""
+        if not source_path.exists():
+            return 'missing'
+        stat = source_path.stat()
+        return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+    def _snapshot_path(self, source_path: Path) -> Path:
+        return self.snapshot_dir / f"{source_path.stem}.parquet"
+
+    def read(self, source_path: Path, parse_dates: Optional[List[str]] = None) -> Optional[pd.DataFrame]:
+        """
+        Read the snapshot for a source file if it is still in sync.
+
+        Returns:
+            DataFrame, or None if there is no fresh snapshot
+        """
+        if not self.enabled:
+            return None
+        return self._read_snapshot(
+            self._snapshot_path(source_path),
+            self._signature(source_path, parse_dates)
+        )
+
+    def write(self, source_path: Path, df: pd.DataFrame, parse_dates: Optional[List[str]] = None):
+        """Write a snapshot for a freshly parsed source file (best effort)"""
+        if not self.enabled or df.empty:
+            return
+        self._write_snapshot(
+            self._snapshot_path(source_path),
+            df,
+            self._signature(source_path, parse_dates)
+        )
+
+    def read_derived(self, name: str, signature: str) -> Optional[pd.DataFrame]:
+        """Read a derived table (built from one or more sources) if its signature matches"""
+        if not self.enabled:
+            return None
+        return self._read_snapshot(self.snapshot_dir / f"{name}.parquet", signature)
+
+    def write_derived(self, name: str, df: pd.DataFrame, signature: str):
+        """Persist a derived table together with the signature of its sources"""
+        if not self.enabled or df.empty:
+            return
+        self._write_snapshot(self.snapshot_dir / f"{name}.parquet", df, signature)
+
+    def _read_snapshot(self, snapshot_path: Path, signature: str) -> Optional[pd.DataFrame]:
+        if not snapshot_path.exists():
+            self._misses += 1
+            return None
+
+        try:
+            schema_meta = pq.read_schema(snapshot_path).metadata or {}
+            if schema_meta.get(self.METADATA_KEY) != signature.encode():
+                self._misses += 1
+                logger.debug(f"Snapshot stale: {snapshot_path.name}")
+                return None
+
+            df = pq.read_table(snapshot_path).to_pandas()
+            self._hits += 1
+            logger.debug(f"Loaded {len(df)} rows from snapshot {snapshot_path.name}")
+            return df
+        except Exception as e:
+            self._misses += 1
+            logger.warning(f"Could not read snapshot {snapshot_path}: {e}")
+            return None
+
+    def _write_snapshot(self, snapshot_path: Path, df: pd.DataFrame, signature: str):
+        try:
+            self.snapshot_dir.mkdir(parents=True, exist_ok=True)
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            metadata = dict(table.schema.metadata or {})
+            metadata[self.METADATA_KEY] = signature.encode()
+            table = table.replace_schema_metadata(metadata)
+
+            dictionary_columns = [c for c in SNAPSHOT_DICTIONARY_COLUMNS if c in df.columns]
+            tmp_path = snapshot_path.with_suffix('.parquet.tmp')
+            pq.write_table(
+                table,
+                tmp_path,
+                compression='zstd',
+                use_dictionary=dictionary_columns or False,
+            )
+            os.replace(tmp_path, snapshot_path)
+            self._writes += 1
+            logger.debug(f"Wrote snapshot {snapshot_path.name} ({len(df)} rows)")
+        except Exception as e:
+            logger.warning(f"Could not write snapshot {snapshot_path.name}: {e}")
+
+    def clear(self):
+        """Delete all snapshot files"""
+        if self.snapshot_dir.exists():
+            for path in self.snapshot_dir.glob('*.parquet'):
+                path.unlink(missing_ok=True)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Get snapshot statistics"""
+        return {
+            'enabled': self.enabled,
+            'pyarrow_available': PYARROW_AVAILABLE,
+            'snapshot_dir': str(self.snapshot_dir),
+            'hits': self._hits,
+            'misses': self._misses,
+            'writes': self._writes
+        }
+
+
+class HierarchyIndex:
+    """
+    Precomputed lookup index over the Sector > Category > SubCategory hierarchy.
+
+    Built once per spend-data version and used by resolve_category_input,
+    search_categories and _get_suggestions so that they no longer rescan the
+    full spend frame on every request. Holds:
+    - normalized name -> original name and row positions, per level
+    - (name, client) -> row positions for client-filtered resolution
+    - character n-gram and word-token postings for contains/fuzzy matching
+    """
+
+    LEVELS = (
+        ('subcategory', 'SubCategory'),
+        ('category', 'Category'),
+        ('sector', 'Sector'),
+    )
+    NGRAM_SIZE = 3
+
+    def __init__(self, spend_data: pd.DataFrame, version: int = 0):
+        self.frame = spend_data
+        self.version = version
+        self.has_client = 'Client_ID' in spend_data.columns
+
+        self._names: Dict[str, Dict[str, str]] = {}
+        self._positions: Dict[str, Dict[str, np.ndarray]] = {}
+        self._client_positions: Dict[str, Dict[Tuple[str, str], np.ndarray]] = {}
+        self._spend: Dict[str, Dict[str, float]] = {}
+        self._paths: Dict[str, Dict[str, str]] = {}
+        self._ngrams: Dict[str, set] = {}
+        self._short_names: set = set()
+        self._tokens: Dict[str, set] = {}
+
+        for level, column in self.LEVELS:
+            if column in spend_data.columns:
+                self._index_level(level, column)
+
+    @staticmethod
+    def normalize(value: Any) -> str:
+        return str(value).lower()
+
+    def _iter_ngrams(self, text: str):
+        size = self.NGRAM_SIZE
+        for i in range(len(text) - size + 1):
+            yield text[i:i + size]
+
+    def _index_level(self, level: str, column: str):
+        """Index one hierarchy level in a handful of vectorized passes"""
+        frame = self.frame
+        names: Dict[str, str] = {}
+        positions: Dict[str, np.ndarray] = {}
+
+        # groupby(sort=False) keeps first-appearance order; positions are ascending
+        for value, rows in frame.groupby(column, sort=False).indices.items():
+            key = self.normalize(value)
+            if key in names:
+                continue  # Case variants resolve to the first-seen spelling
+            names[key] = value
+            positions[key] = rows
+
+        client_positions: Dict[Tuple[str, str], np.ndarray] = {}
+        if self.has_client:
+            for (value, client), rows in frame.groupby([column, 'Client_ID'], sort=False).indices.items():
+                key = self.normalize(value)
+                if names.get(key) == value:
+                    client_positions[(key, client)] = rows
+
+        spend: Dict[str, float] = {}
+        if 'Spend_USD' in frame.columns:
+            for value, total in frame.groupby(column, sort=False)['Spend_USD'].sum().items():
+                key = self.normalize(value)
+                if names.get(key) == value:
+                    spend[key] = float(total)
+
+        paths: Dict[str, str] = {}
+        first_rows = frame.drop_duplicates(column)
+        has_sector = 'Sector' in frame.columns
+        for _, row in first_rows.iterrows():
+            value = row[column]
+            if pd.isna(value):
+                continue
+            key = self.normalize(value)
+            if names.get(key) != value:
+                continue
+            sector = row['Sector'] if has_sector else 'N/A'
+            if level == 'sector':
+                paths[key] = value
+            elif level == 'category':
+                paths[key] = f"{sector} > {value}"
+            else:
+                paths[key] = f"{sector} > {row['Category']} > {value}"
+
+        for key in names:
+            entry = (level, key)
+            if len(key) < self.NGRAM_SIZE:
+                self._short_names.add(entry)
+            for gram in self._iter_ngrams(key):
+                self._ngrams.setdefault(gram, set()).add(entry)
+            for token in key.split():
+                self._tokens.setdefault(token, set()).add(entry)
+
+        self._names[level] = names
+        self._positions[level] = positions
+        self._client_positions[level] = client_positions
+        self._spend[level] = spend
+        self._paths[level] = paths
+
+    def has_level(self, level: str) -> bool:
+        return level in self._names
+
+    def positions(self, level: str, key: str, client_id: str = None) -> Optional[np.ndarray]:
+        """Row positions for a normalized name, optionally restricted to a client"""
+        if client_id:
+            return self._client_positions.get(level, {}).get((key, client_id))
+        return self._positions.get(level, {}).get(key)
+
+    def rows(self, positions: np.ndarray) -> pd.DataFrame:
+        """Materialize spend rows for a set of positions"""
+        return self.frame.iloc[positions]
+
+    def exact(self, level: str, input_lower: str, client_id: str = None) -> Optional[Tuple[str, np.ndarray]]:
+        """O(1) exact (case-insensitive) match at one level"""
+        rows = self.positions(level, input_lower, client_id)
+        if rows is None:
+            return None
+        return self._names[level][input_lower], rows
+
+    def _contains_candidates(self, input_lower: str) -> set:
+        """Superset of names where input is a substring of the name or vice versa"""
+        if len(input_lower) < self.NGRAM_SIZE:
+            return {(level, key) for level, names in self._names.items() for key in names}
+
+        # Either direction of containment implies at least one shared n-gram
+        # (names shorter than an n-gram are always checked)
+        candidates = set(self._short_names)
+        for gram in set(self._iter_ngrams(input_lower)):
+            candidates |= self._ngrams.get(gram, set())
+        return candidates
+
+    def contains(self, level: str, input_lower: str, client_id: str = None) -> Optional[Tuple[str, np.ndarray]]:
+        """
+        First name (by appearance in spend data) at a level where the input
+        is contained in the name or the name is contained in the input.
+        """
+        best = None
+        for cand_level, key in self._contains_candidates(input_lower):
+            if cand_level != level:
+                continue
+            if input_lower not in key and key not in input_lower:
+                continue
+            rows = self.positions(level, key, client_id)
+            if rows is None or len(rows) == 0:
+                continue
+            if best is None or rows[0] < best[1][0]:
+                best = (self._names[level][key], rows)
+        return best
+
+    def search(self, query_lower: str) -> List[Dict[str, Any]]:
+        """Names at any level containing the query, with path and total spend"""
+        if len(query_lower) < self.NGRAM_SIZE:
+            candidates = {(level, key) for level, names in self._names.items() for key in names}
+        else:
+            postings = [self._ngrams.get(gram, set()) for gram in set(self._iter_ngrams(query_lower))]
+            candidates = set.intersection(*postings) if postings else set()
+
+        results = []
+        for level, key in candidates:
+            if query_lower not in key:
+                continue
+            results.append({
+                'type': level,
+                'name': self._names[level][key],
+                'path': self._paths[level].get(key, self._names[level][key]),
+                'spend': self._spend[level].get(key, 0.0)
+            })
+        return results
+
+    def suggestions(self, input_lower: str, client_id: str = None, limit: int = 5) -> List[str]:
+        """Names sharing at least one word with the input"""
+        matches = set()
+        for token in set(input_lower.split()):
+            matches |= self._tokens.get(token, set())
+
+        level_order = {level: i for i, (level, _) in enumerate(self.LEVELS)}
+        ranked = []
+        for level, key in matches:
+            rows = self.positions(level, key, client_id)
+            if rows is None or len(rows) == 0:
+                continue
+            ranked.append((level_order[level], rows[0], self._names[level][key]))
+
+        suggestions = []
+        for _, _, name in sorted(ranked):
+            if name not in suggestions:
+                suggestions.append(name)
+            if len(suggestions) >= limit:
+                break
+        return suggestions
+
+
+class SpendCube:
+    """
+    Materialized spend aggregate over every hierarchy and supplier dimension.
+
+    One cell per distinct (client, sector, category, subcategory, supplier,
+    country, region) combination holding total spend and transaction counts.
+    Summaries and rule metrics roll cells up instead of re-grouping raw
+    transactions. Cells keep first-appearance order of the transactions.
+    """
+
+    DIMENSIONS = (
+        'Client_ID', 'Sector', 'Category', 'SubCategory',
+        'Supplier_ID', 'Supplier_Name', 'Supplier_Country', 'Supplier_Region',
+    )
+    HIERARCHY_LEVELS = (
+        ('Sector',),
+        ('Sector', 'Category'),
+        ('Sector', 'Category', 'SubCategory'),
+    )
+    ROLLUP_CACHE_SIZE = 512
+
+    def __init__(self, spend_data: pd.DataFrame, version: int = 0):
+        self.version = version
+        self.dimensions = [d for d in self.DIMENSIONS if d in spend_data.columns]
+
+        if spend_data.empty or 'Spend_USD' not in spend_data.columns or not self.dimensions:
+            self.cells = pd.DataFrame(columns=self.dimensions + ['Spend_USD', 'Spend_Count', 'Transactions'])
+        else:
+            grouped = spend_data.groupby(self.dimensions, sort=False, dropna=False)['Spend_USD']
+            cells = grouped.agg(['sum', 'count', 'size']).reset_index()
+            cells.columns = self.dimensions + ['Spend_USD', 'Spend_Count', 'Transactions']
+            self.cells = cells
+
+        self._rollups = LRUCache(max_size=self.ROLLUP_CACHE_SIZE, default_ttl=10 ** 9)
+
+        # Pre-materialize roll-ups at every hierarchy level, overall and per client
+        for levels in self.HIERARCHY_LEVELS:
+            if all(level in self.dimensions for level in levels):
+                self.rollup(list(levels))
+                if 'Client_ID' in self.dimensions:
+                    self.rollup(['Client_ID'] + list(levels))
+
+    @staticmethod
+    def _filters_key(filters: Optional[Dict[str, Any]]) -> Tuple:
+        return tuple(sorted((filters or {}).items()))
+
+    def filter(self, filters: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
+        """Cube cells matching column == value filters"""
+        cells = self.cells
+        if not filters:
+            return cells
+        mask = np.ones(len(cells), dtype=bool)
+        for column, value in filters.items():
+            if column not in cells.columns:
+                return cells.iloc[0:0]
+            mask &= (cells[column] == value).to_numpy()
+        return cells[mask]
+
+    def rollup(self, by: List[str], filters: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
+        """
+        Aggregate cells to the given dimensions (sorted by key, NaN keys
+        dropped, like DataFrame.groupby). Results are memoized per version.
+
+        Returns:
+            DataFrame with the `by` columns plus Spend_USD, Spend_Count,
+            Transactions and Spend_Mean
+        """
+        cache_key = f"{tuple(by)}|{self._filters_key(filters)}"
+        cached = self._rollups.get(cache_key)
+        if cached is not None:
+            return cached
+
+        cells = self.filter(filters)
+        result = cells.groupby(list(by))[['Spend_USD', 'Spend_Count', 'Transactions']].sum().reset_index()
+        result['Spend_Mean'] = result['Spend_USD'] / result['Spend_Count'].where(result['Spend_Count'] > 0)
+        self._rollups.set(cache_key, result)
+        return result
+
+    def spend_by(self, by, filters: Optional[Dict[str, Any]] = None) -> pd.Series:
+        """Total spend per key, equivalent to df.groupby(by)['Spend_USD'].sum()"""
+        columns = [by] if isinstance(by, str) else list(by)
+        rolled = self.rollup(columns, filters)
+        return rolled.set_index(by if isinstance(by, str) else columns)['Spend_USD']
+
+    def totals(self, filters: Optional[Dict[str, Any]] = None) -> Dict[str, float]:
+        """Total spend, non-null spend count and transaction count for a slice"""
+        cells = self.filter(filters)
+        spend_count = int(cells['Spend_Count'].sum())
+        total_spend = float(cells['Spend_USD'].sum())
+        return {
+            'total_spend': total_spend,
+            'spend_count': spend_count,
+            'transactions': int(cells['Transactions'].sum()),
+            'mean_spend': total_spend / spend_count if spend_count else float('nan')
+        }
+
+
+class SupplierDimension:
+    """
+    Pre-joined supplier dimension: supplier_master joined with
+    supplier_contracts on supplier ID, with audit dates parsed and
+    cybersecurity ratings mapped to numbers ahead of time.
+
+    Rows are addressed by an integer surrogate key (``supplier_key``) so
+    spend aggregates can be enriched with a positional take instead of
+    string merges. Supplier IDs are matched first, then supplier names for
+    spend rows whose ID is unknown to the master data.
+    """
+
+    CYBER_RATING_SCALE = {'A': 5, 'B': 4, 'C': 3, 'D': 2, 'F': 1}
+    SNAPSHOT_NAME = 'supplier_dimension'
+
+    def __init__(self, table: pd.DataFrame, signature: str = ''):
+        self.table = table.reset_index(drop=True)
+        self.signature = signature
+
+        ids = self.table['Supplier_ID'] if 'Supplier_ID' in self.table.columns else pd.Series(dtype=object)
+        names = self.table['supplier_name'] if 'supplier_name' in self.table.columns else pd.Series(dtype=object)
+        self._id_keys = self._first_key_index(ids)
+        self._name_keys = self._first_key_index(names)
+
+    @staticmethod
+    def _first_key_index(values: pd.Series) -> pd.Series:
+        """Map each distinct non-null value to the first surrogate key carrying it"""
+        keys = pd.Series(np.arange(len(values), dtype=np.int64), index=values.to_numpy())
+        keys = keys[keys.index.notna()]
+        return keys[~keys.index.duplicated(keep='first')]
+
+    @classmethod
+    def build(cls, supplier_master: pd.DataFrame, supplier_contracts: pd.DataFrame, signature: str = '') -> 'SupplierDimension':
+        """Build the dimension from the raw master and contract tables"""
+        master = supplier_master.copy()
+        if 'last_audit_date' in master.columns:
+            master['last_audit_date'] = pd.to_datetime(master['last_audit_date'], errors='coerce')
+        if 'cybersecurity_rating' in master.columns:
+            master['cyber_numeric'] = master['cybersecurity_rating'].map(cls.CYBER_RATING_SCALE)
+
+        if 'supplier_id' in master.columns:
+            master['Supplier_ID'] = master['supplier_id']
+
+        if supplier_contracts.empty:
+            table = master
+        elif master.empty:
+            table = supplier_contracts.rename(columns={'Supplier_Name': 'Supplier_Name_contract'})
+        else:
+            contracts = supplier_contracts.rename(columns={'Supplier_Name': 'Supplier_Name_contract'})
+            table = pd.merge(master, contracts, on='Supplier_ID', how='outer', suffixes=('', '_contract'))
+
+        table = table.reset_index(drop=True)
+        table.insert(0, 'supplier_key', np.arange(len(table), dtype=np.int64))
+        return cls(table, signature)
+
+    def lookup(self, supplier_ids: pd.Series, supplier_names: pd.Series) -> np.ndarray:
+        """Surrogate keys for spend rows (-1 where the supplier is unknown)"""
+        keys = self._id_keys.reindex(supplier_ids.to_numpy()).to_numpy(dtype=float)
+        missing = np.isnan(keys)
+        if missing.any() and len(self._name_keys):
+            by_name = self._name_keys.reindex(supplier_names.to_numpy()[missing]).to_numpy(dtype=float)
+            keys[missing] = by_name
+        return np.where(np.isnan(keys), -1, keys).astype(np.int64)
+
+    def enrich(self, frame: pd.DataFrame, id_column: str = 'Supplier_ID', name_column: str = 'Supplier_Name') -> pd.DataFrame:
+        """
+        Left-join dimension attributes onto a frame of supplier rows.
+
+        Equivalent to merging supplier_master on name and supplier_contracts
+        on ID, without re-parsing or string merges.
+        """
+        frame = frame.reset_index(drop=True)
+        keys = self.lookup(frame[id_column], frame[name_column])
+        attributes = self.table.drop(columns=['supplier_key', 'Supplier_ID'], errors='ignore')
+        attributes = attributes.reindex(np.where(keys >= 0, keys, len(self.table))).reset_index(drop=True)
+        attributes = attributes.drop(columns=[c for c in attributes.columns if c in frame.columns])
+        enriched = pd.concat([frame, attributes], axis=1)
+        enriched['supplier_key'] = keys
+        return enriched
+
+
 class DataLoader:
     """
     Loads and caches data from all sources with:
     - LRU caching with configurable limits
     - TTL-based cache expiration
+    - Parquet snapshots for fast cold loads
+    - Zero-copy read-only views on cache hits
     - Proper error handling
     - Data validation
     """
 
-    def __init__(self, data_dir: str = None, cache_max_size: int = None, cache_ttl: int = None):
+    def __init__(
+        self,
+        data_dir: str = None,
+        cache_max_size: int = None,
+        cache_ttl: int = None,
+        use_snapshots: bool = None,
+        read_only: bool = True
+    ):
         """
         Initialize data loader
 
@@ -166,6 +743,10 @@ class DataLoader:
             data_dir: Path to data directory (defaults to project data dir)
             cache_max_size: Maximum number of items in cache
             cache_ttl: Cache time-to-live in seconds
+            use_snapshots: Use Parquet snapshots of CSV files (defaults to settings)
+            read_only: Hand out write-protected shallow views of cached frames
+                       instead of deep copies. Callers that need to modify a
+                       frame in place must pass mutable=True to the loader.
         """
         if data_dir is None:
             # Get project root
@@ -174,19 +755,34 @@ class DataLoader:
             data_dir = project_root / 'data' / 'structured'
 
         self.data_dir = Path(data_dir)
+        self.read_only = read_only
+        self._data_version = 0
+        self._hierarchy_index: Optional[HierarchyIndex] = None
+        self._spend_cube: Optional[SpendCube] = None
+        self._derived_lock = threading.RLock()  # Guards lazy index/cube/dimension builds
+        self._supplier_dimension: Optional[SupplierDimension] = None
+        self._supplier_master_injections = 0
         self._cache = LRUCache(
             max_size=cache_max_size or CACHE_MAX_SIZE,
             default_ttl=cache_ttl or CACHE_TTL_SECONDS
         )
+        self._snapshots = SnapshotStore(
+            self.data_dir / SNAPSHOT_DIR_NAME,
+            enabled=ENABLE_DATA_SNAPSHOTS if use_snapshots is None else use_snapshots
+        )
 
         # Verify data directory exists
         if not self.data_dir.exists():
             logger.warning(f"Data directory does not exist: {self.data_dir}")
 
+    @tracing.traced('data.load_csv')
     def _load_csv_safe(self, file_path: Path, parse_dates: List[str] = None) -> pd.DataFrame:
         """
         Safely load CSV with proper error handling.
 
+        A fresh Parquet snapshot is used instead of reparsing the CSV when
+        available; after a CSV parse the snapshot is rewritten.
+
         Args:
             file_path: Path to CSV file
             parse_dates: List of columns to parse as dates
@@ -201,6 +797,15 @@ class DataLoader:
             logger.warning(f"Data file not found: {file_path}")
             return pd.DataFrame()
 
+        load_span = tracing.current_span()
+        load_span.set_attribute('file', file_path.name)
+
+        snapshot_df = self._snapshots.read(file_path, parse_dates)
+        load_span.set_attribute('cache_hit', snapshot_df is not None)
+        if snapshot_df is not None:
+            load_span.set_attribute('rows', len(snapshot_df))
+            return snapshot_df
+
         try:
             df = pd.read_csv(file_path)
 
@@ -211,6 +816,8 @@ class DataLoader:
                         df[col] = pd.to_datetime(df[col], errors='coerce')
 
             logger.debug(f"Loaded {len(df)} rows from {file_path.name}")
+            load_span.set_attribute('rows', len(df))
+            self._snapshots.write(file_path, df, parse_dates)
             return df
 
         except pd.errors.EmptyDataError:
@@ -226,6 +833,25 @@ class DataLoader:
             logger.error(f"Unexpected error loading {file_path}: {e}")
             raise DataLoaderError(f"Error loading {file_path.name}: {e}") from e
     
+    def _store_frame(self, cache_key: str, df: pd.DataFrame):
+        """Cache a frame, write-protecting it when read-only views are enabled"""
+        if self.read_only:
+            freeze_frame(df)
+        self._cache.set(cache_key, df)
+        if cache_key == 'spend_data':
+            self._data_version += 1
+
+    def _hand_out(self, df: pd.DataFrame, mutable: bool = False) -> pd.DataFrame:
+        """
+        Return a cached frame to a caller.
+
+        Read-only mode returns a shallow view sharing the cached arrays;
+        otherwise (or when mutable=True) a private deep copy is returned.
+        """
+        if mutable or not self.read_only:
+            return df.copy()
+        return df.copy(deep=False)
+
     def set_spend_data(self, df: pd.DataFrame):
         """
         Inject custom spend data DataFrame (for user uploads).
@@ -234,7 +860,8 @@ class DataLoader:
         # Ensure date column is datetime
         if 'Transaction_Date' in df.columns:
             df['Transaction_Date'] = pd.to_datetime(df['Transaction_Date'], errors='coerce')
-        self._cache.set('spend_data', df)
+        # Cache a private copy so freezing never affects the caller's frame
+        self._store_frame('spend_data', df.copy())
         logger.info(f"Custom spend data loaded: {len(df)} rows")
 
     def set_supplier_master(self, df: pd.DataFrame):
@@ -242,13 +869,19 @@ class DataLoader:
         Inject custom supplier master DataFrame (for user uploads).
         This overrides the default CSV file loading.
         """
-        self._cache.set('supplier_master', df)
+        self._store_frame('supplier_master', df.copy())
+        self._supplier_master_injections += 1
         logger.info(f"Custom supplier master loaded: {len(df)} rows")
 
-    def load_spend_data(self, force_reload: bool = False) -> pd.DataFrame:
+    def load_spend_data(self, force_reload: bool = False, mutable: bool = False) -> pd.DataFrame:
         """
         Load spend data with caching.
 
+        Args:
+            force_reload: Bypass the cache and reload from disk
+            mutable: Return a private deep copy that may be modified in place.
+                     By default a read-only view of the cached frame is returned.
+
         Returns:
             DataFrame with columns: Client_ID, Category, Supplier_ID, Supplier_Name,
                                    Supplier_Country, Supplier_Region, Transaction_Date, Spend_USD
@@ -258,18 +891,18 @@ class DataLoader:
         if not force_reload:
             cached = self._cache.get(cache_key)
             if cached is not None:
-                return cached.copy()
+                return self._hand_out(cached, mutable)
 
         # Load from file
         file_path = self.data_dir / 'spend_data.csv'
         df = self._load_csv_safe(file_path, parse_dates=['Transaction_Date'])
 
         if not df.empty:
-            self._cache.set(cache_key, df)
+            self._store_frame(cache_key, df)
 
-        return df.copy() if not df.empty else df
+        return self._hand_out(df, mutable) if not df.empty else df
 
-    def load_supplier_contracts(self, force_reload: bool = False) -> pd.DataFrame:
+    def load_supplier_contracts(self, force_reload: bool = False, mutable: bool = False) -> pd.DataFrame:
         """
         Load supplier contract data with caching.
 
@@ -282,17 +915,17 @@ class DataLoader:
         if not force_reload:
             cached = self._cache.get(cache_key)
             if cached is not None:
-                return cached.copy()
+                return self._hand_out(cached, mutable)
 
         file_path = self.data_dir / 'supplier_contracts.csv'
         df = self._load_csv_safe(file_path, parse_dates=['Contract_Start', 'Contract_End'])
 
         if not df.empty:
-            self._cache.set(cache_key, df)
+            self._store_frame(cache_key, df)
 
-        return df.copy() if not df.empty else df
+        return self._hand_out(df, mutable) if not df.empty else df
 
-    def load_rule_book(self, force_reload: bool = False) -> pd.DataFrame:
+    def load_rule_book(self, force_reload: bool = False, mutable: bool = False) -> pd.DataFrame:
         """
         Load rule book with caching.
 
@@ -305,68 +938,68 @@ class DataLoader:
         if not force_reload:
             cached = self._cache.get(cache_key)
             if cached is not None:
-                return cached.copy()
+                return self._hand_out(cached, mutable)
 
         file_path = self.data_dir / 'rule_book.csv'
         df = self._load_csv_safe(file_path)
 
         if not df.empty:
-            self._cache.set(cache_key, df)
+            self._store_frame(cache_key, df)
 
-        return df.copy() if not df.empty else df
+        return self._hand_out(df, mutable) if not df.empty else df
 
-    def load_client_master(self, force_reload: bool = False) -> pd.DataFrame:
+    def load_client_master(self, force_reload: bool = False, mutable: bool = False) -> pd.DataFrame:
         """Load client master data with caching."""
         cache_key = 'client_master'
 
         if not force_reload:
             cached = self._cache.get(cache_key)
             if cached is not None:
-                return cached.copy()
+                return self._hand_out(cached, mutable)
 
         file_path = self.data_dir / 'client_master.csv'
         df = self._load_csv_safe(file_path)
 
         if not df.empty:
-            self._cache.set(cache_key, df)
+            self._store_frame(cache_key, df)
 
-        return df.copy() if not df.empty else df
+        return self._hand_out(df, mutable) if not df.empty else df
 
-    def load_supplier_master(self, force_reload: bool = False) -> pd.DataFrame:
+    def load_supplier_master(self, force_reload: bool = False, mutable: bool = False) -> pd.DataFrame:
         """Load supplier master data with caching."""
         cache_key = 'supplier_master'
 
         if not force_reload:
             cached = self._cache.get(cache_key)
             if cached is not None:
-                return cached.copy()
+                return self._hand_out(cached, mutable)
 
         file_path = self.data_dir / 'supplier_master.csv'
         df = self._load_csv_safe(file_path)
 
         if not df.empty:
-            self._cache.set(cache_key, df)
+            self._store_frame(cache_key, df)
 
-        return df.copy() if not df.empty else df
+        return self._hand_out(df, mutable) if not df.empty else df
 
-    def load_pricing_benchmarks(self, force_reload: bool = False) -> pd.DataFrame:
+    def load_pricing_benchmarks(self, force_reload: bool = False, mutable: bool = False) -> pd.DataFrame:
         """Load pricing benchmarks with caching."""
         cache_key = 'pricing_benchmarks'
 
         if not force_reload:
             cached = self._cache.get(cache_key)
             if cached is not None:
-                return cached.copy()
+                return self._hand_out(cached, mutable)
 
         file_path = self.data_dir / 'pricing_benchmarks.csv'
         df = self._load_csv_safe(file_path)
 
         if not df.empty:
-            self._cache.set(cache_key, df)
+            self._store_frame(cache_key, df)
 
-        return df.copy() if not df.empty else df
+        return self._hand_out(df, mutable) if not df.empty else df
 
-    def load_industry_benchmarks(self, force_reload: bool = False) -> pd.DataFrame:
+    def load_industry_benchmarks(self, force_reload: bool = False, mutable: bool = False) -> pd.DataFrame:
         """
         Load industry benchmarks with caching.
 
@@ -379,17 +1012,17 @@ class DataLoader:
         if not force_reload:
             cached = self._cache.get(cache_key)
             if cached is not None:
-                return cached.copy()
+                return self._hand_out(cached, mutable)
 
         file_path = self.data_dir / 'industry_benchmarks.csv'
         df = self._load_csv_safe(file_path, parse_dates=['Last_Updated'])
 
         if not df.empty:
-            self._cache.set(cache_key, df)
+            self._store_frame(cache_key, df)
 
-        return df.copy() if not df.empty else df
+        return self._hand_out(df, mutable) if not df.empty else df
 
-    def load_proof_points(self, force_reload: bool = False) -> pd.DataFrame:
+    def load_proof_points(self, force_reload: bool = False, mutable: bool = False) -> pd.DataFrame:
         """
         Load proof points (verified supplier evidence and performance metrics).
 
@@ -403,13 +1036,13 @@ class DataLoader:
         if not force_reload:
             cached = self._cache.get(cache_key)
             if cached is not None:
-                return cached.copy()
+                return self._hand_out(cached, mutable)
 
         file_path = self.data_dir / 'proof_points.csv'
         df = self._load_csv_safe(file_path, parse_dates=['Date_Recorded'])
 
-        self._cache.set(cache_key, df)
-        return df.copy() if not df.empty else df
+        self._store_frame(cache_key, df)
+        return self._hand_out(df, mutable) if not df.empty else df
 
     def get_supplier_proof_points(self, supplier_id: str = None, supplier_name: str = None) -> Dict[str, Any]:
         """
@@ -585,28 +1218,30 @@ class DataLoader:
         Returns:
             Dictionary with supplier details from all sources
         """
-        spend_data = self.load_spend_data()
+        cube = self.get_spend_cube()
         contracts = self.load_supplier_contracts()
-        
+
         # Get spend info
-        supplier_spend = spend_data[spend_data['Supplier_ID'] == supplier_id]
-        
+        supplier_cells = cube.filter({'Supplier_ID': supplier_id})
+
         # Get contract info
         supplier_contract = contracts[contracts['Supplier_ID'] == supplier_id]
-        
-        if len(supplier_spend) == 0:
+
+        if len(supplier_cells) == 0:
             return {"error": f"Supplier {supplier_id} not found in spend data"}
-        
+
+        totals = cube.totals({'Supplier_ID': supplier_id})
+        first_cell = supplier_cells.iloc[0]
         summary = {
             "supplier_id": supplier_id,
-            "supplier_name": supplier_spend.iloc[0]['Supplier_Name'],
-            "country": supplier_spend.iloc[0]['Supplier_Country'],
-            "region": supplier_spend.iloc[0]['Supplier_Region'],
-            "total_spend": float(supplier_spend['Spend_USD'].sum()),
-            "transaction_count": len(supplier_spend),
-            "avg_transaction_size": float(supplier_spend['Spend_USD'].mean()),
+            "supplier_name": first_cell['Supplier_Name'],
+            "country": first_cell['Supplier_Country'],
+            "region": first_cell['Supplier_Region'],
+            "total_spend": totals['total_spend'],
+            "transaction_count": totals['transactions'],
+            "avg_transaction_size": float(totals['mean_spend']),
         }
-        
+
         # Add contract info if available
         if len(supplier_contract) > 0:
             contract = supplier_contract.iloc[0]
@@ -626,12 +1261,13 @@ class DataLoader:
         Returns:
             Dictionary with regional spend breakdown
         """
-        spend_data = self.load_spend_data()
-        
-        total_spend = spend_data['Spend_USD'].sum()
-        regional_spend = spend_data.groupby('Supplier_Region')['Spend_USD'].agg(['sum', 'count'])
+        cube = self.get_spend_cube()
+
+        total_spend = cube.totals()['total_spend']
+        regional_spend = cube.rollup(['Supplier_Region']).set_index('Supplier_Region')
+        regional_spend = regional_spend.rename(columns={'Spend_USD': 'sum', 'Spend_Count': 'count'})
         regional_spend['percentage'] = (regional_spend['sum'] / total_spend * 100)
-        
+
         summary = {
             "total_spend": float(total_spend),
             "regions": {}
@@ -656,25 +1292,24 @@ class DataLoader:
         Returns:
             Dictionary with category spend breakdown
         """
-        spend_data = self.load_spend_data()
-        
-        if category:
-            spend_data = spend_data[spend_data['Category'] == category]
-        
-        total_spend = spend_data['Spend_USD'].sum()
-        supplier_count = spend_data['Supplier_ID'].nunique()
-        transaction_count = len(spend_data)
-        
+        cube = self.get_spend_cube()
+        filters = {'Category': category} if category else None
+
+        totals = cube.totals(filters)
+        total_spend = totals['total_spend']
+        supplier_count = cube.filter(filters)['Supplier_ID'].nunique()
+        transaction_count = totals['transactions']
+
         # Top suppliers
-        top_suppliers = spend_data.groupby(['Supplier_ID', 'Supplier_Name'])['Spend_USD'].sum()
+        top_suppliers = cube.spend_by(['Supplier_ID', 'Supplier_Name'], filters)
         top_suppliers = top_suppliers.sort_values(ascending=False).head(5)
-        
+
         summary = {
             "category": category or "All Categories",
             "total_spend": float(total_spend),
             "supplier_count": supplier_count,
             "transaction_count": transaction_count,
-            "avg_transaction_size": float(spend_data['Spend_USD'].mean()),
+            "avg_transaction_size": float(totals['mean_spend']),
             "top_suppliers": [
                 {
                     "supplier_id": sid,
@@ -691,11 +1326,21 @@ class DataLoader:
     def clear_cache(self):
         """Clear all cached data"""
         self._cache.clear()
+        self._hierarchy_index = None
+        self._spend_cube = None
+        self._supplier_dimension = None
         logger.info("Data cache cleared")
 
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache performance statistics"""
-        return self._cache.stats
+        stats = self._cache.stats
+        stats['snapshots'] = self._snapshots.stats
+        return stats
+
+    def clear_snapshots(self):
+        """Delete Parquet snapshots so the next load reparses the CSV files"""
+        self._snapshots.clear()
+        logger.info("Data snapshots cleared")
 
     def cleanup_expired_cache(self):
         """Remove expired cache entries"""
@@ -706,7 +1351,7 @@ class DataLoader:
     # Support for Sector > Category > SubCategory structure
     # ========================================================================
 
-    def load_inventory_metrics(self, force_reload: bool = False) -> pd.DataFrame:
+    def load_inventory_metrics(self, force_reload: bool = False, mutable: bool = False) -> pd.DataFrame:
         """
         Load inventory metrics for inventory-related rules (R012, R014, R022).
 
@@ -719,15 +1364,15 @@ class DataLoader:
         if not force_reload:
             cached = self._cache.get(cache_key)
             if cached is not None:
-                return cached.copy()
+                return self._hand_out(cached, mutable)
 
         file_path = self.data_dir / 'inventory_metrics.csv'
         df = self._load_csv_safe(file_path)
 
-        self._cache.set(cache_key, df)
-        return df.copy() if not df.empty else df
+        self._store_frame(cache_key, df)
+        return self._hand_out(df, mutable) if not df.empty else df
 
-    def load_category_metrics(self, force_reload: bool = False) -> pd.DataFrame:
+    def load_category_metrics(self, force_reload: bool = False, mutable: bool = False) -> pd.DataFrame:
         """
         Load category-level metrics for aggregated rules (R015, R016, R017, R018, etc.).
 
@@ -740,15 +1385,15 @@ class DataLoader:
         if not force_reload:
             cached = self._cache.get(cache_key)
             if cached is not None:
-                return cached.copy()
+                return self._hand_out(cached, mutable)
 
         file_path = self.data_dir / 'category_metrics.csv'
         df = self._load_csv_safe(file_path)
 
-        self._cache.set(cache_key, df)
-        return df.copy() if not df.empty else df
+        self._store_frame(cache_key, df)
+        return self._hand_out(df, mutable) if not df.empty else df
 
-    def load_industry_taxonomy(self, force_reload: bool = False) -> pd.DataFrame:
+    def load_industry_taxonomy(self, force_reload: bool = False, mutable: bool = False) -> pd.DataFrame:
         """
         Load industry taxonomy (Sector > Category > SubCategory hierarchy).
 
@@ -762,13 +1407,13 @@ class DataLoader:
         if not force_reload:
             cached = self._cache.get(cache_key)
             if cached is not None:
-                return cached.copy()
+                return self._hand_out(cached, mutable)
 
         file_path = self.data_dir / 'industry_taxonomy.csv'
         df = self._load_csv_safe(file_path)
 
-        self._cache.set(cache_key, df)
-        return df.copy() if not df.empty else df
+        self._store_frame(cache_key, df)
+        return self._hand_out(df, mutable) if not df.empty else df
 
     def get_all_sectors(self) -> List[Dict[str, Any]]:
         """
@@ -1005,6 +1650,83 @@ class DataLoader:
             'subcategory': subcat_data.iloc[0].get('SubCategory', subcategory)
         }
 
+    def get_hierarchy_index(self) -> HierarchyIndex:
+        """
+        Get the hierarchy index for the current spend data, rebuilding it
+        only when the spend data has been (re)loaded or replaced.
+        """
+        with self._derived_lock:
+            spend_data = self.load_spend_data()
+            index = self._hierarchy_index
+            if index is None or index.version != self._data_version:
+                start = time.perf_counter()
+                index = HierarchyIndex(spend_data, version=self._data_version)
+                self._hierarchy_index = index
+                logger.debug(
+                    f"Built hierarchy index (version {self._data_version}) "
+                    f"in {(time.perf_counter() - start) * 1000:.1f}ms"
+                )
+            return index
+
+    def get_spend_cube(self) -> SpendCube:
+        """
+        Get the pre-aggregated spend cube for the current spend data,
+        rebuilding it only when the spend data has changed.
+        """
+        with self._derived_lock:
+            spend_data = self.load_spend_data()
+            cube = self._spend_cube
+            if cube is None or cube.version != self._data_version:
+                start = time.perf_counter()
+                cube = SpendCube(spend_data, version=self._data_version)
+                self._spend_cube = cube
+                logger.debug(
+                    f"Built spend cube with {len(cube.cells)} cells (version {self._data_version}) "
+                    f"in {(time.perf_counter() - start) * 1000:.1f}ms"
+                )
+            return cube
+
+    def get_supplier_dimension(self) -> SupplierDimension:
+        """
+        Get the pre-joined supplier dimension.
+
+        Rebuilt only when supplier_master.csv or supplier_contracts.csv
+        change on disk (or a custom supplier master is injected); otherwise
+        served from memory or its Parquet snapshot.
+        """
+        with self._derived_lock:
+            master_path = self.data_dir / 'supplier_master.csv'
+            contracts_path = self.data_dir / 'supplier_contracts.csv'
+            signature = (
+                f"{SnapshotStore.file_signature(master_path)}|"
+                f"{SnapshotStore.file_signature(contracts_path)}|"
+                f"injected:{self._supplier_master_injections}"
+            )
+
+            dimension = self._supplier_dimension
+            if dimension is not None and dimension.signature == signature:
+                return dimension
+
+            persist = self._supplier_master_injections == 0
+            table = self._snapshots.read_derived(SupplierDimension.SNAPSHOT_NAME, signature) if persist else None
+
+            if table is not None:
+                dimension = SupplierDimension(table, signature)
+            else:
+                # Files changed since the last build: bypass possibly stale cache entries
+                reload = dimension is not None and persist
+                master = self.load_supplier_master(force_reload=reload)
+                contracts = self.load_supplier_contracts(force_reload=reload)
+                dimension = SupplierDimension.build(master, contracts, signature)
+                if persist:
+                    self._snapshots.write_derived(SupplierDimension.SNAPSHOT_NAME, dimension.table, signature)
+                logger.debug(f"Built supplier dimension with {len(dimension.table)} suppliers")
+
+            if self.read_only:
+                freeze_frame(dimension.table)
+            self._supplier_dimension = dimension
+            return dimension
+
     def search_categories(self, query: str) -> List[Dict[str, Any]]:
         """
         Search across sectors, categories, and subcategories
@@ -1015,44 +1737,8 @@ class DataLoader:
         Returns:
             List of matching items with their hierarchy
         """
-        spend_data = self.load_spend_data()
-        query_lower = query.lower()
-
-        results = []
-
-        # Search in Sectors
-        if 'Sector' in spend_data.columns:
-            for sector in spend_data['Sector'].unique():
-                if query_lower in sector.lower():
-                    results.append({
-                        'type': 'sector',
-                        'name': sector,
-                        'path': sector,
-                        'spend': float(spend_data[spend_data['Sector'] == sector]['Spend_USD'].sum())
-                    })
-
-        # Search in Categories
-        for category in spend_data['Category'].unique():
-            if query_lower in category.lower():
-                sector = spend_data[spend_data['Category'] == category]['Sector'].iloc[0] if 'Sector' in spend_data.columns else 'N/A'
-                results.append({
-                    'type': 'category',
-                    'name': category,
-                    'path': f"{sector} > {category}",
-                    'spend': float(spend_data[spend_data['Category'] == category]['Spend_USD'].sum())
-                })
-
-        # Search in SubCategories
-        if 'SubCategory' in spend_data.columns:
-            for subcat in spend_data['SubCategory'].unique():
-                if query_lower in subcat.lower():
-                    row = spend_data[spend_data['SubCategory'] == subcat].iloc[0]
-                    results.append({
-                        'type': 'subcategory',
-                        'name': subcat,
-                        'path': f"{row.get('Sector', 'N/A')} > {row['Category']} > {subcat}",
-                        'spend': float(spend_data[spend_data['SubCategory'] == subcat]['Spend_USD'].sum())
-                    })
+        index = self.get_hierarchy_index()
+        results = index.search(query.lower())
 
         return sorted(results, key=lambda x: x['spend'], reverse=True)
 
@@ -1094,78 +1780,47 @@ class DataLoader:
                 'error': 'No input value provided'
             }
 
-        spend_data = self.load_spend_data()
+        index = self.get_hierarchy_index()
         supplier_master = self.load_supplier_master()
 
-        if client_id:
-            spend_data = spend_data[spend_data['Client_ID'] == client_id]
+        if client_id and not index.has_client:
+            client_id = None
 
         input_lower = input_value.strip().lower()
 
-        # Strategy 1: Try exact match on SubCategory (most specific)
-        if 'SubCategory' in spend_data.columns:
-            for subcat in spend_data['SubCategory'].dropna().unique():
-                if subcat.lower() == input_lower:
-                    return self._build_resolved_response(
-                        spend_data[spend_data['SubCategory'] == subcat],
-                        supplier_master,
-                        'subcategory',
-                        subcat
-                    )
-
-        # Strategy 2: Try exact match on Category
-        for category in spend_data['Category'].dropna().unique():
-            if category.lower() == input_lower:
+        # Strategies 1-3: exact match, most specific level first
+        for level in ('subcategory', 'category', 'sector'):
+            if not index.has_level(level):
+                continue
+            match = index.exact(level, input_lower, client_id)
+            if match:
+                matched_value, rows = match
                 return self._build_resolved_response(
-                    spend_data[spend_data['Category'] == category],
+                    index.rows(rows),
                     supplier_master,
-                    'category',
-                    category
+                    level,
+                    matched_value,
+                    filters=self._hierarchy_filters(level, matched_value, client_id)
                 )
 
-        # Strategy 3: Try exact match on Sector
-        if 'Sector' in spend_data.columns:
-            for sector in spend_data['Sector'].dropna().unique():
-                if sector.lower() == input_lower:
-                    return self._build_resolved_response(
-                        spend_data[spend_data['Sector'] == sector],
-                        supplier_master,
-                        'sector',
-                        sector
-                    )
-
-        # Strategy 4: Try partial/fuzzy matching (contains search)
-        # Check subcategory first (most specific)
-        if 'SubCategory' in spend_data.columns:
-            for subcat in spend_data['SubCategory'].dropna().unique():
-                if input_lower in subcat.lower() or subcat.lower() in input_lower:
-                    return self._build_resolved_response(
-                        spend_data[spend_data['SubCategory'] == subcat],
-                        supplier_master,
-                        'subcategory',
-                        subcat
-                    )
-
-        # Check category
-        for category in spend_data['Category'].dropna().unique():
-            if input_lower in category.lower() or category.lower() in input_lower:
+        # Strategy 4: partial/fuzzy matching (contains search), most specific first
+        for level in ('subcategory', 'category', 'sector'):
+            if not index.has_level(level):
+                continue
+            match = index.contains(level, input_lower, client_id)
+            if match:
+                matched_value, rows = match
                 return self._build_resolved_response(
-                    spend_data[spend_data['Category'] == category],
+                    index.rows(rows),
                     supplier_master,
-                    'category',
-                    category
+                    level,
+                    matched_value,
+                    filters=self._hierarchy_filters(level, matched_value, client_id)
                 )
 
-        # Check sector
-        if 'Sector' in spend_data.columns:
-            for sector in spend_data['Sector'].dropna().unique():
-                if input_lower in sector.lower() or sector.lower() in input_lower:
-                    return self._build_resolved_response(
-                        spend_data[spend_data['Sector'] == sector],
-                        supplier_master,
-                        'sector',
-                        sector
-                    )
+        spend_data = index.frame
+        if client_id:
+            spend_data = spend_data[spend_data['Client_ID'] == client_id]
 
         # Strategy 5: Check supplier_master for matching product_category or subcategory
         if not supplier_master.empty:
@@ -1215,18 +1870,31 @@ class DataLoader:
             'success': False,
             'match_type': 'none',
             'error': f"Could not resolve '{input_value}' to any sector, category, or subcategory",
-            'suggestions': self._get_suggestions(input_value, spend_data)
+            'suggestions': self._get_suggestions(input_value, client_id=client_id)
         }
 
+    @staticmethod
+    def _hierarchy_filters(level: str, matched_value: str, client_id: str = None) -> Dict[str, Any]:
+        """Spend cube filters equivalent to a hierarchy-level resolution"""
+        column = {'sector': 'Sector', 'category': 'Category', 'subcategory': 'SubCategory'}[level]
+        filters = {column: matched_value}
+        if client_id:
+            filters['Client_ID'] = client_id
+        return filters
+
     def _build_resolved_response(
         self,
         filtered_data: pd.DataFrame,
         supplier_master: pd.DataFrame,
         match_type: str,
-        matched_value: str
+        matched_value: str,
+        filters: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
-        Build a standardized response for resolved category data
+        Build a standardized response for resolved category data.
+
+        `filters` describes the slice as spend cube filters when the match is
+        a plain hierarchy/client slice (None for supplier-master matches).
         """
         if filtered_data.empty:
             return {
@@ -1259,11 +1927,14 @@ class DataLoader:
         elif match_type == 'subcategory':
             hierarchy['subcategory'] = matched_value
 
+        # Aggregate from pre-summed cube cells when the slice is a plain filter
+        agg_source = self.get_spend_cube().filter(filters) if filters else filtered_data
+
         # Calculate metrics
-        total_spend = float(filtered_data['Spend_USD'].sum())
+        total_spend = float(agg_source['Spend_USD'].sum())
 
         # Get supplier breakdown
-        supplier_spend = filtered_data.groupby(['Supplier_ID', 'Supplier_Name']).agg({
+        supplier_spend = agg_source.groupby(['Supplier_ID', 'Supplier_Name']).agg({
             'Spend_USD': 'sum',
             'Supplier_Region': 'first',
             'Supplier_Country': 'first'
@@ -1297,7 +1968,7 @@ class DataLoader:
             suppliers.append(supplier_info)
 
         # Get regional breakdown
-        regional_spend = filtered_data.groupby('Supplier_Region')['Spend_USD'].sum()
+        regional_spend = agg_source.groupby('Supplier_Region')['Spend_USD'].sum()
         regions = {
             region: {
                 'spend': float(spend),
@@ -1315,36 +1986,18 @@ class DataLoader:
             'supplier_count': len(suppliers),
             'suppliers': suppliers,
             'regions': regions,
-            'spend_data': filtered_data
+            'spend_data': filtered_data,
+            'filters': filters
         }
 
-    def _get_suggestions(self, input_value: str, spend_data: pd.DataFrame) -> List[str]:
+    def _get_suggestions(self, input_value: str, client_id: str = None) -> List[str]:
         """
         Get suggestions when no exact match is found
         """
-        suggestions = []
-        input_lower = input_value.lower()
-
-        # Get all unique values
-        all_values = set()
-
-        if 'Sector' in spend_data.columns:
-            all_values.update(spend_data['Sector'].dropna().unique())
-        all_values.update(spend_data['Category'].dropna().unique())
-        if 'SubCategory' in spend_data.columns:
-            all_values.update(spend_data['SubCategory'].dropna().unique())
-
-        # Find similar values (simple similarity check)
-        for value in all_values:
-            value_lower = value.lower()
-            # Check for word overlap
-            input_words = set(input_lower.split())
-            value_words = set(value_lower.split())
-
-            if input_words & value_words:  # Any common words
-                suggestions.append(value)
-
-        return suggestions[:5]  # Return top 5 suggestions
+        index = self.get_hierarchy_index()
+        if client_id and not index.has_client:
+            client_id = None
+        return index.suggestions(input_value.lower(), client_id=client_id, limit=5)
 
 
 # Example usage
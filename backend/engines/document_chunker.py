@@ -0,0 +1,228 @@
+"""
+Document Chunker - Heading-aware chunking for the FAISS knowledge base
+
+Policy and best-practice documents are split into chunks before embedding,
+so a search hit is the relevant section rather than a whole file:
+- Markdown is split at headings; each chunk records its heading path
+  ("2. Supplier Selection > 2.1 Mandatory Requirements")
+- Small neighbouring sections are packed together up to the chunk size,
+  without crossing a top-level (#/##) heading
+- Sections longer than the chunk size are split on line boundaries into
+  windows of at most RAG_CHUNK_SIZE tokens, each overlapping the previous
+  one by up to RAG_CHUNK_OVERLAP tokens and repeating the section heading
+
+Token counts use the prompt compiler's (cached) tiktoken encoding.
+"""
+
+import re
+from typing import Dict, Any, List, Optional, Tuple
+
+from backend.engines.prompt_compiler import count_tokens, get_encoding, DEFAULT_MODEL
+
+# Import settings for configuration
+try:
+    from backend.config.settings import settings
+    RAG_CHUNK_SIZE = settings.RAG_CHUNK_SIZE
+    RAG_CHUNK_OVERLAP = settings.RAG_CHUNK_OVERLAP
+except ImportError:
+    RAG_CHUNK_SIZE = 400
+    RAG_CHUNK_OVERLAP = 60
+
+HEADING_PATTERN = re.compile(r'^(#{1,6})\s+(.+?)\s*#*\s*$')
+
+# Headings at or above this level start a new packing group
+TOP_LEVEL_HEADING = 2
+
+
+class DocumentChunker:
+    """
+    Splits documents into overlapping, heading-aware chunks.
+
+    Usage:
+        chunker = DocumentChunker()
+        documents = chunker.chunk_document(text, {'file_name': 'policy.md'})
+    """
+
+    def __init__(
+        self,
+        chunk_tokens: int = None,
+        overlap_tokens: int = None,
+        model: Optional[str] = None
+    ):
+        """
+        Args:
+            chunk_tokens: Maximum tokens per chunk (default: RAG_CHUNK_SIZE)
+            overlap_tokens: Tokens repeated between consecutive windows of a
+                            long section (default: RAG_CHUNK_OVERLAP)
+            model: Model whose tokenizer is used for counting
+        """
+        self.chunk_tokens = chunk_tokens or RAG_CHUNK_SIZE
+        overlap = RAG_CHUNK_OVERLAP if overlap_tokens is None else overlap_tokens
+        self.overlap_tokens = min(overlap, self.chunk_tokens // 2)
+        self.model = model or DEFAULT_MODEL
+
+    def _count(self, text: str) -> int:
+        return count_tokens(text, self.model)
+
+    # ------------------------------------------------------------------
+    # Sections
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def split_sections(text: str) -> List[Dict[str, Any]]:
+        """
+        Split markdown at headings.
+
+        Returns:
+            Sections in order, each with 'level' (0 for text before the first
+            heading), 'heading' (the heading line), 'path' and 'text'
+        """
+        sections = []
+        stack: List[Tuple[int, str]] = []
+        current = {'level': 0, 'heading': '', 'path': '', 'lines': []}
+        in_code_block = False
+
+        for line in text.splitlines():
+            if line.lstrip().startswith('```'):
+                in_code_block = not in_code_block
+            match = None if in_code_block else HEADING_PATTERN.match(line)
+            if match:
+                if current['lines'] or current['heading']:
+                    sections.append(current)
+                level = len(match.group(1))
+                stack = [(lvl, title) for lvl, title in stack if lvl < level]
+                stack.append((level, match.group(2).strip('*_ ')))
+                current = {
+                    'level': level,
+                    'heading': line.strip(),
+                    'path': " > ".join(title for _, title in stack),
+                    'lines': [line]
+                }
+            else:
+                current['lines'].append(line)
+        if current['lines']:
+            sections.append(current)
+
+        result = []
+        for section in sections:
+            body = "\n".join(section.pop('lines')).strip()
+            if body:
+                result.append({**section, 'text': body})
+        return result
+
+    # ------------------------------------------------------------------
+    # Windows
+    # ------------------------------------------------------------------
+
+    def _split_long_line(self, line: str) -> List[str]:
+        """Chunk-sized pieces of a single line longer than the chunk size"""
+        encoding = get_encoding(self.model)
+        if encoding is None:
+            size = self.chunk_tokens * 4
+            return [line[i:i + size] for i in range(0, len(line), size)]
+        tokens = encoding.encode(line, disallowed_special=())
+        return [
+            encoding.decode(tokens[i:i + self.chunk_tokens])
+            for i in range(0, len(tokens), self.chunk_tokens)
+        ]
+
+    def split_windows(self, text: str, heading: str = '') -> List[str]:
+        """
+        Split text on line boundaries into windows within the chunk size.
+
+        Consecutive windows share up to overlap_tokens of trailing lines;
+        windows after the first are prefixed with the section heading.
+        """
+        if self._count(text) <= self.chunk_tokens:
+            return [text]
+
+        lines: List[str] = []
+        for line in text.splitlines():
+            lines.extend(self._split_long_line(line) if self._count(line) > self.chunk_tokens else [line])
+
+        heading_tokens = self._count(heading) + 1 if heading else 0
+        windows: List[str] = []
+        current: List[str] = []
+        current_tokens = 0
+
+        for line in lines:
+            line_tokens = self._count(line) + 1
+            budget = self.chunk_tokens - (heading_tokens if windows else 0)
+            if current and current_tokens + line_tokens > budget:
+                windows.append("\n".join(current))
+                # Carry trailing lines forward as overlap
+                overlap: List[str] = []
+                overlap_tokens = 0
+                for previous in reversed(current):
+                    previous_tokens = self._count(previous) + 1
+                    if overlap_tokens + previous_tokens > self.overlap_tokens:
+                        break
+                    overlap.insert(0, previous)
+                    overlap_tokens += previous_tokens
+                current, current_tokens = overlap, overlap_tokens
+            current.append(line)
+            current_tokens += line_tokens
+        if current:
+            windows.append("\n".join(current))
+
+        if heading:
+            windows = [windows[0]] + [
+                w if w.startswith(heading) else f"{heading}\n{w}" for w in windows[1:]
+            ]
+        return [w.strip() for w in windows if w.strip()]
+
+    # ------------------------------------------------------------------
+    # Documents
+    # ------------------------------------------------------------------
+
+    def _pack_sections(self, sections: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Merge small neighbouring sections up to the chunk size within a top-level group"""
+        packed: List[Dict[str, Any]] = []
+        for section in sections:
+            tokens = self._count(section['text'])
+            starts_group = 0 < section['level'] <= TOP_LEVEL_HEADING
+            if (
+                packed
+                and not starts_group
+                and tokens <= self.chunk_tokens
+                and packed[-1]['tokens'] + tokens <= self.chunk_tokens
+            ):
+                packed[-1]['text'] += "\n\n" + section['text']
+                packed[-1]['tokens'] += tokens
+            else:
+                packed.append({**section, 'tokens': tokens})
+        return packed
+
+    def chunk_text(self, text: str) -> List[Dict[str, str]]:
+        """Chunks of a document as {'text', 'section'} dicts"""
+        chunks = []
+        for section in self._pack_sections(self.split_sections(text)):
+            for window in self.split_windows(section['text'], section['heading']):
+                chunks.append({'text': window, 'section': section['path']})
+        return chunks
+
+    def chunk_document(self, text: str, metadata: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Split one document into vector store documents.
+
+        Each chunk keeps the document metadata and adds 'section',
+        'chunk_index', 'chunk_count' and 'chunk_id' (file_name#index).
+
+        Returns:
+            List of {'content', 'metadata'} dicts
+        """
+        chunks = self.chunk_text(text)
+        file_name = metadata.get('file_name', metadata.get('source', 'document'))
+        return [
+            {
+                'content': chunk['text'],
+                'metadata': {
+                    **metadata,
+                    'section': chunk['section'],
+                    'chunk_index': i,
+                    'chunk_count': len(chunks),
+                    'chunk_id': f"{file_name}#{i}"
+                }
+            }
+            for i, chunk in enumerate(chunks)
+        ]
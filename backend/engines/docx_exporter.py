@@ -7,6 +7,7 @@ Features:
 - Secure path handling with sanitization
 - Automatic cleanup of failed exports
 - Proper logging
+- Traced exports
 """
 
 import os
@@ -25,6 +26,8 @@ from pathlib import Path
 from datetime import datetime
 import numpy as np
 
+from backend.engines import tracing
+
 # Configure logger
 logger = logging.getLogger(__name__)
 
@@ -237,6 +240,7 @@ class DOCXExporter:
         
         return table
     
+    @tracing.traced('docx.export_incumbent')
     def export_incumbent_concentration_brief(
         self, 
         brief_data: Dict[str, Any],
@@ -592,6 +596,7 @@ class DOCXExporter:
 
         return str(filepath)
 
+    @tracing.traced('docx.export_regional')
     def export_regional_concentration_brief(
         self, 
         brief_data: Dict[str, Any],
@@ -865,6 +870,7 @@ class DOCXExporter:
 
         return str(filepath)
 
+    @tracing.traced('docx.export_both')
     def export_both_briefs(
         self,
         briefs: Dict[str, Dict[str, Any]],
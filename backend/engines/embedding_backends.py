@@ -0,0 +1,192 @@
+"""
+Embedding Backends - Pluggable text embedding for FAISSVectorStore
+
+Backends:
+- OpenAIEmbeddingBackend: OpenAI embeddings API (text-embedding-3-small),
+  one network round trip per query
+- LocalEmbeddingBackend: sentence-transformers model on CPU
+  (all-MiniLM-L6-v2 by default, optionally via ONNX Runtime), batched,
+  no network or API key needed
+
+Each backend reports its dimension, so the FAISS index is built to match.
+Select with EMBEDDING_BACKEND=openai|local (or pass backend= to
+FAISSVectorStore). 'auto' uses OpenAI when a key is set and the local
+model otherwise.
+"""
+
+import os
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+# OpenAI for embeddings
+try:
+    from openai import OpenAI
+    OPENAI_AVAILABLE = True
+except ImportError:
+    OPENAI_AVAILABLE = False
+    OpenAI = None
+
+# Optional local embedding support
+try:
+    from sentence_transformers import SentenceTransformer
+    SENTENCE_TRANSFORMERS_AVAILABLE = True
+except ImportError:
+    SENTENCE_TRANSFORMERS_AVAILABLE = False
+    SentenceTransformer = None
+
+# Import settings for configuration
+try:
+    from backend.config.settings import settings
+    EMBEDDING_BACKEND = settings.EMBEDDING_BACKEND
+    EMBEDDING_MODEL = settings.EMBEDDING_MODEL
+    LOCAL_EMBEDDING_MODEL = settings.LOCAL_EMBEDDING_MODEL
+    LOCAL_EMBEDDING_RUNTIME = settings.LOCAL_EMBEDDING_RUNTIME
+    EMBEDDING_BATCH_SIZE = settings.EMBEDDING_BATCH_SIZE
+except ImportError:
+    EMBEDDING_BACKEND = "auto"
+    EMBEDDING_MODEL = "text-embedding-3-small"
+    LOCAL_EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+    LOCAL_EMBEDDING_RUNTIME = "torch"
+    EMBEDDING_BATCH_SIZE = 64
+
+# Output dimensions of the OpenAI embedding models
+OPENAI_DIMENSIONS = {
+    'text-embedding-3-small': 1536,
+    'text-embedding-3-large': 3072,
+    'text-embedding-ada-002': 1536,
+}
+
+# Inputs per OpenAI embeddings request
+OPENAI_BATCH_SIZE = 100
+
+
+class EmbeddingBackend(ABC):
+    """
+    Text embedding backend used by FAISSVectorStore.
+
+    model_name identifies the vector space: indexes built with one model
+    cannot be searched with another.
+    """
+
+    name = "backend"
+    model_name = ""
+    dimension = 0
+
+    @property
+    def available(self) -> bool:
+        """False when embeddings would be placeholders (e.g. no API key)"""
+        return True
+
+    @abstractmethod
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        """Embeddings for texts, in order"""
+        pass
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed([text])[0]
+
+
+class OpenAIEmbeddingBackend(EmbeddingBackend):
+    """OpenAI embeddings API; zero vectors without an API key"""
+
+    name = "openai"
+
+    def __init__(self, model: str = None, api_key: Optional[str] = None):
+        self.model_name = model or EMBEDDING_MODEL
+        self.dimension = OPENAI_DIMENSIONS.get(self.model_name, 1536)
+        self.api_key = api_key or os.getenv("OPENAI_API_KEY")
+        self.client = OpenAI(api_key=self.api_key) if self.api_key and OPENAI_AVAILABLE else None
+
+    @property
+    def available(self) -> bool:
+        return self.client is not None
+
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        if not self.client:
+            return [[0.0] * self.dimension for _ in texts]
+
+        embeddings = []
+        for i in range(0, len(texts), OPENAI_BATCH_SIZE):
+            response = self.client.embeddings.create(
+                model=self.model_name,
+                input=texts[i:i + OPENAI_BATCH_SIZE]
+            )
+            embeddings.extend(d.embedding for d in response.data)
+        return embeddings
+
+
+class LocalEmbeddingBackend(EmbeddingBackend):
+    """
+    sentence-transformers model running locally on CPU.
+
+    MiniLM-class models (384 dimensions) embed a query in a few
+    milliseconds. runtime='onnx' uses ONNX Runtime (sentence-transformers
+    >= 3.2 with optimum installed).
+    """
+
+    name = "local"
+
+    def __init__(
+        self,
+        model: str = None,
+        batch_size: int = None,
+        runtime: str = None,
+        device: str = "cpu"
+    ):
+        """
+        Args:
+            model: sentence-transformers model name or local path
+            batch_size: Texts per forward pass
+            runtime: 'torch' or 'onnx'
+            device: Torch device
+        """
+        if not SENTENCE_TRANSFORMERS_AVAILABLE:
+            raise ImportError(
+                "sentence-transformers not installed. Install with: pip install sentence-transformers"
+            )
+
+        self.model_name = model or LOCAL_EMBEDDING_MODEL
+        self.batch_size = batch_size or EMBEDDING_BATCH_SIZE
+        runtime = runtime or LOCAL_EMBEDDING_RUNTIME
+
+        if runtime == 'onnx':
+            self.model = SentenceTransformer(self.model_name, device=device, backend='onnx')
+        else:
+            self.model = SentenceTransformer(self.model_name, device=device)
+        self.dimension = self.model.get_sentence_embedding_dimension()
+
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        if not texts:
+            return []
+        vectors = self.model.encode(
+            texts,
+            batch_size=self.batch_size,
+            normalize_embeddings=True,
+            convert_to_numpy=True,
+            show_progress_bar=False
+        )
+        return vectors.tolist()
+
+
+def create_embedding_backend(name: Optional[str] = None, model: Optional[str] = None) -> EmbeddingBackend:
+    """
+    Embedding backend for a name (default: EMBEDDING_BACKEND).
+
+    'auto' picks OpenAI when OPENAI_API_KEY is set, else the local model
+    if sentence-transformers is installed, else OpenAI (zero vectors).
+    """
+    name = (name or EMBEDDING_BACKEND).lower()
+    if name == 'auto':
+        if os.getenv("OPENAI_API_KEY") and OPENAI_AVAILABLE:
+            name = 'openai'
+        elif SENTENCE_TRANSFORMERS_AVAILABLE:
+            name = 'local'
+        else:
+            print("[WARN] No OpenAI key and sentence-transformers not installed - embeddings disabled")
+            name = 'openai'
+
+    if name == 'openai':
+        return OpenAIEmbeddingBackend(model=model)
+    if name == 'local':
+        return LocalEmbeddingBackend(model=model)
+    raise ValueError(f"Unknown embedding backend '{name}'. Available: auto, openai, local")
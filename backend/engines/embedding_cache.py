@@ -0,0 +1,101 @@
+"""
+Query Embedding Cache - Reuse embeddings of repeated RAG queries
+
+Agents search the knowledge base with the same query strings on every
+brief (market and risk queries built from category names). The cache maps
+(embedding model, query text) to the normalized float32 query vector, so
+repeated lookups skip the embedding call.
+
+Entries live in an in-memory LRU in front of a SQLite table (see
+TwoLevelCache), so they survive restarts and are shared between
+processes; the disk layer is bounded by entry count with LRU eviction.
+
+Embeddings of a query never change for a given model, so entries do not
+expire; the model is part of the key.
+"""
+
+import hashlib
+from typing import Optional
+
+from backend.engines.sqlite_cache import TwoLevelCache
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
+
+# Import settings for configuration
+try:
+    from backend.config.settings import settings
+    EMBEDDING_CACHE_ENABLED = settings.EMBEDDING_CACHE_ENABLED
+    EMBEDDING_CACHE_PATH = settings.EMBEDDING_CACHE_PATH
+    EMBEDDING_CACHE_MAX_ENTRIES = settings.EMBEDDING_CACHE_MAX_ENTRIES
+    EMBEDDING_CACHE_MEMORY_SIZE = settings.EMBEDDING_CACHE_MEMORY_SIZE
+except ImportError:
+    EMBEDDING_CACHE_ENABLED = True
+    EMBEDDING_CACHE_PATH = "./data/cache/query_embeddings.sqlite"
+    EMBEDDING_CACHE_MAX_ENTRIES = 20000
+    EMBEDDING_CACHE_MEMORY_SIZE = 1024
+
+
+class QueryEmbeddingCache(TwoLevelCache):
+    """
+    Two-level (memory + SQLite) cache of normalized query embeddings.
+
+    Usage:
+        cache = QueryEmbeddingCache()
+        vector = cache.get(model, query)
+        if vector is None:
+            vector = normalize(embed(query))
+            cache.set(model, query, vector)
+    """
+
+    TABLE = "query_embeddings"
+    VALUE_COLUMN = "vector"
+    VALUE_TYPE = "BLOB"
+    LABEL = "Query embedding cache"
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        max_entries: int = None,
+        memory_size: int = None
+    ):
+        """
+        Args:
+            db_path: SQLite file (None uses EMBEDDING_CACHE_PATH; ':memory:' keeps it in-process)
+            max_entries: Maximum vectors kept on disk before LRU eviction
+            memory_size: Vectors held in the in-memory LRU
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError("numpy not installed. Install with: pip install numpy")
+
+        super().__init__(
+            db_path=db_path or EMBEDDING_CACHE_PATH,
+            max_entries=max_entries or EMBEDDING_CACHE_MAX_ENTRIES,
+            memory_size=memory_size or EMBEDDING_CACHE_MEMORY_SIZE
+        )
+
+    @staticmethod
+    def make_key(model: str, query: str) -> str:
+        """Hash of the embedding model and the whitespace-normalized query"""
+        payload = f"{model}\n{' '.join(query.split())}"
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _encode(self, vector: 'np.ndarray') -> bytes:
+        return vector.tobytes()
+
+    def _decode(self, stored: bytes) -> 'np.ndarray':
+        return np.frombuffer(stored, dtype='float32')
+
+    def get(self, model: str, query: str) -> Optional['np.ndarray']:
+        """Return the cached float32 vector, or None on miss"""
+        return self._get(self.make_key(model, query))
+
+    def set(self, model: str, query: str, vector: 'np.ndarray') -> None:
+        """Store a normalized query vector in both layers"""
+        vector = np.array(vector, dtype='float32').reshape(-1)
+        vector.setflags(write=False)
+        self._set(self.make_key(model, query), vector, model=model)
@@ -1,15 +1,30 @@
 """
 FAISS Vector Store for RAG Pipeline
 Simple, Windows-compatible vector database
+
+The index is an IndexIDMap2 over IndexFlatIP, so vectors can be added and
+removed by ID. manifest.json (next to index.faiss) maps each document key
+(chunk_id, else file_name) to its vector ID and content hash; updates embed
+only new or changed chunks, and chunks whose content already exists in the
+index (e.g. shifted by an insert earlier in the file) reuse that vector.
+
+search_batch() embeds several queries in one backend call and runs one
+index search; prefetch() uses it to answer a known set of search() calls
+(e.g. every RAG lookup of a brief) up front.
 """
 
-import os
+import json
 import pickle
+import hashlib
+import contextvars
+from contextlib import contextmanager
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 from dotenv import load_dotenv
 load_dotenv()
 
+from backend.engines import tracing
+
 # FAISS
 try:
     import faiss
@@ -20,13 +35,27 @@ except ImportError:
     faiss = None
     np = None
 
-# OpenAI for embeddings
-try:
-    from openai import OpenAI
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
-    OpenAI = None
+from backend.engines.embedding_backends import EmbeddingBackend, create_embedding_backend
+from backend.engines.embedding_cache import QueryEmbeddingCache, EMBEDDING_CACHE_ENABLED
+
+MANIFEST_VERSION = 1
+
+# Model of indexes saved before the manifest recorded one
+LEGACY_EMBEDDING_MODEL = "text-embedding-3-small"
+
+# Results of the active prefetch() blocks: (store id, query) -> (k searched, results)
+_prefetched_results: contextvars.ContextVar[Optional[Dict[Tuple[int, str], Tuple[int, List[Dict[str, Any]]]]]] = \
+    contextvars.ContextVar('faiss_prefetched_results', default=None)
+
+
+def content_hash(content: str) -> str:
+    """Hash identifying a chunk's embedded text"""
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+def document_key(content: str, metadata: Dict[str, Any]) -> str:
+    """Stable identity of a document across index updates"""
+    return metadata.get('chunk_id') or metadata.get('file_name') or content_hash(content)
 
 
 class FAISSVectorStore:
@@ -38,61 +67,116 @@ class FAISSVectorStore:
     def __init__(
         self,
         persist_directory: str = "./data/faiss_db",
-        embedding_model: str = "text-embedding-3-small"
+        embedding_model: Optional[str] = None,
+        backend: Optional[EmbeddingBackend] = None,
+        enable_query_cache: Optional[bool] = None
     ):
+        """
+        Args:
+            persist_directory: Directory holding index.faiss and the manifest
+            embedding_model: Model for the configured backend (default: backend's)
+            backend: Embedding backend (default: EMBEDDING_BACKEND)
+            enable_query_cache: Cache query embeddings (default: EMBEDDING_CACHE_ENABLED)
+        """
         if not FAISS_AVAILABLE:
             raise ImportError("FAISS not installed. Install with: pip install faiss-cpu")
 
         self.persist_directory = Path(persist_directory)
         self.persist_directory.mkdir(parents=True, exist_ok=True)
-        self.embedding_model = embedding_model
 
-        # OpenAI client for embeddings
-        self.api_key = os.getenv("OPENAI_API_KEY")
-        self.client = OpenAI(api_key=self.api_key) if self.api_key and OPENAI_AVAILABLE else None
+        # Embedding backend decides the model and index dimension
+        self.backend = backend or create_embedding_backend(model=embedding_model)
+        self.embedding_model = self.backend.model_name
+        self.dimension = self.backend.dimension
 
         # FAISS index and documents
         self.index = None
-        self.documents = []  # List of (content, metadata) tuples
-        self.dimension = 1536  # text-embedding-3-small dimension
+        self.documents: Dict[int, Tuple[str, Dict[str, Any]]] = {}  # Vector ID -> (content, metadata)
+        self.manifest: Dict[str, Dict[str, Any]] = {}  # Document key -> {'id', 'hash'}
+        self._next_id = 0
+        self._indexed_model = self.embedding_model
+
+        # Repeated queries skip the embedding call
+        if enable_query_cache is None:
+            enable_query_cache = EMBEDDING_CACHE_ENABLED
+        self.query_cache = QueryEmbeddingCache() if enable_query_cache else None
 
         print(f" FAISS Vector Store initialized")
         print(f"  Persist Directory: {self.persist_directory}")
-        print(f"  Embedding Model: {self.embedding_model}")
+        print(f"  Embedding Model: {self.embedding_model} ({self.backend.name}, {self.dimension} dimensions)")
 
-    def _get_embedding(self, text: str) -> List[float]:
-        """Get embedding for text using OpenAI"""
-        if not self.client:
-            return [0.0] * self.dimension
+    @property
+    def embeddings_available(self) -> bool:
+        """False when the backend returns placeholder vectors (no API key)"""
+        return self.backend.available
 
-        response = self.client.embeddings.create(
-            model=self.embedding_model,
-            input=text
-        )
-        return response.data[0].embedding
+    def _get_embedding(self, text: str) -> List[float]:
+        """Get embedding for text"""
+        return self.backend.embed_query(text)
 
     def _get_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
         """Get embeddings for multiple texts"""
-        if not self.client:
-            return [[0.0] * self.dimension for _ in texts]
+        return self.backend.embed(texts)
 
-        # Process in batches of 100
-        all_embeddings = []
-        batch_size = 100
-
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i:i + batch_size]
-            response = self.client.embeddings.create(
-                model=self.embedding_model,
-                input=batch
-            )
-            all_embeddings.extend([d.embedding for d in response.data])
+    def _embed_queries(self, queries: List[str]) -> Tuple['np.ndarray', int]:
+        """
+        Normalized (len(queries), dimension) float32 query matrix
 
-        return all_embeddings
+        Vectors come from the query cache when possible; the rest are
+        embedded in one backend call. Also returns the number of cache hits.
+        """
+        matrix = np.zeros((len(queries), self.dimension), dtype='float32')
+        missing: Dict[str, List[int]] = {}  # Query -> rows
+        hits = 0
+
+        for row, query in enumerate(queries):
+            cached = self.query_cache.get(self.embedding_model, query) if self.query_cache is not None else None
+            if cached is not None:
+                matrix[row] = cached
+                hits += 1
+            else:
+                missing.setdefault(query, []).append(row)
+
+        if missing:
+            texts = list(missing)
+            embeddings = np.array(self._get_embeddings_batch(texts)).astype('float32')
+            faiss.normalize_L2(embeddings)
+            for query, embedding in zip(texts, embeddings):
+                matrix[missing[query]] = embedding
+                # Placeholder vectors (no API key) are not worth keeping
+                if self.query_cache is not None and self.embeddings_available:
+                    self.query_cache.set(self.embedding_model, query, embedding)
+
+        return matrix, hits
+
+    @property
+    def query_cache_stats(self) -> Dict[str, Any]:
+        """Query embedding cache hit/miss statistics"""
+        return self.query_cache.stats if self.query_cache is not None else {"enabled": False}
+
+    # ------------------------------------------------------------------
+    # Index maintenance
+    # ------------------------------------------------------------------
+
+    def _new_index(self):
+        """Empty ID-mapped inner product index (cosine similarity on normalized vectors)"""
+        return faiss.IndexIDMap2(faiss.IndexFlatIP(self.dimension))
+
+    def _reset(self) -> None:
+        self.index = self._new_index()
+        self.documents = {}
+        self.manifest = {}
+        self._next_id = 0
+        self._indexed_model = self.embedding_model
 
     def create_index(self, documents: List[Dict[str, Any]], reset: bool = False) -> None:
         """
-        Create FAISS index from documents
+        Make the index hold exactly these documents
+
+        Without reset, an index loaded with load_index() is updated in place:
+        only new or changed chunks are embedded and documents no longer
+        present are removed. The index is rebuilt when reset is set, nothing
+        is loaded, or it was built with a different embedding model.
 
         Args:
             documents: List of dicts with 'content' and 'metadata' keys
@@ -102,33 +186,147 @@ class FAISSVectorStore:
             print("Warning: No documents provided")
             return
 
-        print(f"\n Creating FAISS index with {len(documents)} documents...")
+        if (
+            reset
+            or self.index is None
+            or self._indexed_model != self.embedding_model
+            or self.index.d != self.dimension
+        ):
+            print(f"\n Creating FAISS index with {len(documents)} documents...")
+            self._reset()
+        else:
+            print(f"\n Updating FAISS index ({self.index.ntotal} vectors) with {len(documents)} documents...")
+
+        stats = self.add_documents(documents, save=False)
+        keys = {document_key(doc['content'], doc.get('metadata', {})) for doc in documents}
+        stale_keys = [key for key in self.manifest if key not in keys]
+        self._remove_ids([self.manifest.pop(key)['id'] for key in stale_keys])
+        stats['removed'] = len(stale_keys)
+        self._save()
 
-        # Get embeddings
-        texts = [doc['content'] for doc in documents]
-        print(" Generating embeddings...")
-        embeddings = self._get_embeddings_batch(texts)
+        print(f" FAISS index ready with {self.index.ntotal} vectors "
+              f"({stats['added']} added, {stats['updated']} updated, {stats['removed']} removed, "
+              f"{stats['embedded']} embedded)")
 
-        # Create FAISS index
-        embeddings_array = np.array(embeddings).astype('float32')
-        self.index = faiss.IndexFlatIP(self.dimension)  # Inner product (cosine similarity with normalized vectors)
+    def add_documents(self, documents: List[Dict[str, Any]], save: bool = True) -> Dict[str, int]:
+        """
+        Add or update documents, embedding only new or changed content
 
-        # Normalize for cosine similarity
-        faiss.normalize_L2(embeddings_array)
-        self.index.add(embeddings_array)
+        A document whose key is already indexed with the same content hash
+        only has its metadata refreshed.
 
-        # Store documents
-        self.documents = [(doc['content'], doc.get('metadata', {})) for doc in documents]
+        Args:
+            documents: List of dicts with 'content' and 'metadata' keys
+            save: Persist the index afterwards
 
-        # Save to disk
-        self._save()
+        Returns:
+            Counts of added, updated, unchanged and embedded documents
+        """
+        if self.index is None:
+            self._reset()
+
+        stats = {'added': 0, 'updated': 0, 'unchanged': 0, 'embedded': 0}
+        vector_ids = {entry['hash']: entry['id'] for entry in self.manifest.values()}
+        reused: List[Tuple[int, int]] = []  # (new ID, existing ID with the same content)
+        to_embed: Dict[str, List[int]] = {}  # Content hash -> new IDs
+        texts: Dict[str, str] = {}
+        stale_ids: List[int] = []
+
+        for doc in documents:
+            content = doc['content']
+            metadata = doc.get('metadata', {})
+            key = document_key(content, metadata)
+            digest = content_hash(content)
+
+            entry = self.manifest.get(key)
+            if entry and entry['hash'] == digest:
+                self.documents[entry['id']] = (content, metadata)
+                stats['unchanged'] += 1
+                continue
+            if entry:
+                stale_ids.append(entry['id'])
+                stats['updated'] += 1
+            else:
+                stats['added'] += 1
+
+            new_id = self._next_id
+            self._next_id += 1
+            self.manifest[key] = {'id': new_id, 'hash': digest}
+            self.documents[new_id] = (content, metadata)
+            if digest in vector_ids:
+                reused.append((new_id, vector_ids[digest]))
+            else:
+                to_embed.setdefault(digest, []).append(new_id)
+                texts[digest] = content
+
+        ids: List[int] = []
+        vectors = []
+        # Copy reused vectors before their old IDs are removed
+        for new_id, existing_id in reused:
+            ids.append(new_id)
+            vectors.append(self.index.reconstruct(existing_id))
+
+        if to_embed:
+            hashes = list(to_embed)
+            print(f" Generating embeddings for {len(hashes)} chunks...")
+            embeddings = np.array(self._get_embeddings_batch([texts[h] for h in hashes])).astype('float32')
+            faiss.normalize_L2(embeddings)
+            for digest, embedding in zip(hashes, embeddings):
+                for new_id in to_embed[digest]:
+                    ids.append(new_id)
+                    vectors.append(embedding)
+            stats['embedded'] = len(hashes)
+
+        self._remove_ids(stale_ids)
+        if ids:
+            self.index.add_with_ids(np.array(vectors, dtype='float32'), np.array(ids, dtype='int64'))
+
+        if save:
+            self._save()
+        return stats
+
+    def remove_documents(self, keys: List[str], save: bool = True) -> int:
+        """
+        Remove documents from the index
 
-        print(f" FAISS index created with {self.index.ntotal} vectors")
+        Args:
+            keys: Document keys (chunk_id) or file names; a file name
+                  removes every chunk of that file
+            save: Persist the index afterwards
+
+        Returns:
+            Number of documents removed
+        """
+        if self.index is None:
+            return 0
+
+        targets = set(keys)
+        removed_keys = [
+            key for key, entry in self.manifest.items()
+            if key in targets or self.documents.get(entry['id'], ('', {}))[1].get('file_name') in targets
+        ]
+        self._remove_ids([self.manifest.pop(key)['id'] for key in removed_keys])
+
+        if save and removed_keys:
+            self._save()
+        return len(removed_keys)
+
+    def _remove_ids(self, ids: List[int]) -> None:
+        if not ids:
+            return
+        self.index.remove_ids(np.array(ids, dtype='int64'))
+        for vector_id in ids:
+            self.documents.pop(vector_id, None)
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
 
     def load_index(self) -> bool:
         """Load existing index from disk"""
         index_path = self.persist_directory / "index.faiss"
         docs_path = self.persist_directory / "documents.pkl"
+        manifest_path = self.persist_directory / "manifest.json"
 
         if not index_path.exists() or not docs_path.exists():
             print(f"[WARN] FAISS index not found at {self.persist_directory}")
@@ -139,21 +337,57 @@ class FAISSVectorStore:
             with open(docs_path, 'rb') as f:
                 self.documents = pickle.load(f)
 
+            if manifest_path.exists():
+                manifest = json.loads(manifest_path.read_text(encoding='utf-8'))
+                self.manifest = manifest['documents']
+                self._next_id = manifest['next_id']
+                self._indexed_model = manifest.get('embedding_model', self.embedding_model)
+            else:
+                self._migrate_positional_index()
+
+            if self._indexed_model != self.embedding_model or self.index.d != self.dimension:
+                print(f"[WARN] FAISS index was built with {self._indexed_model} ({self.index.d} dimensions), "
+                      f"not {self.embedding_model} - rebuild with scripts/setup_faiss_rag.py")
+                return False
+
             print(f" Loaded FAISS index: {self.index.ntotal} vectors")
             return True
         except Exception as e:
             print(f"[WARN] Error loading FAISS index: {e}")
             return False
 
+    def _migrate_positional_index(self) -> None:
+        """Convert an index saved before the manifest (flat index, document list) to ID-mapped form"""
+        vectors = self.index.reconstruct_n(0, self.index.ntotal)
+        self.index = faiss.IndexIDMap2(faiss.IndexFlatIP(vectors.shape[1]))
+        self.index.add_with_ids(vectors, np.arange(len(vectors), dtype='int64'))
+
+        self.documents = dict(enumerate(self.documents))
+        self.manifest = {
+            document_key(content, metadata): {'id': vector_id, 'hash': content_hash(content)}
+            for vector_id, (content, metadata) in self.documents.items()
+        }
+        self._next_id = len(self.documents)
+        self._indexed_model = LEGACY_EMBEDDING_MODEL
+
     def _save(self) -> None:
-        """Save index and documents to disk"""
+        """Save index, documents and manifest to disk"""
         index_path = self.persist_directory / "index.faiss"
         docs_path = self.persist_directory / "documents.pkl"
+        manifest_path = self.persist_directory / "manifest.json"
 
         faiss.write_index(self.index, str(index_path))
         with open(docs_path, 'wb') as f:
             pickle.dump(self.documents, f)
-
+        manifest_path.write_text(json.dumps({
+            'version': MANIFEST_VERSION,
+            'embedding_model': self._indexed_model,
+            'dimension': self.dimension,
+            'next_id': self._next_id,
+            'documents': self.manifest
+        }, indent=2), encoding='utf-8')
+
+    @tracing.traced('faiss.search')
     def search(
         self,
         query: str,
@@ -169,26 +403,95 @@ class FAISSVectorStore:
         Returns:
             List of results with content, metadata, and score
         """
+        prefetched = (_prefetched_results.get() or {}).get((id(self), query))
+        if prefetched is not None and k <= prefetched[0]:
+            tracing.current_span().set_attribute('prefetched', True)
+            return [dict(result) for result in prefetched[1][:k]]
+
         if self.index is None or self.index.ntotal == 0:
             return []
 
-        # Get query embedding
-        query_embedding = np.array([self._get_embedding(query)]).astype('float32')
-        faiss.normalize_L2(query_embedding)
+        query_embedding, hits = self._embed_queries([query])
+        if self.query_cache is not None:
+            tracing.current_span().set_attribute('cache_hit', hits == 1)
 
         # Search
         scores, indices = self.index.search(query_embedding, min(k, self.index.ntotal))
+        return self._format_results(scores[0], indices[0])
+
+    @tracing.traced('faiss.search_batch')
+    def search_batch(
+        self,
+        queries: List[str],
+        k: int = 5
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Search for several queries at once
+
+        Embeds all queries not in the query cache in one request and runs a
+        single index search on the stacked query matrix.
+
+        Args:
+            queries: Search queries
+            k: Number of results per query
+
+        Returns:
+            One result list per query, as returned by search()
+        """
+        if not queries:
+            return []
+        if self.index is None or self.index.ntotal == 0:
+            return [[] for _ in queries]
+
+        query_matrix, hits = self._embed_queries(queries)
+        tracing.current_span().set_attributes(queries=len(queries), cache_hits=hits)
+
+        scores, indices = self.index.search(query_matrix, min(k, self.index.ntotal))
+        return [self._format_results(row_scores, row_indices) for row_scores, row_indices in zip(scores, indices)]
+
+    @contextmanager
+    def prefetch(self, queries: List[Tuple[str, int]]):
+        """
+        Answer search(query, k) for these (query, k) pairs from one batched
+        search while the block runs
+
+        Applies to the current context and to threads started from copies
+        of it (StagePipeline runs stages in copied contexts). Other queries
+        are searched as usual. A failed prefetch is logged and skipped.
+        """
+        prefetched = dict(_prefetched_results.get() or {})
+        wanted: Dict[str, int] = {}
+        for query, k in queries:
+            wanted[query] = max(k, wanted.get(query, 0))
+
+        if wanted:
+            k_max = max(wanted.values())
+            try:
+                for query, results in zip(wanted, self.search_batch(list(wanted), k=k_max)):
+                    prefetched[(id(self), query)] = (k_max, results)
+            except Exception as e:
+                print(f"[WARN] RAG prefetch failed: {e}")
+
+        token = _prefetched_results.set(prefetched)
+        try:
+            yield
+        finally:
+            _prefetched_results.reset(token)
 
+    def _format_results(self, scores, indices) -> List[Dict[str, Any]]:
+        """Result dicts for one row of index.search output"""
         results = []
-        for score, idx in zip(scores[0], indices[0]):
-            if idx >= 0 and idx < len(self.documents):
-                content, metadata = self.documents[idx]
+        for score, idx in zip(scores, indices):
+            if idx >= 0 and int(idx) in self.documents:
+                content, metadata = self.documents[int(idx)]
                 results.append({
                     'content': content,
                     'metadata': metadata,
                     'score': float(score),
                     'source': metadata.get('source', 'unknown'),
-                    'category': metadata.get('category', 'unknown')
+                    'category': metadata.get('category', 'unknown'),
+                    'section': metadata.get('section', ''),
+                    'chunk_id': metadata.get('chunk_id', metadata.get('file_name', ''))
                 })
 
         return results
@@ -202,6 +505,7 @@ class FAISSVectorStore:
 
         context_parts = []
         for i, result in enumerate(results, 1):
-            context_parts.append(f"[SOURCE-{i}] ({result['source']})\n{result['content']}")
+            label = f"{result['source']} - {result['section']}" if result['section'] else result['source']
+            context_parts.append(f"[SOURCE-{i}] ({label})\n{result['content']}")
 
         return "\n\n---\n\n".join(context_parts)
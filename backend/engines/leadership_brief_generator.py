@@ -12,6 +12,10 @@ NOW WITH LLM-POWERED REASONING:
 
 import sys
 import os
+import asyncio
+import contextvars
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
@@ -31,6 +35,16 @@ from backend.engines.rule_evaluation_engine import RuleEvaluationEngine
 from backend.engines.rule_orchestrator import RuleOrchestrator
 from backend.engines.llm_engine import LLMEngine
 from backend.engines.web_search_engine import WebSearchEngine
+from backend.engines.prompt_compiler import PromptCompiler
+from backend.engines.supplier_extraction import extract_supplier_profiles
+from backend.engines import tracing
+
+# Import settings for configuration
+try:
+    from backend.config.settings import settings
+    LLM_MAX_CONCURRENCY = settings.LLM_MAX_CONCURRENCY
+except ImportError:
+    LLM_MAX_CONCURRENCY = 4
 # VectorStoreManager imported lazily to avoid ChromaDB Windows segfault
 
 
@@ -220,7 +234,10 @@ class LeadershipBriefGenerator:
         enable_llm: bool = True,
         enable_rag: bool = True,
         enable_web_search: bool = True,
-        use_agents: bool = False
+        use_agents: bool = False,
+        llm_concurrency: int = None,
+        llm_engine: Optional[LLMEngine] = None,
+        vector_store=None
     ):
         """
         Initialize brief generator with RAG-powered reasoning.
@@ -240,6 +257,12 @@ class LeadershipBriefGenerator:
                         When True, delegates to BriefOrchestrator which coordinates
                         specialized agents (DataAnalysis, Risk, Recommendation, Market).
                         Defaults to False for backward compatibility.
+            llm_concurrency: Maximum LLM sections requested concurrently per brief
+                        (default: LLM_MAX_CONCURRENCY). 1 generates sections sequentially.
+            llm_engine: Preconfigured LLMEngine (e.g. with StubLLMBackend for offline
+                        load tests). Created from settings when not provided.
+            vector_store: Preconfigured vector store (e.g. StubVectorStore for offline
+                        load tests). The FAISS index is loaded when not provided.
         """
         if data_loader:
             self.data_loader = data_loader
@@ -250,31 +273,34 @@ class LeadershipBriefGenerator:
         self.use_agents = use_agents
         self.enable_web_search = enable_web_search
         self._orchestrator = None  # Lazy-loaded when use_agents=True
+        self.llm_concurrency = max(1, llm_concurrency or LLM_MAX_CONCURRENCY)
 
         # Initialize LLM engine for AI-powered reasoning
         self.enable_llm = enable_llm
         self.llm_engine = None
         if enable_llm:
             try:
-                self.llm_engine = LLMEngine()
-                if self.llm_engine.client is None:
+                self.llm_engine = llm_engine or LLMEngine()
+                if not self.llm_engine.is_available:
                     print("[WARN] LLM not available - using template-based reasoning")
                     self.enable_llm = False
             except Exception as e:
                 print(f"[WARN] LLM initialization failed: {e} - using template-based reasoning")
                 self.enable_llm = False
 
+        # Token budgets for RAG chunks and data sections in every prompt
+        self.prompt_compiler = PromptCompiler(model=getattr(self.llm_engine, 'model', None))
+
         # Initialize RAG for context-aware generation (using FAISS - Windows compatible)
         self.enable_rag = enable_rag
         self.vector_store = None
-        if enable_rag:
+        if enable_rag and vector_store is not None:
+            self.vector_store = vector_store
+        elif enable_rag:
             try:
                 # Use FAISS instead of ChromaDB (Windows compatible)
                 from backend.engines.faiss_vector_store import FAISSVectorStore
-                self.vector_store = FAISSVectorStore(
-                    persist_directory="./data/faiss_db",
-                    embedding_model="text-embedding-3-small"
-                )
+                self.vector_store = FAISSVectorStore(persist_directory="./data/faiss_db")
                 if self.vector_store.load_index():
                     print("[OK] FAISS RAG loaded - context-aware generation enabled")
                 else:
@@ -286,6 +312,12 @@ class LeadershipBriefGenerator:
                 self.enable_rag = False
                 self.vector_store = None
 
+        # Optional semantic cache for near-duplicate grounded prompts
+        self.semantic_cache = None
+        if self.enable_llm and self.vector_store is not None:
+            from backend.engines.semantic_cache import get_semantic_cache
+            self.semantic_cache = get_semantic_cache(self.vector_store)
+
         # Initialize Web Search Engine for supplier data fallback
         self.web_search_engine = None
         if enable_web_search:
@@ -457,10 +489,15 @@ class LeadershipBriefGenerator:
 
         # Calculate total spend per supplier and sort descending to identify top suppliers
         supplier_spend_series = spend_df.groupby('Supplier_Name')['Spend_USD'].sum().sort_values(ascending=False)
-        supplier_names = supplier_spend_series.index.tolist()
+        supplier_names = supplier_spend_series.index.tolist()[:15]
+
+        # Suppliers missing from the database are enriched from the web in one batch
+        known = set(supplier_df['supplier_name'])
+        unknown = [name for name in supplier_names if name not in known]
+        web_infos = self._get_suppliers_info_from_web(unknown, category) if unknown else {}
 
         # Process top 15 suppliers (increased from 5 to ensure coverage)
-        for supplier_name in supplier_names[:15]:
+        for supplier_name in supplier_names:
             supplier_info = supplier_df[supplier_df['supplier_name'] == supplier_name]
             supplier_spend = spend_df[spend_df['Supplier_Name'] == supplier_name]['Spend_USD'].sum()
 
@@ -482,8 +519,8 @@ class LeadershipBriefGenerator:
                     'data_source': 'database'
                 })
             else:
-                # CASE 2: Supplier NOT in database - try web search fallback
-                web_info = self._get_supplier_info_from_web(supplier_name, category)
+                # CASE 2: Supplier NOT in database - web search fallback (fetched above)
+                web_info = web_infos[supplier_name]
                 
                 metrics.append({
                     'supplier': supplier_name,
@@ -549,82 +586,29 @@ class LeadershipBriefGenerator:
         except Exception as e:
             return {'has_proof_points': False, 'error': str(e)}
 
-    def _get_supplier_info_from_web(self, supplier_name: str, category: str = None) -> Dict[str, Any]:
+    @tracing.traced('web.supplier_info')
+    def _get_suppliers_info_from_web(
+        self,
+        supplier_names: List[str],
+        category: str = None
+    ) -> Dict[str, Dict[str, Any]]:
         """
-        Fetch supplier information from the web when not found in database.
-        
-        This is a FALLBACK mechanism - only called when supplier is NOT in supplier_master.csv
-        
+        Fetch supplier information from the web for suppliers not in the database.
+
+        This is a FALLBACK mechanism - only called for suppliers NOT in supplier_master.csv.
+        Each supplier gets its own web search; the LLM (if available) then extracts
+        structured info for all of them in batched JSON-mode requests.
+
         Args:
-            supplier_name: Name of the supplier to search for
+            supplier_names: Suppliers to search for
             category: Optional category context for better search results
-            
+
         Returns:
-            Dictionary with supplier metrics (estimated from web data) or empty values
+            Supplier name -> metrics (estimated from web data) or empty values
         """
-        if not self.web_search_engine or not self.web_search_engine.enabled:
+        def empty_info(source: str) -> Dict[str, Any]:
             return {
-                'source': 'not_found',
-                'quality_rating': 0,
-                'delivery_reliability': 0,
-                'sustainability_score': 0,
-                'years_in_business': 0,
-                'certifications': []
-            }
-        
-        try:
-            # Build search query for supplier
-            query_parts = [supplier_name]
-            if category:
-                query_parts.append(category)
-            query_parts.extend(['company', 'supplier', 'profile', 'rating', 'review'])
-            query = " ".join(query_parts)
-            
-            # Search the web
-            search_result = self.web_search_engine.search(query, num_results=3)
-            
-            if not search_result.get('success') or not search_result.get('results'):
-                return {
-                    'source': 'web_search_failed',
-                    'quality_rating': 0,
-                    'delivery_reliability': 0,
-                    'sustainability_score': 0,
-                    'years_in_business': 0,
-                    'certifications': []
-                }
-            
-            # Extract information from search results
-            # Note: These are estimates based on web context, not verified data
-            web_context = search_result.get('context', '')
-            sources = search_result.get('results', [])
-            
-            # Use LLM to extract structured info if available
-            if self.llm_engine and self.llm_engine.client:
-                extracted_info = self._extract_supplier_info_with_llm(
-                    supplier_name, web_context, sources
-                )
-                if extracted_info:
-                    extracted_info['source'] = 'web_search'
-                    extracted_info['web_sources'] = [s.get('url', '') for s in sources[:3]]
-                    return extracted_info
-            
-            # Fallback: Return partial info with web source citation
-            return {
-                'source': 'web_search',
-                'quality_rating': 0,  # Cannot estimate without LLM
-                'delivery_reliability': 0,
-                'sustainability_score': 0,
-                'years_in_business': 0,
-                'certifications': [],
-                'web_context': web_context[:500],  # First 500 chars for reference
-                'web_sources': [s.get('url', '') for s in sources[:3]]
-            }
-            
-        except Exception as e:
-            print(f"[WARN] Web search failed for {supplier_name}: {e}")
-            return {
-                'source': 'error',
-                'error': str(e),
+                'source': source,
                 'quality_rating': 0,
                 'delivery_reliability': 0,
                 'sustainability_score': 0,
@@ -632,77 +616,59 @@ class LeadershipBriefGenerator:
                 'certifications': []
             }
 
-    def _extract_supplier_info_with_llm(
-        self, 
-        supplier_name: str, 
-        web_context: str, 
-        sources: List[Dict]
-    ) -> Optional[Dict[str, Any]]:
-        """
-        Use LLM to extract structured supplier info from web search results.
-        
-        Args:
-            supplier_name: Name of the supplier
-            web_context: Combined text from web search
-            sources: List of source URLs
-            
-        Returns:
-            Extracted supplier info or None if extraction fails
-        """
-        if not self.llm_engine or not self.llm_engine.client:
-            return None
-            
-        prompt = f"""Based on the following web search results about "{supplier_name}", extract supplier information.
-
-WEB SEARCH RESULTS:
-{web_context}
+        if not self.web_search_engine or not self.web_search_engine.enabled:
+            return {name: empty_info('not_found') for name in supplier_names}
 
-INSTRUCTIONS:
-1. Extract ONLY information explicitly mentioned in the search results
-2. If information is not available, use 0 or empty values
-3. Be conservative with ratings - only assign high values if clearly supported
-4. Return a JSON object with these fields:
-   - quality_rating: 0-5 scale (0 if not mentioned)
-   - delivery_reliability: 0-100 percentage (0 if not mentioned)
-   - sustainability_score: 0-100 (0 if not mentioned)
-   - years_in_business: integer (0 if not mentioned)
-   - certifications: list of certification names found (empty list if none)
-   - company_description: brief description if found
+        infos: Dict[str, Dict[str, Any]] = {}
+        found: Dict[str, Dict[str, Any]] = {}
+        for supplier_name in supplier_names:
+            try:
+                # Build search query for supplier
+                query_parts = [supplier_name]
+                if category:
+                    query_parts.append(category)
+                query_parts.extend(['company', 'supplier', 'profile', 'rating', 'review'])
+                query = " ".join(query_parts)
+
+                # Search the web
+                search_result = self.web_search_engine.search(query, num_results=3)
+
+                if not search_result.get('success') or not search_result.get('results'):
+                    infos[supplier_name] = empty_info('web_search_failed')
+                else:
+                    found[supplier_name] = search_result
+            except Exception as e:
+                print(f"[WARN] Web search failed for {supplier_name}: {e}")
+                infos[supplier_name] = {**empty_info('error'), 'error': str(e)}
 
-Return ONLY valid JSON, no other text."""
+        # Use LLM to extract structured info for all found suppliers (batched)
+        # Note: These are estimates based on web context, not verified data
+        extracted: Dict[str, Optional[Dict[str, Any]]] = {}
+        if found and self.llm_engine and self.llm_engine.is_available:
+            try:
+                extracted = extract_supplier_profiles(
+                    self.llm_engine,
+                    {name: result.get('context', '') for name, result in found.items()}
+                )
+            except Exception as e:
+                print(f"[WARN] LLM extraction failed for {len(found)} suppliers: {e}")
 
-        try:
-            response = self.llm_engine.generate(
-                prompt=prompt,
-                max_tokens=500,
-                temperature=0.1  # Low temperature for structured extraction
-            )
-            
-            if response:
-                import json
-                # Try to parse JSON from response
-                # Handle case where response might have markdown code blocks
-                response_text = response.strip()
-                if response_text.startswith('```'):
-                    response_text = response_text.split('```')[1]
-                    if response_text.startswith('json'):
-                        response_text = response_text[4:]
-                    response_text = response_text.strip()
-                
-                extracted = json.loads(response_text)
-                return {
-                    'quality_rating': float(extracted.get('quality_rating', 0)),
-                    'delivery_reliability': float(extracted.get('delivery_reliability', 0)),
-                    'sustainability_score': float(extracted.get('sustainability_score', 0)),
-                    'years_in_business': int(extracted.get('years_in_business', 0)),
-                    'certifications': extracted.get('certifications', []),
-                    'company_description': extracted.get('company_description', '')
+        for supplier_name, search_result in found.items():
+            sources = search_result.get('results', [])
+            web_sources = [s.get('url', '') for s in sources[:3]]
+            extracted_info = extracted.get(supplier_name)
+            if extracted_info:
+                infos[supplier_name] = {**extracted_info, 'source': 'web_search', 'web_sources': web_sources}
+            else:
+                # Fallback: Return partial info with web source citation
+                infos[supplier_name] = {
+                    **empty_info('web_search'),  # Cannot estimate without LLM
+                    'web_context': search_result.get('context', '')[:500],  # First 500 chars for reference
+                    'web_sources': web_sources
                 }
-        except Exception as e:
-            print(f"[WARN] LLM extraction failed for {supplier_name}: {e}")
-            
-        return None
-    
+
+        return {name: infos[name] for name in supplier_names}
+
     def _calculate_risk_matrix(
         self,
         supplier_concentration: float,
@@ -886,19 +852,70 @@ Return ONLY valid JSON, no other text."""
     def generate_both_briefs(
         self,
         client_id: str,
-        category: str = None
+        category: str = None,
+        shared_analysis: bool = True
     ) -> Dict[str, Any]:
-        """Generate both leadership briefs with enhanced metrics"""
+        """
+        Generate both leadership briefs with enhanced metrics.
 
+        With shared_analysis (default) category resolution, supplier
+        performance and rule evaluation run once for both briefs, and the
+        two briefs are assembled concurrently.
+
+        Generation is traced; both briefs carry the trace summary
+        ('trace_summary') when tracing is enabled.
+        """
+        with tracing.trace(
+            'generate_both_briefs',
+            client_id=client_id,
+            category=category or '',
+            use_agents=self.use_agents
+        ) as brief_trace:
+            result = self._generate_both_briefs(client_id, category, shared_analysis)
+
+        if brief_trace is not None:
+            summary = brief_trace.summary()
+            result['trace_summary'] = summary
+            for key in ('incumbent_concentration_brief', 'regional_concentration_brief'):
+                if isinstance(result.get(key), dict):
+                    result[key]['trace_summary'] = summary
+        return result
+
+    def _generate_both_briefs(
+        self,
+        client_id: str,
+        category: str,
+        shared_analysis: bool
+    ) -> Dict[str, Any]:
+        """Both briefs via the orchestrator (use_agents) or the template pipeline"""
         # Use agent-based generation if enabled
         if self.use_agents:
             orchestrator = self._get_orchestrator()
             if orchestrator:
-                return orchestrator.generate_both_briefs(client_id, category)
+                return orchestrator.generate_both_briefs(
+                    client_id, category, shared_analysis=shared_analysis
+                )
 
         # Fall back to original implementation
-        incumbent_brief = self.generate_incumbent_concentration_brief(client_id, category)
-        regional_brief = self.generate_regional_concentration_brief(client_id, category)
+        if not shared_analysis:
+            incumbent_brief = self.generate_incumbent_concentration_brief(client_id, category)
+            regional_brief = self.generate_regional_concentration_brief(client_id, category)
+        else:
+            shared = self._prepare_shared_analysis(client_id, category)
+            if 'error' in shared:
+                incumbent_brief = self._empty_brief_response(shared['error'])
+                regional_brief = self._empty_brief_response(shared['error'])
+            else:
+                results = self._run_stages([
+                    ('incumbent_brief', lambda _: self.generate_incumbent_concentration_brief(
+                        client_id, category, shared=shared
+                    )),
+                    ('regional_brief', lambda _: self.generate_regional_concentration_brief(
+                        client_id, category, shared=shared
+                    ))
+                ])
+                incumbent_brief = results['incumbent_brief']
+                regional_brief = results['regional_brief']
 
         return {
             'incumbent_concentration_brief': incumbent_brief,
@@ -908,19 +925,24 @@ Return ONLY valid JSON, no other text."""
             'category': category
         }
 
-    def generate_incumbent_concentration_brief(
+    def _run_stages(self, stages: List[Tuple[str, Any]]) -> Dict[str, Any]:
+        """Run independent (name, func) stages concurrently via StagePipeline."""
+        from backend.agents.stage_pipeline import StagePipeline, PipelineStage
+        pipeline = StagePipeline([PipelineStage(name, func) for name, func in stages])
+        return pipeline.run()
+
+    def _prepare_shared_analysis(
         self,
         client_id: str,
         category: str = None
     ) -> Dict[str, Any]:
-        """Generate Incumbent Concentration Brief with all data-driven metrics"""
-
-        # Use agent-based generation if enabled
-        if self.use_agents:
-            orchestrator = self._get_orchestrator()
-            if orchestrator:
-                return orchestrator.generate_incumbent_concentration_brief(client_id, category)
+        """
+        Resolve the brief scope and compute analysis common to both briefs.
 
+        Returns a dict with spend/supplier data, resolved hierarchy, supplier
+        performance and rule violations, or {'error': ...} when there is no
+        data to analyze.
+        """
         supplier_df = self.data_loader.load_supplier_master()
 
         # Use robust category resolver for any input type (sector/category/subcategory)
@@ -933,9 +955,7 @@ Return ONLY valid JSON, no other text."""
                 resolved = self.data_loader.resolve_category_input(category)
 
             if not resolved.get('success', False):
-                return self._empty_brief_response(
-                    resolved.get('error', f"Could not resolve category: {category}")
-                )
+                return {'error': resolved.get('error', f"Could not resolve category: {category}")}
 
             spend_df = resolved.get('spend_data', pd.DataFrame())
 
@@ -955,7 +975,56 @@ Return ONLY valid JSON, no other text."""
                 resolved_sector = spend_df['Sector'].iloc[0]
 
         if spend_df.empty:
-            return self._empty_brief_response("No spend data found")
+            return {'error': "No spend data found"}
+
+        # Supplier performance (may hit web search) and the full rule book
+        # evaluation are independent, so run them side by side
+        results = self._run_stages([
+            ('supplier_performance', lambda _: self._calculate_supplier_performance_metrics(
+                spend_df, supplier_df, category
+            )),
+            ('rule_violations', lambda _: self._evaluate_rule_violations(client_id, category))
+        ])
+
+        return {
+            'spend_df': spend_df,
+            'supplier_df': supplier_df,
+            'category': category,
+            'resolved_sector': resolved_sector,
+            'resolved_category': resolved_category,
+            'supplier_performance': results['supplier_performance'],
+            'rule_violations': results['rule_violations']
+        }
+
+    def generate_incumbent_concentration_brief(
+        self,
+        client_id: str,
+        category: str = None,
+        shared: Dict[str, Any] = None
+    ) -> Dict[str, Any]:
+        """
+        Generate Incumbent Concentration Brief with all data-driven metrics.
+
+        ``shared`` is the output of _prepare_shared_analysis, passed in by
+        generate_both_briefs so both briefs reuse one analysis.
+        """
+
+        # Use agent-based generation if enabled
+        if self.use_agents:
+            orchestrator = self._get_orchestrator()
+            if orchestrator:
+                return orchestrator.generate_incumbent_concentration_brief(client_id, category)
+
+        if shared is None:
+            shared = self._prepare_shared_analysis(client_id, category)
+        if 'error' in shared:
+            return self._empty_brief_response(shared['error'])
+
+        spend_df = shared['spend_df']
+        supplier_df = shared['supplier_df']
+        category = shared['category']
+        resolved_sector = shared['resolved_sector']
+        resolved_category = shared['resolved_category']
 
         total_spend = spend_df['Spend_USD'].sum()
 
@@ -1060,7 +1129,7 @@ Return ONLY valid JSON, no other text."""
             category, product_category, total_spend, new_regions
         )
         
-        supplier_performance = self._calculate_supplier_performance_metrics(spend_df, supplier_df, category)
+        supplier_performance = shared['supplier_performance']
         
         risk_matrix = self._calculate_risk_matrix(
             dominant_supplier_pct, dominant_region_pct, num_current_suppliers
@@ -1075,7 +1144,7 @@ Return ONLY valid JSON, no other text."""
         
         timeline = self._generate_implementation_timeline(category)
         
-        rule_violations = self._evaluate_rule_violations(client_id, category)
+        rule_violations = shared['rule_violations']
         
         brief = {
             'title': f'LEADERSHIP BRIEF – {(category or "PROCUREMENT").upper()} DIVERSIFICATION',
@@ -1177,12 +1246,17 @@ Return ONLY valid JSON, no other text."""
 
         # Add LLM-powered deep analysis sections if enabled
         if self.enable_llm:
-            brief['ai_executive_summary'] = self._generate_llm_executive_summary(brief, "incumbent")
-            brief['ai_risk_analysis'] = self._generate_llm_risk_analysis(brief, "incumbent")
-            brief['ai_strategic_recommendations'] = self._generate_llm_strategic_recommendations(brief, "incumbent")
-            brief['ai_market_intelligence'] = self._generate_llm_market_intelligence(
-                category, supplier_countries + new_regions, product_category
-            )
+            # Sections are independent: issue all prompts concurrently
+            sections = {
+                'ai_executive_summary': self._executive_summary_section(brief, "incumbent"),
+                'ai_risk_analysis': self._risk_analysis_section(brief, "incumbent"),
+                'ai_strategic_recommendations': self._strategic_recommendations_section(brief, "incumbent"),
+                'ai_market_intelligence': self._market_intelligence_section(
+                    category, supplier_countries + new_regions, product_category
+                )
+            }
+            brief.update(self._generate_llm_sections(sections))
+            brief['prompt_tokens'] = self._prompt_token_report(sections)
             brief['llm_enabled'] = True
         else:
             # Use template-based reasoning as fallback
@@ -1199,9 +1273,15 @@ Return ONLY valid JSON, no other text."""
     def generate_regional_concentration_brief(
         self,
         client_id: str,
-        category: str = None
+        category: str = None,
+        shared: Dict[str, Any] = None
     ) -> Dict[str, Any]:
-        """Generate Regional Concentration Brief with all data-driven metrics"""
+        """
+        Generate Regional Concentration Brief with all data-driven metrics.
+
+        ``shared`` is the output of _prepare_shared_analysis (see
+        generate_incumbent_concentration_brief).
+        """
 
         # Use agent-based generation if enabled
         if self.use_agents:
@@ -1209,41 +1289,16 @@ Return ONLY valid JSON, no other text."""
             if orchestrator:
                 return orchestrator.generate_regional_concentration_brief(client_id, category)
 
-        supplier_df = self.data_loader.load_supplier_master()
-
-        # Use robust category resolver for any input type (sector/category/subcategory)
-        resolved_sector = None
-        resolved_category = None
-        if category:
-            resolved = self.data_loader.resolve_category_input(category, client_id)
-            if not resolved.get('success', False):
-                # Try without client filter
-                resolved = self.data_loader.resolve_category_input(category)
+        if shared is None:
+            shared = self._prepare_shared_analysis(client_id, category)
+        if 'error' in shared:
+            return self._empty_brief_response(shared['error'])
 
-            if not resolved.get('success', False):
-                return self._empty_brief_response(
-                    resolved.get('error', f"Could not resolve category: {category}")
-                )
-
-            spend_df = resolved.get('spend_data', pd.DataFrame())
-
-            # Update category with resolved hierarchy info
-            hierarchy = resolved.get('hierarchy', {})
-            resolved_sector = hierarchy.get('sector')
-            resolved_category = hierarchy.get('category')
-            if hierarchy.get('subcategory'):
-                category = hierarchy['subcategory']
-            elif hierarchy.get('category'):
-                category = hierarchy['category']
-        else:
-            spend_df = self.data_loader.load_spend_data()
-            spend_df = spend_df[spend_df['Client_ID'] == client_id]
-            # Try to get sector from spend data
-            if not spend_df.empty and 'Sector' in spend_df.columns:
-                resolved_sector = spend_df['Sector'].iloc[0]
-
-        if spend_df.empty:
-            return self._empty_brief_response("No spend data found")
+        spend_df = shared['spend_df']
+        supplier_df = shared['supplier_df']
+        category = shared['category']
+        resolved_sector = shared['resolved_sector']
+        resolved_category = shared['resolved_category']
         
         total_spend = spend_df['Spend_USD'].sum()
         
@@ -1322,8 +1377,8 @@ Return ONLY valid JSON, no other text."""
         )
         
         timeline = self._generate_implementation_timeline(category)
-        supplier_performance = self._calculate_supplier_performance_metrics(spend_df, supplier_df, category)
-        rule_violations = self._evaluate_rule_violations(client_id, category)
+        supplier_performance = shared['supplier_performance']
+        rule_violations = shared['rule_violations']
         
         if len(high_concentration_countries) >= 2:
             concentration_note = f"{high_concentration_countries[0]} and {high_concentration_countries[1]} each exceeded 40% of spend, creating high regional dependency."
@@ -1405,12 +1460,17 @@ Return ONLY valid JSON, no other text."""
 
         # Add LLM-powered deep analysis sections if enabled
         if self.enable_llm:
-            brief['ai_executive_summary'] = self._generate_llm_executive_summary(brief, "regional")
-            brief['ai_risk_analysis'] = self._generate_llm_risk_analysis(brief, "regional")
-            brief['ai_strategic_recommendations'] = self._generate_llm_strategic_recommendations(brief, "regional")
-            brief['ai_market_intelligence'] = self._generate_llm_market_intelligence(
-                category, all_countries + new_regions, product_category
-            )
+            # Sections are independent: issue all prompts concurrently
+            sections = {
+                'ai_executive_summary': self._executive_summary_section(brief, "regional"),
+                'ai_risk_analysis': self._risk_analysis_section(brief, "regional"),
+                'ai_strategic_recommendations': self._strategic_recommendations_section(brief, "regional"),
+                'ai_market_intelligence': self._market_intelligence_section(
+                    category, all_countries + new_regions, product_category
+                )
+            }
+            brief.update(self._generate_llm_sections(sections))
+            brief['prompt_tokens'] = self._prompt_token_report(sections)
             brief['llm_enabled'] = True
         else:
             # Use template-based reasoning as fallback
@@ -1751,6 +1811,7 @@ Return ONLY valid JSON, no other text."""
     # - If RAG context is weak, fallback to template (no LLM guessing)
     # ========================================================================
 
+    @tracing.traced('rag.context')
     def _get_rag_context_with_metadata(
         self,
         query: str,
@@ -1790,6 +1851,7 @@ Return ONLY valid JSON, no other text."""
                     category=category,
                     verbose=False
                 )
+            tracing.current_span().set_attribute('results', len(results or []))
 
             if not results:
                 return {
@@ -1805,7 +1867,10 @@ Return ONLY valid JSON, no other text."""
             sources = []
             citations = []
 
-            for i, result in enumerate(results, 1):
+            # Best-scoring chunks first, within the RAG token budget
+            ranked = self.prompt_compiler.fit_rag(results, higher_is_better=hasattr(self.vector_store, 'search'))
+
+            for i, result in enumerate(ranked, 1):
                 # Handle both FAISS and ChromaDB result formats
                 metadata = result.get('metadata', {})
                 source_file = metadata.get('file_name', metadata.get('source', 'knowledge_base'))
@@ -1821,6 +1886,7 @@ Return ONLY valid JSON, no other text."""
                     'citation_id': citation_id,
                     'file_name': source_file,
                     'category': source_category,
+                    'section': metadata.get('section', ''),
                     'relevance_score': score,
                     'excerpt': content[:200] + '...' if len(content) > 200 else content
                 })
@@ -1920,7 +1986,7 @@ industry trends, market conditions, or best practices that are not in the data.
 {knowledge_section}
 
 DATA SECTION (PRIMARY SOURCE - all numbers from here):
-{data_section}
+{self.prompt_compiler.fit_data(data_section)}
 
 TASK:
 {task_instruction}
@@ -1928,6 +1994,159 @@ TASK:
 REMEMBER: Cite sources. No hallucination. Only use provided information.
 """
 
+    # ========================================================================
+    # LLM SECTION FAN-OUT
+    # Each LLM section is described by a spec: build() does RAG retrieval and
+    # returns the prompt request or None for the template, fallback() renders
+    # the template, and 'rag_query' is the (query, k) build() searches (the
+    # searches of a fan-out are prefetched in one batch). Independent sections are issued concurrently through the
+    # async client, capped by llm_concurrency. Sections flagged
+    # 'semantic_cache' may be served from near-duplicate earlier prompts
+    # stored under the same 'cache_namespace' (section and category).
+    # ========================================================================
+
+    def _prepare_llm_request(self, section: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """Build a section's prompt request and look it up in the semantic cache."""
+        request = section['build']()
+        if request is None:
+            return None, None
+        section['token_report'] = self.prompt_compiler.report(
+            request['prompt'], task=request['task_instruction']
+        )
+
+        cached = None
+        if section.get('semantic_cache') and self.semantic_cache is not None:
+            cached = self.semantic_cache.lookup(
+                section['cache_namespace'], request['task_instruction'], request['data_section'],
+                context=request['rag_context']
+            )
+        return request, cached
+
+    def _run_llm_section(self, section: Dict[str, Any]) -> str:
+        """Generate one LLM section synchronously, falling back to its template."""
+        if not self.enable_llm or not self.llm_engine:
+            return section['fallback']()
+
+        try:
+            request, cached = self._prepare_llm_request(section)
+            if request is None:
+                return section['fallback']()
+            if cached is not None:
+                return self._finish_llm_section(section, cached, request)
+            response = self.llm_engine._generate_openai(request['prompt'])
+            return self._finish_llm_section(section, response, request, store=True)
+        except Exception as e:
+            print(f"[WARN] LLM {section['name']} failed: {e}")
+            return section['fallback']()
+
+    async def _run_llm_section_async(
+        self,
+        section: Dict[str, Any],
+        semaphore: asyncio.Semaphore
+    ) -> str:
+        """Generate one LLM section via the async client, falling back to its template."""
+        if not self.enable_llm or not self.llm_engine:
+            return section['fallback']()
+
+        try:
+            # RAG retrieval and cache lookup are blocking (embedding calls + FAISS)
+            request, cached = await asyncio.to_thread(self._prepare_llm_request, section)
+            if request is None:
+                return section['fallback']()
+            if cached is not None:
+                return self._finish_llm_section(section, cached, request)
+            async with semaphore:
+                response = await self.llm_engine.generate_async(request['prompt'])
+            return await asyncio.to_thread(
+                self._finish_llm_section, section, response, request, True
+            )
+        except Exception as e:
+            print(f"[WARN] LLM {section['name']} failed: {e}")
+            return section['fallback']()
+
+    def _finish_llm_section(
+        self,
+        section: Dict[str, Any],
+        response: str,
+        request: Dict[str, Any],
+        store: bool = False
+    ) -> str:
+        """Apply refusal check and sources footer; remember fresh responses."""
+        if self._is_llm_refusal(response):
+            return section['fallback']()
+
+        if store and section.get('semantic_cache') and self.semantic_cache is not None:
+            self.semantic_cache.add(
+                section['cache_namespace'], request['task_instruction'], request['data_section'], response,
+                context=request['rag_context']
+            )
+
+        # Add sources footer for traceability
+        sources = request['sources']
+        if sources:
+            response += "\n\n---\nSources: " + ", ".join(
+                s['file_name'] for s in sources[:section['max_sources']]
+            )
+        return response
+
+    async def _generate_llm_sections_async(
+        self,
+        sections: Dict[str, Dict[str, Any]]
+    ) -> Dict[str, str]:
+        """Generate all sections concurrently (at most llm_concurrency LLM calls in flight)."""
+        semaphore = asyncio.Semaphore(self.llm_concurrency)
+        keys = list(sections)
+        try:
+            results = await asyncio.gather(*(
+                self._run_llm_section_async(sections[key], semaphore) for key in keys
+            ))
+        finally:
+            # Runs on its own asyncio.run loop: release this loop's connection pool
+            if hasattr(self.llm_engine, 'close_async_client'):
+                await self.llm_engine.close_async_client()
+        return dict(zip(keys, results))
+
+    @staticmethod
+    def _prompt_token_report(sections: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """Prompt token counts of the sections that reached the LLM, plus their total"""
+        reports = {key: section['token_report'] for key, section in sections.items() if 'token_report' in section}
+        return {
+            'sections': reports,
+            'total_prompt_tokens': sum(r['prompt_tokens'] for r in reports.values())
+        }
+
+    def _generate_llm_sections(self, sections: Dict[str, Dict[str, Any]]) -> Dict[str, str]:
+        """
+        Generate independent LLM sections, keyed like the brief fields they fill.
+
+        Latency is bounded by the slowest section rather than their sum.
+        Falls back to sequential generation when async fan-out is disabled.
+        """
+        with self._prefetch_section_rag(sections):
+            if self.llm_concurrency <= 1 or not hasattr(self.llm_engine, 'generate_async'):
+                return {key: self._run_llm_section(section) for key, section in sections.items()}
+
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                return asyncio.run(self._generate_llm_sections_async(sections))
+
+            # Already inside an event loop (e.g. an async API handler): run the
+            # fan-out on its own loop in a helper thread (keeping the active trace
+            # and the prefetched RAG results)
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                return pool.submit(
+                    contextvars.copy_context().run, asyncio.run, self._generate_llm_sections_async(sections)
+                ).result()
+
+    def _prefetch_section_rag(self, sections: Dict[str, Dict[str, Any]]):
+        """Context in which the sections' RAG searches are served from one batched search."""
+        if not (self.enable_llm and self.llm_engine and self.enable_rag) or not hasattr(self.vector_store, 'prefetch'):
+            return nullcontext()
+        return self.vector_store.prefetch([
+            section['rag_query'] for section in sections.values() if section.get('rag_query')
+        ])
+
     # ========================================================================
     # LLM-POWERED REASONING METHODS - STRICT GROUNDING
     # ZERO HALLUCINATION: Uses RAG context + data only
@@ -1956,20 +2175,27 @@ REMEMBER: Cite sources. No hallucination. Only use provided information.
         Returns:
             AI-generated executive summary with source citations
         """
-        if not self.enable_llm or not self.llm_engine:
-            return self._generate_template_executive_summary(brief_data, brief_type)
+        return self._run_llm_section(self._executive_summary_section(brief_data, brief_type))
 
-        try:
+    def _executive_summary_section(
+        self,
+        brief_data: Dict[str, Any],
+        brief_type: str = "incumbent"
+    ) -> Dict[str, Any]:
+        """LLM section spec for the executive summary (see _run_llm_section)"""
+        category = brief_data.get('category', 'procurement')
+        rag_query = f"executive summary supplier diversification procurement strategy {category}"
+        rag_k = 5
+
+        def build():
             # RAG: Retrieve context with full metadata
-            category = brief_data.get('category', 'procurement')
-            rag_query = f"executive summary supplier diversification procurement strategy {category}"
-            rag_result = self._get_rag_context_with_metadata(rag_query, k=5)
+            rag_result = self._get_rag_context_with_metadata(rag_query, k=rag_k)
 
             # SMART FALLBACK: If RAG context is weak, use template
             # This prevents LLM from hallucinating when it doesn't have good context
             if not rag_result['has_strong_context']:
                 print(f"[INFO] RAG confidence low ({rag_result['confidence']}) - using data-driven template")
-                return self._generate_template_executive_summary(brief_data, brief_type)
+                return None
 
             # Build data section from brief_data (all numbers come from here)
             data_section = self._format_data_for_prompt(brief_data, brief_type)
@@ -1989,24 +2215,22 @@ CITATIONS: Include [SOURCE-N] when referencing knowledge base insights.
 
             # Build strictly grounded prompt
             prompt = self._build_strict_grounding_prompt(data_section, rag_result, task_instruction)
-            response = self.llm_engine._generate_openai(prompt)
-
-            # Check for refusal
-            if self._is_llm_refusal(response):
-                return self._generate_template_executive_summary(brief_data, brief_type)
-
-            # Add sources footer for traceability
-            if rag_result['sources']:
-                sources_footer = "\n\n---\nSources: " + ", ".join(
-                    s['file_name'] for s in rag_result['sources'][:3]
-                )
-                response += sources_footer
-
-            return response
+            return {
+                'prompt': prompt,
+                'sources': rag_result['sources'],
+                'rag_context': rag_result['context'],
+                'data_section': data_section,
+                'task_instruction': task_instruction
+            }
 
-        except Exception as e:
-            print(f"[WARN] LLM executive summary failed: {e}")
-            return self._generate_template_executive_summary(brief_data, brief_type)
+        return {
+            'name': 'executive summary',
+            'build': build,
+            'rag_query': (rag_query, rag_k),
+            'semantic_cache': False,  # Quotes exact figures
+            'fallback': lambda: self._generate_template_executive_summary(brief_data, brief_type),
+            'max_sources': 3
+        }
 
     def _format_data_for_prompt(self, brief_data: Dict[str, Any], brief_type: str) -> str:
         """Format brief data into a clear data section for the prompt."""
@@ -2244,29 +2468,26 @@ resilience, and reduced exposure to regional disruption events."""
 
         Returns deep risk analysis with source citations.
         """
-        if not self.enable_llm or not self.llm_engine:
-            return self._generate_risk_reasoning(
-                brief_data.get('current_state', {}).get('num_suppliers', 1),
-                brief_data.get('current_state', {}).get('spend_share_pct', 100),
-                brief_data.get('regional_dependency', {}).get('original_pct', 100),
-                []
-            )
+        return self._run_llm_section(self._risk_analysis_section(brief_data, brief_type))
 
-        try:
+    def _risk_analysis_section(
+        self,
+        brief_data: Dict[str, Any],
+        brief_type: str = "incumbent"
+    ) -> Dict[str, Any]:
+        """LLM section spec for the risk analysis (see _run_llm_section)"""
+        category = brief_data.get('category', 'Procurement')
+        rag_query = f"procurement risk management supplier concentration geographic risk {category}"
+        rag_k = 5
+
+        def build():
             # RAG: Retrieve risk management context with metadata
-            category = brief_data.get('category', 'Procurement')
-            rag_query = f"procurement risk management supplier concentration geographic risk {category}"
-            rag_result = self._get_rag_context_with_metadata(rag_query, k=5)
+            rag_result = self._get_rag_context_with_metadata(rag_query, k=rag_k)
 
             # SMART FALLBACK: If RAG context is weak, use template
             if not rag_result['has_strong_context']:
                 print(f"[INFO] RAG confidence low ({rag_result['confidence']}) for risk analysis - using template")
-                return self._generate_risk_reasoning(
-                    brief_data.get('current_state', {}).get('num_suppliers', 1),
-                    brief_data.get('current_state', {}).get('spend_share_pct', 100),
-                    brief_data.get('regional_dependency', {}).get('original_pct', 100),
-                    []
-                )
+                return None
 
             risk_matrix = brief_data.get('risk_matrix', {})
             rule_violations = brief_data.get('rule_violations', {})
@@ -2313,33 +2534,27 @@ IMPORTANT:
 
             # Build strictly grounded prompt
             prompt = self._build_strict_grounding_prompt(data_section, rag_result, task_instruction)
-            response = self.llm_engine._generate_openai(prompt)
-
-            # Check for refusal and use fallback if needed
-            if self._is_llm_refusal(response):
-                return self._generate_risk_reasoning(
-                    brief_data.get('current_state', {}).get('num_suppliers', 1),
-                    brief_data.get('current_state', {}).get('spend_share_pct', 100),
-                    brief_data.get('regional_dependency', {}).get('original_pct', 100),
-                    []
-                )
-
-            # Add sources footer
-            if rag_result['sources']:
-                response += "\n\n---\nSources: " + ", ".join(
-                    s['file_name'] for s in rag_result['sources'][:3]
-                )
-
-            return response
+            return {
+                'prompt': prompt,
+                'sources': rag_result['sources'],
+                'rag_context': rag_result['context'],
+                'data_section': data_section,
+                'task_instruction': task_instruction
+            }
 
-        except Exception as e:
-            print(f"[WARN] LLM risk analysis failed: {e}")
-            return self._generate_risk_reasoning(
+        return {
+            'name': 'risk analysis',
+            'build': build,
+            'rag_query': (rag_query, rag_k),
+            'semantic_cache': False,  # Quotes exact figures
+            'fallback': lambda: self._generate_risk_reasoning(
                 brief_data.get('current_state', {}).get('num_suppliers', 1),
                 brief_data.get('current_state', {}).get('spend_share_pct', 100),
                 brief_data.get('regional_dependency', {}).get('original_pct', 100),
                 []
-            )
+            ),
+            'max_sources': 3
+        }
 
     def _generate_llm_strategic_recommendations(
         self,
@@ -2357,29 +2572,26 @@ IMPORTANT:
 
         Returns actionable recommendations with source citations.
         """
-        if not self.enable_llm or not self.llm_engine:
-            return self._generate_recommendation_rationale(
-                brief_data.get('category', ''),
-                brief_data.get('supplier_reduction', {}).get('alternate_supplier', {}).get('name'),
-                [],
-                self._get_industry_config(brief_data.get('category', ''), None)
-            )
+        return self._run_llm_section(self._strategic_recommendations_section(brief_data, brief_type))
 
-        try:
+    def _strategic_recommendations_section(
+        self,
+        brief_data: Dict[str, Any],
+        brief_type: str = "incumbent"
+    ) -> Dict[str, Any]:
+        """LLM section spec for the strategic recommendations (see _run_llm_section)"""
+        category = brief_data.get('category', 'Procurement')
+        rag_query = f"strategic procurement recommendations supplier diversification {category}"
+        rag_k = 5
+
+        def build():
             # RAG: Retrieve strategic context with metadata
-            category = brief_data.get('category', 'Procurement')
-            rag_query = f"strategic procurement recommendations supplier diversification {category}"
-            rag_result = self._get_rag_context_with_metadata(rag_query, k=5)
+            rag_result = self._get_rag_context_with_metadata(rag_query, k=rag_k)
 
             # SMART FALLBACK: If RAG context is weak, use template
             if not rag_result['has_strong_context']:
                 print(f"[INFO] RAG confidence low ({rag_result['confidence']}) for recommendations - using template")
-                return self._generate_recommendation_rationale(
-                    brief_data.get('category', ''),
-                    brief_data.get('supplier_reduction', {}).get('alternate_supplier', {}).get('name'),
-                    [],
-                    self._get_industry_config(brief_data.get('category', ''), None)
-                )
+                return None
 
             total_spend = brief_data.get('total_spend', 0)
             roi = brief_data.get('roi_projections', {})
@@ -2424,33 +2636,27 @@ IMPORTANT:
 
             # Build strictly grounded prompt
             prompt = self._build_strict_grounding_prompt(data_section, rag_result, task_instruction)
-            response = self.llm_engine._generate_openai(prompt)
-
-            # Check for refusal and use fallback if needed
-            if self._is_llm_refusal(response):
-                return self._generate_recommendation_rationale(
-                    brief_data.get('category', ''),
-                    brief_data.get('supplier_reduction', {}).get('alternate_supplier', {}).get('name'),
-                    [],
-                    self._get_industry_config(brief_data.get('category', ''), None)
-                )
-
-            # Add sources footer
-            if rag_result['sources']:
-                response += "\n\n---\nSources: " + ", ".join(
-                    s['file_name'] for s in rag_result['sources'][:3]
-                )
-
-            return response
+            return {
+                'prompt': prompt,
+                'sources': rag_result['sources'],
+                'rag_context': rag_result['context'],
+                'data_section': data_section,
+                'task_instruction': task_instruction
+            }
 
-        except Exception as e:
-            print(f"[WARN] LLM strategic recommendations failed: {e}")
-            return self._generate_recommendation_rationale(
+        return {
+            'name': 'strategic recommendations',
+            'build': build,
+            'rag_query': (rag_query, rag_k),
+            'semantic_cache': False,  # Quotes exact figures
+            'fallback': lambda: self._generate_recommendation_rationale(
                 brief_data.get('category', ''),
                 brief_data.get('supplier_reduction', {}).get('alternate_supplier', {}).get('name'),
                 [],
                 self._get_industry_config(brief_data.get('category', ''), None)
-            )
+            ),
+            'max_sources': 3
+        }
 
     def _generate_llm_market_intelligence(
         self,
@@ -2468,21 +2674,28 @@ IMPORTANT:
 
         Returns market intelligence with full source traceability.
         """
-        industry_config = self._get_industry_config(category, product_category)
+        return self._run_llm_section(self._market_intelligence_section(category, regions, product_category))
 
-        if not self.enable_llm or not self.llm_engine:
-            return self._generate_market_intelligence_fallback(category, regions, industry_config)
+    def _market_intelligence_section(
+        self,
+        category: str,
+        regions: List[str],
+        product_category: str = None
+    ) -> Dict[str, Any]:
+        """LLM section spec for the market intelligence (see _run_llm_section)"""
+        industry_config = self._get_industry_config(category, product_category)
+        rag_query = f"market intelligence {category} {product_category or ''} supplier landscape pricing trends"
+        rag_k = 6  # Get more docs for market intel
 
-        try:
+        def build():
             # RAG: Retrieve market intelligence with strict confidence requirement
-            rag_query = f"market intelligence {category} {product_category or ''} supplier landscape pricing trends"
-            rag_result = self._get_rag_context_with_metadata(rag_query, k=6)  # Get more docs for market intel
+            rag_result = self._get_rag_context_with_metadata(rag_query, k=rag_k)
 
             # STRICT FALLBACK: Market intelligence requires HIGH confidence
             # We set a higher bar here because inventing market data is dangerous
             if not rag_result['has_strong_context'] or rag_result['confidence'] < 0.5:
                 print(f"[INFO] RAG confidence too low ({rag_result['confidence']}) for market intel - using safe template")
-                return self._generate_market_intelligence_fallback(category, regions, industry_config)
+                return None
 
             # Build data section (minimal - most info should come from RAG)
             data_section = f"""
@@ -2516,23 +2729,23 @@ REMEMBER: Better to say less than to hallucinate. Cite every claim.
 
             # Build strictly grounded prompt
             prompt = self._build_strict_grounding_prompt(data_section, rag_result, task_instruction)
-            response = self.llm_engine._generate_openai(prompt)
-
-            # Check for refusal and use fallback if needed
-            if self._is_llm_refusal(response):
-                return self._generate_market_intelligence_fallback(category, regions, industry_config)
-
-            # Add sources footer
-            if rag_result['sources']:
-                response += "\n\n---\nSources: " + ", ".join(
-                    s['file_name'] for s in rag_result['sources'][:4]
-                )
-
-            return response
+            return {
+                'prompt': prompt,
+                'sources': rag_result['sources'],
+                'rag_context': rag_result['context'],
+                'data_section': data_section,
+                'task_instruction': task_instruction
+            }
 
-        except Exception as e:
-            print(f"[WARN] LLM market intelligence failed: {e}")
-            return self._generate_market_intelligence_fallback(category, regions, industry_config)
+        return {
+            'name': 'market intelligence',
+            'build': build,
+            'rag_query': (rag_query, rag_k),
+            'semantic_cache': True,  # Qualitative, RAG-sourced text
+            'cache_namespace': f"market intelligence:{category}:{product_category or category}",
+            'fallback': lambda: self._generate_market_intelligence_fallback(category, regions, industry_config),
+            'max_sources': 4
+        }
 
     def _generate_market_intelligence_fallback(
         self,
@@ -0,0 +1,217 @@
+"""
+LLM Backends - Pluggable completion backends for LLMEngine
+
+LLMEngine talks to OpenAI by default. A backend replaces the OpenAI client:
+it receives the chat.completions request (model, messages, temperature,
+max_tokens, optional stream/response_format) and returns an object shaped
+like the OpenAI response, so every engine feature (response cache, rate
+limit scheduler, streaming, JSON mode) works unchanged on top of it.
+
+Backends:
+- StubLLMBackend: offline, deterministic text with simulated latency and
+  token throughput, for load testing the brief pipeline without network
+
+Select with LLM_BACKEND=stub (or pass backend= to LLMEngine).
+"""
+
+import re
+import json
+import math
+import time
+import random
+import asyncio
+import hashlib
+import threading
+from abc import ABC, abstractmethod
+from types import SimpleNamespace
+from typing import Dict, Any, Iterator, AsyncIterator, Optional
+
+from backend.engines.prompt_compiler import count_tokens
+
+# Import settings for configuration
+try:
+    from backend.config.settings import settings
+    LLM_BACKEND = settings.LLM_BACKEND
+    LLM_STUB_LATENCY_MS = settings.LLM_STUB_LATENCY_MS
+    LLM_STUB_LATENCY_SIGMA = settings.LLM_STUB_LATENCY_SIGMA
+    LLM_STUB_TOKENS_PER_SECOND = settings.LLM_STUB_TOKENS_PER_SECOND
+    LLM_STUB_THROUGHPUT_SIGMA = settings.LLM_STUB_THROUGHPUT_SIGMA
+    LLM_STUB_RESPONSE_TOKENS = settings.LLM_STUB_RESPONSE_TOKENS
+    LLM_STUB_SEED = settings.LLM_STUB_SEED
+except ImportError:
+    LLM_BACKEND = "openai"
+    LLM_STUB_LATENCY_MS = 400.0
+    LLM_STUB_LATENCY_SIGMA = 0.3
+    LLM_STUB_TOKENS_PER_SECOND = 60.0
+    LLM_STUB_THROUGHPUT_SIGMA = 0.2
+    LLM_STUB_RESPONSE_TOKENS = 250
+    LLM_STUB_SEED = 0
+
+# Item IDs in LLMEngine.extract_batch prompts
+ITEM_PATTERN = re.compile(r'^ITEM "(.+?)":$', re.MULTILINE)
+
+STUB_VOCABULARY = (
+    "supplier concentration risk spend category region diversification strategy "
+    "procurement contract pricing leverage continuity resilience sourcing analysis "
+    "allocation target market capacity quality delivery performance savings "
+    "exposure mitigation recommendation portfolio dependency alternative phase"
+).split()
+
+
+class LLMBackend(ABC):
+    """
+    Completion backend used by LLMEngine in place of the OpenAI client.
+
+    complete() returns an OpenAI-shaped ChatCompletion
+    (response.choices[0].message.content), or an iterator of chunks
+    (chunk.choices[0].delta.content) when request['stream'] is true.
+    """
+
+    name = "backend"
+
+    @abstractmethod
+    def complete(self, request: Dict[str, Any]) -> Any:
+        pass
+
+    @abstractmethod
+    async def complete_async(self, request: Dict[str, Any]) -> Any:
+        """Async variant; streams are returned as async iterators"""
+        pass
+
+
+class StubLLMBackend(LLMBackend):
+    """
+    Deterministic offline backend with a realistic cost profile.
+
+    Output text and timings depend only on the request and the seed, so
+    repeated benchmark runs see identical responses. Latency is modelled as
+    time-to-first-token (lognormal around latency_ms) plus generation at
+    tokens_per_second (lognormal around the given rate).
+    """
+
+    name = "stub"
+
+    def __init__(
+        self,
+        latency_ms: float = None,
+        latency_sigma: float = None,
+        tokens_per_second: float = None,
+        throughput_sigma: float = None,
+        response_tokens: int = None,
+        seed: int = None
+    ):
+        """
+        Args:
+            latency_ms: Median time to first token
+            latency_sigma: Lognormal shape of time to first token (0 = constant)
+            tokens_per_second: Median generation throughput
+            throughput_sigma: Lognormal shape of throughput (0 = constant)
+            response_tokens: Tokens per response (capped by max_tokens)
+            seed: Varies the generated text and timings
+        """
+        self.latency_ms = LLM_STUB_LATENCY_MS if latency_ms is None else latency_ms
+        self.latency_sigma = LLM_STUB_LATENCY_SIGMA if latency_sigma is None else latency_sigma
+        self.tokens_per_second = tokens_per_second or LLM_STUB_TOKENS_PER_SECOND
+        self.throughput_sigma = LLM_STUB_THROUGHPUT_SIGMA if throughput_sigma is None else throughput_sigma
+        self.response_tokens = response_tokens or LLM_STUB_RESPONSE_TOKENS
+        self.seed = LLM_STUB_SEED if seed is None else seed
+        self.calls = 0  # Requests served, so callers can confirm the LLM path ran
+        self._calls_lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Deterministic content and timing
+    # ------------------------------------------------------------------
+
+    def _plan(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Response text and timings for a request"""
+        with self._calls_lock:
+            self.calls += 1
+        digest = hashlib.sha256(
+            json.dumps([self.seed, request.get('model'), request.get('messages')], sort_keys=True).encode('utf-8')
+        ).digest()
+        rng = random.Random(digest)
+
+        first_token_s = self.latency_ms / 1000 * math.exp(rng.gauss(0, self.latency_sigma))
+        rate = self.tokens_per_second * math.exp(rng.gauss(0, self.throughput_sigma))
+
+        response_format = request.get('response_format') or {}
+        if response_format.get('type') == 'json_object':
+            prompt = request['messages'][-1].get('content', '')
+            words = [json.dumps({item_id: {} for item_id in ITEM_PATTERN.findall(prompt)})]
+        else:
+            n_tokens = min(self.response_tokens, request.get('max_tokens') or self.response_tokens)
+            words = [rng.choice(STUB_VOCABULARY) for _ in range(max(1, n_tokens))]
+            words[0] = words[0].capitalize()
+            words = [w + " " for w in words[:-1]] + [words[-1] + "."]
+
+        return {'words': words, 'first_token_s': first_token_s, 'token_interval_s': 1.0 / max(rate, 1e-6)}
+
+    def _completion(self, request: Dict[str, Any], text: str) -> Any:
+        prompt_tokens = sum(count_tokens(m.get('content', ''), request.get('model')) for m in request['messages'])
+        completion_tokens = count_tokens(text, request.get('model'))
+        return SimpleNamespace(
+            model=request.get('model'),
+            choices=[SimpleNamespace(
+                index=0,
+                message=SimpleNamespace(role='assistant', content=text),
+                finish_reason='stop'
+            )],
+            usage=SimpleNamespace(
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+                total_tokens=prompt_tokens + completion_tokens
+            )
+        )
+
+    @staticmethod
+    def _chunk(text: str) -> Any:
+        return SimpleNamespace(choices=[SimpleNamespace(index=0, delta=SimpleNamespace(content=text))])
+
+    # ------------------------------------------------------------------
+    # Backend interface
+    # ------------------------------------------------------------------
+
+    def complete(self, request: Dict[str, Any]) -> Any:
+        plan = self._plan(request)
+        if request.get('stream'):
+            return self._stream(plan)
+        time.sleep(plan['first_token_s'] + plan['token_interval_s'] * len(plan['words']))
+        return self._completion(request, "".join(plan['words']))
+
+    async def complete_async(self, request: Dict[str, Any]) -> Any:
+        plan = self._plan(request)
+        if request.get('stream'):
+            return self._stream_async(plan)
+        await asyncio.sleep(plan['first_token_s'] + plan['token_interval_s'] * len(plan['words']))
+        return self._completion(request, "".join(plan['words']))
+
+    def _stream(self, plan: Dict[str, Any]) -> Iterator[Any]:
+        time.sleep(plan['first_token_s'])
+        for word in plan['words']:
+            time.sleep(plan['token_interval_s'])
+            yield self._chunk(word)
+
+    async def _stream_async(self, plan: Dict[str, Any]) -> AsyncIterator[Any]:
+        await asyncio.sleep(plan['first_token_s'])
+        for word in plan['words']:
+            await asyncio.sleep(plan['token_interval_s'])
+            yield self._chunk(word)
+
+
+BACKENDS = {
+    'stub': StubLLMBackend,
+}
+
+
+def create_backend(name: Optional[str] = None) -> Optional[LLMBackend]:
+    """
+    Backend for a name (default: LLM_BACKEND).
+
+    Returns None for 'openai', which LLMEngine serves with its own client.
+    """
+    name = (name or LLM_BACKEND).lower()
+    if name == 'openai':
+        return None
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown LLM backend '{name}'. Available: openai, {', '.join(BACKENDS)}")
+    return BACKENDS[name]()
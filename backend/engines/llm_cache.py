@@ -0,0 +1,106 @@
+"""
+LLM Response Cache - Content-addressed cache for LLM completions
+
+Responses are keyed by a SHA-256 hash of everything that determines the
+output: model, system prompt, messages, temperature, max_tokens and (when
+set) the response format.
+
+Both layers (see TwoLevelCache) honour a TTL; the disk layer is bounded
+by entry count and evicts least-recently-used rows when full.
+"""
+
+import json
+import hashlib
+from typing import Dict, Any, List, Optional
+
+from backend.engines.sqlite_cache import TwoLevelCache
+
+# Import settings for configuration
+try:
+    from backend.config.settings import settings
+    LLM_CACHE_ENABLED = settings.LLM_CACHE_ENABLED
+    LLM_CACHE_PATH = settings.LLM_CACHE_PATH
+    LLM_CACHE_TTL_SECONDS = settings.LLM_CACHE_TTL_SECONDS
+    LLM_CACHE_MAX_ENTRIES = settings.LLM_CACHE_MAX_ENTRIES
+    LLM_CACHE_MEMORY_SIZE = settings.LLM_CACHE_MEMORY_SIZE
+except ImportError:
+    LLM_CACHE_ENABLED = True
+    LLM_CACHE_PATH = "./data/cache/llm_responses.sqlite"
+    LLM_CACHE_TTL_SECONDS = 7 * 24 * 3600  # 1 week
+    LLM_CACHE_MAX_ENTRIES = 5000
+    LLM_CACHE_MEMORY_SIZE = 256
+
+
+class LLMResponseCache(TwoLevelCache):
+    """
+    Two-level (memory + SQLite) cache of LLM responses.
+
+    Usage:
+        cache = LLMResponseCache()
+        key = cache.make_key(model, system_prompt, messages, temperature, max_tokens)
+        response = cache.get(key)
+        if response is None:
+            response = call_llm(...)
+            cache.set(key, response, model=model)
+    """
+
+    TABLE = "llm_responses"
+    VALUE_COLUMN = "response"
+    VALUE_TYPE = "TEXT"
+    LABEL = "LLM response cache"
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        ttl_seconds: int = None,
+        max_entries: int = None,
+        memory_size: int = None
+    ):
+        """
+        Args:
+            db_path: SQLite file (None uses LLM_CACHE_PATH; ':memory:' keeps it in-process)
+            ttl_seconds: Entry lifetime in both layers
+            max_entries: Maximum rows kept on disk before LRU eviction
+            memory_size: Entries held in the in-memory LRU
+        """
+        super().__init__(
+            db_path=db_path or LLM_CACHE_PATH,
+            max_entries=max_entries or LLM_CACHE_MAX_ENTRIES,
+            memory_size=memory_size or LLM_CACHE_MEMORY_SIZE,
+            ttl_seconds=ttl_seconds or LLM_CACHE_TTL_SECONDS
+        )
+
+    @staticmethod
+    def make_key(
+        model: str,
+        system_prompt: str,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: int,
+        response_format: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Content hash of every input that determines the completion"""
+        request = {
+            'model': model,
+            'system': system_prompt,
+            'messages': messages,
+            'temperature': round(float(temperature), 4),
+            'max_tokens': int(max_tokens)
+        }
+        if response_format is not None:
+            request['response_format'] = response_format
+        payload = json.dumps(
+            request,
+            sort_keys=True,
+            ensure_ascii=False
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return a cached response, or None on miss/expiry"""
+        return self._get(key)
+
+    def set(self, key: str, response: str, model: Optional[str] = None) -> None:
+        """Store a response in both layers (empty responses are not cached)"""
+        if response:
+            self._set(key, response, model=model)
@@ -1,14 +1,27 @@
 """
 LLM Engine - OpenAI GPT integration for brief generation
-Provides synchronous and asynchronous text generation capabilities.
+Provides synchronous and asynchronous text generation capabilities
+(blocking or streamed token by token), with repeated prompts served from a
+persistent response cache. Every call is traced with its cache hit and
+token counts.
 """
 
 import os
+import json
 import logging
 import asyncio
-from typing import Optional, Dict, Any, List
+import threading
+from typing import Optional, Dict, Any, List, Iterator, AsyncIterator, Type
 from pathlib import Path
 
+from pydantic import BaseModel, ValidationError
+
+from backend.engines.llm_cache import LLMResponseCache, LLM_CACHE_ENABLED
+from backend.engines.prompt_compiler import count_tokens
+from backend.engines.llm_scheduler import LLMScheduler, get_scheduler, PRIORITY_BATCH
+from backend.engines.llm_backends import LLMBackend, create_backend
+from backend.engines import tracing
+
 # Configure logger
 logger = logging.getLogger(__name__)
 
@@ -40,13 +53,22 @@ class LLMEngine:
     DEFAULT_MODEL = "gpt-4o"
     DEFAULT_MAX_TOKENS = 2000
     DEFAULT_TEMPERATURE = 0.3
+    STRUCTURED_SYSTEM_PROMPT = (
+        "You extract structured data from the text provided. "
+        "Reply with a single JSON object and nothing else."
+    )
 
     def __init__(
         self,
         api_key: Optional[str] = None,
         model: Optional[str] = None,
         max_retries: int = 3,
-        timeout: float = 60.0
+        timeout: float = 60.0,
+        enable_cache: Optional[bool] = None,
+        cache: Optional[LLMResponseCache] = None,
+        scheduler: Optional[LLMScheduler] = None,
+        priority: int = PRIORITY_BATCH,
+        backend: Optional[LLMBackend] = None
     ):
         """
         Initialize LLM Engine with OpenAI.
@@ -55,22 +77,50 @@ class LLMEngine:
             api_key: OpenAI API key (if None, reads from environment)
             model: Model name (if None, uses gpt-4o)
             max_retries: Maximum number of retry attempts for failed requests
+                         (handled by the SDK when no scheduler is active)
             timeout: Request timeout in seconds
+            enable_cache: Serve repeated prompts from the response cache
+                          (default: LLM_CACHE_ENABLED)
+            cache: Response cache to use (default: shared on-disk cache)
+            scheduler: Rate-limit scheduler (default: process-wide scheduler,
+                       None when LLM_RATE_LIMIT_ENABLED is off)
+            priority: Scheduler priority of this engine's requests
+                      (PRIORITY_INTERACTIVE is served before PRIORITY_BATCH)
+            backend: Completion backend replacing the OpenAI client
+                     (default: per LLM_BACKEND; e.g. StubLLMBackend offline)
         """
         self.api_key = api_key or os.getenv('OPENAI_API_KEY', '')
         self.model = model or self.DEFAULT_MODEL
-        self.max_retries = max_retries
+        self.priority = priority
+        self._backend = backend if backend is not None else create_backend()
+
+        # Rate limiting: the scheduler owns retries, so the SDK does not retry
+        self._scheduler = scheduler or get_scheduler()
+        self.max_retries = 0 if self._scheduler is not None else max_retries
         self.timeout = timeout
         self._client = None
         self._async_client = None
+        self._async_clients: Dict[int, Any] = {}  # Event loop id -> (loop, AsyncOpenAI)
+        self._async_lock = threading.Lock()
         self._system_prompt: Optional[str] = None
         self._is_available: Optional[bool] = None
 
+        # Response cache (memory LRU + SQLite)
+        enable_cache = LLM_CACHE_ENABLED if enable_cache is None else enable_cache
+        self._cache: Optional[LLMResponseCache] = None
+        if enable_cache:
+            self._cache = cache or LLMResponseCache()
+
         # Initialize client
         self._initialize_client()
 
     def _initialize_client(self) -> None:
         """Initialize OpenAI client with proper error handling"""
+        if self._backend is not None:
+            self._is_available = True
+            logger.info(f"LLM Engine using '{self._backend.name}' backend with model: {self.model}")
+            return
+
         if not self.api_key or len(self.api_key) < 10:
             logger.warning(
                 "OPENAI_API_KEY not set or invalid. LLM features will be disabled. "
@@ -108,9 +158,156 @@ class LLMEngine:
 
     @property
     def client(self):
-        """Get the synchronous OpenAI client"""
+        """Get the synchronous OpenAI client (None when another backend is used)"""
         return self._client
 
+    @property
+    def backend_name(self) -> str:
+        return self._backend.name if self._backend is not None else "openai"
+
+    def _cache_key(
+        self,
+        system_content: str,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: int,
+        response_format: Optional[Dict[str, Any]] = None
+    ) -> Optional[str]:
+        """Response cache key for a request, or None when caching is off"""
+        if self._cache is None:
+            return None
+        return LLMResponseCache.make_key(
+            self.model, system_content, messages, temperature, max_tokens, response_format
+        )
+
+    def _cache_get(self, key: Optional[str]) -> Optional[str]:
+        """Look up a cached response"""
+        if key is None:
+            return None
+        response = self._cache.get(key)
+        tracing.current_span().set_attribute('cache_hit', response is not None)
+        if response is not None:
+            logger.debug("LLM response served from cache")
+        return response
+
+    def _cache_set(self, key: Optional[str], response: str) -> None:
+        """Store a response for later identical requests"""
+        if key is not None and response:
+            self._cache.set(key, response, model=self.model)
+
+    def _prompt_tokens(self, messages: List[Dict[str, str]]) -> int:
+        return sum(count_tokens(m.get('content', ''), self.model) for m in messages)
+
+    def _estimate_tokens(self, request: Dict[str, Any]) -> int:
+        """Tokens a request counts against TPM: prompt tokens plus max_tokens"""
+        return self._prompt_tokens(request['messages']) + request.get('max_tokens', 0)
+
+    def _record_usage(self, response: Any) -> None:
+        """Add a completion's token usage to the active span"""
+        usage = getattr(response, 'usage', None)
+        if usage is not None:
+            tracing.current_span().set_attributes(
+                prompt_tokens=getattr(usage, 'prompt_tokens', 0) or 0,
+                completion_tokens=getattr(usage, 'completion_tokens', 0) or 0
+            )
+
+    def _record_stream_usage(self, messages: List[Dict[str, str]], text: str) -> None:
+        """Streams report no usage; count the tokens when tracing"""
+        if tracing.ENABLE_TRACING:
+            tracing.current_span().set_attributes(
+                prompt_tokens=self._prompt_tokens(messages),
+                completion_tokens=count_tokens(text, self.model)
+            )
+
+    def _create_completion(self, **request):
+        """chat.completions.create (or the backend), admitted and retried by the rate-limit scheduler"""
+        if self._backend is not None:
+            def call():
+                return self._backend.complete(request)
+        elif self._scheduler is None:
+            return self._client.chat.completions.create(**request)
+        else:
+            def call():
+                raw = self._client.chat.completions.with_raw_response.create(**request)
+                self._scheduler.record_headers(raw.headers)
+                return raw.parse()
+
+        if self._scheduler is None:
+            return call()
+        return self._scheduler.run(call, self._estimate_tokens(request), self.priority)
+
+    async def _create_completion_async(self, client, **request):
+        """Async variant of _create_completion"""
+        if self._backend is not None:
+            async def call():
+                return await self._backend.complete_async(request)
+        elif self._scheduler is None:
+            return await client.chat.completions.create(**request)
+        else:
+            async def call():
+                raw = await client.chat.completions.with_raw_response.create(**request)
+                self._scheduler.record_headers(raw.headers)
+                return raw.parse()
+
+        if self._scheduler is None:
+            return await call()
+
+        return await self._scheduler.run_async(call, self._estimate_tokens(request), self.priority)
+
+    def _get_async_client(self):
+        """
+        Get an async client bound to the running event loop.
+
+        AsyncOpenAI keeps a connection pool tied to the loop it was first used
+        on, so callers that run fan-outs via asyncio.run (a fresh loop each
+        time, possibly on several threads) get one client per live loop.
+        Such callers should await close_async_client() before the loop ends.
+        Non-OpenAI backends serve as their own async client.
+        """
+        if self._backend is not None:
+            return self._backend
+        if self._async_client is None:
+            return None
+
+        loop = asyncio.get_running_loop()
+        with self._async_lock:
+            for key, (bound_loop, _) in list(self._async_clients.items()):
+                if bound_loop.is_closed():
+                    # Its pool can no longer be closed on its own loop
+                    logger.debug("Dropping async LLM client of a closed event loop")
+                    del self._async_clients[key]
+
+            entry = self._async_clients.get(id(loop))
+            if entry is None:
+                from openai import AsyncOpenAI
+                client = AsyncOpenAI(
+                    api_key=self.api_key,
+                    timeout=self.timeout,
+                    max_retries=self.max_retries
+                )
+                entry = (loop, client)
+                self._async_clients[id(loop)] = entry
+            return entry[1]
+
+    async def close_async_client(self) -> None:
+        """
+        Close the running event loop's async client and its connection pool.
+
+        Await at the end of an asyncio.run fan-out; once the loop is closed
+        the client can only be dropped, leaving its pool to garbage collection.
+        """
+        if self._backend is not None:
+            return
+        loop = asyncio.get_running_loop()
+        with self._async_lock:
+            entry = self._async_clients.pop(id(loop), None)
+        if entry is None:
+            return
+        try:
+            await entry[1].close()
+        except Exception as e:
+            logger.warning(f"Could not close async LLM client: {e}")
+
     def _load_system_prompt(self) -> str:
         """
         Load enterprise system prompt from file or use default.
@@ -165,12 +362,14 @@ ALWAYS:
 - Acknowledge data limitations
 """
 
+    @tracing.traced('llm.generate')
     def generate(
         self,
         prompt: str,
         max_tokens: int = DEFAULT_MAX_TOKENS,
         temperature: float = DEFAULT_TEMPERATURE,
-        system_prompt: Optional[str] = None
+        system_prompt: Optional[str] = None,
+        response_format: Optional[Dict[str, Any]] = None
     ) -> str:
         """
         Generate text with OpenAI (synchronous).
@@ -180,6 +379,7 @@ ALWAYS:
             max_tokens: Maximum tokens in response (default: 2000)
             temperature: Creativity level 0.0-2.0 (default: 0.3)
             system_prompt: Custom system prompt (uses default if None)
+            response_format: OpenAI response format, e.g. {"type": "json_object"}
 
         Returns:
             Generated text response, or empty string if unavailable
@@ -199,19 +399,31 @@ ALWAYS:
 
         try:
             system_content = system_prompt or self._load_system_prompt()
+            temperature = min(max(temperature, 0.0), 2.0)  # Clamp to valid range
+            max_tokens = min(max(max_tokens, 1), 128000)  # Clamp to valid range
+            messages = [{"role": "user", "content": prompt}]
+
+            cache_key = self._cache_key(system_content, messages, temperature, max_tokens, response_format)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
 
-            response = self._client.chat.completions.create(
+            request_kwargs = {}
+            if response_format is not None:
+                request_kwargs['response_format'] = response_format
+
+            response = self._create_completion(
                 model=self.model,
-                messages=[
-                    {"role": "system", "content": system_content},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=min(max(temperature, 0.0), 2.0),  # Clamp to valid range
-                max_tokens=min(max(max_tokens, 1), 128000)  # Clamp to valid range
+                messages=[{"role": "system", "content": system_content}] + messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                **request_kwargs
             )
 
             result = response.choices[0].message.content
+            self._record_usage(response)
             logger.debug(f"Generated {len(result)} characters")
+            self._cache_set(cache_key, result)
             return result or ""
 
         except ImportError:
@@ -235,6 +447,7 @@ ALWAYS:
                 logger.error(f"LLM generation error ({error_type}): {e}")
                 return ""
 
+    @tracing.traced('llm.generate_async')
     async def generate_async(
         self,
         prompt: str,
@@ -254,7 +467,8 @@ ALWAYS:
         Returns:
             Generated text response, or empty string if unavailable
         """
-        if not self.is_available or self._async_client is None:
+        client = self._get_async_client() if self.is_available else None
+        if client is None:
             logger.warning("Async LLM not available, returning empty response")
             return ""
 
@@ -264,25 +478,173 @@ ALWAYS:
 
         try:
             system_content = system_prompt or self._load_system_prompt()
+            temperature = min(max(temperature, 0.0), 2.0)
+            max_tokens = min(max(max_tokens, 1), 128000)
+            messages = [{"role": "user", "content": prompt}]
+
+            cache_key = self._cache_key(system_content, messages, temperature, max_tokens)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
 
-            response = await self._async_client.chat.completions.create(
+            response = await self._create_completion_async(
+                client,
                 model=self.model,
-                messages=[
-                    {"role": "system", "content": system_content},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=min(max(temperature, 0.0), 2.0),
-                max_tokens=min(max(max_tokens, 1), 128000)
+                messages=[{"role": "system", "content": system_content}] + messages,
+                temperature=temperature,
+                max_tokens=max_tokens
             )
 
             result = response.choices[0].message.content
+            self._record_usage(response)
             logger.debug(f"Async generated {len(result)} characters")
+            self._cache_set(cache_key, result)
             return result or ""
 
         except Exception as e:
             logger.error(f"Async LLM generation error: {e}")
             return ""
 
+    @tracing.traced('llm.generate_stream')
+    def generate_stream(
+        self,
+        prompt: str,
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+        temperature: float = DEFAULT_TEMPERATURE,
+        system_prompt: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        Generate text with OpenAI, yielding content deltas as they arrive.
+
+        A cached response is yielded as a single chunk. The complete
+        response is cached once the stream finishes.
+
+        Args:
+            prompt: The prompt to send to OpenAI
+            max_tokens: Maximum tokens in response
+            temperature: Creativity level 0.0-2.0
+            system_prompt: Custom system prompt (uses default if None)
+
+        Yields:
+            Text chunks (nothing if unavailable)
+
+        Raises:
+            LLMRateLimitError: If rate limit is exceeded before streaming starts
+        """
+        if not self.is_available:
+            logger.warning("LLM not available, returning empty stream")
+            return
+
+        if not prompt or not prompt.strip():
+            logger.warning("Empty prompt provided")
+            return
+
+        system_content = system_prompt or self._load_system_prompt()
+        temperature = min(max(temperature, 0.0), 2.0)
+        max_tokens = min(max(max_tokens, 1), 128000)
+        messages = [{"role": "user", "content": prompt}]
+
+        cache_key = self._cache_key(system_content, messages, temperature, max_tokens)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            yield cached
+            return
+
+        parts: List[str] = []
+        try:
+            stream = self._create_completion(
+                model=self.model,
+                messages=[{"role": "system", "content": system_content}] + messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=True
+            )
+            for chunk in stream:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    parts.append(delta)
+                    yield delta
+        except Exception as e:
+            if 'RateLimitError' in type(e).__name__ and not parts:
+                logger.error(f"Rate limit exceeded: {e}")
+                raise LLMRateLimitError(f"Rate limit exceeded: {e}") from e
+            logger.error(f"LLM streaming error ({type(e).__name__}): {e}")
+            return
+
+        self._record_stream_usage([{"role": "system", "content": system_content}] + messages, "".join(parts))
+        self._cache_set(cache_key, "".join(parts))
+
+    @tracing.traced('llm.generate_stream_async')
+    async def generate_stream_async(
+        self,
+        prompt: str,
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+        temperature: float = DEFAULT_TEMPERATURE,
+        system_prompt: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """
+        Asynchronous variant of generate_stream().
+
+        Unlike generate_stream(), upstream errors are raised rather than
+        ending the stream early, so callers (the SSE route) can report them.
+
+        Yields:
+            Text chunks as they arrive (nothing if unavailable)
+
+        Raises:
+            LLMRateLimitError: If rate limit is exceeded
+            Exception: Any other error from the API, mid-stream included
+        """
+        client = self._get_async_client() if self.is_available else None
+        if client is None:
+            logger.warning("Async LLM not available, returning empty stream")
+            return
+
+        if not prompt or not prompt.strip():
+            logger.warning("Empty prompt provided")
+            return
+
+        system_content = system_prompt or self._load_system_prompt()
+        temperature = min(max(temperature, 0.0), 2.0)
+        max_tokens = min(max(max_tokens, 1), 128000)
+        messages = [{"role": "user", "content": prompt}]
+
+        cache_key = self._cache_key(system_content, messages, temperature, max_tokens)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            yield cached
+            return
+
+        parts: List[str] = []
+        try:
+            stream = await self._create_completion_async(
+                client,
+                model=self.model,
+                messages=[{"role": "system", "content": system_content}] + messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=True
+            )
+            async for chunk in stream:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    parts.append(delta)
+                    yield delta
+        except Exception as e:
+            if 'RateLimitError' in type(e).__name__:
+                logger.error(f"Rate limit exceeded: {e}")
+                raise LLMRateLimitError(f"Rate limit exceeded: {e}") from e
+            logger.error(f"Async LLM streaming error ({type(e).__name__}): {e}")
+            raise
+
+        self._record_stream_usage([{"role": "system", "content": system_content}] + messages, "".join(parts))
+        self._cache_set(cache_key, "".join(parts))
+
+    def _generate_openai(self, prompt: str, **kwargs) -> str:
+        """Alias of generate() used by the brief generator and agents"""
+        return self.generate(prompt, **kwargs)
+
+    @tracing.traced('llm.generate_with_context')
     def generate_with_context(
         self,
         prompt: str,
@@ -306,42 +668,167 @@ ALWAYS:
             return ""
 
         try:
-            messages = [{"role": "system", "content": self._load_system_prompt()}]
-            messages.extend(context)
+            system_content = self._load_system_prompt()
+            temperature = min(max(temperature, 0.0), 2.0)
+            max_tokens = min(max(max_tokens, 1), 128000)
+            messages = list(context)
             messages.append({"role": "user", "content": prompt})
 
-            response = self._client.chat.completions.create(
+            cache_key = self._cache_key(system_content, messages, temperature, max_tokens)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
+
+            response = self._create_completion(
                 model=self.model,
-                messages=messages,
-                temperature=min(max(temperature, 0.0), 2.0),
-                max_tokens=min(max(max_tokens, 1), 128000)
+                messages=[{"role": "system", "content": system_content}] + messages,
+                temperature=temperature,
+                max_tokens=max_tokens
             )
 
-            return response.choices[0].message.content or ""
+            result = response.choices[0].message.content or ""
+            self._record_usage(response)
+            self._cache_set(cache_key, result)
+            return result
 
         except Exception as e:
             logger.error(f"Context generation error: {e}")
             return ""
 
+    def generate_json(
+        self,
+        prompt: str,
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+        temperature: float = 0.0,
+        system_prompt: Optional[str] = None
+    ) -> Optional[Any]:
+        """
+        Generate a JSON object using OpenAI JSON mode.
+
+        The prompt must ask for JSON (an OpenAI requirement for JSON mode).
+
+        Returns:
+            Parsed JSON, or None if unavailable or the response is not valid JSON
+        """
+        response = self.generate(
+            prompt,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            system_prompt=system_prompt or self.STRUCTURED_SYSTEM_PROMPT,
+            response_format={"type": "json_object"}
+        )
+        if not response:
+            return None
+
+        text = response.strip()
+        if text.startswith('```'):
+            # Defensive: JSON mode should never fence its output
+            text = text.strip('`')
+            if text.startswith('json'):
+                text = text[4:]
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError as e:
+            logger.warning(f"LLM returned invalid JSON: {e}")
+            return None
+
+    @tracing.traced('llm.extract_batch')
+    def extract_batch(
+        self,
+        items: Dict[str, str],
+        item_model: Type[BaseModel],
+        instructions: str,
+        batch_size: int = 8,
+        max_tokens_per_item: int = 300
+    ) -> Dict[str, Optional[BaseModel]]:
+        """
+        Extract one structured record per item, several items per request.
+
+        Each request sends up to batch_size items and asks for a JSON object
+        keyed by item ID. Every record is validated against item_model.
+        Items missing from a batch response or failing validation are retried
+        on their own; items that still fail map to None.
+
+        Args:
+            items: Item ID -> source text to extract from
+            item_model: Pydantic model describing one record
+            instructions: Extraction rules shared by all items
+            batch_size: Items per request
+            max_tokens_per_item: Response token allowance per item
+
+        Returns:
+            Item ID -> validated record (or None)
+        """
+        results: Dict[str, Optional[BaseModel]] = {item_id: None for item_id in items}
+        if not items or not self.is_available:
+            return results
+
+        fields = json.dumps(item_model.model_json_schema().get('properties', {}))
+        item_ids = list(items)
+        retry: List[str] = []
+
+        for start in range(0, len(item_ids), max(1, batch_size)):
+            batch = item_ids[start:start + batch_size]
+            records = self._extract_records(items, batch, fields, instructions, max_tokens_per_item)
+            for item_id in batch:
+                record = self._validate_record(item_model, records.get(item_id))
+                if record is None:
+                    retry.append(item_id)
+                results[item_id] = record
+
+        # Per-item fallback for anything the batch did not return cleanly
+        if len(item_ids) > 1:
+            for item_id in retry:
+                records = self._extract_records(items, [item_id], fields, instructions, max_tokens_per_item)
+                results[item_id] = self._validate_record(item_model, records.get(item_id))
+
+        failed = sum(1 for record in results.values() if record is None)
+        tracing.current_span().set_attributes(items=len(item_ids), retried=len(retry), failed=failed)
+        if failed:
+            logger.warning(f"Structured extraction failed for {failed}/{len(item_ids)} items")
+        return results
+
+    def _extract_records(
+        self,
+        items: Dict[str, str],
+        batch: List[str],
+        fields: str,
+        instructions: str,
+        max_tokens_per_item: int
+    ) -> Dict[str, Any]:
+        """Send one extraction request; returns the raw JSON object keyed by item ID"""
+        sections = "\n\n".join(f'ITEM "{item_id}":\n{items[item_id]}' for item_id in batch)
+        prompt = f"""{instructions}
+
+Return a JSON object with exactly one key per item ID ({', '.join(json.dumps(i) for i in batch)}).
+Each value must be an object with these fields:
+{fields}
+
+{sections}"""
+        parsed = self.generate_json(prompt, max_tokens=max_tokens_per_item * len(batch) + 100)
+        return parsed if isinstance(parsed, dict) else {}
+
+    @staticmethod
+    def _validate_record(item_model: Type[BaseModel], data: Any) -> Optional[BaseModel]:
+        if not isinstance(data, dict):
+            return None
+        try:
+            return item_model.model_validate(data)
+        except ValidationError as e:
+            logger.debug(f"Extracted record failed validation: {e}")
+            return None
+
     def count_tokens(self, text: str) -> int:
         """
-        Estimate token count for text.
+        Count tokens for text with the model's (cached) tiktoken encoding.
 
         Args:
             text: Text to count tokens for
 
         Returns:
-            Estimated token count
+            Token count (estimated at ~4 chars/token without tiktoken)
         """
-        try:
-            import tiktoken
-            encoding = tiktoken.encoding_for_model(self.model)
-            return len(encoding.encode(text))
-        except ImportError:
-            # Rough estimate: ~4 chars per token
-            return len(text) // 4
-        except Exception:
-            return len(text) // 4
+        return count_tokens(text, self.model)
 
     def health_check(self) -> Dict[str, Any]:
         """
@@ -353,9 +840,12 @@ ALWAYS:
         return {
             "available": self.is_available,
             "model": self.model,
+            "backend": self.backend_name,
             "api_key_set": bool(self.api_key and len(self.api_key) > 10),
             "client_initialized": self._client is not None,
-            "async_client_initialized": self._async_client is not None
+            "async_client_initialized": self._async_client is not None,
+            "response_cache": self._cache.stats if self._cache is not None else {"enabled": False},
+            "rate_limiter": self._scheduler.stats if self._scheduler is not None else {"enabled": False}
         }
 
 
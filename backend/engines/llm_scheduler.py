@@ -0,0 +1,322 @@
+"""
+LLM Scheduler - Process-wide rate limiting for LLM requests
+
+Keeps requests within the provider's requests-per-minute (RPM) and
+tokens-per-minute (TPM) limits, instead of sending them and failing:
+- Two token buckets (requests, tokens) refill continuously
+- Bucket sizes follow the account's x-ratelimit-limit-* response headers
+  (the configured RPM/TPM only apply until the first response), and
+  levels follow x-ratelimit-remaining-*, so usage by other processes on
+  the same key is accounted for
+- Waiting requests are served by priority (interactive before batch), FIFO
+  within a priority
+- Rate-limit and transient errors are retried with jittered exponential
+  backoff; a 429 pauses every request until the limit resets
+"""
+
+import re
+import time
+import heapq
+import random
+import asyncio
+import logging
+import itertools
+import threading
+from typing import Dict, Any, Callable, Optional, Awaitable, TypeVar
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+# Import settings for configuration
+try:
+    from backend.config.settings import settings
+    LLM_RATE_LIMIT_ENABLED = settings.LLM_RATE_LIMIT_ENABLED
+    LLM_RATE_LIMIT_RPM = settings.LLM_RATE_LIMIT_RPM
+    LLM_RATE_LIMIT_TPM = settings.LLM_RATE_LIMIT_TPM
+    LLM_RATE_LIMIT_MAX_RETRIES = settings.LLM_RATE_LIMIT_MAX_RETRIES
+except ImportError:
+    LLM_RATE_LIMIT_ENABLED = True
+    LLM_RATE_LIMIT_RPM = 500
+    LLM_RATE_LIMIT_TPM = 30000
+    LLM_RATE_LIMIT_MAX_RETRIES = 5
+
+T = TypeVar('T')
+
+# Request priorities (lower is served first)
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BATCH = 10
+
+# Errors worth retrying, matched by class name as elsewhere in the engines
+RATE_LIMIT_ERRORS = ('RateLimitError',)
+TRANSIENT_ERRORS = ('APIConnectionError', 'APITimeoutError', 'InternalServerError')
+
+DURATION_PATTERN = re.compile(r'(\d+(?:\.\d+)?)(ms|h|m|s)')
+DURATION_UNITS = {'ms': 0.001, 's': 1.0, 'm': 60.0, 'h': 3600.0}
+
+
+def parse_reset_duration(value: Optional[str]) -> Optional[float]:
+    """Parse an OpenAI reset header ('1s', '6m0s', '20ms') into seconds"""
+    if not value:
+        return None
+    parts = DURATION_PATTERN.findall(str(value))
+    if not parts:
+        try:
+            return float(value)
+        except ValueError:
+            return None
+    return sum(float(amount) * DURATION_UNITS[unit] for amount, unit in parts)
+
+
+class TokenBucket:
+    """Continuously refilling bucket (not thread-safe; guarded by LLMScheduler)"""
+
+    def __init__(self, capacity: float, per_minute: float):
+        self.capacity = float(capacity)
+        self.rate = per_minute / 60.0
+        self.level = float(capacity)
+        self._updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until `amount` is available (0 if available now)"""
+        self._refill(now)
+        amount = min(amount, self.capacity)
+        if self.level >= amount:
+            return 0.0
+        return (amount - self.level) / self.rate
+
+    def consume(self, amount: float, now: float) -> None:
+        self._refill(now)
+        self.level -= min(amount, self.capacity)
+
+    def resize(self, capacity: float, now: float) -> None:
+        """Adopt a new per-minute limit, keeping the amount already used"""
+        self._refill(now)
+        capacity = float(capacity)
+        if capacity <= 0 or capacity == self.capacity:
+            return
+        self.level = min(capacity, self.level + capacity - self.capacity)
+        self.capacity = capacity
+        self.rate = capacity / 60.0
+
+    def observe(self, remaining: float, now: float) -> None:
+        """Lower the level to the server-reported remaining budget"""
+        self._refill(now)
+        self.level = min(self.level, float(remaining))
+
+
+class LLMScheduler:
+    """
+    Token-bucket scheduler shared by all LLM calls in the process.
+
+    Usage:
+        scheduler = get_scheduler()
+        response = scheduler.run(
+            lambda: client.chat.completions.create(...),
+            estimated_tokens=1500,
+            priority=PRIORITY_BATCH
+        )
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int = None,
+        tokens_per_minute: int = None,
+        max_retries: int = None,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0
+    ):
+        """
+        Args:
+            requests_per_minute: RPM limit until the server reports one (default: LLM_RATE_LIMIT_RPM)
+            tokens_per_minute: TPM limit until the server reports one (default: LLM_RATE_LIMIT_TPM)
+            max_retries: Retries after rate-limit/transient errors
+            base_delay: First backoff ceiling in seconds
+            max_delay: Longest backoff in seconds
+        """
+        self.requests = TokenBucket(requests_per_minute or LLM_RATE_LIMIT_RPM, requests_per_minute or LLM_RATE_LIMIT_RPM)
+        self.tokens = TokenBucket(tokens_per_minute or LLM_RATE_LIMIT_TPM, tokens_per_minute or LLM_RATE_LIMIT_TPM)
+        self.max_retries = LLM_RATE_LIMIT_MAX_RETRIES if max_retries is None else max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+        self._cond = threading.Condition()
+        self._waiting: list = []
+        self._sequence = itertools.count()
+        self._blocked_until = 0.0
+
+        self._granted = 0
+        self._retries = 0
+        self._rate_limited = 0
+        self._wait_seconds = 0.0
+
+    # ------------------------------------------------------------------
+    # Admission
+    # ------------------------------------------------------------------
+
+    def _wait_time_locked(self, tokens: int, now: float) -> float:
+        return max(
+            self._blocked_until - now,
+            self.requests.wait_time(1, now),
+            self.tokens.wait_time(tokens, now)
+        )
+
+    def acquire(self, estimated_tokens: int = 0, priority: int = PRIORITY_BATCH) -> float:
+        """
+        Block until the request fits both budgets, then consume from them.
+
+        Returns:
+            Seconds spent waiting
+        """
+        started = time.monotonic()
+        with self._cond:
+            ticket = (priority, next(self._sequence))
+            heapq.heappush(self._waiting, ticket)
+            try:
+                while True:
+                    if self._waiting[0] == ticket:
+                        now = time.monotonic()
+                        wait = self._wait_time_locked(estimated_tokens, now)
+                        if wait <= 0:
+                            self.requests.consume(1, now)
+                            self.tokens.consume(estimated_tokens, now)
+                            break
+                    else:
+                        wait = None  # Until the requests ahead of us are admitted
+                    self._cond.wait(timeout=wait)
+            finally:
+                self._waiting.remove(ticket)
+                heapq.heapify(self._waiting)
+                self._cond.notify_all()
+
+            waited = time.monotonic() - started
+            self._granted += 1
+            self._wait_seconds += waited
+        if waited > 0.05:
+            logger.debug(f"LLM request waited {waited:.2f}s for rate limit budget")
+        return waited
+
+    def record_headers(self, headers: Optional[Any]) -> None:
+        """Align the buckets with x-ratelimit-* response headers"""
+        if not headers:
+            return
+        now = time.monotonic()
+        with self._cond:
+            for bucket, kind in ((self.requests, 'requests'), (self.tokens, 'tokens')):
+                limit = headers.get(f'x-ratelimit-limit-{kind}')
+                if limit is not None:
+                    try:
+                        bucket.resize(float(limit), now)
+                    except ValueError:
+                        pass
+                remaining = headers.get(f'x-ratelimit-remaining-{kind}')
+                if remaining is None:
+                    continue
+                try:
+                    bucket.observe(float(remaining), now)
+                except ValueError:
+                    continue
+                if float(remaining) <= 0:
+                    reset = parse_reset_duration(headers.get(f'x-ratelimit-reset-{kind}'))
+                    if reset:
+                        self._blocked_until = max(self._blocked_until, now + reset)
+
+    # ------------------------------------------------------------------
+    # Retries
+    # ------------------------------------------------------------------
+
+    def _backoff(self, attempt: int, error: Exception) -> Optional[float]:
+        """Delay before retrying after `error`, or None if it should not be retried"""
+        name = type(error).__name__
+        if attempt >= self.max_retries or not (name in RATE_LIMIT_ERRORS or name in TRANSIENT_ERRORS):
+            return None
+
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+        if name in RATE_LIMIT_ERRORS:
+            headers = getattr(getattr(error, 'response', None), 'headers', None)
+            self.record_headers(headers)
+            retry_after = parse_reset_duration(headers.get('retry-after')) if headers else None
+            if retry_after:
+                delay = max(delay, min(retry_after, self.max_delay))
+            # Everyone pauses, not just this request
+            with self._cond:
+                self._rate_limited += 1
+                self._blocked_until = max(self._blocked_until, time.monotonic() + delay)
+
+        with self._cond:
+            self._retries += 1
+        logger.warning(f"LLM {name}; retry {attempt + 1}/{self.max_retries} in {delay:.1f}s")
+        return delay
+
+    def run(
+        self,
+        call: Callable[[], T],
+        estimated_tokens: int = 0,
+        priority: int = PRIORITY_BATCH
+    ) -> T:
+        """Run a blocking LLM call within the budgets, retrying with backoff"""
+        attempt = 0
+        while True:
+            self.acquire(estimated_tokens, priority)
+            try:
+                return call()
+            except Exception as e:
+                delay = self._backoff(attempt, e)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+                attempt += 1
+
+    async def run_async(
+        self,
+        call: Callable[[], Awaitable[T]],
+        estimated_tokens: int = 0,
+        priority: int = PRIORITY_BATCH
+    ) -> T:
+        """Async variant of run(); waiting happens off the event loop"""
+        attempt = 0
+        while True:
+            await asyncio.to_thread(self.acquire, estimated_tokens, priority)
+            try:
+                return await call()
+            except Exception as e:
+                delay = self._backoff(attempt, e)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            now = time.monotonic()
+            return {
+                'granted': self._granted,
+                'retries': self._retries,
+                'rate_limited': self._rate_limited,
+                'total_wait_seconds': round(self._wait_seconds, 2),
+                'queued': len(self._waiting),
+                'requests_available': int(self.requests.level),
+                'tokens_available': int(self.tokens.level),
+                'requests_per_minute': int(self.requests.capacity),
+                'tokens_per_minute': int(self.tokens.capacity),
+                'paused_seconds': round(max(0.0, self._blocked_until - now), 2)
+            }
+
+
+_shared_scheduler: Optional[LLMScheduler] = None
+_shared_lock = threading.Lock()
+
+
+def get_scheduler() -> Optional[LLMScheduler]:
+    """Process-wide scheduler, or None when LLM_RATE_LIMIT_ENABLED is off"""
+    global _shared_scheduler
+    if not LLM_RATE_LIMIT_ENABLED:
+        return None
+    with _shared_lock:
+        if _shared_scheduler is None:
+            _shared_scheduler = LLMScheduler()
+        return _shared_scheduler
@@ -0,0 +1,218 @@
+"""
+Metrics - Prometheus metrics for capacity planning
+
+Exposes service metrics in the Prometheus text format:
+- HTTP request latency per route and API rate-limit rejections (recorded
+  by the FastAPI middleware)
+- LLM calls, tokens and latency, FAISS search latency, and brief generation
+  duration in total and per stage (derived from tracing spans)
+- DataLoader cache hit rates and LLM rate-limiter counters (read at scrape
+  time from get_cache_stats() and LLMScheduler.stats)
+
+Requires prometheus_client. get_metrics() returns None without it or when
+ENABLE_MONITORING is off, so callers skip recording.
+"""
+
+import logging
+import threading
+from typing import Dict, Any, Callable, Optional, Tuple
+
+from backend.engines import tracing
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+# Optional Prometheus support
+try:
+    from prometheus_client import (
+        CollectorRegistry, Counter, Histogram,
+        generate_latest, start_http_server, CONTENT_TYPE_LATEST
+    )
+    from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+
+# Import settings for configuration
+try:
+    from backend.config.settings import settings
+    ENABLE_MONITORING = settings.ENABLE_MONITORING
+except ImportError:
+    ENABLE_MONITORING = True
+
+NAMESPACE = "procurement"
+
+# Seconds; LLM calls and briefs run from milliseconds (cache hits) to minutes
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+SEARCH_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5)
+
+
+class _StatsCollector:
+    """Reads cache and rate-limiter statistics at scrape time"""
+
+    def __init__(self, cache_sources: Dict[str, Callable[[], Dict[str, Any]]]):
+        self.cache_sources = cache_sources
+
+    def collect(self):
+        hits = CounterMetricFamily(f"{NAMESPACE}_data_cache_hits", "DataLoader cache hits", labels=['cache'])
+        misses = CounterMetricFamily(f"{NAMESPACE}_data_cache_misses", "DataLoader cache misses", labels=['cache'])
+        hit_ratio = GaugeMetricFamily(f"{NAMESPACE}_data_cache_hit_ratio", "DataLoader cache hit ratio (0-1)", labels=['cache'])
+        entries = GaugeMetricFamily(f"{NAMESPACE}_data_cache_entries", "Entries held in the DataLoader cache", labels=['cache'])
+
+        for name, stats_fn in list(self.cache_sources.items()):
+            try:
+                stats = stats_fn()
+            except Exception as e:
+                logger.debug(f"Cache stats unavailable for {name}: {e}")
+                continue
+            hits.add_metric([name], stats.get('hits', 0))
+            misses.add_metric([name], stats.get('misses', 0))
+            hit_ratio.add_metric([name], stats.get('hit_rate_percent', 0) / 100)
+            entries.add_metric([name], stats.get('size', 0))
+        yield from (hits, misses, hit_ratio, entries)
+
+        from backend.engines.llm_scheduler import get_scheduler
+        scheduler = get_scheduler()
+        if scheduler is None:
+            return
+        stats = scheduler.stats
+        yield CounterMetricFamily(
+            f"{NAMESPACE}_llm_rate_limited", "LLM 429 responses received", value=stats['rate_limited']
+        )
+        yield CounterMetricFamily(
+            f"{NAMESPACE}_llm_retries", "LLM requests retried after rate-limit or transient errors", value=stats['retries']
+        )
+        yield CounterMetricFamily(
+            f"{NAMESPACE}_llm_rate_limit_wait_seconds", "Time LLM requests waited for rate-limit budget",
+            value=stats['total_wait_seconds']
+        )
+        yield GaugeMetricFamily(
+            f"{NAMESPACE}_llm_queued_requests", "LLM requests waiting for rate-limit budget", value=stats['queued']
+        )
+
+
+class ServiceMetrics:
+    """
+    Prometheus metrics for the service, on a dedicated registry.
+
+    Usage:
+        metrics = get_metrics()
+        if metrics is not None:
+            metrics.observe_request("GET", "/api/v1/suppliers", 200, 0.012)
+            body, content_type = metrics.render()
+    """
+
+    def __init__(self, registry: Optional['CollectorRegistry'] = None):
+        if not PROMETHEUS_AVAILABLE:
+            raise ImportError("prometheus_client not installed. Install with: pip install prometheus-client")
+
+        self.registry = registry or CollectorRegistry()
+        self._cache_sources: Dict[str, Callable[[], Dict[str, Any]]] = {}
+
+        self.http_request_duration = Histogram(
+            'http_request_duration_seconds', "HTTP request latency",
+            ['method', 'route', 'status'], namespace=NAMESPACE,
+            buckets=LATENCY_BUCKETS, registry=self.registry
+        )
+        self.rate_limit_rejections = Counter(
+            'rate_limit_rejections_total', "Requests rejected by a rate limiter",
+            ['limiter'], namespace=NAMESPACE, registry=self.registry
+        )
+        self.llm_requests = Counter(
+            'llm_requests_total', "LLM calls by operation, response cache result and status",
+            ['operation', 'cache', 'status'], namespace=NAMESPACE, registry=self.registry
+        )
+        self.llm_tokens = Counter(
+            'llm_tokens_total', "LLM tokens by type (prompt/completion)",
+            ['type'], namespace=NAMESPACE, registry=self.registry
+        )
+        self.llm_duration = Histogram(
+            'llm_request_duration_seconds', "LLM call latency (including rate-limit waits)",
+            ['operation'], namespace=NAMESPACE, buckets=LATENCY_BUCKETS, registry=self.registry
+        )
+        self.faiss_search_duration = Histogram(
+            'faiss_search_duration_seconds', "FAISS search latency (query embedding and index search, per call or batch)",
+            namespace=NAMESPACE, buckets=SEARCH_BUCKETS, registry=self.registry
+        )
+        self.brief_duration = Histogram(
+            'brief_generation_duration_seconds', "Generation time for a pair of briefs",
+            ['mode'], namespace=NAMESPACE, buckets=LATENCY_BUCKETS, registry=self.registry
+        )
+        self.brief_stage_duration = Histogram(
+            'brief_stage_duration_seconds', "Brief pipeline stage duration",
+            ['stage'], namespace=NAMESPACE, buckets=LATENCY_BUCKETS, registry=self.registry
+        )
+
+        self.registry.register(_StatsCollector(self._cache_sources))
+        tracing.add_span_listener(self.observe_span)
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def observe_request(self, method: str, route: str, status_code: int, seconds: float) -> None:
+        self.http_request_duration.labels(method, route, str(status_code)).observe(seconds)
+
+    def observe_rejection(self, limiter: str) -> None:
+        self.rate_limit_rejections.labels(limiter).inc()
+
+    def observe_span(self, span) -> None:
+        """Map finished tracing spans onto LLM, FAISS and brief metrics"""
+        name = span.name
+        seconds = (span.duration_ms or 0.0) / 1000
+        attributes = span.attributes
+
+        if name.startswith('llm.') and name != 'llm.extract_batch':
+            operation = name[len('llm.'):]
+            cache_hit = attributes.get('cache_hit')
+            cache = 'none' if cache_hit is None else ('hit' if cache_hit else 'miss')
+            self.llm_requests.labels(operation, cache, span.status).inc()
+            self.llm_duration.labels(operation).observe(seconds)
+            for token_type in ('prompt', 'completion'):
+                tokens = attributes.get(f'{token_type}_tokens', 0)
+                if tokens:
+                    self.llm_tokens.labels(token_type).inc(tokens)
+        elif name == 'faiss.search_batch' or (name == 'faiss.search' and not attributes.get('prefetched')):
+            self.faiss_search_duration.observe(seconds)
+        elif name.startswith('stage.'):
+            self.brief_stage_duration.labels(name[len('stage.'):]).observe(seconds)
+        elif name == 'generate_both_briefs':
+            mode = 'agent' if attributes.get('use_agents') else 'template'
+            self.brief_duration.labels(mode).observe(seconds)
+
+    def register_cache(self, name: str, stats_fn: Callable[[], Dict[str, Any]]) -> None:
+        """Report a cache's hits/misses at scrape time (e.g. DataLoader.get_cache_stats)"""
+        self._cache_sources[name] = stats_fn
+
+    # ------------------------------------------------------------------
+    # Exposition
+    # ------------------------------------------------------------------
+
+    def render(self) -> Tuple[bytes, str]:
+        """Prometheus text exposition and its content type"""
+        return generate_latest(self.registry), CONTENT_TYPE_LATEST
+
+    def start_server(self, port: int) -> bool:
+        """Serve the metrics on a separate port; False if the port is taken"""
+        try:
+            start_http_server(port, registry=self.registry)
+            logger.info(f"Metrics server listening on port {port}")
+            return True
+        except OSError as e:
+            logger.warning(f"Could not start metrics server on port {port}: {e}")
+            return False
+
+
+_shared_metrics: Optional[ServiceMetrics] = None
+_shared_lock = threading.Lock()
+
+
+def get_metrics() -> Optional[ServiceMetrics]:
+    """Process-wide metrics, or None when ENABLE_MONITORING is off or prometheus_client is missing"""
+    global _shared_metrics
+    if not ENABLE_MONITORING or not PROMETHEUS_AVAILABLE:
+        return None
+    with _shared_lock:
+        if _shared_metrics is None:
+            _shared_metrics = ServiceMetrics()
+        return _shared_metrics
@@ -0,0 +1,224 @@
+"""
+Prompt Compiler - Token-budgeted assembly of grounded prompts
+
+Grounded prompts are built from three variable-size parts. Each one gets its own
+token budget:
+- RAG chunks: ranked by relevance score, lowest-ranked chunks dropped first
+- Web results: each snippet truncated, then results dropped past the total budget
+- Data section: long lists/tables summarized to their top rows, then truncated
+
+Token counts come from tiktoken. The encoding is cached per model, so building
+it once per process is the only setup cost. Without tiktoken, counts fall back
+to a ~4 characters/token estimate.
+"""
+
+import re
+import logging
+from functools import lru_cache
+from typing import Dict, Any, List, Optional
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+# Optional tiktoken support
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+    tiktoken = None
+
+# Import settings for configuration
+try:
+    from backend.config.settings import settings
+    DEFAULT_MODEL = settings.OPENAI_MODEL
+    PROMPT_RAG_TOKENS = settings.PROMPT_RAG_TOKENS
+    PROMPT_WEB_TOKENS = settings.PROMPT_WEB_TOKENS
+    PROMPT_WEB_SNIPPET_TOKENS = settings.PROMPT_WEB_SNIPPET_TOKENS
+    PROMPT_DATA_TOKENS = settings.PROMPT_DATA_TOKENS
+    PROMPT_TABLE_MAX_ROWS = settings.PROMPT_TABLE_MAX_ROWS
+except ImportError:
+    DEFAULT_MODEL = "gpt-4o"
+    PROMPT_RAG_TOKENS = 1500
+    PROMPT_WEB_TOKENS = 1000
+    PROMPT_WEB_SNIPPET_TOKENS = 120
+    PROMPT_DATA_TOKENS = 2000
+    PROMPT_TABLE_MAX_ROWS = 12
+
+# Lines that belong to a list or table in a data section
+TABLE_ROW_PATTERN = re.compile(r'^\s*(?:[-*•|]|\d+[.)])\s')
+
+TRUNCATION_MARKER = " ...[truncated]"
+
+
+@lru_cache(maxsize=8)
+def get_encoding(model: str = DEFAULT_MODEL):
+    """tiktoken encoding for a model (built once per model), or None without tiktoken"""
+    if not TIKTOKEN_AVAILABLE:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        # Unknown model name - use the encoding shared by current OpenAI chat models
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logger.warning(f"tiktoken encoding unavailable, estimating tokens: {e}")
+        return None
+
+
+def count_tokens(text: str, model: str = DEFAULT_MODEL) -> int:
+    """Token count for text (estimated at ~4 chars/token without tiktoken)"""
+    if not text:
+        return 0
+    encoding = get_encoding(model)
+    if encoding is None:
+        return len(text) // 4
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def truncate_to_tokens(text: str, max_tokens: int, model: str = DEFAULT_MODEL) -> str:
+    """Cut text to at most max_tokens tokens, marking the cut"""
+    if not text or max_tokens <= 0:
+        return ""
+    encoding = get_encoding(model)
+    if encoding is None:
+        max_chars = max_tokens * 4
+        return text if len(text) <= max_chars else text[:max_chars].rstrip() + TRUNCATION_MARKER
+
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return encoding.decode(tokens[:max_tokens]).rstrip() + TRUNCATION_MARKER
+
+
+class PromptCompiler:
+    """
+    Applies per-section token budgets to prompt inputs and reports prompt sizes.
+
+    Usage:
+        compiler = PromptCompiler()
+        chunks = compiler.fit_rag(vector_store.search(query, k=8))
+        results = compiler.fit_web(web_result['results'])
+        data_section = compiler.fit_data(data_section)
+        prompt = build_prompt(...)
+        report = compiler.report(prompt, data=data_section)
+    """
+
+    def __init__(
+        self,
+        model: Optional[str] = None,
+        rag_tokens: int = None,
+        web_tokens: int = None,
+        web_snippet_tokens: int = None,
+        data_tokens: int = None,
+        table_max_rows: int = None
+    ):
+        """
+        Args:
+            model: Model whose tokenizer is used (default: OPENAI_MODEL)
+            rag_tokens: Budget for all knowledge base chunks
+            web_tokens: Budget for all web results
+            web_snippet_tokens: Budget for each web snippet
+            data_tokens: Budget for the data section
+            table_max_rows: Rows kept per list/table when summarizing data
+        """
+        self.model = model or DEFAULT_MODEL
+        self.rag_tokens = rag_tokens or PROMPT_RAG_TOKENS
+        self.web_tokens = web_tokens or PROMPT_WEB_TOKENS
+        self.web_snippet_tokens = web_snippet_tokens or PROMPT_WEB_SNIPPET_TOKENS
+        self.data_tokens = data_tokens or PROMPT_DATA_TOKENS
+        self.table_max_rows = table_max_rows or PROMPT_TABLE_MAX_ROWS
+
+    def count(self, text: str) -> int:
+        return count_tokens(text, self.model)
+
+    def fit_rag(
+        self,
+        results: List[Dict[str, Any]],
+        higher_is_better: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Rank retrieved chunks by score and keep those that fit the RAG budget.
+
+        The best chunk is always kept (truncated if it alone exceeds the budget).
+
+        Args:
+            results: Vector store results with 'content' and 'score'
+            higher_is_better: False for distance scores (e.g. ChromaDB)
+        """
+        ranked = sorted(
+            results,
+            key=lambda r: r.get('score', 0.5),
+            reverse=higher_is_better
+        )
+
+        kept = []
+        remaining = self.rag_tokens
+        for result in ranked:
+            tokens = self.count(result.get('content', ''))
+            if tokens <= remaining:
+                kept.append(result)
+                remaining -= tokens
+            elif not kept:
+                kept.append({**result, 'content': truncate_to_tokens(result.get('content', ''), remaining, self.model)})
+                break
+
+        if len(kept) < len(results):
+            logger.debug(f"RAG budget kept {len(kept)}/{len(results)} chunks")
+        return kept
+
+    def fit_web(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Truncate web snippets and keep results (in rank order) within the web budget"""
+        kept = []
+        remaining = self.web_tokens
+        for result in results:
+            snippet = truncate_to_tokens(result.get('snippet', ''), self.web_snippet_tokens, self.model)
+            tokens = self.count(f"{result.get('title', '')}\n{snippet}\n{result.get('url', '')}")
+            if tokens > remaining and kept:
+                break
+            kept.append({**result, 'snippet': snippet})
+            remaining -= tokens
+        return kept
+
+    def summarize_tables(self, data_section: str) -> str:
+        """Keep the first table_max_rows rows of every list/table; note how many were omitted"""
+        lines = data_section.splitlines()
+        output: List[str] = []
+        run: List[str] = []
+
+        def flush():
+            output.extend(run[:self.table_max_rows])
+            omitted = len(run) - self.table_max_rows
+            if omitted > 0:
+                indent = run[0][:len(run[0]) - len(run[0].lstrip())]
+                output.append(f"{indent}- ... ({omitted} more rows omitted)")
+            run.clear()
+
+        for line in lines:
+            if TABLE_ROW_PATTERN.match(line):
+                run.append(line)
+            else:
+                if run:
+                    flush()
+                output.append(line)
+        if run:
+            flush()
+        return "\n".join(output)
+
+    def fit_data(self, data_section: str) -> str:
+        """Summarize long tables, then truncate the data section to its budget"""
+        if not data_section or self.count(data_section) <= self.data_tokens:
+            return data_section
+        summarized = self.summarize_tables(data_section)
+        return truncate_to_tokens(summarized, self.data_tokens, self.model)
+
+    def report(self, prompt: str, **parts: str) -> Dict[str, Any]:
+        """Token counts for a built prompt and the named parts it was assembled from"""
+        report = {
+            'model': self.model,
+            'prompt_tokens': self.count(prompt),
+            'parts': {name: self.count(text) for name, text in parts.items()},
+            'exact': get_encoding(self.model) is not None
+        }
+        logger.debug(f"Compiled prompt: {report['prompt_tokens']} tokens {report['parts']}")
+        return report
@@ -3,10 +3,11 @@ Comprehensive Rule Evaluation Engine
 Evaluates all 35 procurement rules from rule_book.csv
 """
 
+import re
 import sys
 import logging
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
@@ -31,6 +32,233 @@ except ImportError:
     ELEVATED_RISK_COUNTRIES = ['China', 'Ukraine', 'Myanmar', 'Afghanistan', 'Yemen', 'Libya', 'Sudan']
 
 
+# ============================================================================
+# COMPILED RULE TABLE
+# ============================================================================
+
+# Comparison operator codes used by the compiled rule table
+OP_UNSUPPORTED = 0
+OP_GT = 1
+OP_LT = 2
+OP_GE = 3
+OP_LE = 4
+OP_IS_NONE = 5
+
+_OPERATOR_CODES = {'>': OP_GT, '<': OP_LT, '>=': OP_GE, '<=': OP_LE}
+
+# Rule outcome codes
+STATUS_SKIPPED = -1
+STATUS_COMPLIANT = 0
+STATUS_WARNING = 1
+STATUS_VIOLATION = 2
+
+# Rules with dedicated evaluators: (metric key, threshold, warning factor).
+# Both the compiled table and the dedicated evaluators read them from here.
+SPECIAL_RULES = {
+    'R001': ('max_region_concentration', 40.0, 0.9),
+    'R002': ('tail_suppliers_count', 10.0, 0.8),
+    'R003': ('max_supplier_concentration', 60.0, 0.85),
+    'R023': ('hhi', 2500.0, 0.9),
+}
+
+# (violation, warning) severities reported by the dedicated evaluators
+SPECIAL_RULE_SEVERITY = {
+    'R001': ('HIGH', 'MEDIUM'),
+    'R002': ('MEDIUM', 'LOW'),
+    'R003': ('CRITICAL', 'HIGH'),
+    'R023': ('HIGH', 'MEDIUM'),
+}
+
+# Spend-weighted supplier metrics: metric key -> (supplier column,
+# fill for suppliers without a value, value when the column is missing)
+SUPPLIER_WEIGHTED_METRICS = {
+    'On_Time_Delivery_Rate': ('delivery_reliability_pct', 85, 85.0),
+    'Supplier_Debt_Equity_Ratio': ('debt_to_equity_ratio', 1.5, 1.5),
+    'Supplier_Capacity_Utilization': ('capacity_utilization_pct', 75, 75.0),
+    'Lead_Time_Variance_Percentage': ('lead_time_variance_pct', 15, 15.0),
+    'Supplier_Response_Time': ('response_time_hours', 24, 24.0),
+    'Supplier_Cyber_Rating': ('cyber_numeric', 3, 4.0),  # 4.0 = B rating equivalent
+    'Supplier_Innovation_Score': ('innovation_score', 60, 60.0),
+    'Carbon_Footprint': ('carbon_footprint_kg_co2', 500, 500.0),
+    'Supplier_Performance_Score': ('performance_score', 80, 80.0),
+}
+
+# Letter ratings used by threshold strings such as "B rating"
+RATING_SCALE = {'A': 5.0, 'B': 4.0, 'C': 3.0, 'D': 2.0, 'F': 1.0}
+
+_LOGIC_PATTERN = re.compile(r'^\s*([A-Za-z_][A-Za-z0-9_]*)\s*(>=|<=|>|<|=)\s*(\w+)')
+_NUMBER_PATTERN = re.compile(r'-?\d+(?:\.\d+)?')
+_RATING_PATTERN = re.compile(r'\b([ABCDF])\s+rating\b', re.IGNORECASE)
+
+
+def parse_threshold(value: Any) -> float:
+    """
+    Parse a rule book threshold string into a number.
+
+    Handles units ("90 days", "48 hours", "1000 kg CO2/unit"), percentages
+    and letter ratings ("B rating"). Returns NaN when nothing numeric is found.
+    """
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+
+    text = str(value).strip()
+    rating = _RATING_PATTERN.search(text)
+    if rating:
+        return RATING_SCALE[rating.group(1).upper()]
+
+    number = _NUMBER_PATTERN.search(text)
+    return float(number.group()) if number else float('nan')
+
+
+def _group_reduce(series: pd.Series, keys: Any, index: pd.Index, how: str) -> pd.Series:
+    """
+    Per-group reduction of series, aligned to index.
+
+    keys=None treats the series as one group labelled 0 (pass
+    index=pd.Index([0])). Single-slice and portfolio metrics both reduce
+    through here, so they sum in the same order and agree to the last bit.
+    """
+    if keys is None:
+        keys = np.zeros(len(series), dtype=int)
+    return getattr(series.groupby(keys), how)().reindex(index)
+
+
+class CompiledRuleTable:
+    """
+    Rule book compiled into typed column arrays (metric key, operator,
+    threshold, warning threshold) so that every rule can be evaluated
+    against one metrics vector, or a matrix of metrics vectors, with a
+    handful of NumPy operations instead of per-row parsing.
+    """
+
+    def __init__(self, rule_book: pd.DataFrame):
+        self.records: List[Dict[str, Any]] = rule_book.to_dict('records')
+        n_rules = len(self.records)
+
+        self.rule_ids: List[str] = []
+        self.metric_keys: List[Optional[str]] = []
+        self.operators = np.zeros(n_rules, dtype=np.int8)
+        self.thresholds = np.full(n_rules, np.nan)
+        self.warning_thresholds = np.full(n_rules, np.nan)
+
+        for i, record in enumerate(self.records):
+            rule_id = record['Rule_ID']
+            self.rule_ids.append(rule_id)
+
+            if rule_id in SPECIAL_RULES:
+                metric_key, threshold, warn_factor = SPECIAL_RULES[rule_id]
+                self.metric_keys.append(metric_key)
+                self.operators[i] = OP_GT
+                self.thresholds[i] = threshold
+                self.warning_thresholds[i] = threshold * warn_factor
+                continue
+
+            match = _LOGIC_PATTERN.match(str(record.get('Comparison_Logic', '')))
+            if not match:
+                self.metric_keys.append(None)
+                continue
+
+            metric_key, operator, operand = match.groups()
+            self.metric_keys.append(metric_key)
+            if operator == '=' and operand == 'None':
+                self.operators[i] = OP_IS_NONE
+            else:
+                self.operators[i] = _OPERATOR_CODES.get(operator, OP_UNSUPPORTED)
+            self.thresholds[i] = parse_threshold(record.get('Threshold_Value'))
+
+        self.is_special = np.array([rid in SPECIAL_RULES for rid in self.rule_ids], dtype=bool)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def metric_vector(self, metrics: Dict[str, Any]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Gather each rule's metric from a metrics dict.
+
+        Returns:
+            (values, present, is_none) arrays aligned with the rules
+        """
+        n_rules = len(self.records)
+        values = np.full(n_rules, np.nan)
+        present = np.zeros(n_rules, dtype=bool)
+        is_none = np.zeros(n_rules, dtype=bool)
+
+        for i, key in enumerate(self.metric_keys):
+            if key is None or key not in metrics:
+                continue
+            present[i] = True
+            value = metrics[key]
+            if value is None:
+                is_none[i] = True
+            else:
+                try:
+                    values[i] = float(value)
+                except (TypeError, ValueError):
+                    present[i] = False
+        return values, present, is_none
+
+    def evaluate_matrix(
+        self,
+        values: np.ndarray,
+        present: Optional[np.ndarray] = None,
+        is_none: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Evaluate all rules for many metric vectors at once.
+
+        Args:
+            values: Array of shape (n_groups, n_rules) with each rule's metric
+            present: Boolean mask of metrics that exist (defaults to non-NaN)
+            is_none: Boolean mask of metrics that are explicitly None
+
+        Returns:
+            int8 array of shape (n_groups, n_rules) with STATUS_* codes
+        """
+        values = np.atleast_2d(np.asarray(values, dtype=float))
+        if present is None:
+            present = ~np.isnan(values)
+        if is_none is None:
+            is_none = np.zeros(values.shape, dtype=bool)
+        present = np.atleast_2d(present)
+        is_none = np.atleast_2d(is_none)
+
+        ops = self.operators[np.newaxis, :]
+        thresholds = self.thresholds[np.newaxis, :]
+        warnings_at = self.warning_thresholds[np.newaxis, :]
+
+        with np.errstate(invalid='ignore'):
+            violation = (
+                ((ops == OP_GT) & (values > thresholds))
+                | ((ops == OP_LT) & (values < thresholds))
+                | ((ops == OP_GE) & (values >= thresholds))
+                | ((ops == OP_LE) & (values <= thresholds))
+                | ((ops == OP_IS_NONE) & (is_none | (values == 0)))
+            )
+            warning = ~violation & (values > warnings_at)
+
+        skipped = (
+            ~present
+            | (ops == OP_UNSUPPORTED)
+            | ((ops != OP_IS_NONE) & is_none)
+        )
+
+        status = np.full(values.shape, STATUS_COMPLIANT, dtype=np.int8)
+        status[warning] = STATUS_WARNING
+        status[violation] = STATUS_VIOLATION
+        status[skipped] = STATUS_SKIPPED
+        return status
+
+    def evaluate(self, metrics: Dict[str, Any]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Evaluate every rule against one metrics dict.
+
+        Returns:
+            (status codes, metric values) aligned with the rules
+        """
+        values, present, is_none = self.metric_vector(metrics)
+        return self.evaluate_matrix(values, present, is_none)[0], values
+
+
 class RuleEvaluationEngine:
     """
     Comprehensive engine for evaluating all procurement rules
@@ -39,7 +267,8 @@ class RuleEvaluationEngine:
     def __init__(self, data_loader: DataLoader = None):
         self.data_loader = data_loader if data_loader else DataLoader()
         self.rule_book = self._load_rule_book()
-        
+        self.compiled_rules = CompiledRuleTable(self.rule_book)
+
     def _load_rule_book(self) -> pd.DataFrame:
         """Load rule book from CSV"""
         rule_book_path = Path(__file__).parent.parent.parent / 'data' / 'structured' / 'rule_book.csv'
@@ -73,6 +302,7 @@ class RuleEvaluationEngine:
                 }
 
             client_spend = resolved.get('spend_data', pd.DataFrame()).copy()
+            spend_filters = resolved.get('filters')
 
             # Update category with resolved value for accurate reporting
             hierarchy = resolved.get('hierarchy', {})
@@ -84,6 +314,7 @@ class RuleEvaluationEngine:
             # No category specified - use all spend for this client
             spend_df = self.data_loader.load_spend_data()
             client_spend = spend_df[spend_df['Client_ID'] == client_id].copy()
+            spend_filters = {'Client_ID': client_id}
 
         if client_spend.empty:
             return {
@@ -95,15 +326,24 @@ class RuleEvaluationEngine:
             }
         
         # Calculate metrics needed for rules
-        metrics = self._calculate_metrics(client_spend)
+        metrics = self._calculate_metrics(client_spend, spend_filters=spend_filters)
         
         # Evaluate each rule
         violations = []
         warnings = []
         compliant = []
         
-        for _, rule in self.rule_book.iterrows():
-            result = self._evaluate_rule(rule, metrics, client_spend)
+        # Evaluate every rule in one vectorized pass, then format results
+        statuses, values = self.compiled_rules.evaluate(metrics)
+        for i, rule in enumerate(self.compiled_rules.records):
+            if statuses[i] == STATUS_SKIPPED:
+                continue
+            if self.compiled_rules.is_special[i]:
+                result = self._evaluate_rule(rule, metrics, client_spend)
+            else:
+                result = self._format_rule_result(
+                    rule, values[i], self.compiled_rules.thresholds[i], statuses[i]
+                )
             if result:
                 if result['status'] == 'VIOLATION':
                     violations.append(result)
@@ -128,118 +368,82 @@ class RuleEvaluationEngine:
             }
         }
     
-    def _evaluate_generic_rule(self, rule: pd.Series, metrics: Dict[str, Any], spend_df: pd.DataFrame) -> Dict[str, Any]:
-        """
-        Generic evaluator that parses Comparison_Logic from rule_book.csv
-        Example logic: "Spend_Region_Percentage > Threshold"
-        """
-        try:
-            logic = rule['Comparison_Logic']
-            threshold_str = str(rule['Threshold_Value']).replace('%', '').replace(' days', '').replace(' suppliers', '').strip()
-            
-            # Simple parsing of threshold
-            try:
-                threshold = float(threshold_str)
-            except ValueError:
-                # Handle non-numeric thresholds like "B rating"
-                threshold = 0 if 'rating' in threshold_str else 0
-            
-            # Map logic variables to metrics
-            # This mapping allows dynamic evaluation of any rule in the CSV
-            context = metrics.copy()
-            context['Threshold'] = threshold
-            
-            # Safe evaluation
-            # 1. Replace variables with values
-            # 2. Check condition
-            
-            # Define supported variables in logic
-            supported_vars = [
-                'Spend_Region_Percentage', 'Single_Supplier_Percentage', 'Herfindahl_Index',
-                'Supplier_ESG_Score', 'Quality_Rejection_Rate', 'On_Time_Delivery_Rate',
-                'Average_Payment_Terms', 'Supplier_Debt_Equity_Ratio', 'Supplier_Capacity_Utilization',
-                'MOQ_Months_of_Demand', 'Lead_Time_Variance_Percentage', 'Foreign_Currency_Spend_Percentage',
-                'Diverse_Supplier_Spend_Percentage', 'Innovation_Supplier_Spend_Percentage',
-                'Local_Content_Percentage', 'Qualified_Supplier_Count', 'Price_Benchmark_Deviation',
-                'Supplier_Response_Time', 'Contract_Compliance_Rate', 'Inventory_Turnover',
-                'High_Risk_Country_Spend', 'Supplier_Cyber_Rating', 'Certified_Suppliers_Percentage',
-                'Months_Since_Last_Audit', 'Backup_Supplier_Count', 'Supplier_Innovation_Score',
-                'Carbon_Footprint', 'Ethical_Certified_Suppliers', 'Low_Spend_Supplier_Count',
-                'Average_Contract_Duration', 'Supplier_Performance_Score',
-                'Days_To_Expiry', 'Price_Escalation_Cap', 'Price_Variance_Percentage'
-            ]
-            
-            # Determine the variable being tested
-            tested_var = None
-            for var in supported_vars:
-                if var in logic:
-                    tested_var = var
-                    break
-            
-            if not tested_var or tested_var not in metrics:
-                return None # Metric not calculated
-            
-            current_value = metrics[tested_var]
-            
-            # Perform comparison
-            is_violation = False
-            if '= None' in logic:
-                # Special case: checking if value is None/missing (violation if no cap exists)
-                is_violation = current_value is None or current_value == 0
-            elif '>' in logic:
-                is_violation = current_value > threshold
-            elif '<' in logic:
-                is_violation = current_value < threshold
-            
-            result = {
-                'rule_id': rule['Rule_ID'],
-                'rule_name': rule['Rule_Name'],
-                'rule_description': rule['Rule_Description'],
-                'threshold': rule['Threshold_Value'],
-                'current_value': f"{current_value:.1f}",
-                'risk_level': rule['Risk_Level'],
-                'category': rule['Category']
-            }
-            
-            if is_violation:
-                result['status'] = 'VIOLATION'
-                result['severity'] = 'HIGH' if rule['Risk_Level'] == 'Critical' else 'MEDIUM'
-                result['message'] = f"⚠️ VIOLATION: {rule['Rule_Name']} ({current_value:.1f} vs {threshold})"
-                result['action_required'] = rule['Action_Recommendation']
-            else:
-                result['status'] = 'COMPLIANT'
-                result['severity'] = 'LOW'
-                result['message'] = f"✅ COMPLIANT: {rule['Rule_Name']} ({current_value:.1f})"
-                
-            return result
-            
-        except Exception as e:
-            # print(f"Error evaluating generic rule {rule['Rule_ID']}: {str(e)}")
-            return None
+    def _format_rule_result(
+        self,
+        rule: Dict[str, Any],
+        current_value: float,
+        threshold: float,
+        status: int
+    ) -> Dict[str, Any]:
+        """Build the result dict for a generic rule from its compiled status"""
+        result = {
+            'rule_id': rule['Rule_ID'],
+            'rule_name': rule['Rule_Name'],
+            'rule_description': rule['Rule_Description'],
+            'threshold': rule['Threshold_Value'],
+            'current_value': f"{current_value:.1f}",
+            'risk_level': rule['Risk_Level'],
+            'category': rule['Category']
+        }
+
+        if status == STATUS_VIOLATION:
+            result['status'] = 'VIOLATION'
+            result['severity'] = 'HIGH' if rule['Risk_Level'] == 'Critical' else 'MEDIUM'
+            result['message'] = f"⚠️ VIOLATION: {rule['Rule_Name']} ({current_value:.1f} vs {threshold})"
+            result['action_required'] = rule['Action_Recommendation']
+        else:
+            result['status'] = 'COMPLIANT'
+            result['severity'] = 'LOW'
+            result['message'] = f"✅ COMPLIANT: {rule['Rule_Name']} ({current_value:.1f})"
+
+        return result
 
-    def _calculate_metrics(self, spend_df: pd.DataFrame) -> Dict[str, Any]:
+    def _calculate_metrics(
+        self,
+        spend_df: pd.DataFrame,
+        spend_filters: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
         """
         Calculate ALL metrics needed for rule evaluation using REAL DATA from CSV files.
         All 35 rules are now evaluated against actual data.
+
+        Args:
+            spend_df: Spend transactions for the slice being evaluated
+            spend_filters: Spend cube filters describing spend_df (e.g. from
+                           resolve_category_input). When given, spend
+                           aggregates are read from the pre-aggregated cube.
         """
-        total_spend = spend_df['Spend_USD'].sum()
+        cube = None
+        if spend_filters and hasattr(self.data_loader, 'get_spend_cube'):
+            cube = self.data_loader.get_spend_cube()
+
+        if cube:
+            # Grouped sum, like the group totals of calculate_portfolio_metrics
+            total_spend = float(cube.rollup(list(spend_filters), spend_filters)['Spend_USD'].sum())
+        else:
+            total_spend = spend_df['Spend_USD'].sum()
 
         # Supplier-level metrics
-        supplier_spend = spend_df.groupby(['Supplier_ID', 'Supplier_Name', 'Supplier_Region']).agg({
-            'Spend_USD': ['sum', 'count', 'mean']
-        }).reset_index()
+        if cube:
+            supplier_spend = cube.rollup(
+                ['Supplier_ID', 'Supplier_Name', 'Supplier_Region'], spend_filters
+            )[['Supplier_ID', 'Supplier_Name', 'Supplier_Region', 'Spend_USD', 'Spend_Count', 'Spend_Mean']].copy()
+        else:
+            supplier_spend = spend_df.groupby(['Supplier_ID', 'Supplier_Name', 'Supplier_Region']).agg({
+                'Spend_USD': ['sum', 'count', 'mean']
+            }).reset_index()
         supplier_spend.columns = ['Supplier_ID', 'Supplier_Name', 'Supplier_Region', 'total', 'transactions', 'average']
         supplier_spend['percentage'] = (supplier_spend['total'] / total_spend * 100).round(2)
-        supplier_spend = supplier_spend.sort_values('total', ascending=False)
+        supplier_spend = supplier_spend.sort_values('total', ascending=False, kind='mergesort')
 
         # Load ALL data sources
-        supplier_master = self.data_loader.load_supplier_master()
-        supplier_contracts = self.data_loader.load_supplier_contracts()
+        supplier_dimension = self.data_loader.get_supplier_dimension()
         inventory_metrics = self.data_loader.load_inventory_metrics()
         category_metrics = self.data_loader.load_category_metrics()
 
         # Get category context from spend data
         category_context = None
+        inv_context = None
         if 'SubCategory' in spend_df.columns and len(spend_df['SubCategory'].unique()) == 1:
             subcategory = spend_df['SubCategory'].iloc[0]
             category = spend_df['Category'].iloc[0] if 'Category' in spend_df.columns else None
@@ -252,166 +456,46 @@ class RuleEvaluationEngine:
                     category_context = cat_match.iloc[0].to_dict()
 
             # Get inventory metrics
-            inv_context = None
             if not inventory_metrics.empty:
                 inv_match = inventory_metrics[inventory_metrics['subcategory'] == subcategory]
                 if not inv_match.empty:
                     inv_context = inv_match.iloc[0].to_dict()
 
-        # Join spend with master data
-        if not supplier_master.empty:
-            merged = pd.merge(supplier_spend, supplier_master, left_on='Supplier_Name', right_on='supplier_name', how='left')
+        # Enrich spend with the pre-joined supplier dimension (master + contracts)
+        if not supplier_dimension.table.empty:
+            merged = supplier_dimension.enrich(supplier_spend)
         else:
             merged = supplier_spend.copy()
             cols = ['sustainability_score', 'quality_rating', 'delivery_reliability_pct', 'lead_time_days']
             for col in cols:
                 merged[col] = 0
 
-        # Join with contract data
-        if not supplier_contracts.empty:
-            merged = pd.merge(merged, supplier_contracts, left_on='Supplier_ID', right_on='Supplier_ID', how='left', suffixes=('', '_contract'))
-
         # Regional concentration
-        region_spend = spend_df.groupby('Supplier_Region')['Spend_USD'].sum()
-        region_percentages = (region_spend / total_spend * 100).round(2)
-
-        # HHI (Herfindahl-Hirschman Index)
-        hhi = (supplier_spend['percentage'] ** 2).sum()
-
-        # ============================================================
-        # CALCULATE ALL 35 METRICS FROM REAL DATA
-        # ============================================================
-
-        # R005: ESG Score (Weighted Average from supplier_contracts)
-        if 'ESG_Score' in merged.columns:
-            valid_esg = merged[merged['ESG_Score'].notna()]
-            if not valid_esg.empty:
-                avg_esg = (valid_esg['ESG_Score'] * valid_esg['percentage'] / 100).sum()
-            else:
-                avg_esg = 75.0
-        else:
-            avg_esg = (merged['sustainability_score'] * merged['percentage'] / 100).sum() * 10
-
-        # R007: Quality Rejection (from quality_rating)
-        avg_quality = (merged['quality_rating'].fillna(4.0) * merged['percentage'] / 100).sum()
-        rejection_rate = max(0, (5 - avg_quality) * 2)
-
-        # R008: On Time Delivery (from supplier_master)
-        avg_delivery = (merged['delivery_reliability_pct'].fillna(85) * merged['percentage'] / 100).sum()
-
-        # R009: Average Payment Terms (from supplier_contracts)
-        if 'Payment_Terms_Days' in merged.columns:
-            avg_payment_terms = merged['Payment_Terms_Days'].fillna(45).mean()
-        else:
-            avg_payment_terms = 45.0
-
-        # R010: Supplier Debt/Equity Ratio (from supplier_master)
-        if 'debt_to_equity_ratio' in merged.columns:
-            avg_debt_equity = (merged['debt_to_equity_ratio'].fillna(1.5) * merged['percentage'] / 100).sum()
-        else:
-            avg_debt_equity = 1.5
-
-        # R011: Capacity Utilization (from supplier_master)
-        if 'capacity_utilization_pct' in merged.columns:
-            avg_capacity = (merged['capacity_utilization_pct'].fillna(75) * merged['percentage'] / 100).sum()
-        else:
-            avg_capacity = 75.0
-
-        # R013: Lead Time Variance (from supplier_master)
-        if 'lead_time_variance_pct' in merged.columns:
-            avg_lead_variance = (merged['lead_time_variance_pct'].fillna(15) * merged['percentage'] / 100).sum()
-        else:
-            avg_lead_variance = 15.0
-
-        # R020: Supplier Response Time (from supplier_master)
-        if 'response_time_hours' in merged.columns:
-            avg_response_time = (merged['response_time_hours'].fillna(24) * merged['percentage'] / 100).sum()
-        else:
-            avg_response_time = 24.0
-
-        # R025: Cybersecurity Rating (from supplier_master - convert to numeric)
-        cyber_map = {'A': 5, 'B': 4, 'C': 3, 'D': 2, 'F': 1}
-        if 'cybersecurity_rating' in merged.columns:
-            merged['cyber_numeric'] = merged['cybersecurity_rating'].map(cyber_map).fillna(3)
-            avg_cyber = (merged['cyber_numeric'] * merged['percentage'] / 100).sum()
-        else:
-            avg_cyber = 4.0  # B rating equivalent
-
-        # R030: Innovation Score (from supplier_master)
-        if 'innovation_score' in merged.columns:
-            avg_innovation = (merged['innovation_score'].fillna(60) * merged['percentage'] / 100).sum()
-        else:
-            avg_innovation = 60.0
-
-        # R031: Carbon Footprint (from supplier_master)
-        if 'carbon_footprint_kg_co2' in merged.columns:
-            avg_carbon = (merged['carbon_footprint_kg_co2'].fillna(500) * merged['percentage'] / 100).sum()
+        if cube:
+            region_spend = cube.spend_by('Supplier_Region', spend_filters)
         else:
-            avg_carbon = 500.0
+            region_spend = spend_df.groupby('Supplier_Region')['Spend_USD'].sum()
+        region_percentages = (region_spend / total_spend * 100).round(2)
 
-        # R035: Performance Score (from supplier_master)
-        if 'performance_score' in merged.columns:
-            avg_performance = (merged['performance_score'].fillna(80) * merged['percentage'] / 100).sum()
-        else:
-            avg_performance = 80.0
+        # Supplier-level metrics (shared with calculate_portfolio_metrics)
+        single_index = pd.Index([0])
+        supplier_metrics = {
+            key: value.iloc[0] if isinstance(value, pd.Series) else value
+            for key, value in self._supplier_metrics(merged, None, single_index).items()
+        }
+        hhi = supplier_metrics['hhi']
 
         # R024: Geopolitical Risk (from spend_df country)
         # Use externalized high-risk countries from settings
         all_risk_countries = HIGH_RISK_COUNTRIES + ELEVATED_RISK_COUNTRIES
-        high_risk_spend = spend_df[spend_df['Supplier_Country'].isin(all_risk_countries)]['Spend_USD'].sum()
-        high_risk_pct = (high_risk_spend / total_spend * 100) if total_spend > 0 else 0
-
-        # R004: Days to Contract Expiry (from supplier_contracts)
-        if 'days_to_expiry' in merged.columns:
-            min_days_to_expiry = merged['days_to_expiry'].min()
+        if cube:
+            country_spend = cube.spend_by('Supplier_Country', spend_filters)
         else:
-            min_days_to_expiry = 120
-
-        # R006: Price Variance (from supplier_contracts)
-        if 'price_variance_pct' in merged.columns:
-            max_price_variance = merged['price_variance_pct'].max()
-        else:
-            max_price_variance = 5.0
-
-        # R019: Price Benchmark Deviation (from supplier_contracts)
-        if 'price_benchmark_deviation_pct' in merged.columns:
-            avg_price_deviation = merged['price_benchmark_deviation_pct'].mean()
-        else:
-            avg_price_deviation = 5.0
-
-        # R021: Contract Compliance (from supplier_contracts)
-        if 'contract_compliance_pct' in merged.columns:
-            avg_compliance = merged['contract_compliance_pct'].mean()
-        else:
-            avg_compliance = 95.0
-
-        # R028: Price Escalation Cap (from supplier_contracts)
-        if 'has_price_escalation_cap' in merged.columns:
-            pct_with_cap = (merged['has_price_escalation_cap'].sum() / len(merged)) * 100
-            price_cap_value = pct_with_cap if pct_with_cap > 0 else 0
-        else:
-            price_cap_value = 5.0
-
-        # R034: Contract Duration (from supplier_contracts)
-        if 'contract_duration_years' in merged.columns:
-            avg_contract_duration = merged['contract_duration_years'].mean()
-        else:
-            avg_contract_duration = 2.5
-
-        # R027: Months Since Last Audit (from supplier_master)
-        if 'last_audit_date' in merged.columns:
-            try:
-                merged['last_audit_date'] = pd.to_datetime(merged['last_audit_date'], errors='coerce')
-                today = pd.Timestamp.now()
-                merged['months_since_audit'] = ((today - merged['last_audit_date']).dt.days / 30).round(0)
-                max_months_since_audit = merged['months_since_audit'].max()
-                if pd.isna(max_months_since_audit):
-                    max_months_since_audit = 6
-            except (ValueError, TypeError) as e:
-                logger.warning(f"Error calculating months since audit: {e}")
-                max_months_since_audit = 6
-        else:
-            max_months_since_audit = 6
+            country_spend = spend_df.groupby('Supplier_Country')['Spend_USD'].sum()
+        high_risk_spend = _group_reduce(
+            country_spend[country_spend.index.isin(all_risk_countries)], None, single_index, 'sum'
+        ).fillna(0).iloc[0]
+        high_risk_pct = (high_risk_spend / total_spend * 100) if total_spend > 0 else 0
 
         # Category-level metrics (R012, R014, R015, R016, R017, R018, R022, R026, R029, R032, R033)
         if category_context:
@@ -424,39 +508,14 @@ class RuleEvaluationEngine:
             ethical_pct = category_context.get('ethical_certified_pct', 80.0)
             low_spend_count = category_context.get('low_spend_supplier_count', 10)
         else:
-            # Calculate from merged data
-            if 'is_diverse_supplier' in merged.columns:
-                diverse_pct = (merged['is_diverse_supplier'].sum() / len(merged)) * 100
-            else:
-                diverse_pct = 15.0
-
-            if 'is_innovation_supplier' in merged.columns:
-                innovation_pct = (merged['is_innovation_supplier'].sum() / len(merged)) * 100
-            else:
-                innovation_pct = 10.0
-
-            if 'is_local_supplier' in merged.columns:
-                local_pct = (merged['is_local_supplier'].sum() / len(merged)) * 100
-            else:
-                local_pct = 40.0
-
-            qualified_count = len(merged[merged['quality_rating'] >= 4.0]) if 'quality_rating' in merged.columns else len(supplier_spend)
-
-            if 'has_required_certifications' in merged.columns:
-                certified_pct = (merged['has_required_certifications'].sum() / len(merged)) * 100
-            else:
-                certified_pct = 90.0
-
-            if 'is_backup_supplier' in merged.columns:
-                backup_count = merged['is_backup_supplier'].sum()
-            else:
-                backup_count = 1
-
-            if 'has_ethical_certification' in merged.columns:
-                ethical_pct = (merged['has_ethical_certification'].sum() / len(merged)) * 100
-            else:
-                ethical_pct = 80.0
-
+            # Calculated from merged data
+            diverse_pct = supplier_metrics['Diverse_Supplier_Spend_Percentage']
+            innovation_pct = supplier_metrics['Innovation_Supplier_Spend_Percentage']
+            local_pct = supplier_metrics['Local_Content_Percentage']
+            qualified_count = supplier_metrics['Qualified_Supplier_Count']
+            certified_pct = supplier_metrics['Certified_Suppliers_Percentage']
+            backup_count = supplier_metrics['Backup_Supplier_Count']
+            ethical_pct = supplier_metrics['Ethical_Certified_Suppliers']
             low_spend_count = len(merged[merged['percentage'] < 2.0]) if 'percentage' in merged.columns else 5
 
         # Inventory metrics (R012, R014, R022)
@@ -477,7 +536,7 @@ class RuleEvaluationEngine:
             'region_spend': region_spend,
             'region_percentages': region_percentages,
             'max_region_concentration': region_percentages.max() if len(region_percentages) > 0 else 0,
-            'max_supplier_concentration': supplier_spend['percentage'].max() if len(supplier_spend) > 0 else 0,
+            'max_supplier_concentration': supplier_metrics['max_supplier_concentration'],
             'hhi': hhi,
 
             # === ALL 35 METRICS FROM REAL DATA ===
@@ -488,37 +547,37 @@ class RuleEvaluationEngine:
             # R002: Tail Spend (calculated below)
 
             # R003: Single Supplier Dependency
-            'Single_Supplier_Percentage': supplier_spend['percentage'].max() if len(supplier_spend) > 0 else 0,
+            'Single_Supplier_Percentage': supplier_metrics['max_supplier_concentration'],
 
             # R004: Contract Expiry Warning
-            'Days_To_Expiry': min_days_to_expiry,
+            'Days_To_Expiry': supplier_metrics['Days_To_Expiry'],
 
             # R005: ESG Compliance Score
-            'Supplier_ESG_Score': avg_esg,
+            'Supplier_ESG_Score': supplier_metrics['Supplier_ESG_Score'],
 
             # R006: Price Variance Alert
-            'Price_Variance_Percentage': max_price_variance,
+            'Price_Variance_Percentage': supplier_metrics['Price_Variance_Percentage'],
 
             # R007: Quality Rejection Rate
-            'Quality_Rejection_Rate': rejection_rate,
+            'Quality_Rejection_Rate': supplier_metrics['Quality_Rejection_Rate'],
 
             # R008: Delivery Performance
-            'On_Time_Delivery_Rate': avg_delivery,
+            'On_Time_Delivery_Rate': supplier_metrics['On_Time_Delivery_Rate'],
 
             # R009: Payment Terms Optimization
-            'Average_Payment_Terms': avg_payment_terms,
+            'Average_Payment_Terms': supplier_metrics['Average_Payment_Terms'],
 
             # R010: Supplier Financial Risk
-            'Supplier_Debt_Equity_Ratio': avg_debt_equity,
+            'Supplier_Debt_Equity_Ratio': supplier_metrics['Supplier_Debt_Equity_Ratio'],
 
             # R011: Capacity Utilization Risk
-            'Supplier_Capacity_Utilization': avg_capacity,
+            'Supplier_Capacity_Utilization': supplier_metrics['Supplier_Capacity_Utilization'],
 
             # R012: MOQ Months of Demand
             'MOQ_Months_of_Demand': moq_months,
 
             # R013: Lead Time Variance
-            'Lead_Time_Variance_Percentage': avg_lead_variance,
+            'Lead_Time_Variance_Percentage': supplier_metrics['Lead_Time_Variance_Percentage'],
 
             # R014: Foreign Currency Exposure
             'Foreign_Currency_Spend_Percentage': foreign_currency_pct,
@@ -536,13 +595,13 @@ class RuleEvaluationEngine:
             'Qualified_Supplier_Count': qualified_count,
 
             # R019: Price Benchmark Deviation
-            'Price_Benchmark_Deviation': avg_price_deviation,
+            'Price_Benchmark_Deviation': supplier_metrics['Price_Benchmark_Deviation'],
 
             # R020: Supplier Responsiveness
-            'Supplier_Response_Time': avg_response_time,
+            'Supplier_Response_Time': supplier_metrics['Supplier_Response_Time'],
 
             # R021: Contract Compliance Rate
-            'Contract_Compliance_Rate': avg_compliance,
+            'Contract_Compliance_Rate': supplier_metrics['Contract_Compliance_Rate'],
 
             # R022: Inventory Turnover
             'Inventory_Turnover': inventory_turnover,
@@ -554,25 +613,25 @@ class RuleEvaluationEngine:
             'High_Risk_Country_Spend': high_risk_pct,
 
             # R025: Cybersecurity Rating
-            'Supplier_Cyber_Rating': avg_cyber,
+            'Supplier_Cyber_Rating': supplier_metrics['Supplier_Cyber_Rating'],
 
             # R026: Certification Compliance
             'Certified_Suppliers_Percentage': certified_pct,
 
             # R027: Audit Frequency
-            'Months_Since_Last_Audit': max_months_since_audit,
+            'Months_Since_Last_Audit': supplier_metrics['Months_Since_Last_Audit'],
 
             # R028: Price Escalation Clause
-            'Price_Escalation_Cap': price_cap_value,
+            'Price_Escalation_Cap': supplier_metrics['Price_Escalation_Cap'],
 
             # R029: Backup Supplier Availability
             'Backup_Supplier_Count': backup_count,
 
             # R030: Innovation Score
-            'Supplier_Innovation_Score': avg_innovation,
+            'Supplier_Innovation_Score': supplier_metrics['Supplier_Innovation_Score'],
 
             # R031: Carbon Footprint
-            'Carbon_Footprint': avg_carbon,
+            'Carbon_Footprint': supplier_metrics['Carbon_Footprint'],
 
             # R032: Ethical Sourcing Compliance
             'Ethical_Certified_Suppliers': ethical_pct,
@@ -581,10 +640,10 @@ class RuleEvaluationEngine:
             'Low_Spend_Supplier_Count': low_spend_count,
 
             # R034: Long-term Contract Coverage
-            'Average_Contract_Duration': avg_contract_duration,
+            'Average_Contract_Duration': supplier_metrics['Average_Contract_Duration'],
 
             # R035: Supplier Performance Score
-            'Supplier_Performance_Score': avg_performance,
+            'Supplier_Performance_Score': supplier_metrics['Supplier_Performance_Score'],
         }
 
         # R002 & R033: Tail spend calculation
@@ -604,8 +663,103 @@ class RuleEvaluationEngine:
 
         return metrics
     
-    def _evaluate_rule(self, rule: pd.Series, metrics: Dict[str, Any], spend_df: pd.DataFrame) -> Dict[str, Any]:
-        """Evaluate a single rule"""
+    def _supplier_metrics(self, merged: pd.DataFrame, keys: Any, index: pd.Index) -> Dict[str, Any]:
+        """
+        Metrics computed from enriched supplier rows, per group.
+
+        Used by _calculate_metrics (keys=None, one group) and by
+        calculate_portfolio_metrics (keys = group columns of merged).
+
+        Args:
+            merged: Supplier spend rows with 'percentage' (share of the
+                    group's spend) and supplier dimension attributes
+            keys: Group keys for the rows, or None for a single group
+            index: Groups to report, in order
+
+        Returns:
+            Metric key -> Series aligned to index, or a scalar default when
+            the source column is missing
+        """
+        def reduce(series: pd.Series, how: str) -> pd.Series:
+            return _group_reduce(series, keys, index, how)
+
+        def weighted(col: str, fill, missing) -> Any:
+            if col not in merged.columns:
+                return missing
+            return reduce(merged[col].fillna(fill) * merged['percentage'] / 100, 'sum')
+
+        def stat(col: str, how: str, missing, fill=None) -> Any:
+            if col not in merged.columns:
+                return missing
+            series = merged[col] if fill is None else merged[col].fillna(fill)
+            return reduce(series, how)
+
+        def share(col: str, missing) -> Any:
+            if col not in merged.columns:
+                return missing
+            return reduce(merged[col], 'sum') / reduce(merged[col], 'size') * 100
+
+        metrics = {
+            'supplier_count': reduce(merged['percentage'], 'size').fillna(0),
+            'max_supplier_concentration': reduce(merged['percentage'], 'max').fillna(0),
+            'hhi': reduce(merged['percentage'] ** 2, 'sum').fillna(0),
+        }
+
+        # R005: ESG Score (weighted average from supplier_contracts)
+        if 'ESG_Score' in merged.columns:
+            valid = merged['ESG_Score'].notna()
+            esg = reduce((merged['ESG_Score'] * merged['percentage'] / 100).where(valid, 0), 'sum')
+            metrics['Supplier_ESG_Score'] = esg.where(reduce(valid, 'sum') > 0, 75.0)
+        else:
+            metrics['Supplier_ESG_Score'] = reduce(
+                merged['sustainability_score'] * merged['percentage'] / 100, 'sum'
+            ) * 10
+
+        # R007: Quality Rejection (from quality_rating)
+        avg_quality = weighted('quality_rating', 4.0, 4.0)
+        metrics['Quality_Rejection_Rate'] = (
+            ((5 - avg_quality) * 2).clip(lower=0) if isinstance(avg_quality, pd.Series)
+            else max(0, (5 - avg_quality) * 2)
+        )
+
+        # Spend-weighted supplier_master metrics (R008, R010, R011, R013, R020, R025, R030, R031, R035)
+        for metric, (column, fill, missing) in SUPPLIER_WEIGHTED_METRICS.items():
+            metrics[metric] = weighted(column, fill, missing)
+
+        # Contract metrics (R004, R006, R009, R019, R021, R028, R034)
+        metrics['Days_To_Expiry'] = stat('days_to_expiry', 'min', 120)
+        metrics['Price_Variance_Percentage'] = stat('price_variance_pct', 'max', 5.0)
+        metrics['Average_Payment_Terms'] = stat('Payment_Terms_Days', 'mean', 45.0, fill=45)
+        metrics['Price_Benchmark_Deviation'] = stat('price_benchmark_deviation_pct', 'mean', 5.0)
+        metrics['Contract_Compliance_Rate'] = stat('contract_compliance_pct', 'mean', 95.0)
+        metrics['Price_Escalation_Cap'] = share('has_price_escalation_cap', 5.0)
+        metrics['Average_Contract_Duration'] = stat('contract_duration_years', 'mean', 2.5)
+
+        # R027: Months Since Last Audit (from supplier_master)
+        metrics['Months_Since_Last_Audit'] = 6
+        if 'last_audit_date' in merged.columns:
+            try:
+                months = ((pd.Timestamp.now() - merged['last_audit_date']).dt.days / 30).round(0)
+                metrics['Months_Since_Last_Audit'] = reduce(months, 'max').fillna(6)
+            except (ValueError, TypeError) as e:
+                logger.warning(f"Error calculating months since audit: {e}")
+
+        # Category-level metrics derived from suppliers (used without a category_metrics row)
+        metrics['Diverse_Supplier_Spend_Percentage'] = share('is_diverse_supplier', 15.0)
+        metrics['Innovation_Supplier_Spend_Percentage'] = share('is_innovation_supplier', 10.0)
+        metrics['Local_Content_Percentage'] = share('is_local_supplier', 40.0)
+        metrics['Qualified_Supplier_Count'] = (
+            reduce(merged['quality_rating'] >= 4.0, 'sum')
+            if 'quality_rating' in merged.columns else metrics['supplier_count']
+        )
+        metrics['Certified_Suppliers_Percentage'] = share('has_required_certifications', 90.0)
+        metrics['Backup_Supplier_Count'] = stat('is_backup_supplier', 'sum', 1)
+        metrics['Ethical_Certified_Suppliers'] = share('has_ethical_certification', 80.0)
+
+        return metrics
+
+    def _evaluate_rule(self, rule: pd.Series, metrics: Dict[str, Any], spend_df: pd.DataFrame) -> Optional[Dict[str, Any]]:
+        """Evaluate a rule with a dedicated evaluator (SPECIAL_RULES)"""
         rule_id = rule['Rule_ID']
         
         # Map rule IDs to evaluation methods
@@ -616,17 +770,15 @@ class RuleEvaluationEngine:
             'R023': self._evaluate_r023_supplier_concentration_index,
         }
         
-        # Use specific evaluator if available, otherwise use generic evaluator
-        if rule_id in evaluators:
-            return evaluators[rule_id](rule, metrics, spend_df)
-        else:
-            # Use generic evaluator for all other rules (R004-R035 except R023)
-            return self._evaluate_generic_rule(rule, metrics, spend_df)
+        # All other rules are evaluated through the compiled rule table
+        evaluator = evaluators.get(rule_id)
+        return evaluator(rule, metrics, spend_df) if evaluator else None
     
     def _evaluate_r001_regional_concentration(self, rule: pd.Series, metrics: Dict[str, Any], spend_df: pd.DataFrame) -> Dict[str, Any]:
         """R001: Regional Concentration - If >40% of category spend is concentrated in a single region"""
-        threshold = 40.0
-        current_value = metrics['max_region_concentration']
+        metric_key, threshold, warn_factor = SPECIAL_RULES['R001']
+        violation_severity, warning_severity = SPECIAL_RULE_SEVERITY['R001']
+        current_value = metrics[metric_key]
         
         result = {
             'rule_id': 'R001',
@@ -642,7 +794,7 @@ class RuleEvaluationEngine:
             excess = current_value - threshold
             max_region = metrics['region_percentages'].idxmax()
             result['status'] = 'VIOLATION'
-            result['severity'] = 'HIGH'
+            result['severity'] = violation_severity
             result['message'] = f"⚠️ VIOLATION: {current_value:.1f}% of spend concentrated in {max_region} (exceeds {threshold}% limit by {excess:.1f}%)"
             result['action_required'] = rule['Action_Recommendation']
             result['details'] = {
@@ -650,9 +802,9 @@ class RuleEvaluationEngine:
                 'region_spend': float(metrics['region_spend'][max_region]),
                 'region_percentage': float(current_value)
             }
-        elif current_value > threshold * 0.9:  # Warning at 90% of threshold
+        elif current_value > threshold * warn_factor:  # Warning at 90% of threshold
             result['status'] = 'WARNING'
-            result['severity'] = 'MEDIUM'
+            result['severity'] = warning_severity
             max_region = metrics['region_percentages'].idxmax()
             result['message'] = f"⚡ WARNING: {current_value:.1f}% of spend in {max_region} (approaching {threshold}% limit)"
             result['action_required'] = "Monitor regional concentration"
@@ -665,8 +817,10 @@ class RuleEvaluationEngine:
     
     def _evaluate_r002_tail_spend_fragmentation(self, rule: pd.Series, metrics: Dict[str, Any], spend_df: pd.DataFrame) -> Dict[str, Any]:
         """R002: Tail Spend Fragmentation - If bottom 20% of spend is distributed across too many suppliers"""
-        threshold = 10  # Max 10 suppliers in tail spend
-        current_value = metrics['tail_suppliers_count']
+        metric_key, threshold, warn_factor = SPECIAL_RULES['R002']
+        violation_severity, warning_severity = SPECIAL_RULE_SEVERITY['R002']
+        threshold = int(threshold)  # Max 10 suppliers in tail spend
+        current_value = metrics[metric_key]
         
         result = {
             'rule_id': 'R002',
@@ -681,7 +835,7 @@ class RuleEvaluationEngine:
         if current_value > threshold:
             excess = current_value - threshold
             result['status'] = 'VIOLATION'
-            result['severity'] = 'MEDIUM'
+            result['severity'] = violation_severity
             result['message'] = f"⚠️ VIOLATION: {current_value} suppliers in tail spend (exceeds {threshold} supplier limit by {excess})"
             result['action_required'] = rule['Action_Recommendation']
             result['details'] = {
@@ -689,9 +843,9 @@ class RuleEvaluationEngine:
                 'tail_spend_amount': float(metrics['tail_spend_amount']),
                 'tail_spend_percentage': float((metrics['tail_spend_amount'] / metrics['total_spend']) * 100)
             }
-        elif current_value > threshold * 0.8:  # Warning at 80% of threshold
+        elif current_value > threshold * warn_factor:  # Warning at 80% of threshold
             result['status'] = 'WARNING'
-            result['severity'] = 'LOW'
+            result['severity'] = warning_severity
             result['message'] = f"⚡ WARNING: {current_value} suppliers in tail spend (approaching {threshold} supplier limit)"
             result['action_required'] = "Consider consolidating tail suppliers"
         else:
@@ -703,8 +857,9 @@ class RuleEvaluationEngine:
     
     def _evaluate_r003_single_supplier_dependency(self, rule: pd.Series, metrics: Dict[str, Any], spend_df: pd.DataFrame) -> Dict[str, Any]:
         """R003: Single Supplier Dependency - If >60% of category spend is with a single supplier"""
-        threshold = 60.0
-        current_value = metrics['max_supplier_concentration']
+        metric_key, threshold, warn_factor = SPECIAL_RULES['R003']
+        violation_severity, warning_severity = SPECIAL_RULE_SEVERITY['R003']
+        current_value = metrics[metric_key]
         
         result = {
             'rule_id': 'R003',
@@ -721,7 +876,7 @@ class RuleEvaluationEngine:
             top_supplier = metrics['supplier_spend'].iloc[0]
             excess_amount = (excess / 100) * metrics['total_spend']
             result['status'] = 'VIOLATION'
-            result['severity'] = 'CRITICAL'
+            result['severity'] = violation_severity
             result['message'] = f"⚠️ VIOLATION: {top_supplier['Supplier_Name']} at {current_value:.1f}% (exceeds {threshold}% limit by {excess:.1f}%)"
             result['action_required'] = rule['Action_Recommendation']
             result['details'] = {
@@ -732,9 +887,9 @@ class RuleEvaluationEngine:
                 'excess_amount': float(excess_amount),
                 'recommended_reduction': float(excess_amount)
             }
-        elif current_value > threshold * 0.85:  # Warning at 85% of threshold (51%)
+        elif current_value > threshold * warn_factor:  # Warning at 85% of threshold (51%)
             result['status'] = 'WARNING'
-            result['severity'] = 'HIGH'
+            result['severity'] = warning_severity
             top_supplier = metrics['supplier_spend'].iloc[0]
             result['message'] = f"⚡ WARNING: {top_supplier['Supplier_Name']} at {current_value:.1f}% (approaching {threshold}% limit)"
             result['action_required'] = "Monitor supplier dependency and plan diversification"
@@ -747,8 +902,10 @@ class RuleEvaluationEngine:
     
     def _evaluate_r023_supplier_concentration_index(self, rule: pd.Series, metrics: Dict[str, Any], spend_df: pd.DataFrame) -> Dict[str, Any]:
         """R023: Supplier Concentration Index - If Herfindahl index exceeds concentration threshold"""
-        threshold = 2500
-        current_value = metrics['hhi']
+        metric_key, threshold, warn_factor = SPECIAL_RULES['R023']
+        violation_severity, warning_severity = SPECIAL_RULE_SEVERITY['R023']
+        threshold = int(threshold)
+        current_value = metrics[metric_key]
         
         result = {
             'rule_id': 'R023',
@@ -763,7 +920,7 @@ class RuleEvaluationEngine:
         if current_value > threshold:
             excess = current_value - threshold
             result['status'] = 'VIOLATION'
-            result['severity'] = 'HIGH'
+            result['severity'] = violation_severity
             result['message'] = f"⚠️ VIOLATION: HHI at {current_value:.0f} (exceeds {threshold} limit by {excess:.0f})"
             result['action_required'] = rule['Action_Recommendation']
             result['details'] = {
@@ -771,9 +928,9 @@ class RuleEvaluationEngine:
                 'supplier_count': metrics['supplier_count'],
                 'market_structure': self._interpret_hhi(current_value)
             }
-        elif current_value > threshold * 0.9:  # Warning at 90% of threshold
+        elif current_value > threshold * warn_factor:  # Warning at 90% of threshold
             result['status'] = 'WARNING'
-            result['severity'] = 'MEDIUM'
+            result['severity'] = warning_severity
             result['message'] = f"⚡ WARNING: HHI at {current_value:.0f} (approaching {threshold} limit)"
             result['action_required'] = "Monitor supplier concentration"
         else:
@@ -792,6 +949,239 @@ class RuleEvaluationEngine:
         else:
             return "Highly concentrated"
     
+    # ========================================================================
+    # PORTFOLIO (BATCH) EVALUATION
+    # Every client x subcategory group in one groupby/merge + matrix pass
+    # ========================================================================
+
+    PORTFOLIO_GROUP_COLUMNS = ('Client_ID', 'Sector', 'Category', 'SubCategory')
+
+    def calculate_portfolio_metrics(
+        self,
+        client_ids: Optional[List[str]] = None,
+        subcategories: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """
+        Calculate the rule metrics of _calculate_metrics for every
+        client x subcategory group at once.
+
+        Args:
+            client_ids: Optional list of clients to include
+            subcategories: Optional list of subcategories to include
+
+        Returns:
+            DataFrame with one row per group: the group columns followed by
+            one column per metric key (same names as _calculate_metrics)
+        """
+        cube = self.data_loader.get_spend_cube()
+        group_cols = [c for c in self.PORTFOLIO_GROUP_COLUMNS if c in cube.dimensions]
+        if not group_cols or cube.cells.empty:
+            return pd.DataFrame()
+
+        # Single aggregation for all groups (supplier x region within group)
+        supplier_spend = cube.rollup(
+            group_cols + ['Supplier_ID', 'Supplier_Name', 'Supplier_Region']
+        )[group_cols + ['Supplier_ID', 'Supplier_Name', 'Supplier_Region', 'Spend_USD']]
+        supplier_spend = supplier_spend.rename(columns={'Spend_USD': 'total'})
+
+        group_totals = cube.rollup(group_cols)[group_cols + ['Spend_USD']]
+        group_totals = group_totals.rename(columns={'Spend_USD': 'group_total'})
+
+        if client_ids is not None and 'Client_ID' in group_cols:
+            supplier_spend = supplier_spend[supplier_spend['Client_ID'].isin(client_ids)]
+            group_totals = group_totals[group_totals['Client_ID'].isin(client_ids)]
+        if subcategories is not None and 'SubCategory' in group_cols:
+            supplier_spend = supplier_spend[supplier_spend['SubCategory'].isin(subcategories)]
+            group_totals = group_totals[group_totals['SubCategory'].isin(subcategories)]
+
+        if group_totals.empty:
+            return pd.DataFrame()
+
+        supplier_spend = supplier_spend.merge(group_totals, on=group_cols, how='inner')
+        supplier_spend['percentage'] = (supplier_spend['total'] / supplier_spend['group_total'] * 100).round(2)
+        # Same supplier order within each group as _calculate_metrics (largest first)
+        supplier_spend = supplier_spend.sort_values(
+            group_cols + ['total'], ascending=[True] * len(group_cols) + [False], kind='mergesort'
+        ).reset_index(drop=True)
+
+        # Single enrichment pass for all groups
+        supplier_dimension = self.data_loader.get_supplier_dimension()
+        if not supplier_dimension.table.empty:
+            merged = supplier_dimension.enrich(supplier_spend)
+        else:
+            merged = supplier_spend.copy()
+            for col in ['sustainability_score', 'quality_rating', 'delivery_reliability_pct', 'lead_time_days']:
+                merged[col] = 0
+
+        keys = [merged[c] for c in group_cols]
+        index = group_totals.set_index(group_cols).index
+        out = pd.DataFrame(index=index)
+        out['total_spend'] = group_totals['group_total'].to_numpy()
+
+        # Supplier-level metrics (shared with _calculate_metrics)
+        computed = self._supplier_metrics(merged, keys, index)
+        for metric, values in computed.items():
+            out[metric] = values
+
+        # Regional concentration
+        region_spend = cube.rollup(group_cols + ['Supplier_Region'])[group_cols + ['Supplier_Region', 'Spend_USD']]
+        region_spend = region_spend.merge(group_totals, on=group_cols, how='inner')
+        region_spend['pct'] = (region_spend['Spend_USD'] / region_spend['group_total'] * 100).round(2)
+        out['max_region_concentration'] = (
+            region_spend.groupby(group_cols)['pct'].max().reindex(index).fillna(0)
+        )
+
+        all_risk_countries = HIGH_RISK_COUNTRIES + ELEVATED_RISK_COUNTRIES
+        country_spend = cube.rollup(group_cols + ['Supplier_Country'])
+        country_spend = country_spend[country_spend['Supplier_Country'].isin(all_risk_countries)]
+        high_risk_spend = _group_reduce(
+            country_spend['Spend_USD'], [country_spend[c] for c in group_cols], index, 'sum'
+        ).fillna(0)
+        out['High_Risk_Country_Spend'] = (high_risk_spend / out['total_spend'] * 100).where(out['total_spend'] > 0, 0)
+
+        # Category-level metrics: category_metrics row when available, else from suppliers
+        category_columns = {
+            'Diverse_Supplier_Spend_Percentage': ('diverse_supplier_pct', 15.0),
+            'Innovation_Supplier_Spend_Percentage': ('innovation_supplier_pct', 10.0),
+            'Local_Content_Percentage': ('local_content_pct', 40.0),
+            'Qualified_Supplier_Count': ('qualified_supplier_count', 3),
+            'Certified_Suppliers_Percentage': ('certified_suppliers_pct', 90.0),
+            'Backup_Supplier_Count': ('backup_supplier_count', 1),
+            'Ethical_Certified_Suppliers': ('ethical_certified_pct', 80.0),
+        }
+        inventory_columns = {
+            'MOQ_Months_of_Demand': ('moq_months_of_demand', 3.0),
+            'Foreign_Currency_Spend_Percentage': ('foreign_currency_spend_pct', 30.0),
+            'Inventory_Turnover': ('inventory_turnover', 7.0),
+        }
+
+        subcats = (
+            pd.Series(index.get_level_values('SubCategory'), index=index)
+            if 'SubCategory' in group_cols else None
+        )
+        category_metrics = self.data_loader.load_category_metrics()
+        inventory_metrics = self.data_loader.load_inventory_metrics()
+
+        def context_lookup(table: pd.DataFrame, column: str):
+            """Per-group value from a subcategory-keyed table (NaN where no row)"""
+            if subcats is None or table.empty or 'subcategory' not in table.columns:
+                return None, pd.Series(False, index=index)
+            first_rows = table.drop_duplicates('subcategory').set_index('subcategory')
+            has_row = subcats.isin(first_rows.index)
+            if column not in first_rows.columns:
+                return None, has_row
+            return subcats.map(first_rows[column]), has_row
+
+        for metric, (column, default) in category_columns.items():
+            values, has_row = context_lookup(category_metrics, column)
+            fallback = computed[metric]
+            fallback = fallback if isinstance(fallback, pd.Series) else pd.Series(fallback, index=index)
+            context_values = values if values is not None else pd.Series(default, index=index)
+            out[metric] = context_values.where(has_row, fallback)
+
+        for metric, (column, default) in inventory_columns.items():
+            values, has_row = context_lookup(inventory_metrics, column)
+            context_values = values if values is not None else pd.Series(default, index=index)
+            out[metric] = context_values.where(has_row, default)
+
+        # R002 & R033: tail spend - smallest suppliers making up the bottom 20% of spend
+        ordered = supplier_spend.sort_values(group_cols + ['total'])
+        cumulative_before = ordered.groupby(group_cols)['total'].cumsum() - ordered['total']
+        in_tail = cumulative_before < ordered['group_total'] * 0.20
+        out['tail_suppliers_count'] = in_tail.groupby([ordered[c] for c in group_cols]).sum().reindex(index).fillna(0)
+
+        # Metric-name aliases used by the rule book
+        out['Spend_Region_Percentage'] = out['max_region_concentration']
+        out['Single_Supplier_Percentage'] = out['max_supplier_concentration']
+        out['Herfindahl_Index'] = out['hhi']
+        out['Low_Spend_Supplier_Count'] = out['tail_suppliers_count']
+
+        return out.reset_index()
+
+    def evaluate_portfolio(
+        self,
+        client_ids: Optional[List[str]] = None,
+        subcategories: Optional[List[str]] = None,
+        include_warnings: bool = True,
+        include_compliant: bool = False
+    ) -> pd.DataFrame:
+        """
+        Evaluate all rules for every client x subcategory group in one pass.
+
+        Metrics for all groups come from a single aggregation and enrichment
+        merge (calculate_portfolio_metrics); the compiled rule table then
+        evaluates the whole groups x rules matrix at once.
+
+        Args:
+            client_ids: Optional list of clients to include
+            subcategories: Optional list of subcategories to include
+            include_warnings: Include WARNING rows
+            include_compliant: Include COMPLIANT rows
+
+        Returns:
+            Tidy DataFrame with one row per (group, rule) finding:
+            group columns, Rule_ID, Rule_Name, Rule_Category, Risk_Level,
+            Metric, Current_Value, Threshold, Status, Severity,
+            Action_Recommendation
+        """
+        metrics_df = self.calculate_portfolio_metrics(client_ids, subcategories)
+        columns_out = [
+            'Rule_ID', 'Rule_Name', 'Rule_Category', 'Risk_Level', 'Metric',
+            'Current_Value', 'Threshold', 'Status', 'Severity', 'Action_Recommendation'
+        ]
+        if metrics_df.empty:
+            return pd.DataFrame(columns=list(self.PORTFOLIO_GROUP_COLUMNS) + columns_out)
+
+        group_cols = [c for c in self.PORTFOLIO_GROUP_COLUMNS if c in metrics_df.columns]
+        compiled = self.compiled_rules
+        n_groups, n_rules = len(metrics_df), len(compiled)
+
+        values = np.full((n_groups, n_rules), np.nan)
+        present = np.zeros((n_groups, n_rules), dtype=bool)
+        for j, key in enumerate(compiled.metric_keys):
+            if key is not None and key in metrics_df.columns:
+                values[:, j] = pd.to_numeric(metrics_df[key], errors='coerce').to_numpy(dtype=float)
+                present[:, j] = True
+
+        statuses = compiled.evaluate_matrix(values, present)
+
+        wanted = [STATUS_VIOLATION]
+        if include_warnings:
+            wanted.append(STATUS_WARNING)
+        if include_compliant:
+            wanted.append(STATUS_COMPLIANT)
+        group_idx, rule_idx = np.nonzero(np.isin(statuses, wanted))
+
+        records = compiled.records
+        status_names = {STATUS_VIOLATION: 'VIOLATION', STATUS_WARNING: 'WARNING', STATUS_COMPLIANT: 'COMPLIANT'}
+        found = statuses[group_idx, rule_idx]
+
+        table = metrics_df.iloc[group_idx][group_cols].reset_index(drop=True)
+        table['Rule_ID'] = [compiled.rule_ids[j] for j in rule_idx]
+        table['Rule_Name'] = [records[j]['Rule_Name'] for j in rule_idx]
+        table['Rule_Category'] = [records[j]['Category'] for j in rule_idx]
+        table['Risk_Level'] = [records[j]['Risk_Level'] for j in rule_idx]
+        table['Metric'] = [compiled.metric_keys[j] for j in rule_idx]
+        table['Current_Value'] = values[group_idx, rule_idx]
+        table['Threshold'] = compiled.thresholds[rule_idx]
+        table['Status'] = [status_names[s] for s in found]
+        table['Severity'] = [
+            self._portfolio_severity(records[j], s) for j, s in zip(rule_idx, found)
+        ]
+        table['Action_Recommendation'] = [records[j]['Action_Recommendation'] for j in rule_idx]
+
+        return table.sort_values(group_cols + ['Rule_ID']).reset_index(drop=True)
+
+    def _portfolio_severity(self, rule: Dict[str, Any], status: int) -> str:
+        """Severity matching evaluate_all_rules for a compiled status"""
+        rule_id = rule['Rule_ID']
+        if rule_id in SPECIAL_RULE_SEVERITY and status != STATUS_COMPLIANT:
+            violation_severity, warning_severity = SPECIAL_RULE_SEVERITY[rule_id]
+            return violation_severity if status == STATUS_VIOLATION else warning_severity
+        if status == STATUS_VIOLATION:
+            return 'HIGH' if rule['Risk_Level'] == 'Critical' else 'MEDIUM'
+        return 'LOW'
+
     def get_rule_details(self, rule_id: str) -> Dict[str, Any]:
         """Get details for a specific rule"""
         rule = self.rule_book[self.rule_book['Rule_ID'] == rule_id]
@@ -0,0 +1,290 @@
+"""
+Semantic Prompt Cache - Near-duplicate lookup for grounded LLM prompts
+
+Grounded prompts for the same category differ between runs only in small
+numeric details of the data section. This cache embeds the task
+instruction together with a number-normalized data section and serves a
+prior response when a new prompt is similar enough.
+
+Only sections whose wording does not depend on exact figures should use
+it (e.g. market intelligence); sections quoting numbers opt out.
+
+Responses cite the retrieved knowledge base chunks ([SOURCE-N]), so each
+entry also records a hash of the RAG context it was grounded on and is only
+served when the same context is retrieved again.
+
+Requires faiss and an embedding function (the RAG vector store's).
+"""
+
+import re
+import time
+import hashlib
+import pickle
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Callable
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+# Optional FAISS support
+try:
+    import faiss
+    import numpy as np
+    FAISS_AVAILABLE = True
+except ImportError:
+    FAISS_AVAILABLE = False
+    faiss = None
+    np = None
+
+# Import settings for configuration
+try:
+    from backend.config.settings import settings
+    SEMANTIC_CACHE_ENABLED = settings.SEMANTIC_CACHE_ENABLED
+    SEMANTIC_CACHE_DIR = settings.SEMANTIC_CACHE_DIR
+    SEMANTIC_CACHE_THRESHOLD = settings.SEMANTIC_CACHE_THRESHOLD
+    SEMANTIC_CACHE_TTL_SECONDS = settings.SEMANTIC_CACHE_TTL_SECONDS
+    SEMANTIC_CACHE_MAX_ENTRIES = settings.SEMANTIC_CACHE_MAX_ENTRIES
+except ImportError:
+    SEMANTIC_CACHE_ENABLED = False
+    SEMANTIC_CACHE_DIR = "./data/cache/semantic"
+    SEMANTIC_CACHE_THRESHOLD = 0.97
+    SEMANTIC_CACHE_TTL_SECONDS = 7 * 24 * 3600  # 1 week
+    SEMANTIC_CACHE_MAX_ENTRIES = 2000
+
+# Figures (not identifiers such as rule IDs 'R001')
+NUMBER_PATTERN = re.compile(r'(?<![A-Za-z_\d])[-+]?\$?\d[\d,]*(?:\.\d+)?%?')
+
+
+def normalize_data_section(data_section: str) -> str:
+    """Mask numbers and collapse whitespace so runs differing only in figures match"""
+    masked = NUMBER_PATTERN.sub('<num>', data_section or '')
+    return ' '.join(masked.split())
+
+
+def context_fingerprint(context: str) -> str:
+    """Hash of the retrieved RAG context a response was grounded on"""
+    return hashlib.sha256((context or '').encode('utf-8')).hexdigest()
+
+
+class SemanticPromptCache:
+    """
+    FAISS-backed cache of LLM responses keyed by prompt embedding.
+
+    Entries are partitioned by namespace; a lookup only returns responses
+    stored under the same namespace and grounded on the same retrieved
+    context. Namespaces must name the category as well as the section:
+    prompts for related categories (e.g. two edible oils) differ only in a
+    few words and embed well above the threshold.
+    """
+
+    ENTRIES_FILE = "entries.pkl"
+
+    def __init__(
+        self,
+        embed_fn: Callable[[str], List[float]],
+        dimension: int,
+        cache_dir: Optional[str] = None,
+        threshold: float = None,
+        ttl_seconds: int = None,
+        max_entries: int = None
+    ):
+        """
+        Args:
+            embed_fn: Text -> embedding vector
+            dimension: Embedding dimension
+            cache_dir: Directory for the persisted index (None = memory only)
+            threshold: Minimum cosine similarity for a hit
+            ttl_seconds: Entry lifetime
+            max_entries: Oldest entries are dropped beyond this size
+        """
+        if not FAISS_AVAILABLE:
+            raise ImportError("FAISS not installed. Install with: pip install faiss-cpu")
+
+        self.embed_fn = embed_fn
+        self.dimension = dimension
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.threshold = threshold if threshold is not None else SEMANTIC_CACHE_THRESHOLD
+        self.ttl_seconds = ttl_seconds or SEMANTIC_CACHE_TTL_SECONDS
+        self.max_entries = max_entries or SEMANTIC_CACHE_MAX_ENTRIES
+
+        self._lock = threading.Lock()
+        self._index = faiss.IndexFlatIP(dimension)
+        self._vectors: List[Any] = []
+        self._entries: List[Dict[str, Any]] = []
+        self._hits = 0
+        self._misses = 0
+
+        self._load()
+
+    def _cache_text(self, task_instruction: str, data_section: str) -> str:
+        return f"{' '.join((task_instruction or '').split())}\n{normalize_data_section(data_section)}"
+
+    def _embed(self, text: str):
+        vector = np.array([self.embed_fn(text)], dtype='float32')
+        faiss.normalize_L2(vector)
+        return vector
+
+    def lookup(
+        self,
+        namespace: str,
+        task_instruction: str,
+        data_section: str,
+        context: str = ''
+    ) -> Optional[str]:
+        """Return a prior response for a near-duplicate prompt with the same RAG context, or None"""
+        with self._lock:
+            empty = self._index.ntotal == 0
+        if empty:
+            self._misses += 1
+            return None
+
+        vector = self._embed(self._cache_text(task_instruction, data_section))
+        context_key = context_fingerprint(context)
+        now = time.time()
+
+        with self._lock:
+            k = min(8, self._index.ntotal)
+            scores, indices = self._index.search(vector, k)
+            for score, idx in zip(scores[0], indices[0]):
+                if idx < 0 or score < self.threshold:
+                    break
+                entry = self._entries[idx]
+                if (entry['namespace'] != namespace
+                        or entry.get('context_key') != context_key
+                        or now - entry['created_at'] > self.ttl_seconds):
+                    continue
+                self._hits += 1
+                logger.debug(f"Semantic cache hit for {namespace} (similarity {score:.3f})")
+                return entry['response']
+
+        self._misses += 1
+        return None
+
+    def add(
+        self,
+        namespace: str,
+        task_instruction: str,
+        data_section: str,
+        response: str,
+        context: str = ''
+    ) -> None:
+        """Store a response for future near-duplicate prompts grounded on the same context"""
+        if not response:
+            return
+        vector = self._embed(self._cache_text(task_instruction, data_section))
+
+        with self._lock:
+            self._vectors.append(vector[0])
+            self._entries.append({
+                'namespace': namespace,
+                'context_key': context_fingerprint(context),
+                'response': response,
+                'created_at': time.time()
+            })
+            if len(self._entries) > self.max_entries:
+                self._prune_locked()
+            else:
+                self._index.add(vector)
+            self._save_locked()
+
+    def _prune_locked(self) -> None:
+        """Drop expired and oldest entries, then rebuild the flat index"""
+        now = time.time()
+        keep = [
+            i for i, e in enumerate(self._entries)
+            if now - e['created_at'] <= self.ttl_seconds
+        ][-self.max_entries:]
+        self._entries = [self._entries[i] for i in keep]
+        self._vectors = [self._vectors[i] for i in keep]
+        self._index = faiss.IndexFlatIP(self.dimension)
+        if self._vectors:
+            self._index.add(np.vstack(self._vectors).astype('float32'))
+
+    def _load(self) -> None:
+        if self.cache_dir is None:
+            return
+        entries_path = self.cache_dir / self.ENTRIES_FILE
+        if not entries_path.exists():
+            return
+        try:
+            with open(entries_path, 'rb') as f:
+                saved = pickle.load(f)
+            if saved.get('dimension') != self.dimension:
+                logger.info("Semantic cache dimension changed - starting empty")
+                return
+            self._entries = saved['entries']
+            self._vectors = list(saved['vectors'])
+            self._prune_locked()
+            logger.info(f"Loaded semantic cache: {len(self._entries)} entries")
+        except Exception as e:
+            logger.warning(f"Could not load semantic cache: {e}")
+            self._entries, self._vectors = [], []
+
+    def _save_locked(self) -> None:
+        if self.cache_dir is None:
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_dir / (self.ENTRIES_FILE + '.tmp')
+            with open(tmp_path, 'wb') as f:
+                pickle.dump({
+                    'dimension': self.dimension,
+                    'entries': self._entries,
+                    'vectors': np.vstack(self._vectors) if self._vectors else np.zeros((0, self.dimension), 'float32')
+                }, f)
+            tmp_path.replace(self.cache_dir / self.ENTRIES_FILE)
+        except Exception as e:
+            logger.warning(f"Could not persist semantic cache: {e}")
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        with self._lock:
+            self._entries, self._vectors = [], []
+            self._index = faiss.IndexFlatIP(self.dimension)
+            self._save_locked()
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        total = self._hits + self._misses
+        return {
+            'entries': len(self._entries),
+            'hits': self._hits,
+            'misses': self._misses,
+            'hit_rate_percent': round(self._hits / total * 100, 2) if total else 0,
+            'threshold': self.threshold
+        }
+
+
+_shared_cache: Optional[SemanticPromptCache] = None
+_shared_lock = threading.Lock()
+
+
+def get_semantic_cache(vector_store=None) -> Optional[SemanticPromptCache]:
+    """
+    Process-wide semantic cache using the vector store's embeddings.
+
+    Returns None when disabled (SEMANTIC_CACHE_ENABLED), when faiss is
+    missing, or when the vector store has no working embedding backend.
+    """
+    global _shared_cache
+    if not SEMANTIC_CACHE_ENABLED or not FAISS_AVAILABLE:
+        return None
+    if _shared_cache is not None:
+        return _shared_cache
+    if vector_store is None or not getattr(vector_store, 'embeddings_available', False):
+        return None
+
+    with _shared_lock:
+        if _shared_cache is None:
+            try:
+                _shared_cache = SemanticPromptCache(
+                    embed_fn=vector_store._get_embedding,
+                    dimension=vector_store.dimension,
+                    cache_dir=SEMANTIC_CACHE_DIR
+                )
+            except Exception as e:
+                logger.warning(f"Semantic cache unavailable: {e}")
+                return None
+    return _shared_cache
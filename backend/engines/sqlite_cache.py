@@ -0,0 +1,235 @@
+"""
+Two-Level Cache - In-memory LRU in front of a SQLite table
+
+Shared storage for the engines' persistent caches (LLM responses, RAG
+query embeddings). Subclasses choose the table, how keys are built and
+how values are encoded for disk; this module handles the layers.
+
+Layers:
+- In-memory LRU (hot entries, per process)
+- SQLite on disk (survives restarts, shared between processes), bounded by
+  entry count with least-recently-used eviction
+
+An optional TTL applies to both layers. Tables written by an older layout
+are recreated on open, since their contents are only a cache.
+"""
+
+import time
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+from backend.engines.data_loader import LRUCache
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+# LRUCache requires a TTL; used for caches whose entries never expire
+NO_EXPIRY_SECONDS = 10 * 365 * 24 * 3600
+
+
+class TwoLevelCache:
+    """
+    Memory + SQLite key/value store with LRU eviction.
+
+    Subclasses set TABLE, VALUE_COLUMN/VALUE_TYPE and LABEL, override
+    _encode/_decode when values are not stored as-is, and expose typed
+    get/set methods built on _get/_set.
+    """
+
+    TABLE = "cache_entries"
+    VALUE_COLUMN = "value"
+    VALUE_TYPE = "BLOB"
+    LABEL = "Cache"
+
+    def __init__(
+        self,
+        db_path: str,
+        max_entries: int,
+        memory_size: int,
+        ttl_seconds: Optional[int] = None
+    ):
+        """
+        Args:
+            db_path: SQLite file (':memory:' keeps it in-process)
+            max_entries: Maximum rows kept on disk before LRU eviction
+            memory_size: Entries held in the in-memory LRU
+            ttl_seconds: Entry lifetime in both layers (None = never expire)
+        """
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._memory = LRUCache(max_size=memory_size, default_ttl=ttl_seconds or NO_EXPIRY_SECONDS)
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._writes = 0
+        self._evictions = 0
+
+        self._connect()
+
+    @property
+    def _columns(self) -> Dict[str, str]:
+        return {
+            'key': 'TEXT PRIMARY KEY',
+            'model': 'TEXT',
+            self.VALUE_COLUMN: f'{self.VALUE_TYPE} NOT NULL',
+            'created_at': 'REAL NOT NULL',
+            'last_accessed': 'REAL NOT NULL',
+            'hits': 'INTEGER NOT NULL DEFAULT 0'
+        }
+
+    def _connect(self) -> None:
+        """Open the SQLite database, disabling the disk layer on failure"""
+        try:
+            if self.db_path != ':memory:':
+                Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=5.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+
+            existing = [row[1] for row in conn.execute(f"PRAGMA table_info({self.TABLE})")]
+            if existing and existing != list(self._columns):
+                logger.info(f"{self.LABEL} table layout changed - recreating {self.TABLE}")
+                conn.execute(f"DROP TABLE {self.TABLE}")
+
+            columns = ", ".join(f"{name} {spec}" for name, spec in self._columns.items())
+            conn.execute(f"CREATE TABLE IF NOT EXISTS {self.TABLE} ({columns})")
+            conn.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{self.TABLE}_last_accessed ON {self.TABLE}(last_accessed)"
+            )
+            conn.commit()
+            self._conn = conn
+        except sqlite3.Error as e:
+            logger.warning(f"{self.LABEL} disk layer disabled ({self.db_path}): {e}")
+            self._conn = None
+
+    def _encode(self, value: Any) -> Any:
+        """Value -> SQLite column value"""
+        return value
+
+    def _decode(self, stored: Any) -> Any:
+        """SQLite column value -> value"""
+        return stored
+
+    def _expired(self, created_at: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - created_at > self.ttl_seconds
+
+    def _get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None on miss/expiry"""
+        value = self._memory.get(key)
+        if value is not None:
+            self._memory_hits += 1
+            return value
+
+        if self._conn is not None:
+            now = time.time()
+            try:
+                with self._lock:
+                    row = self._conn.execute(
+                        f"SELECT {self.VALUE_COLUMN}, created_at FROM {self.TABLE} WHERE key = ?", (key,)
+                    ).fetchone()
+                    if row is not None and self._expired(row[1], now):
+                        self._conn.execute(f"DELETE FROM {self.TABLE} WHERE key = ?", (key,))
+                        self._conn.commit()
+                        row = None
+                    elif row is not None:
+                        self._conn.execute(
+                            f"UPDATE {self.TABLE} SET last_accessed = ?, hits = hits + 1 WHERE key = ?",
+                            (now, key)
+                        )
+                        self._conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"{self.LABEL} read failed: {e}")
+                row = None
+
+            if row is not None:
+                self._disk_hits += 1
+                value = self._decode(row[0])
+                if self.ttl_seconds is not None:
+                    self._memory.set(key, value, ttl=max(1, int(self.ttl_seconds - (now - row[1]))))
+                else:
+                    self._memory.set(key, value)
+                return value
+
+        self._misses += 1
+        return None
+
+    def _set(self, key: str, value: Any, model: Optional[str] = None) -> None:
+        """Store a value in both layers"""
+        self._memory.set(key, value)
+        if self._conn is None:
+            return
+
+        now = time.time()
+        try:
+            with self._lock:
+                self._conn.execute(
+                    f"INSERT OR REPLACE INTO {self.TABLE} "
+                    f"(key, model, {self.VALUE_COLUMN}, created_at, last_accessed, hits) VALUES (?, ?, ?, ?, ?, 0)",
+                    (key, model, self._encode(value), now, now)
+                )
+                self._writes += 1
+                self._evict_locked(now)
+                self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"{self.LABEL} write failed: {e}")
+
+    def _evict_locked(self, now: float) -> None:
+        """Drop expired rows, then least-recently-used rows above max_entries"""
+        expired = 0
+        if self.ttl_seconds is not None:
+            expired = self._conn.execute(
+                f"DELETE FROM {self.TABLE} WHERE created_at < ?", (now - self.ttl_seconds,)
+            ).rowcount
+        count = self._conn.execute(f"SELECT COUNT(*) FROM {self.TABLE}").fetchone()[0]
+        overflow = count - self.max_entries
+        if overflow > 0:
+            self._conn.execute(
+                f"DELETE FROM {self.TABLE} WHERE key IN "
+                f"(SELECT key FROM {self.TABLE} ORDER BY last_accessed ASC LIMIT ?)",
+                (overflow,)
+            )
+        evicted = max(expired, 0) + max(overflow, 0)
+        if evicted:
+            self._evictions += evicted
+            logger.debug(f"{self.LABEL} evicted {evicted} entries")
+
+    def clear(self) -> None:
+        """Remove all entries from both layers"""
+        self._memory.clear()
+        if self._conn is not None:
+            with self._lock:
+                self._conn.execute(f"DELETE FROM {self.TABLE}")
+                self._conn.commit()
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss statistics for both layers"""
+        entries = 0
+        if self._conn is not None:
+            try:
+                with self._lock:
+                    entries = self._conn.execute(f"SELECT COUNT(*) FROM {self.TABLE}").fetchone()[0]
+            except sqlite3.Error:
+                pass
+
+        hits = self._memory_hits + self._disk_hits
+        total = hits + self._misses
+        return {
+            'memory_hits': self._memory_hits,
+            'disk_hits': self._disk_hits,
+            'misses': self._misses,
+            'hit_rate_percent': round(hits / total * 100, 2) if total else 0,
+            'writes': self._writes,
+            'evictions': self._evictions,
+            'memory_entries': self._memory.stats['size'],
+            'disk_entries': entries,
+            'max_entries': self.max_entries,
+            'ttl_seconds': self.ttl_seconds,
+            'db_path': self.db_path if self._conn is not None else None
+        }
@@ -0,0 +1,109 @@
+"""
+Stub Vector Store - Deterministic in-memory knowledge base
+
+Drop-in replacement for FAISSVectorStore (search / search_batch /
+get_context_for_query) for offline runs such as the brief pipeline
+benchmark. Documents are ranked by word overlap with the query and every
+returned document scores at least min_score, so briefs always see strong
+RAG context and take their LLM paths.
+"""
+
+import re
+from typing import Dict, Any, List, Optional
+
+WORD_PATTERN = re.compile(r'[a-z0-9]+')
+
+# Small fixed procurement corpus covering the agents' and sections' queries
+DEFAULT_DOCUMENTS = [
+    {
+        'content': "Supplier concentration risk: a single supplier above 50% of category spend is a "
+                   "critical supply chain risk. Maintain 3-5 qualified suppliers and dual source critical items.",
+        'metadata': {'source': 'stub_policy.md', 'file_name': 'stub_policy.md', 'category': 'risk_management',
+                     'section': 'Supplier Concentration', 'chunk_id': 'stub_policy.md#0'}
+    },
+    {
+        'content': "Geographic risk: more than 70% of spend in one region is high risk. Diversify sourcing "
+                   "across Americas, Europe, APAC, Middle East and Africa to reduce corridor dependency.",
+        'metadata': {'source': 'stub_policy.md', 'file_name': 'stub_policy.md', 'category': 'risk_management',
+                     'section': 'Geographic Risk', 'chunk_id': 'stub_policy.md#1'}
+    },
+    {
+        'content': "Strategic procurement recommendations: phase diversification over 6-18 months, qualify "
+                   "alternate suppliers, renegotiate contracts for leverage and track savings of 5-20%.",
+        'metadata': {'source': 'stub_best_practices.md', 'file_name': 'stub_best_practices.md',
+                     'category': 'sourcing', 'section': 'Recommendations', 'chunk_id': 'stub_best_practices.md#0'}
+    },
+    {
+        'content': "Market intelligence: regional sourcing trends favour nearshoring and multi-region supply "
+                   "chains; pricing is driven by logistics, capacity, quality and supplier landscape.",
+        'metadata': {'source': 'stub_market.md', 'file_name': 'stub_market.md', 'category': 'market',
+                     'section': 'Market Trends', 'chunk_id': 'stub_market.md#0'}
+    },
+    {
+        'content': "Executive summary guidance: state the concentration finding, the risk it creates and the "
+                   "diversification strategy with expected savings and timeline.",
+        'metadata': {'source': 'stub_best_practices.md', 'file_name': 'stub_best_practices.md',
+                     'category': 'sourcing', 'section': 'Executive Summary', 'chunk_id': 'stub_best_practices.md#1'}
+    },
+]
+
+
+def _words(text: str) -> set:
+    return set(WORD_PATTERN.findall(text.lower()))
+
+
+class StubVectorStore:
+    """
+    In-memory vector store with deterministic lexical ranking.
+
+    Usage:
+        store = StubVectorStore()
+        results = store.search("supplier concentration risk", k=3)
+    """
+
+    name = "stub"
+
+    def __init__(self, documents: Optional[List[Dict[str, Any]]] = None, min_score: float = 0.7):
+        """
+        Args:
+            documents: List of dicts with 'content' and 'metadata' keys (default: DEFAULT_DOCUMENTS)
+            min_score: Score of a document sharing no words with the query (max is 1.0)
+        """
+        self.documents = [(doc['content'], doc.get('metadata', {})) for doc in (documents or DEFAULT_DOCUMENTS)]
+        self._words = [_words(content) for content, _ in self.documents]
+        self.min_score = min_score
+        self.searches = 0
+
+    def search(self, query: str, k: int = 5) -> List[Dict[str, Any]]:
+        """Top-k documents by share of query words they contain"""
+        self.searches += 1
+        query_words = _words(query) or {''}
+        scored = [
+            (self.min_score + (1 - self.min_score) * len(query_words & words) / len(query_words), i)
+            for i, words in enumerate(self._words)
+        ]
+        scored.sort(key=lambda item: (-item[0], item[1]))
+
+        results = []
+        for score, i in scored[:k]:
+            content, metadata = self.documents[i]
+            results.append({
+                'content': content,
+                'metadata': metadata,
+                'score': round(score, 4),
+                'source': metadata.get('source', 'unknown'),
+                'category': metadata.get('category', 'unknown'),
+                'section': metadata.get('section', ''),
+                'chunk_id': metadata.get('chunk_id', metadata.get('file_name', ''))
+            })
+        return results
+
+    def search_batch(self, queries: List[str], k: int = 5) -> List[List[Dict[str, Any]]]:
+        return [self.search(query, k) for query in queries]
+
+    def get_context_for_query(self, query: str, k: int = 5) -> str:
+        """Get formatted context string for RAG"""
+        return "\n\n---\n\n".join(
+            f"[SOURCE-{i}] ({result['source']})\n{result['content']}"
+            for i, result in enumerate(self.search(query, k), 1)
+        )
@@ -0,0 +1,64 @@
+"""
+Supplier Extraction - Structured supplier profiles from web search results
+
+Suppliers missing from supplier_master.csv are enriched from web search.
+Their profiles are extracted in batches: one JSON-mode LLM request covers
+several suppliers, and each result is validated against SupplierProfile.
+Suppliers that fail validation are retried one at a time (see
+LLMEngine.extract_batch).
+"""
+
+from typing import Dict, Any, List, Optional
+
+from pydantic import BaseModel, Field
+
+# Suppliers per extraction request (top-15 suppliers -> at most 2 requests)
+DEFAULT_BATCH_SIZE = 8
+
+
+class SupplierProfile(BaseModel):
+    """Supplier attributes extracted from web search results"""
+    quality_rating: float = Field(default=0, ge=0, le=5, description="0-5 scale (0 if not mentioned)")
+    delivery_reliability: float = Field(default=0, ge=0, le=100, description="0-100 percentage (0 if not mentioned)")
+    sustainability_score: float = Field(default=0, ge=0, le=100, description="0-100 (0 if not mentioned)")
+    years_in_business: int = Field(default=0, ge=0, description="Integer (0 if not mentioned)")
+    certifications: List[str] = Field(default_factory=list, description="Certification names found (empty if none)")
+    company_description: str = Field(default='', description="Brief description if found")
+
+
+EXTRACTION_INSTRUCTIONS = """Each item below contains web search results about one supplier (the item ID is the supplier name).
+Extract supplier information for every item.
+
+INSTRUCTIONS:
+1. Extract ONLY information explicitly mentioned in that item's search results
+2. If information is not available, use 0 or empty values
+3. Be conservative with ratings - only assign high values if clearly supported
+4. Never carry information over from one item to another"""
+
+
+def extract_supplier_profiles(
+    llm_engine,
+    web_contexts: Dict[str, str],
+    batch_size: int = DEFAULT_BATCH_SIZE
+) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    Extract supplier profiles for several suppliers at once.
+
+    Args:
+        llm_engine: LLMEngine instance
+        web_contexts: Supplier name -> combined web search text
+        batch_size: Suppliers per LLM request
+
+    Returns:
+        Supplier name -> profile dict, or None where extraction failed
+    """
+    records = llm_engine.extract_batch(
+        web_contexts,
+        SupplierProfile,
+        EXTRACTION_INSTRUCTIONS,
+        batch_size=batch_size
+    )
+    return {
+        name: record.model_dump() if record is not None else None
+        for name, record in records.items()
+    }
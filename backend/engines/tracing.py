@@ -0,0 +1,427 @@
+"""
+Tracing - Lightweight spans for brief generation
+
+Spans time units of work (agent executions, RAG and web lookups, LLM calls,
+data loads, DOCX export) and carry attributes such as cache hits and token
+counts. Nested spans share a trace; the trace summary (time per span name,
+cache hits, tokens) is attached to generated briefs.
+
+Works offline with no dependencies. Trace and span IDs use the OpenTelemetry
+format, and when opentelemetry-api is installed every span is mirrored to
+the configured OpenTelemetry tracer as well.
+
+Controlled by ENABLE_TRACING. Finished traces are kept in memory
+(TRACE_HISTORY_SIZE) for export_traces(); set TRACE_EXPORT_DIR to also
+write each one to <dir>/<trace_id>.json. Span listeners (e.g. Prometheus
+metrics) receive every finished span even when ENABLE_TRACING is off.
+
+Usage:
+    with trace('generate_both_briefs', client_id='C001') as brief_trace:
+        with span('rag.search', k=5) as s:
+            results = vector_store.search(query)
+            s.set_attribute('results', len(results))
+    summary = brief_trace.summary() if brief_trace else None
+
+    @traced('docx.export')
+    def export(...): ...
+"""
+
+import json
+import time
+import secrets
+import logging
+import threading
+import functools
+import inspect
+from pathlib import Path
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Any, List, Optional, Iterator, Callable
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+# Optional OpenTelemetry support
+try:
+    from opentelemetry import trace as otel_trace
+    OTEL_AVAILABLE = True
+except ImportError:
+    OTEL_AVAILABLE = False
+    otel_trace = None
+
+# Import settings for configuration
+try:
+    from backend.config.settings import settings
+    ENABLE_TRACING = settings.ENABLE_TRACING
+    TRACE_EXPORT_DIR = settings.TRACE_EXPORT_DIR
+    TRACE_HISTORY_SIZE = settings.TRACE_HISTORY_SIZE
+except ImportError:
+    ENABLE_TRACING = True
+    TRACE_EXPORT_DIR = None
+    TRACE_HISTORY_SIZE = 20
+
+# Attribute types OpenTelemetry accepts
+OTEL_ATTRIBUTE_TYPES = (str, bool, int, float)
+
+_current_span: ContextVar[Optional['Span']] = ContextVar('current_span', default=None)
+_recent_traces: deque = deque(maxlen=TRACE_HISTORY_SIZE)
+_span_listeners: List[Callable[['Span'], None]] = []
+_otel_tracer = otel_trace.get_tracer(__name__) if OTEL_AVAILABLE and ENABLE_TRACING else None
+
+
+class Span:
+    """A timed unit of work with attributes"""
+
+    def __init__(
+        self,
+        name: str,
+        trace: 'Trace',
+        parent: Optional['Span'] = None,
+        attributes: Optional[Dict[str, Any]] = None
+    ):
+        self.name = name
+        self.trace = trace
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent.span_id if parent else None
+        self.attributes: Dict[str, Any] = dict(attributes or {})
+        self.start_time = time.time()
+        self.duration_ms: Optional[float] = None
+        self.status = 'ok'
+        self.error: Optional[str] = None
+        self._start = time.perf_counter()
+
+        self._otel = None
+        if _otel_tracer is not None:
+            context = otel_trace.set_span_in_context(parent._otel) if parent and parent._otel else None
+            self._otel = _otel_tracer.start_span(
+                name,
+                context=context,
+                attributes={k: v for k, v in self.attributes.items() if isinstance(v, OTEL_ATTRIBUTE_TYPES)}
+            )
+
+    @property
+    def trace_id(self) -> str:
+        return self.trace.trace_id
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+        if self._otel is not None and isinstance(value, OTEL_ATTRIBUTE_TYPES):
+            self._otel.set_attribute(key, value)
+
+    def set_attributes(self, **attributes: Any) -> None:
+        for key, value in attributes.items():
+            self.set_attribute(key, value)
+
+    def add(self, key: str, amount: float = 1) -> None:
+        """Increment a numeric attribute"""
+        self.set_attribute(key, self.attributes.get(key, 0) + amount)
+
+    def end(self, error: Optional[BaseException] = None) -> None:
+        if self.duration_ms is not None:
+            return
+        self.duration_ms = round((time.perf_counter() - self._start) * 1000, 3)
+        if error is not None:
+            self.status = 'error'
+            self.error = f"{type(error).__name__}: {error}"
+        if self._otel is not None:
+            if error is not None:
+                self._otel.record_exception(error)
+            self._otel.end()
+        for listener in _span_listeners:
+            try:
+                listener(self)
+            except Exception as e:
+                logger.debug(f"Span listener failed for {self.name}: {e}")
+        if self.trace.root is self and ENABLE_TRACING:
+            _finish_trace(self.trace)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'name': self.name,
+            'trace_id': self.trace_id,
+            'span_id': self.span_id,
+            'parent_id': self.parent_id,
+            'start_time': self.start_time,
+            'duration_ms': self.duration_ms,
+            'status': self.status,
+            'error': self.error,
+            'attributes': self.attributes
+        }
+
+
+class _NoopSpan:
+    """Stand-in returned while tracing is disabled"""
+
+    trace = None
+    trace_id = None
+    span_id = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def set_attributes(self, **attributes: Any) -> None:
+        pass
+
+    def add(self, key: str, amount: float = 1) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class Trace:
+    """All spans under one root span, plus trace-wide counters"""
+
+    def __init__(self):
+        self.trace_id = secrets.token_hex(16)
+        self.root: Optional[Span] = None
+        self.spans: List[Span] = []
+        self.counters: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def name(self) -> Optional[str]:
+        return self.root.name if self.root else None
+
+    def _add(self, span: Span) -> None:
+        with self._lock:
+            if self.root is None:
+                self.root = span
+            self.spans.append(span)
+
+    def count(self, key: str, amount: float = 1) -> None:
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + amount
+
+    def summary(self) -> Dict[str, Any]:
+        """Time and cache hits/misses per span name, token totals and counters"""
+        with self._lock:
+            spans = list(self.spans)
+            counters = dict(self.counters)
+
+        by_name: Dict[str, Dict[str, Any]] = {}
+        prompt_tokens = completion_tokens = errors = 0
+        for item in spans:
+            duration = item.duration_ms or 0.0
+            entry = by_name.setdefault(item.name, {'count': 0, 'total_ms': 0.0, 'max_ms': 0.0})
+            entry['count'] += 1
+            entry['total_ms'] = round(entry['total_ms'] + duration, 3)
+            entry['max_ms'] = max(entry['max_ms'], duration)
+
+            cache_hit = item.attributes.get('cache_hit')
+            if cache_hit is not None:
+                key = 'cache_hits' if cache_hit else 'cache_misses'
+                entry[key] = entry.get(key, 0) + 1
+            prompt_tokens += item.attributes.get('prompt_tokens', 0)
+            completion_tokens += item.attributes.get('completion_tokens', 0)
+            errors += item.status == 'error'
+
+        return {
+            'trace_id': self.trace_id,
+            'name': self.name,
+            'duration_ms': self.root.duration_ms if self.root else None,
+            'span_count': len(spans),
+            'errors': errors,
+            'prompt_tokens': prompt_tokens,
+            'completion_tokens': completion_tokens,
+            'counters': counters,
+            'by_name': by_name
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            spans = [item.to_dict() for item in self.spans]
+        return {'trace_id': self.trace_id, 'summary': self.summary(), 'spans': spans}
+
+    def export_json(self, path: str) -> None:
+        """Write this trace (summary and all spans) to a JSON file"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), indent=2, default=str), encoding='utf-8')
+
+
+def _finish_trace(trace: Trace) -> None:
+    _recent_traces.append(trace)
+    if TRACE_EXPORT_DIR:
+        try:
+            trace.export_json(str(Path(TRACE_EXPORT_DIR) / f"{trace.trace_id}.json"))
+        except Exception as e:
+            logger.warning(f"Could not export trace {trace.trace_id}: {e}")
+
+
+# =============================================================================
+# SPAN API
+# =============================================================================
+
+def add_span_listener(listener: Callable[[Span], None]) -> None:
+    """Call listener(span) for every finished span"""
+    if listener not in _span_listeners:
+        _span_listeners.append(listener)
+
+
+def current_span():
+    """The active span (a no-op span outside any span)"""
+    return _current_span.get() or NOOP_SPAN
+
+
+def count(key: str, amount: float = 1) -> None:
+    """Increment a counter on the active trace (no-op outside a trace)"""
+    active = _current_span.get()
+    if active is not None:
+        active.trace.count(key, amount)
+
+
+def start_span(name: str, **attributes: Any):
+    """
+    Start a span under the active span without making it active.
+
+    The caller must call end(). A span started outside any trace is the
+    root of a new trace.
+    """
+    if not ENABLE_TRACING and not _span_listeners:
+        return NOOP_SPAN
+    parent = _current_span.get()
+    new_span = Span(name, parent.trace if parent else Trace(), parent, attributes)
+    new_span.trace._add(new_span)
+    return new_span
+
+
+@contextmanager
+def activate(active_span) -> Iterator[Any]:
+    """Make a span started with start_span() the parent of spans opened in this block"""
+    if active_span is NOOP_SPAN:
+        yield active_span
+        return
+    token = _current_span.set(active_span)
+    try:
+        yield active_span
+    finally:
+        _current_span.reset(token)
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Any]:
+    """Time a block as a span; exceptions mark the span as failed and propagate"""
+    new_span = start_span(name, **attributes)
+    error = None
+    try:
+        with activate(new_span):
+            yield new_span
+    except Exception as e:
+        error = e
+        raise
+    finally:
+        if new_span is not NOOP_SPAN:
+            new_span.end(error)
+
+
+@contextmanager
+def trace(name: str, **attributes: Any) -> Iterator[Optional[Trace]]:
+    """
+    Root span that yields its Trace, for attaching a summary once it ends.
+
+    Yields None when tracing is disabled or when already inside a trace (the
+    block is then a plain child span of the enclosing trace).
+    """
+    nested = _current_span.get() is not None
+    with span(name, **attributes) as root:
+        yield None if nested or not ENABLE_TRACING else root.trace
+
+
+def traced(name: Optional[str] = None, **attributes: Any):
+    """
+    Decorator running a function inside a span (default name: its qualified name).
+
+    Supports plain and async functions, and sync and async generators; a
+    generator's span covers its whole iteration.
+    """
+    def decorator(func):
+        span_name = name or func.__qualname__
+
+        if inspect.isasyncgenfunction(func):
+            @functools.wraps(func)
+            async def async_gen_wrapper(*args, **kwargs):
+                gen_span = start_span(span_name, **attributes)
+                gen = func(*args, **kwargs)
+                error = None
+                try:
+                    while True:
+                        with activate(gen_span):
+                            try:
+                                value = await gen.__anext__()
+                            except StopAsyncIteration:
+                                return
+                        yield value
+                except Exception as e:
+                    error = e
+                    raise
+                finally:
+                    await gen.aclose()
+                    if gen_span is not NOOP_SPAN:
+                        gen_span.end(error)
+            return async_gen_wrapper
+
+        if inspect.isgeneratorfunction(func):
+            @functools.wraps(func)
+            def gen_wrapper(*args, **kwargs):
+                gen_span = start_span(span_name, **attributes)
+                gen = func(*args, **kwargs)
+                error = None
+                try:
+                    while True:
+                        with activate(gen_span):
+                            try:
+                                value = next(gen)
+                            except StopIteration:
+                                return
+                        yield value
+                except Exception as e:
+                    error = e
+                    raise
+                finally:
+                    gen.close()
+                    if gen_span is not NOOP_SPAN:
+                        gen_span.end(error)
+            return gen_wrapper
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with span(span_name, **attributes):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(span_name, **attributes):
+                return func(*args, **kwargs)
+        return wrapper
+
+    return decorator
+
+
+# =============================================================================
+# EXPORT
+# =============================================================================
+
+def recent_traces() -> List[Trace]:
+    """Finished traces still held in memory, oldest first"""
+    return list(_recent_traces)
+
+
+def export_traces(path: str, traces: Optional[List[Trace]] = None) -> int:
+    """
+    Write traces (default: all recent traces) to a JSON file.
+
+    Returns:
+        Number of traces written
+    """
+    traces = recent_traces() if traces is None else traces
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps([t.to_dict() for t in traces], indent=2, default=str),
+        encoding='utf-8'
+    )
+    return len(traces)
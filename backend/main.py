@@ -10,12 +10,13 @@ from typing import Callable
 
 from fastapi import FastAPI, Request, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from loguru import logger
 import uvicorn
 
-from backend.api.routes import recommendation_router
+from backend.api.routes import recommendation_router, data_loader
 from backend.config.settings import settings
+from backend.engines.metrics import get_metrics
 
 # Configure standard logging
 logging.basicConfig(
@@ -77,6 +78,11 @@ class RateLimiter:
 # Initialize rate limiter
 rate_limiter = RateLimiter(requests_per_minute=settings.RATE_LIMIT_REQUESTS)
 
+# Prometheus metrics (None when ENABLE_MONITORING is off or prometheus_client is missing)
+service_metrics = get_metrics()
+if service_metrics is not None:
+    service_metrics.register_cache("api_data_loader", data_loader.get_cache_stats)
+
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -109,13 +115,15 @@ async def rate_limit_middleware(request: Request, call_next: Callable):
     if client_ip and "," in client_ip:
         client_ip = client_ip.split(",")[0].strip()
 
-    # Skip rate limiting for health checks
-    if request.url.path in ["/", "/health"]:
+    # Skip rate limiting for health checks and metrics scrapes
+    if request.url.path in ["/", "/health", "/metrics"]:
         return await call_next(request)
 
     # Check rate limit
     if not rate_limiter.is_allowed(client_ip):
         logger.warning(f"Rate limit exceeded for IP: {client_ip}")
+        if service_metrics is not None:
+            service_metrics.observe_rejection("api")
         return JSONResponse(
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
             content={
@@ -174,6 +182,16 @@ async def request_logging_middleware(request: Request, call_next: Callable):
     # Calculate duration
     duration = time.time() - start_time
 
+    # Latency histogram per route template (not raw path, to bound cardinality)
+    if service_metrics is not None:
+        route = request.scope.get("route")
+        service_metrics.observe_request(
+            request.method,
+            getattr(route, "path", "unmatched"),
+            response.status_code,
+            duration
+        )
+
     # Log request (skip health checks for cleaner logs)
     if request.url.path not in ["/", "/health"]:
         logger.info(
@@ -203,6 +221,7 @@ async def root():
             "llm_enabled": settings.is_llm_enabled,
             "rag_enabled": True,
             "rate_limiting_enabled": True,
+            "metrics_enabled": service_metrics is not None,
             "api_key_required": settings.API_KEY_REQUIRED
         }
     }
@@ -233,6 +252,28 @@ async def health_check():
     }
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """
+    Prometheus metrics endpoint.
+    Also served without authentication on METRICS_PORT for internal scrapers.
+    """
+    if service_metrics is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Metrics disabled (ENABLE_MONITORING is off or prometheus_client is not installed)"
+        )
+    body, content_type = service_metrics.render()
+    return Response(content=body, media_type=content_type)
+
+
+@app.on_event("startup")
+async def start_metrics_server():
+    """Serve metrics on METRICS_PORT alongside the API"""
+    if service_metrics is not None and settings.METRICS_PORT != settings.APP_PORT:
+        service_metrics.start_server(settings.METRICS_PORT)
+
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     """
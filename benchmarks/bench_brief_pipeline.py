@@ -0,0 +1,264 @@
+"""
+Benchmark: End-to-end leadership brief pipeline
+
+Times every stage of brief generation for each (client, subcategory) pair
+in spend_data.csv, in template mode and agent mode, with the LLM served by
+StubLLMBackend and RAG by StubVectorStore so runs are offline and
+repeatable. StubVectorStore always returns strong context, so every LLM
+section (and its fan-out and scheduling) runs instead of its template
+fallback; the run fails if the stub LLM received no requests. Web search
+is disabled, and verification runs in basic (non-Perplexity) mode.
+
+Stages:
+- data_loading: cold load of spend data, supplier master and rule book
+- category_resolution: DataLoader.resolve_category_input
+- metric_calculation: supplier performance metrics
+- rule_evaluation: full rule book evaluation
+- <mode>.brief_generation: generate_both_briefs (stub RAG and LLM sections included)
+- agent.<stage>: each BriefOrchestrator pipeline stage (agent mode)
+- <mode>.docx_export: DOCXExporter.export_both_briefs
+- <mode>.verification: BriefVerifier.verify_both_briefs
+
+Reports per stage: sample count, p50/p95/max duration and peak traced
+memory (tracemalloc). Agent stages run inside the orchestrator's thread
+pool, so only their timings are reported; their memory is included in
+agent.brief_generation. Timings include tracemalloc overhead unless
+--no-memory is given.
+
+Usage:
+    python benchmarks/bench_brief_pipeline.py
+    python benchmarks/bench_brief_pipeline.py --client C001 --limit 5 --runs 3
+    python benchmarks/bench_brief_pipeline.py --mode agent --llm-latency-ms 400 --output bench.json
+"""
+
+import sys
+import json
+import time
+import argparse
+import tempfile
+import tracemalloc
+from pathlib import Path
+from contextlib import contextmanager
+from collections import defaultdict
+
+# Add project root to path
+root_path = Path(__file__).parent.parent
+sys.path.insert(0, str(root_path))
+
+from backend.engines.data_loader import DataLoader
+from backend.engines.llm_engine import LLMEngine
+from backend.engines.llm_backends import StubLLMBackend
+from backend.engines.llm_scheduler import LLMScheduler
+from backend.engines.stub_vector_store import StubVectorStore
+
+
+class StageRecorder:
+    """Collects duration and peak traced memory samples per stage"""
+
+    def __init__(self, trace_memory: bool = True):
+        self.trace_memory = trace_memory
+        self.durations = defaultdict(list)
+        self.peaks = defaultdict(int)
+
+    @contextmanager
+    def measure(self, stage: str):
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.durations[stage].append((time.perf_counter() - start) * 1000)
+            if self.trace_memory:
+                peak = tracemalloc.get_traced_memory()[1] - baseline
+                self.peaks[stage] = max(self.peaks[stage], peak)
+
+    def add_timing(self, stage: str, duration_ms: float):
+        self.durations[stage].append(duration_ms)
+
+    def report(self) -> dict:
+        report = {}
+        for stage, samples in self.durations.items():
+            report[stage] = {
+                'samples': len(samples),
+                'p50_ms': round(percentile(samples, 50), 2),
+                'p95_ms': round(percentile(samples, 95), 2),
+                'max_ms': round(max(samples), 2)
+            }
+            if stage in self.peaks:
+                report[stage]['peak_memory_bytes'] = self.peaks[stage]
+        return report
+
+
+def percentile(samples: list, pct: float) -> float:
+    """Linear-interpolated percentile"""
+    ordered = sorted(samples)
+    if len(ordered) == 1:
+        return ordered[0]
+    rank = (len(ordered) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def stub_llm_engine(backend: StubLLMBackend) -> LLMEngine:
+    """LLMEngine on the stub backend, uncached and without rate limiting"""
+    return LLMEngine(
+        backend=backend,
+        enable_cache=False,
+        # Effectively unlimited budgets: the stub needs no throttling
+        scheduler=LLMScheduler(requests_per_minute=10 ** 9, tokens_per_minute=10 ** 12)
+    )
+
+
+def list_scopes(spend_df, client_id: str = None, limit: int = None) -> list:
+    """(client_id, subcategory) pairs present in the spend data"""
+    scopes = spend_df[['Client_ID', 'SubCategory']].drop_duplicates()
+    if client_id:
+        scopes = scopes[scopes['Client_ID'] == client_id]
+    pairs = sorted(scopes.itertuples(index=False, name=None))
+    return pairs[:limit] if limit else pairs
+
+
+def run_scope(
+    recorder: StageRecorder,
+    generators: dict,
+    exporter,
+    verifier,
+    spend_df,
+    supplier_df,
+    client_id: str,
+    subcategory: str
+):
+    """Benchmark every stage for one subcategory"""
+    any_generator = next(iter(generators.values()))
+
+    with recorder.measure('category_resolution'):
+        resolved = any_generator.data_loader.resolve_category_input(subcategory, client_id)
+    if not resolved.get('success'):
+        raise ValueError(resolved.get('error', f"Could not resolve {subcategory}"))
+    scope_df = resolved['spend_data']
+
+    with recorder.measure('metric_calculation'):
+        any_generator._calculate_supplier_performance_metrics(scope_df, supplier_df, subcategory)
+
+    with recorder.measure('rule_evaluation'):
+        any_generator._evaluate_rule_violations(client_id, subcategory)
+
+    for mode, generator in generators.items():
+        with recorder.measure(f'{mode}.brief_generation'):
+            briefs = generator.generate_both_briefs(client_id, subcategory)
+
+        timings = briefs.get('stage_timings') or {}
+        for stage, timing in timings.get('stages', {}).items():
+            recorder.add_timing(f'{mode}.{stage}', timing['duration_ms'])
+
+        with recorder.measure(f'{mode}.docx_export'):
+            paths = exporter.export_both_briefs(briefs)
+
+        with recorder.measure(f'{mode}.verification'):
+            verifier.verify_both_briefs(
+                paths.get('incumbent_docx'),
+                paths.get('regional_docx'),
+                spend_df,
+                subcategory
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="End-to-end brief pipeline benchmark")
+    parser.add_argument('--client', default=None, help="Only subcategories of this client")
+    parser.add_argument('--limit', type=int, default=None, help="Benchmark the first N subcategories")
+    parser.add_argument('--runs', type=int, default=1, help="Passes over all subcategories")
+    parser.add_argument('--mode', choices=['template', 'agent', 'both'], default='both')
+    parser.add_argument('--llm-latency-ms', type=float, default=0.0,
+                        help="Stub time to first token (0 = instant)")
+    parser.add_argument('--llm-tokens-per-second', type=float, default=1e9,
+                        help="Stub generation throughput")
+    parser.add_argument('--no-memory', action='store_true', help="Skip tracemalloc (timings only)")
+    parser.add_argument('--output', default=None, help="Also write the JSON report to this file")
+    args = parser.parse_args()
+
+    from backend.engines.leadership_brief_generator import LeadershipBriefGenerator
+    from backend.engines.docx_exporter import DOCXExporter
+    from backend.engines.brief_verifier import BriefVerifier
+
+    recorder = StageRecorder(trace_memory=not args.no_memory)
+    if recorder.trace_memory:
+        tracemalloc.start()
+
+    loader = DataLoader()
+    llm_backend = StubLLMBackend(
+        latency_ms=args.llm_latency_ms,
+        tokens_per_second=args.llm_tokens_per_second
+    )
+    llm_engine = stub_llm_engine(llm_backend)
+    vector_store = StubVectorStore()
+    modes = ['template', 'agent'] if args.mode == 'both' else [args.mode]
+    generators = {
+        mode: LeadershipBriefGenerator(
+            data_loader=loader,
+            enable_llm=True,
+            enable_rag=True,
+            enable_web_search=False,
+            use_agents=(mode == 'agent'),
+            llm_engine=llm_engine,
+            vector_store=vector_store
+        )
+        for mode in modes
+    }
+
+    verifier = BriefVerifier()
+    verifier.enabled = False  # Basic mode keeps the benchmark offline
+
+    failures = []
+    scopes = []
+    started = time.perf_counter()
+    with tempfile.TemporaryDirectory(prefix='bench_briefs_') as output_dir:
+        exporter = DOCXExporter(output_dir=output_dir)
+
+        for _ in range(args.runs):
+            with recorder.measure('data_loading'):
+                loader.clear_cache()
+                spend_df = loader.load_spend_data(force_reload=True)
+                supplier_df = loader.load_supplier_master(force_reload=True)
+                loader.load_rule_book(force_reload=True)
+
+            scopes = list_scopes(spend_df, args.client, args.limit)
+            for client_id, subcategory in scopes:
+                try:
+                    run_scope(
+                        recorder, generators, exporter, verifier,
+                        spend_df, supplier_df, client_id, subcategory
+                    )
+                except Exception as e:
+                    failures.append({'client_id': client_id, 'subcategory': subcategory, 'error': str(e)})
+
+    if recorder.trace_memory:
+        tracemalloc.stop()
+
+    report = {
+        'modes': modes,
+        'runs': args.runs,
+        'subcategories': len(scopes),
+        'llm_backend': llm_engine.backend_name,
+        'llm_latency_ms': args.llm_latency_ms,
+        'llm_requests': llm_backend.calls,
+        'rag_searches': vector_store.searches,
+        'memory_traced': recorder.trace_memory,
+        'total_seconds': round(time.perf_counter() - started, 2),
+        'stages': recorder.report(),
+        'failures': failures
+    }
+    output = json.dumps(report, indent=2)
+    print(output)
+    if args.output:
+        Path(args.output).write_text(output)
+
+    if scopes and llm_backend.calls == 0:
+        sys.exit("[ERROR] Stub LLM received no requests - only template fallbacks were benchmarked")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Benchmark: rule evaluation throughput
+
+Measures rule evaluations per second using:
+- the compiled rule table (single NumPy pass per metrics vector)
+- the compiled rule table in matrix mode (many metric vectors at once)
+
+Usage:
+    python benchmarks/bench_rule_evaluation.py --client C001 --category Coffee
+"""
+
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+
+# Add project root to path
+root_path = Path(__file__).parent.parent
+sys.path.insert(0, str(root_path))
+
+import numpy as np
+
+from backend.engines.rule_evaluation_engine import RuleEvaluationEngine
+
+
+def _rate(evaluations: int, seconds: float) -> float:
+    return round(evaluations / seconds, 1) if seconds > 0 else float('inf')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rule evaluation throughput benchmark")
+    parser.add_argument('--client', default='C001')
+    parser.add_argument('--category', default='Coffee')
+    parser.add_argument('--iterations', type=int, default=200)
+    parser.add_argument('--matrix-rows', type=int, default=10000)
+    args = parser.parse_args()
+
+    engine = RuleEvaluationEngine()
+    resolved = engine.data_loader.resolve_category_input(args.category, args.client)
+    if not resolved.get('success'):
+        print(f"[ERROR] Could not resolve category: {args.category}")
+        sys.exit(1)
+
+    spend_df = resolved['spend_data']
+    metrics = engine._calculate_metrics(spend_df, spend_filters=resolved.get('filters'))
+    compiled = engine.compiled_rules
+    n_rules = len(compiled)
+
+    # Compiled: one metrics vector per call
+    start = time.perf_counter()
+    for _ in range(args.iterations):
+        compiled.evaluate(metrics)
+    compiled_seconds = time.perf_counter() - start
+
+    # Compiled matrix: many groups in one call
+    values, present, is_none = compiled.metric_vector(metrics)
+    matrix = np.tile(values, (args.matrix_rows, 1))
+    matrix *= np.random.default_rng(0).uniform(0.5, 1.5, size=matrix.shape)
+    start = time.perf_counter()
+    compiled.evaluate_matrix(
+        matrix,
+        np.tile(present, (args.matrix_rows, 1)),
+        np.tile(is_none, (args.matrix_rows, 1))
+    )
+    matrix_seconds = time.perf_counter() - start
+
+    print(json.dumps({
+        'rules': n_rules,
+        'iterations': args.iterations,
+        'compiled_evaluations_per_sec': _rate(n_rules * args.iterations, compiled_seconds),
+        'matrix_rows': args.matrix_rows,
+        'matrix_evaluations_per_sec': _rate(n_rules * args.matrix_rows, matrix_seconds)
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
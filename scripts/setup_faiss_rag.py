@@ -1,9 +1,14 @@
 """
 Setup FAISS RAG Vector Store
 Creates FAISS index from knowledge base documents
+
+An existing index is updated incrementally: only new or changed chunks are
+embedded and chunks of deleted documents are removed. Use --rebuild to
+re-embed everything.
 """
 
 import sys
+import argparse
 from pathlib import Path
 import pandas as pd
 
@@ -12,11 +17,14 @@ root_path = Path(__file__).parent.parent
 sys.path.insert(0, str(root_path))
 
 from backend.engines.faiss_vector_store import FAISSVectorStore
+from backend.engines.document_chunker import DocumentChunker
+from backend.engines.embedding_backends import create_embedding_backend
 
 
-def load_documents_from_directory(directory: Path) -> list:
-    """Load all text/markdown documents from directory"""
+def load_documents_from_directory(directory: Path, chunker: DocumentChunker = None) -> list:
+    """Load all text/markdown documents from directory, split into heading-aware chunks"""
     documents = []
+    chunker = chunker or DocumentChunker()
 
     if not directory.exists():
         return documents
@@ -25,15 +33,12 @@ def load_documents_from_directory(directory: Path) -> list:
     for md_file in directory.glob("**/*.md"):
         try:
             content = md_file.read_text(encoding='utf-8')
-            documents.append({
-                'content': content,
-                'metadata': {
-                    'source': md_file.name,
-                    'file_name': md_file.name,
-                    'category': 'knowledge_base',
-                    'file_type': 'markdown'
-                }
-            })
+            documents.extend(chunker.chunk_document(content, {
+                'source': md_file.name,
+                'file_name': md_file.name,
+                'category': 'knowledge_base',
+                'file_type': 'markdown'
+            }))
         except Exception as e:
             print(f"  Warning: Could not read {md_file.name}: {e}")
 
@@ -41,15 +46,12 @@ def load_documents_from_directory(directory: Path) -> list:
     for txt_file in directory.glob("**/*.txt"):
         try:
             content = txt_file.read_text(encoding='utf-8')
-            documents.append({
-                'content': content,
-                'metadata': {
-                    'source': txt_file.name,
-                    'file_name': txt_file.name,
-                    'category': 'knowledge_base',
-                    'file_type': 'text'
-                }
-            })
+            documents.extend(chunker.chunk_document(content, {
+                'source': txt_file.name,
+                'file_name': txt_file.name,
+                'category': 'knowledge_base',
+                'file_type': 'text'
+            }))
         except Exception as e:
             print(f"  Warning: Could not read {txt_file.name}: {e}")
 
@@ -114,6 +116,12 @@ Regions: {', '.join(cat_df['Supplier_Region'].unique()[:5])}
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Create or update the FAISS RAG index")
+    parser.add_argument('--rebuild', action='store_true', help="Re-embed all documents from scratch")
+    parser.add_argument('--embedding-backend', choices=['auto', 'openai', 'local'], default=None,
+                        help="Embedding backend (default: EMBEDDING_BACKEND setting)")
+    args = parser.parse_args()
+
     print("=" * 60)
     print(" SETTING UP FAISS RAG VECTOR STORE")
     print("=" * 60)
@@ -123,9 +131,12 @@ def main():
     # Load UNSTRUCTURED documents (policies, best practices, risk assessments)
     print("\n[1/5] Loading UNSTRUCTURED documents (policies, best practices)...")
     unstructured_path = root_path / "data" / "unstructured"
-    unstructured_docs = load_documents_from_directory(unstructured_path)
+    chunker = DocumentChunker()
+    unstructured_docs = load_documents_from_directory(unstructured_path, chunker)
     documents.extend(unstructured_docs)
-    print(f"  ✅ Loaded {len(unstructured_docs)} unstructured documents")
+    file_count = len({doc['metadata']['file_name'] for doc in unstructured_docs})
+    print(f"  ✅ Loaded {file_count} unstructured documents as {len(unstructured_docs)} chunks "
+          f"(<= {chunker.chunk_tokens} tokens, {chunker.overlap_tokens} overlap)")
 
     # Load STRUCTURED data descriptions (CSVs)
     print("\n[2/5] Loading STRUCTURED data (CSV files)...")
@@ -246,10 +257,12 @@ Global Supplier Database Coverage:
     print("\n[5/5] Creating FAISS index...")
     faiss_store = FAISSVectorStore(
         persist_directory="./data/faiss_db",
-        embedding_model="text-embedding-3-small"
+        backend=create_embedding_backend(args.embedding_backend)
     )
 
-    faiss_store.create_index(documents, reset=True)
+    if not args.rebuild:
+        faiss_store.load_index()
+    faiss_store.create_index(documents, reset=args.rebuild)
 
     # Test search
     print("\n Testing search...")
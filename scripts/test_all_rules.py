@@ -2,6 +2,7 @@
 Test script to verify all 35 rules are being evaluated with real data
 """
 import sys
+import math
 from pathlib import Path
 
 # Add project root to path
@@ -80,5 +81,35 @@ def test_rules():
             print(f"Missing rules: {sorted(missing)}")
 
 
+def test_portfolio_matches_single_slice():
+    """Portfolio metrics must equal _calculate_metrics for every client x subcategory"""
+    engine = RuleEvaluationEngine()
+    portfolio = engine.calculate_portfolio_metrics()
+    metric_keys = sorted({k for k in engine.compiled_rules.metric_keys if k and k in portfolio.columns})
+
+    print("\n" + "=" * 80)
+    print(f"PORTFOLIO vs SINGLE-SLICE METRICS ({len(portfolio)} groups, {len(metric_keys)} metrics)")
+    print("=" * 80)
+
+    mismatches = []
+    for _, group in portfolio.iterrows():
+        resolved = engine.data_loader.resolve_category_input(group['SubCategory'], group['Client_ID'])
+        if not resolved.get('success', False):
+            mismatches.append((group['Client_ID'], group['SubCategory'], 'unresolved', None, None))
+            continue
+        metrics = engine._calculate_metrics(resolved['spend_data'], spend_filters=resolved.get('filters'))
+        for key in metric_keys:
+            single, batch = float(metrics[key]), float(group[key])
+            if single != batch and not (math.isnan(single) and math.isnan(batch)):
+                mismatches.append((group['Client_ID'], group['SubCategory'], key, single, batch))
+
+    for client_id, subcategory, key, single, batch in mismatches[:20]:
+        print(f"  {client_id} / {subcategory} {key}: single={single!r} portfolio={batch!r}")
+    print(f"\n{'PASS' if not mismatches else 'FAIL'}: {len(mismatches)} mismatching values")
+    return not mismatches
+
+
 if __name__ == "__main__":
     test_rules()
+    if not test_portfolio_matches_single_slice():
+        sys.exit(1)